@@ -35,6 +35,18 @@ Examples:
 11-30-05 24: Test_distinct_go_no_list_based_on_neighbor_set_graph
 01-10-06 25: Test_PostFim(output is /tmp/test_PostFim.out)
 01-24-06 26: Test_johnson_sp
+2026-10-18 27: Test_local_node_run
+2026-10-18 28: Test_go_dag_index
+2026-10-18 29: Test_edge_store
+2026-10-18 30: Test_distribution_tail
+2026-10-18 31: Test_table_bulk_writer
+2026-10-18 32: Test_graph_merge
+2026-10-18 33: Test_triplet_counting
+2026-10-18 34: Test_pattern_record
+2026-10-18 35: Test_packed_genome
+2026-10-18 36: Test_AugmentPatternByProtInteraction
+2026-10-18 37: Test_cluster_bs_analysis
+2026-10-18 38: Test_biclustering
 """
 import sys, os, math
 bit_number = math.log(sys.maxint)/math.log(2)
@@ -382,7 +394,32 @@ class TestLinearModel(unittest.TestCase):
 		print "Coefficient list: %s"%repr(self.instance.coefficients())
 		print "chisq: %s"%repr(self.instance.chisq_return())
 		"""
-	
+
+	def test_fit_groups(self):
+		"""
+		2026-10-18
+			same data as above, twice, as two groups. The intercept column is added by fit_groups().
+		"""
+		from module_cc.linear_model import fit_groups
+		from array import array
+		x_2d_list = [[14, 2], [16, 0], [16, 2], [18, 0], [18, 2], [18, 4], [20, 0], [20, 2], [20, 4], [20, 6], \
+			[22, 0], [22, 2], [22, 4], [22, 6], [22, 8], [24, 2], [26, 0], [26, 2], [26, 4]]
+		y_list = [0.5500000, 0.6842105, 0.7647059, 0.5030303, 0.4000000, 0.7647059, \
+			0.5439739, 0.5727412, 0.5603448, 0.5625000, 0.5781991, 0.6218905, \
+			0.561538, 0.5573770, 0.5208333, 0.6666667, 0.8666667, 0.6862745, 0.6551724]
+		x_buffer = array('d')
+		for row in x_2d_list+x_2d_list:
+			x_buffer.extend(row)
+		y_buffer = array('d', y_list+y_list)
+		result_list = fit_groups(x_buffer, y_buffer, [0, 19, 38], 2, 0, 2)
+		real_coeff_list = [0.44622090360304795, 0.0096039858657607172, -0.01244257855672223]
+		real_p_value_list = [0.009938940265, 0.210705278168, 0.276120398382]	#t-test, 16 degrees of freedom
+		for coefficient_list, se_list, p_value_list, converged in result_list:
+			self.assertEqual(converged, 1)
+			for i in range(3):
+				self.assertAlmostEqual(coefficient_list[i], real_coeff_list[i], 10)
+				self.assertAlmostEqual(p_value_list[i], real_p_value_list[i], 8)
+
 	def tearDown(self):
 		self.instance.cleanup()
 
@@ -469,6 +506,22 @@ class TestPGeneLm(unittest.TestCase):
 		score_cut_off = self.instance.return_score_cut_off(score_list, 0.7, -1)
 		print "\nthe score cutoff is %s"%repr(score_cut_off)
 
+	def test_accuracy_curve(self):
+		"""
+		2026-10-18
+			the redundant (gene_no, go_no) pair is counted once, at its highest score.
+		"""
+		from p_gene_lm import accuracy_curve
+		score_list = [[6,1,1,1],[3,0,2,1],[3,0,3,1],[4,1,4,1],[5,1,1,1],[5,0,5,1],[2,1,4,1]]
+		accuracy_curve_instance = accuracy_curve(score_list, no_redundancy=1)
+		self.assertEqual(accuracy_curve_instance.threshold_ls, [2,3,4,5,6])
+		self.assertEqual(accuracy_curve_instance.no_of_correct_ls, [2,2,2,1,1])
+		self.assertEqual(accuracy_curve_instance.no_of_wrong_ls, [3,3,1,1,0])
+		self.assertEqual(accuracy_curve_instance.get_cut_off_by_accuracy(0.6), 4)
+		self.assertEqual(accuracy_curve_instance.get_cut_off_by_accuracy(1.0), 6)
+		self.assertEqual(accuracy_curve_instance.get_cut_off_by_accuracy(1.1), None)
+		self.assertEqual(accuracy_curve_instance.get_cut_off_by_percentage(0.5), 5)
+
 class TestPGeneAnalysis(unittest.TestCase):
 	"""
 	02-28-05
@@ -695,6 +748,27 @@ class TestGraphModeling(unittest.TestCase):
 		print "degree: %s"%data.degree
 		print "significance: %s"%data.significance
 	
+	def test_cor_matrix_construct(self):
+		"""
+		2026-10-18
+			the blocked engine should agree with ind_min_cor() pair by pair
+		"""
+		gene_ls = [[0.1,0.2,0.3,0.4,0.6, 0.7, 0.8, 0.9],
+			[0.2, 0.3, 0.35, 0.4, 0.6, 0.7, 0.8, 0.9],
+			[0.9, 0.1, 0.5, 100000000, 0.3, 0.2, 0.8, 0.4],
+			[1.2, 0.7, 0.35, 0.5, 0.1, 100000000, 0.9, 0.3]]
+		expr_vector = []
+		for gene in gene_ls:
+			expr_vector += gene
+		no_of_genes = len(gene_ls)
+		cor_vector = self.instance.cor_matrix_construct(expr_vector, no_of_genes, 1, 2)
+		for i in range(no_of_genes):
+			for j in range(i+1, no_of_genes):
+				data = self.instance.ind_min_cor(gene_ls[i], gene_ls[j])
+				self.assertAlmostEqual(cor_vector[i*no_of_genes-i*(i+1)/2+j-i-1], data.value, 5)
+		print
+		print "cor_vector: %s"%repr(list(cor_vector))
+	
 class TestCodense2db(unittest.TestCase):
 	"""
 	03-04-05
@@ -1136,6 +1210,8 @@ class Test_cal_gradient_score(unittest.TestCase):
 class Test_cc_from_edge_list(unittest.TestCase):
 	"""
 	10-26-05
+	2026-10-18
+		run_buffer()
 	"""
 	def test_cc_from_edge_list(self):
 		edge_list = [[1,2],[2,3],[2,4],[3,4],[5,6],[7,6],[5,7],[8,9],[10,10]]
@@ -1146,6 +1222,18 @@ class Test_cc_from_edge_list(unittest.TestCase):
 		print "edge_list",edge_list
 		for i in range(len(cc_list)):
 			print "component",i,cc_list[i]
+		#2026-10-18 same components from run_buffer()
+		from array import array
+		edge_buffer = array('l')
+		for edge in edge_list:
+			edge_buffer.extend(edge)
+		edge_string, offset_string = cc_from_edge_list().run_buffer(edge_buffer)
+		cc_edge_array = array('l', edge_string)
+		offset_array = array('l', offset_string)
+		self.assertEqual(len(offset_array), len(cc_list)+1)
+		for i in range(len(cc_list)):
+			cc_edge_list = [tuple(cc_edge_array[2*j:2*j+2]) for j in range(offset_array[i], offset_array[i+1])]
+			self.assertEqual(cc_edge_list, list(cc_list[i]))
 	
 class Test_MpiDifferentialPattern(unittest.TestCase):
 	"""
@@ -1204,6 +1292,21 @@ class Test_MpiDifferentialPattern(unittest.TestCase):
 		print "interesting_dataset_set",interesting_dataset_set
 		print "effective_rec_array",effective_rec_array
 		print "p_value",p_value
+	
+	def test_cal_no_of_effective_possible_edges(self):
+		"""
+		2026-10-18
+			against get_effective_vertex_set()
+		"""
+		no_of_datasets = len(self.original_rec_array)
+		no_of_effective_possible_edges_ls = self.MpiDifferentialPattern_instance.cal_no_of_effective_possible_edges(\
+			self.edge_set, self.gene2enc_array, no_of_datasets)
+		for i in range(no_of_datasets):
+			effective_vertex_set = self.MpiDifferentialPattern_instance.get_effective_vertex_set(self.vertex_list, \
+				self.gene2enc_array, i+1)
+			no_of_effective_possible_edges = len([edge for edge in self.edge_set \
+				if edge[0] in effective_vertex_set and edge[1] in effective_vertex_set])
+			self.assertEqual(no_of_effective_possible_edges_ls[i], no_of_effective_possible_edges)
 		
 class Test_cal_hg_p_value(unittest.TestCase):
 	"""
@@ -1250,6 +1353,24 @@ class Test_is_site_confirmed(unittest.TestCase):
 		result = MpiConfirmMatchResult_instance.is_site_confirmed(mt_id2sites_ls, line, \
 			max_mis_match_perc, min_no_of_mismatches, max_esc_length)
 		print result
+	
+	def test_packed_comparison(self):
+		"""
+		2026-10-18
+		"""
+		from MpiConfirmMatchResult import MpiConfirmMatchResult, reverse_complement
+		instance = MpiConfirmMatchResult()
+		mt_id2sites_ls = {'V$A': [0, 'TTRTTGMNAMAG'], 'V$B': [1, 'GGAAAATT', 'TTTCC CT', 'TTTNCCCT']}
+		mt_id2compiled_sites_ls = instance.compile_mt_id2sites_ls(mt_id2sites_ls, 6)
+		line = ' V$A                    |       51 (+) |  0.944 |  0.915 | ttATTGAaacag\n'
+		self.assertEqual(instance.is_site_confirmed(mt_id2sites_ls, line, 0.1, 1, 6, mt_id2compiled_sites_ls), True)
+		line = ' V$A                    |       51 (+) |  0.944 |  0.915 | ttATTGAaacgg\n'
+		self.assertEqual(instance.is_site_confirmed(mt_id2sites_ls, line, 0.1, 1, 6, mt_id2compiled_sites_ls), False)
+		#reverse complement is TTTCCGAT, one mismatch against the 2nd site, ' ' matches anything
+		line = ' V$B                    |        6 (-) |  1.000 |  0.970 | atCGGAaa\n'
+		self.assertEqual(instance.is_site_confirmed(mt_id2sites_ls, line, 0.1, 1, 6, mt_id2compiled_sites_ls), True)
+		self.assertEqual(instance.is_site_confirmed(mt_id2sites_ls, line, 0.1, 0, 6, mt_id2compiled_sites_ls), False)
+		self.assertEqual(reverse_complement('aaCGTn'), 'nACGtt')
 
 class Test_get_neighbor_set(unittest.TestCase):
 	"""
@@ -1347,6 +1468,8 @@ class Test_PostFim(unittest.TestCase):
 class Test_johnson_sp(unittest.TestCase):
 	"""
 	01-24-06
+	2026-10-18
+		add_edge_sig_block(), py_shortest_distance_buffer(), py_recurrence_buffer()
 	"""
 	def test_johnson_sp(self):
 		from graph.johnson_sp import johnson_sp
@@ -1372,8 +1495,532 @@ class Test_johnson_sp(unittest.TestCase):
 		print "edge_set:", edge_set
 		print "D_matrix:", D_matrix
 		print "recurrence_list:", recurrence_list
+		#2026-10-18 string form of the same matrix
+		from codense.common import d_matrix_bytes2string, string2d_matrix
+		d_matrix_string = d_matrix_bytes2string(instance.py_shortest_distance_string(vertex_set, edge_set))
+		self.assertEqual(string2d_matrix(d_matrix_string), D_matrix)
+		print "d_matrix_string:", d_matrix_string
+		#2026-10-18 buffer input/output
+		from array import array
+		edge_sig_block = array('l')
+		for edge_sig_list in edge_sig_matrix:
+			edge_sig_block.extend(edge_sig_list)
+		edge_sig_block.extend([-1]+[0]*(no_of_datasets+1))
+		instance = johnson_sp(no_of_datasets)
+		self.assertEqual(instance.add_edge_sig_block(edge_sig_block), len(edge_sig_matrix))
+		edge_buffer = array('l')
+		for edge in edge_set:
+			edge_buffer.extend(edge)
+		d_matrix_buffer = array('B', instance.py_shortest_distance_buffer(array('l', vertex_set), edge_buffer))
+		no_of_vertices = len(vertex_set)
+		self.assertEqual([list(d_matrix_buffer[i*no_of_vertices:(i+1)*no_of_vertices]) for i in range(no_of_vertices)], D_matrix)
+		self.assertEqual(list(array('f', instance.py_recurrence_buffer())), recurrence_list)
+
+
+class Test_local_node_run(unittest.TestCase):
+	"""
+	2026-10-18
+	"""
+	def input_handler(self, parameter_list, message_size, report=0):
+		iterator = parameter_list[0]
+		block = []
+		for number in iterator:
+			block.append(number)
+			if len(block)>=message_size:
+				break
+		return block
+	
+	def node_fire_handler(self, communicator, data, parameter_list):
+		import cPickle
+		data = cPickle.loads(data)
+		return [number*parameter_list[0] for number in data]
+	
+	def output_handler(self, communicator, parameter_list, data):
+		import cPickle
+		parameter_list[0] += cPickle.loads(data)
+	
+	def test_local_node_run(self):
+		from codense.common import local_node_run
+		for no_of_workers in [1, 4]:
+			result_ls = []
+			local_node_run([iter(range(100))], [3], [result_ls], 7, self.node_fire_handler, self.output_handler, \
+				input_handler=self.input_handler, no_of_workers=no_of_workers)
+			self.assertEqual(result_ls, [number*3 for number in range(100)])
+		print "result_ls:", result_ls
+	
+	def rank_node_fire_handler(self, communicator, data, parameter_list):
+		import time
+		time.sleep(0.01)	#let all workers get a block
+		return [(communicator.rank, communicator.size)]
+	
+	def test_rank(self):
+		from codense.common import local_node_run
+		for no_of_workers in [1, 3, 3]:	#a second pool in the same process numbers its workers from 1 again
+			result_ls = []
+			local_node_run([iter(range(100))], [], [result_ls], 5, self.rank_node_fire_handler, self.output_handler, \
+				input_handler=self.input_handler, no_of_workers=no_of_workers)
+			rank_set = dict.fromkeys([rank for rank, size in result_ls])
+			self.assertEqual([size for rank, size in result_ls], [no_of_workers+2]*20)
+			if no_of_workers==1:
+				self.assertEqual(rank_set.keys(), [1])
+			else:
+				self.assert_(len(rank_set)>1)
+				for rank in rank_set:
+					self.assert_(1<=rank<=no_of_workers)
 
+class Test_go_dag_index(unittest.TestCase):
+	"""
+	2026-10-18
+		1
+	       / \
+	      2   3
+	     / \ /
+	    5   4
+	     \ /
+	      6
+	"""
+	def setUp(self):
+		from go_dag_index import go_dag_index
+		self.instance = go_dag_index()
+		self.instance.construct([(1,2), (1,3), (2,4), (3,4), (2,5), (4,6), (5,6)])
+	
+	def test_get_distance(self):
+		from sets import Set
+		#1->3->4 and 1->2->5 share only 1, so 1 is an lca besides 2
+		self.assertEqual(self.instance.get_distance(4, 5), (2, 13, 1, Set([1,2])))
+		#3 is not, both its paths go through 4
+		self.assertEqual(self.instance.get_distance(6, 4), (1, 12, 0, Set([1,2,4])))
+		self.assertEqual(self.instance.is_ancestor(3, 6), 1)
+		self.assertEqual(self.instance.is_ancestor(5, 4), 0)
+	
+	def test_dump_load(self):
+		from go_dag_index import go_dag_index
+		self.instance.dump('/tmp/test_go_dag_index.pickle')
+		instance = go_dag_index('/tmp/test_go_dag_index.pickle')
+		self.assertEqual(instance.get_distance(5, 3), self.instance.get_distance(5, 3))
+	
+class Test_edge_store(unittest.TestCase):
+	"""
+	2026-10-18
+	"""
+	def setUp(self):
+		from codense.edge_store import edge_store_writer, edge_store
+		writer = edge_store_writer('/tmp/test_edge_store')
+		writer.add_edge(3, [5, 2], [1,0,1,0,0,0,0,0,1], [0.5,0.1,0.7,0,0,0,0,0,0.9])
+		writer.add_edge(7, [1, 4], [0,1,0,0,0,0,0,0,0], [0.2,0.6,0,0,0,0,0,0,0])
+		writer.close()
+		self.instance = edge_store('/tmp/test_edge_store')
+	
+	def test_reader(self):
+		from MpiFromDatasetSignatureToPattern import encodeOccurrenceBv
+		self.assertEqual(self.instance.get_edge2occurrence(2, 5), {(5,2):3})
+		self.assertEqual(self.instance.fill_edge2encodedOccurrence({}), \
+			{(5,2):encodeOccurrenceBv([1,0,1,0,0,0,0,0,1]), (1,4):encodeOccurrenceBv([0,1])})
+		row_no = self.instance.find_row_no(2, 5)
+		self.assertEqual(self.instance.get_edge_id(row_no), 3)
+		self.assertEqual(self.instance.get_sig_vector(row_no), [1,0,1,0,0,0,0,0,1])
+		self.assertAlmostEqual(self.instance.get_cor_vector(row_no)[2], 0.7, 6)
+		self.assertEqual(self.instance.find_row_no(2, 4), -1)
+	
+	def test_order_by_runs(self):
+		import random
+		from codense.edge_store import edge_store_writer, edge_store
+		random.seed(2)
+		edge_ls = [[random.randint(1, 30), random.randint(1, 30)] for i in range(200)]
+		writer = edge_store_writer('/tmp/test_edge_store_runs', sort_block_size=17)	#12 runs to merge
+		for i in range(len(edge_ls)):
+			writer.add_edge(i, edge_ls[i], [1,0])
+		writer.close()
+		instance = edge_store('/tmp/test_edge_store_runs')
+		key_ls = [(min(edge), max(edge), i) for i, edge in enumerate(edge_ls)]
+		key_ls.sort()
+		self.assertEqual(instance.get_column('order').tolist(), [key[2] for key in key_ls])
+		self.assertEqual(instance.get_edge2occurrence(2, 5), {})
+		self.assertEqual(len(instance.get_edge2occurrence(0, 1)), len(dict.fromkeys(map(tuple, edge_ls))))
+		instance.close()
+		os.remove('/tmp/test_edge_store_runs')
+	
+class Test_distribution_tail(unittest.TestCase):
+	"""
+	2026-10-18
+		expected values are from exact summation
+	"""
+	def test_phyper(self):
+		from codense.distribution_tail import phyper, phyper_ls
+		self.assertAlmostEqual(phyper(2, 10, 20, 8, lower_tail=0), 0.5480259870064967, 12)
+		self.assertAlmostEqual(phyper(2, 10, 20, 8), 1-0.5480259870064967, 12)
+		self.assertEqual(phyper(8, 10, 20, 8, lower_tail=0), 0.0)
+		self.assertEqual(phyper_ls([-1, 8], 10, 20, 8), [0.0, 1.0])
+	
+	def test_binom(self):
+		from codense.distribution_tail import pbinom, dbinom
+		self.assertAlmostEqual(pbinom(3, 10, 0.2, lower_tail=0, log_p=1), -2.1130075777850923, 12)
+		self.assertAlmostEqual(dbinom(0, 5, 0.5), 1/32.0, 12)
+		self.assertEqual(dbinom(3, 3, 1.0, log=1), 0.0)
+		from codense.distribution_tail import pbinom_log_prob, log_choose
+		self.assertAlmostEqual(pbinom_log_prob(3, 10, math.log(0.2), lower_tail=0, log_p=1), -2.1130075777850923, 12)
+		#prob=exp(-2000) underflows, the tail is dominated by the first term
+		self.assertAlmostEqual(pbinom_log_prob(3, 90, -2000.0, lower_tail=0, log_p=1), log_choose(90, 4)-8000, 8)
+	
+	def test_t(self):
+		from codense.distribution_tail import pt, welch_t_test
+		self.assertAlmostEqual(pt(1, 1), 0.75, 12)	#Cauchy
+		self.assertAlmostEqual(pt(2.5, 2), 0.5+2.5/(2*math.sqrt(2+2.5*2.5)), 12)
+		self.assertAlmostEqual(pt(-2.5, 2, lower_tail=0), 0.5+2.5/(2*math.sqrt(2+2.5*2.5)), 12)
+		self.assertAlmostEqual(welch_t_test([1,2,3,4,5], [2,4,6,8,10]), 0.10753116, 7)
+		self.assertEqual(welch_t_test([1,1,1], [2,2,2]), 1.0)
+	
+class Test_table_bulk_writer(unittest.TestCase):
+	"""
+	2026-10-18
+		a fake cursor records what's sent to the database
+	"""
+	class sql_cursor:
+		def __init__(self):
+			self.sql_ls = []
+		def execute(self, sql):
+			self.sql_ls.append(sql)
+	
+	class copy_cursor(sql_cursor):
+		def copy_from(self, file, table):
+			self.sql_ls.append((table, file.read()))
 	
+	def test_copy(self):
+		from codense.common import table_bulk_writer
+		curs = self.copy_cursor()
+		writer = table_bulk_writer(curs, 'p_gene', ['gene_no', 'lca_list', 'p_value_vector', 'cluster_array'], block_size=2)
+		writer.add_row([1, None, [[0.5, 3], [0.25, 4]], '{1,2}'])
+		writer.add_row([2, [7], [], 'a\tb'])
+		writer.add_row([3, None, [], ''])
+		self.assertEqual(curs.sql_ls, [('p_gene(gene_no, lca_list, p_value_vector, cluster_array)', \
+			'1\t\\N\t{{0.5,3},{0.25,4}}\t{1,2}\n2\t{7}\t{}\ta\\tb\n')])
+		writer.close()
+		self.assertEqual(writer.no_of_rows, 3)
+	
+	def test_update(self):
+		from codense.common import table_bulk_writer
+		curs = self.sql_cursor()
+		writer = table_bulk_writer(curs, 'mcl_result', ['mcl_id', 'connectivity'], update_key='mcl_id')
+		writer.add_row([5, 0.5])
+		writer.close()
+		self.assertEqual(curs.sql_ls[1], "insert into tmp_mcl_result_bulk_update(mcl_id, connectivity) values (5, 0.5)")
+		self.assertEqual(curs.sql_ls[2], "update mcl_result set connectivity=t.connectivity from tmp_mcl_result_bulk_update t \
+where mcl_result.mcl_id=t.mcl_id")
+	
+class temp_dir_test_case(unittest.TestCase):
+	"""
+	2026-10-18
+		self.dir is a fresh temporary directory, removed afterwards
+	"""
+	def setUp(self):
+		import tempfile
+		self.dir = tempfile.mkdtemp()
+	
+	def tearDown(self):
+		import shutil
+		shutil.rmtree(self.dir)
+
+class Test_graph_merge(temp_dir_test_case):
+	"""
+	2026-10-18
+		the streaming merge(type 2) on three small gspan files
+	"""
+	def setUp(self):
+		temp_dir_test_case.setUp(self)
+		self.input_dir = os.path.join(self.dir, 'input')
+		os.mkdir(self.input_dir)
+		graph_list = [['e 3 1 0.8', 'e 2 5 0.7', 'e 1 2 0.6'], ['e 1 3 0.9', 'e 5 2 0.9'], ['e 3 1 0.5', 'e 4 6 0.5']]
+		for i in range(len(graph_list)):
+			of = open(os.path.join(self.input_dir, 'gph_%s'%i), 'w')
+			of.write('t # %s\n'%i)
+			of.write('\n'.join(graph_list[i])+'\n')
+			of.close()
+	
+	def test_stream_run(self):
+		from graph_merge import graph_merge
+		output_fname = os.path.join(self.dir, 'merged')
+		instance = graph_merge(2, self.input_dir, output_fname, type=2, tmp_dir=self.dir, block_size=1)
+		instance.run()
+		line_list = open(output_fname).readlines()
+		self.assertEqual(line_list[0][:4], 't # ')
+		self.assertEqual(line_list[1:], ['e 1 3 3\n', 'e 2 5 2\n'])
+
+class Test_triplet_counting(temp_dir_test_case):
+	"""
+	2026-10-18
+		hash-partitioned counting(type 0) against the old multi-pass(type 1)
+		and the text/binary triplet records
+	"""
+	def setUp(self):
+		temp_dir_test_case.setUp(self)
+		self.triplet_fname = os.path.join(self.dir, 'triplets')
+		of = open(self.triplet_fname, 'w')
+		of.write('1,2,3\n4,5,6\n1,2,3\n2,3,9\n1,2,3\n4,5,6\n7,8,10\n')
+		of.close()
+	
+	def test_partition_run(self):
+		sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'triplet'))
+		from triplet_counting import triplet_counting
+		for type, output_dir, no_of_processes in [(1, 'old', 1), (0, 'new', 1), (0, 'parallel', 2)]:
+			instance = triplet_counting(self.triplet_fname, os.path.join(self.dir, output_dir), 2, 0, self.dir, \
+				type=type, no_of_buckets=3, no_of_processes=no_of_processes)
+			instance.run()
+		for output_dir in ['old', 'new', 'parallel']:
+			freq2lines = {}
+			for i in range(1,4):
+				lines = open(os.path.join(self.dir, output_dir, 'triplet_%s'%i)).readlines()
+				lines.sort()
+				freq2lines[i] = lines
+			self.assertEqual(freq2lines, {1:['2,3,9\n', '7,8,10\n'], 2:['4,5,6\n'], 3:['1,2,3\n']})
+	
+	def test_triplet_record(self):
+		sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'triplet'))
+		from triplet_record import convert, open_triplet_file, triplet_reader
+		binary_fname = os.path.join(self.dir, 'triplets.bin')
+		text_fname = os.path.join(self.dir, 'triplets.txt')
+		convert(self.triplet_fname, binary_fname, binary=1)
+		convert(binary_fname, text_fname, binary=0)
+		self.assertEqual(open(text_fname).read(), open(self.triplet_fname).read())
+		reader = triplet_reader(open_triplet_file(binary_fname))
+		self.assertEqual(reader.binary, 1)
+		self.assertEqual(list(reader)[-2:], [(4,5,6), (7,8,10)])
+
+class Test_pattern_record(temp_dir_test_case):
+	"""
+	2026-10-18
+	"""
+	def setUp(self):
+		temp_dir_test_case.setUp(self)
+		self.text_fname = os.path.join(self.dir, 'pattern.txt')
+		self.binary_fname = os.path.join(self.dir, 'pattern.bin')
+		outf = open(self.text_fname, 'w')
+		outf.write('[3, 5, 9]\t[[3, 5], [5, 9]]\t[1.0, 0.0, 0.5]\t000102010001020100\n')
+		outf.write('[4, 6]\t[[4, 6]]\t[0.5]\t[[0, 1], [1, 0]]\n')
+		outf.write('[1, 2]\t[(1, 2)]\n')	#MpiFromDatasetSignatureToPattern.py's output
+		outf.close()
+	
+	def test_convert(self):
+		from codense.pattern_record import convert, pattern_reader, d_matrix_bytes2rows
+		convert(self.text_fname, self.binary_fname)
+		reader = pattern_reader(self.binary_fname)
+		self.assertEqual(len(reader), 3)
+		vertex_set, edge_set, recurrence_array, d_matrix_bytes = reader[0]
+		self.assertEqual(vertex_set, [3, 5, 9])
+		self.assertEqual(edge_set, [[3, 5], [5, 9]])
+		self.assertEqual(recurrence_array, [1.0, 0.0, 0.5])
+		self.assertEqual(d_matrix_bytes2rows(d_matrix_bytes, 3), [[0, 1, 2], [1, 0, 1], [2, 1, 0]])
+		self.assertEqual(reader[2], [[1, 2], [[1, 2]], [], ''])
+		self.assertEqual(list(reader)[1], reader[1])
+		#round trip through text
+		convert(self.binary_fname, self.text_fname, to_text=1)
+		convert(self.text_fname, self.binary_fname+'2')
+		self.assertEqual(open(self.binary_fname, 'rb').read(), open(self.binary_fname+'2', 'rb').read())
+	
+	def test_offset_index(self):
+		from codense.pattern_record import pattern_writer, pattern_reader
+		writer = pattern_writer(self.binary_fname)
+		for i in range(100):
+			writer.write(range(i, i+3), [[i, i+1], [i+1, i+2]], [float(i)], [[0,1,2],[1,0,1],[2,1,0]])
+		writer.close()
+		self.assertEqual(pattern_reader(self.binary_fname)[57][0], [57, 58, 59])
+		os.remove(self.binary_fname+'.index')	#rebuilt by scanning
+		reader = pattern_reader(self.binary_fname)
+		self.assertEqual(len(reader), 100)
+		self.assertEqual(reader[99][2], [99.0])
+
+class Test_packed_genome(temp_dir_test_case):
+	"""
+	2026-10-18
+	"""
+	def setUp(self):
+		import random
+		temp_dir_test_case.setUp(self)
+		self.fname = os.path.join(self.dir, 'genome.packed_genome')
+		random.seed(1)
+		self.chunk_ls = [''.join([random.choice('ACGTacgtNnRY') for i in range(10)]) for j in range(7)]
+		self.chunk_ls[2] = 'NNNNNNNNNN'
+		self.chunk_ls[3] = 'NNNacgtaaC'
+		self.chunk_ls[-1] = 'GATt'
+	
+	def test_get_segment(self):
+		from codense.packed_genome import packed_genome_writer, packed_genome
+		writer = packed_genome_writer(self.fname)
+		writer.begin_sequence('NC_1.1')
+		for chunk in self.chunk_ls:
+			writer.add(chunk)
+		writer.begin_sequence('NC_2.1')
+		writer.add('acgtN')
+		writer.close()
+		genome = packed_genome(self.fname)
+		seq = ''.join(self.chunk_ls)
+		self.assertEqual(genome.get_length('NC_1.1'), len(seq))
+		for start in range(1, len(seq)+1):
+			for stop in range(start, len(seq)+3):
+				self.assertEqual(genome.get_segment('NC_1.1', start, stop), seq[start-1:stop])
+		self.assertEqual(genome.get_segment('NC_2.1', 1, 100), 'acgtN')
+		self.assertEqual(genome.get_segment('NC_3.1', 1, 100), None)
+		genome.close()
+	
+	def test_get_sequence_segment(self):
+		from codense.common import get_sequence_segment, byte_lru_cache, lru_cache
+		class fake_cursor:
+			def __init__(self, chunk_ls):
+				self.chunk_ls = chunk_ls
+				self.query_ls = []
+			def execute(self, query):
+				self.query_ls.append(query)
+				if query.find('annot_assembly')!=-1:
+					self.rows = [('NC_1.1', 1, 64, 101)]
+				else:
+					first_id, last_id = map(int, query.split()[-3::2])
+					self.rows = [(id, self.chunk_ls[id-101]) for id in range(first_id, last_id+1)]
+			def fetchall(self):
+				return self.rows
+		curs = fake_cursor(self.chunk_ls)
+		chunk_cache = byte_lru_cache(30)
+		assembly_cache = lru_cache(10)	#not the module-wide annot_assembly_cache
+		seq = ''.join(self.chunk_ls)
+		self.assertEqual(get_sequence_segment(curs, 1, 1, 64, chunk_size=10, chunk_cache=chunk_cache, \
+			assembly_cache=assembly_cache), seq)
+		self.assertEqual(len(chunk_cache), 3)	#only 3 chunks fit in 30 bytes
+		self.assertEqual(chunk_cache.no_of_bytes, 24)
+		curs.query_ls = []
+		self.assertEqual(get_sequence_segment(curs, 1, 70, 55, chunk_size=10, chunk_cache=chunk_cache, \
+			assembly_cache=assembly_cache), seq[54:][::-1])
+		self.assertEqual(curs.query_ls, [])	#all from the cache
+		self.assertEqual(get_sequence_segment(curs, 1, 10, 11, chunk_size=10, chunk_cache=chunk_cache, \
+			assembly_cache=assembly_cache), seq[9:11])
+		self.assertEqual(len(curs.query_ls), 1)
+
+class Test_AugmentPatternByProtInteraction(unittest.TestCase):
+	"""
+	2026-10-18
+	"""
+	def setUp(self):
+		from AugmentPatternByProtInteraction import AugmentPatternByProtInteraction, csr_graph
+		self.instance = AugmentPatternByProtInteraction()
+		self.csr = csr_graph([(1,2), (2,3), (3,4), (4,5), (3,6), (2,1), (10,11), (21,22), (22,23), (21,23), (7,7)])
+	
+	def test_csr_graph(self):
+		self.assertEqual(len(self.csr), 11)
+		self.assertEqual(self.csr.number_of_edges(), 9)
+		self.assertEqual(self.csr.has_node(7), False)
+		index2 = self.csr.node2index[2]
+		neighbor_ls = self.csr.neighbor_array[self.csr.offset_array[index2]:self.csr.offset_array[index2+1]].tolist()
+		neighbor_ls = [self.csr.index2node[i] for i in neighbor_ls]
+		neighbor_ls.sort()
+		self.assertEqual(neighbor_ls, [1, 3])
+	
+	def test_augment_pattern_by_prot_interaction(self):
+		vertex_set, edge_set = self.instance.augment_pattern_by_prot_interaction([1, 4, 5, 10, 11, 99], self.csr)
+		self.assertEqual(vertex_set, [1, 2, 3, 4, 5, 10, 11])
+		self.assertEqual(edge_set, [[1, 2], [2, 3], [3, 4], [4, 5], [10, 11]])
+		self.assertEqual(self.instance.augment_pattern_by_prot_interaction([1, 4, 5, 10, 11, 99], self.csr, steiner=1), \
+			(vertex_set, edge_set))
+		vertex_set, edge_set = self.instance.augment_pattern_by_prot_interaction([21, 22, 23], self.csr)
+		self.assertEqual(edge_set, [[21, 22], [21, 23], [22, 23]])
+		vertex_set, edge_set = self.instance.augment_pattern_by_prot_interaction([21, 22, 23], self.csr, steiner=1)
+		self.assertEqual(vertex_set, [21, 22, 23])
+		self.assertEqual(len(edge_set), 2)
+
+class Test_cluster_bs_analysis(unittest.TestCase):
+	"""
+	2026-10-18
+		bitset counts against Set intersections
+	"""
+	def setUp(self):
+		import random
+		from sets import Set
+		random.seed(5)
+		self.gene_no2bs_no_set = {}
+		self.bs_no2gene_no_set = {}
+		for gene_no in range(1, 81):
+			bs_no_set = Set(random.sample(range(1, 9), random.randint(0, 4)))
+			self.gene_no2bs_no_set[gene_no] = bs_no_set
+			for bs_no in bs_no_set:
+				if bs_no not in self.bs_no2gene_no_set:
+					self.bs_no2gene_no_set[bs_no] = Set()
+				self.bs_no2gene_no_set[bs_no].add(gene_no)
+		#a cluster enriched in bs_no 1 and 2
+		self.gene_no_list = range(1, 12)
+		for gene_no in self.gene_no_list:
+			self.gene_no2bs_no_set[gene_no] |= Set([1, 2])
+			self.bs_no2gene_no_set[1].add(gene_no)
+			self.bs_no2gene_no_set[2].add(gene_no)
+	
+	def test_co_occurrence(self):
+		from TF_functions import bs_bitset_index
+		instance = bs_bitset_index(self.gene_no2bs_no_set, self.bs_no2gene_no_set)
+		for bs_no1 in self.bs_no2gene_no_set:
+			for bs_no2 in self.bs_no2gene_no_set:
+				self.assertEqual(instance.get_co_occurrence(bs_no1, bs_no2), \
+					len(self.bs_no2gene_no_set[bs_no1]&self.bs_no2gene_no_set[bs_no2]))
+	
+	def test_cluster_bs_analysis(self):
+		from sets import Set
+		from TF_functions import bs_bitset_index, cluster_bs_analysis
+		instance = bs_bitset_index(self.gene_no2bs_no_set, self.bs_no2gene_no_set)
+		ls_with_index = cluster_bs_analysis(self.gene_no_list, self.gene_no2bs_no_set, self.bs_no2gene_no_set, \
+			p_value_cut_off=0.05, bs_bitset_index_instance=instance)
+		ls_without_index = cluster_bs_analysis(self.gene_no_list, self.gene_no2bs_no_set, self.bs_no2gene_no_set, \
+			p_value_cut_off=0.05)
+		self.assertEqual(ls_with_index, ls_without_index)
+		combo_row_ls = [row for row in ls_with_index if len(row[2])==2]
+		self.assert_([1, 2] in [row[2] for row in combo_row_ls])
+		gene_no_set = Set(self.gene_no_list)
+		no_of_total_genes = float(len(self.gene_no2bs_no_set))
+		for row in combo_row_ls:
+			bs_no1, bs_no2 = row[2]
+			combo_set_local = gene_no_set&self.bs_no2gene_no_set[bs_no1]&self.bs_no2gene_no_set[bs_no2]
+			self.assertEqual(Set(row[3]), combo_set_local)
+			self.assertEqual(row[5], len(combo_set_local)/float(len(self.gene_no_list)))
+			self.assertEqual(row[4], len(self.bs_no2gene_no_set[bs_no1]&self.bs_no2gene_no_set[bs_no2])/no_of_total_genes)
+
+class Test_biclustering(unittest.TestCase):
+	"""
+	2026-10-18
+		scoring() on the incrementally maintained sums against the mean squared residue from scratch
+	"""
+	def get_HScore(self, matrix, row_index_list, column_index_list):
+		sub_matrix = [[matrix[i][j] for j in column_index_list] for i in row_index_list]
+		no_of_rows = len(row_index_list)
+		no_of_columns = len(column_index_list)
+		row_mean_ls = [sum(row)/no_of_columns for row in sub_matrix]
+		column_mean_ls = [sum([row[j] for row in sub_matrix])/no_of_rows for j in range(no_of_columns)]
+		mean = sum(row_mean_ls)/no_of_rows
+		HScore = 0.0
+		for i in range(no_of_rows):
+			for j in range(no_of_columns):
+				HScore += (sub_matrix[i][j]-row_mean_ls[i]-column_mean_ls[j]+mean)**2
+		return HScore/(no_of_rows*no_of_columns)
+	
+	def test_scoring(self):
+		import random
+		from array import array
+		from graph.biclustering import biclustering
+		random.seed(4)
+		no_of_rows, no_of_columns = 12, 9
+		matrix = [[float(random.randint(-800, 800)) for j in range(no_of_columns)] for i in range(no_of_rows)]
+		matrix_buffer = array('d')
+		for row in matrix:
+			matrix_buffer.extend(row)
+		instance = biclustering(0.01, 2, 2, 100)
+		instance.data_read_in_buffer(matrix_buffer, no_of_rows, no_of_columns, 0, 0)
+		instance.reset_sums()
+		instance.scoring()
+		row_index_list = range(no_of_rows)
+		column_index_list = range(no_of_columns)
+		self.assertAlmostEqual(instance.HScore, self.get_HScore(matrix, row_index_list, column_index_list), 2)
+		for i, j in [(3, 0), (7, 8), (0, 4), (11, 5)]:	#interleaved deletions
+			instance.remove_row(i)
+			row_index_list.remove(i)
+			instance.remove_column(j)
+			column_index_list.remove(j)
+			instance.scoring()
+			self.assertAlmostEqual(instance.HScore, self.get_HScore(matrix, row_index_list, column_index_list), 2)
+		sub_matrix_sum = sum([matrix[i][j] for i in row_index_list for j in column_index_list])
+		self.assertAlmostEqual(instance.mean, sub_matrix_sum/(len(row_index_list)*len(column_index_list)), 4)
+
 if __name__ == '__main__':
 	if len(sys.argv) == 1:
 		print __doc__
@@ -1411,7 +2058,19 @@ if __name__ == '__main__':
 		23: Test_get_neighbor_set,
 		24: Test_distinct_go_no_list_based_on_neighbor_set_graph,
 		25: Test_PostFim,
-		26: Test_johnson_sp}
+		26: Test_johnson_sp,
+		27: Test_local_node_run,
+		28: Test_go_dag_index,
+		29: Test_edge_store,
+		30: Test_distribution_tail,
+		31: Test_table_bulk_writer,
+		32: Test_graph_merge,
+		33: Test_triplet_counting,
+		34: Test_pattern_record,
+		35: Test_packed_genome,
+		36: Test_AugmentPatternByProtInteraction,
+		37: Test_cluster_bs_analysis,
+		38: Test_biclustering}
 	type = 0
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
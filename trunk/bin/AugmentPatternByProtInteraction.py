@@ -13,6 +13,7 @@ Option:
 	-y ...,	type of input table, 1(default, good_cluster) or 2(pattern_table)
 	-p ...,	running type, 1(default), 2, 3, 4 (details see below)
 	-x ...,	tax_id, 9606(default)
+	-s,	running_type 1 augments by an approximate Steiner tree, not all pairwise shortest paths
 	-c,	commit
 	-b,	debug version.
 	-r,	enable report flag
@@ -55,16 +56,97 @@ else:   #32bit
 import sys, os, getopt, csv, math
 from codense.common import db_connect, pg_1d_array2python_ls, return_vertex_set_string, return_edge_set_string
 from sets import Set
-import networkx as nx
-from DrawPredGOExptTFCompTF_Patterns import DrawPredGOExptTFCompTF_Patterns
-import rpy
+from array import array
+from codense.distribution_tail import phyper
+
+class csr_graph:
+	"""
+	2026-10-18
+		undirected graph in compressed sparse row form, nodes are numbered 0..n-1 in the order they appear.
+		neighbors of node i are neighbor_array[offset_array[i]:offset_array[i+1]].
+		self loops and duplicate edges are dropped.
+	"""
+	def __init__(self, edge_list):
+		self.node2index = {}
+		self.index2node = []
+		index_edge_set = Set()
+		for u, v in edge_list:
+			if u==v:
+				continue
+			for node in (u, v):
+				if node not in self.node2index:
+					self.node2index[node] = len(self.index2node)
+					self.index2node.append(node)
+			i, j = self.node2index[u], self.node2index[v]
+			if i>j:
+				i, j = j, i
+			index_edge_set.add((i, j))
+		no_of_nodes = len(self.index2node)
+		degree_ls = [0]*no_of_nodes
+		for i, j in index_edge_set:
+			degree_ls[i] += 1
+			degree_ls[j] += 1
+		self.offset_array = array('l', [0]*(no_of_nodes+1))
+		for i in range(no_of_nodes):
+			self.offset_array[i+1] = self.offset_array[i] + degree_ls[i]
+		self.neighbor_array = array('l', [0]*self.offset_array[-1])
+		next_slot_ls = self.offset_array.tolist()
+		for i, j in index_edge_set:
+			self.neighbor_array[next_slot_ls[i]] = j
+			next_slot_ls[i] += 1
+			self.neighbor_array[next_slot_ls[j]] = i
+			next_slot_ls[j] += 1
+	
+	def __len__(self):
+		return len(self.index2node)
+	
+	def number_of_edges(self):
+		return len(self.neighbor_array)/2
+	
+	def has_node(self, node):
+		return node in self.node2index
+	
+	def nodes(self):
+		return self.index2node
+	
+	def bfs(self, source_index_ls, target_index_set, stop_at_first=0):
+		"""
+		2026-10-18
+			multi-source breadth-first search, stops once all targets(or the first one if stop_at_first) are reached.
+			return (index2predecessor, found_target_ls). sources have predecessor -1.
+		"""
+		index2predecessor = {}
+		found_target_ls = []
+		for source in source_index_ls:
+			index2predecessor[source] = -1
+		no_of_targets_to_find = len(target_index_set)
+		if stop_at_first:
+			no_of_targets_to_find = min(1, no_of_targets_to_find)
+		offset_array = self.offset_array
+		neighbor_array = self.neighbor_array
+		frontier = list(source_index_ls)
+		while frontier and len(found_target_ls)<no_of_targets_to_find:
+			next_frontier = []
+			for u in frontier:
+				for v in neighbor_array[offset_array[u]:offset_array[u+1]]:
+					if v not in index2predecessor:
+						index2predecessor[v] = u
+						next_frontier.append(v)
+						if v in target_index_set:
+							found_target_ls.append(v)
+							if len(found_target_ls)>=no_of_targets_to_find:
+								return index2predecessor, found_target_ls
+			frontier = next_frontier
+		return index2predecessor, found_target_ls
 
 class AugmentPatternByProtInteraction:
 	def __init__(self,hostname='zhoudb', dbname='graphdb', schema=None, \
 		input_table=None, output_table=None, prot_interaction_table=None, \
-		input_type=1, running_type=1, tax_id=9606, need_commit=0, debug=0, report=0):
+		input_type=1, running_type=1, tax_id=9606, need_commit=0, debug=0, report=0, steiner=0):
 		"""
 		2006-12-18
+		2026-10-18
+			add steiner
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -78,34 +160,119 @@ class AugmentPatternByProtInteraction:
 		self.need_commit = int(need_commit)
 		self.debug = int(debug)
 		self.report = int(report)
+		self.steiner = int(steiner)
 	
-	def augment_pattern_by_prot_interaction(self, vertex_set, prot_interaction_graph):
-		g = nx.Graph()
-		no_of_nodes = len(vertex_set)
-		for m in range(no_of_nodes):
-			for n in range(m+1, no_of_nodes):
-				u = vertex_set[m]
-				v = vertex_set[n]
-				if prot_interaction_graph.has_node(u) and prot_interaction_graph.has_node(v):
-					shortest_path_list = nx.shortest_path(prot_interaction_graph, u, v)
-					if shortest_path_list:	#check the whole shortest path
-						for i in range(len(shortest_path_list)-1):
-							if not g.has_edge(shortest_path_list[i], shortest_path_list[i+1]):
-								g.add_edge(shortest_path_list[i], shortest_path_list[i+1])
-		new_vertex_set = []
-		for v in g:
-			new_vertex_set.append(v)
-		new_vertex_set.sort()
+	def augment_pattern_by_prot_interaction(self, vertex_set, prot_interaction_csr, steiner=0):
+		"""
+		2026-10-18
+			prot_interaction_csr is a csr_graph, not a networkx graph any more.
+			one BFS per pattern vertex, whose predecessor tree gives the shortest paths to all later pattern vertices,
+			instead of one shortest_path() per pair.
+			steiner=1: approximate Steiner tree(grow a tree from the first vertex by the nearest remaining
+				pattern vertex, one multi-source BFS each step) instead of the union of pairwise shortest paths.
+		"""
+		index_ls = []
+		for v in vertex_set:
+			if prot_interaction_csr.has_node(v):
+				index = prot_interaction_csr.node2index[v]
+				if index not in index_ls:
+					index_ls.append(index)
+		if steiner:
+			index_edge_set = self.get_steiner_tree_edge_set(index_ls, prot_interaction_csr)
+		else:
+			index_edge_set = self.get_pairwise_shortest_path_edge_set(index_ls, prot_interaction_csr)
+		index2node = prot_interaction_csr.index2node
+		new_vertex_set = Set()
 		new_edge_set = []
-		for (u, v) in g.edges():
+		for (i, j) in index_edge_set:
+			u, v = index2node[i], index2node[j]
+			new_vertex_set.add(u)
+			new_vertex_set.add(v)
 			if u<=v:
 				edge_tuple = [u, v]
 			else:
 				edge_tuple = [v, u]
 			new_edge_set.append(edge_tuple)
+		new_vertex_set = list(new_vertex_set)
+		new_vertex_set.sort()
 		new_edge_set.sort()
 		return new_vertex_set, new_edge_set
 	
+	def get_pairwise_shortest_path_edge_set(self, index_ls, prot_interaction_csr):
+		"""
+		2026-10-18
+			union of the edges of one shortest path between each pair in index_ls
+		"""
+		index_edge_set = Set()
+		for m in range(len(index_ls)-1):
+			target_index_set = Set(index_ls[m+1:])
+			index2predecessor, found_target_ls = prot_interaction_csr.bfs([index_ls[m]], target_index_set)
+			walked_index_set = Set()
+			for target in found_target_ls:
+				v = target
+				while v not in walked_index_set and index2predecessor[v]!=-1:	#the rest of the path is already in
+					walked_index_set.add(v)
+					u = index2predecessor[v]
+					index_edge_set.add((min(u, v), max(u, v)))
+					v = u
+		return index_edge_set
+	
+	def get_steiner_tree_edge_set(self, index_ls, prot_interaction_csr):
+		"""
+		2026-10-18
+			shortest path heuristic(Takahashi & Matsuyama). pattern vertices in different components
+			end up in different trees.
+		"""
+		index_edge_set = Set()
+		remaining_index_set = Set(index_ls)
+		for start in index_ls:
+			if start not in remaining_index_set:
+				continue
+			remaining_index_set.remove(start)
+			tree_index_set = Set([start])
+			while remaining_index_set:
+				index2predecessor, found_target_ls = prot_interaction_csr.bfs(list(tree_index_set), \
+					remaining_index_set, stop_at_first=1)
+				if not found_target_ls:
+					break
+				v = found_target_ls[0]
+				while v not in tree_index_set:
+					tree_index_set.add(v)
+					remaining_index_set.discard(v)	#other pattern vertices on the way
+					u = index2predecessor[v]
+					index_edge_set.add((min(u, v), max(u, v)))
+					v = u
+		return index_edge_set
+	
+	def get_prot_interaction_csr(self, curs, prot_interaction_table, tax_id):
+		"""
+		2026-10-18
+			same table as DrawPredGOExptTFCompTF_Patterns.get_prot_interaction_graph(), into a csr_graph
+		"""
+		sys.stderr.write("Getting protein interaction graph ...\n")
+		curs.execute("DECLARE crs0 CURSOR for select gene_id_array, interaction_type_id\
+			from %s where tax_id=%s"%(prot_interaction_table, tax_id))
+		curs.execute("fetch 3000 from crs0")
+		rows = curs.fetchall()
+		edge_list = []
+		counter = 0
+		while rows:
+			for row in rows:
+				gene_id_array, interaction_type_id = row
+				gene_id_array = pg_1d_array2python_ls(gene_id_array)
+				for i in range(len(gene_id_array)):
+					for j in range(i+1, len(gene_id_array)):
+						edge_list.append((gene_id_array[i], gene_id_array[j]))
+				counter += 1
+			if self.report:
+				sys.stderr.write("%s%s"%('\x08'*20, counter))
+			curs.execute("fetch 3000 from crs0")
+			rows = curs.fetchall()
+		curs.execute("close crs0")
+		prot_interaction_csr = csr_graph(edge_list)
+		sys.stderr.write("%s nodes, %s edges, Done.\n"%(len(prot_interaction_csr), prot_interaction_csr.number_of_edges()))
+		return prot_interaction_csr
+	
 	def create_aug_pi_table(self, curs, table):
 		sys.stderr.write("Creating table %s..."%table)
 		curs.execute("create table %s(\
@@ -200,13 +367,15 @@ class AugmentPatternByProtInteraction:
 		k = len(vertex_set)
 		if self.debug:
 			sys.stderr.write("Done.\n")
-		return rpy.r.phyper(x, n, m, k, lower_tail=rpy.r.FALSE, log_p=rpy.r.TRUE)
+		return phyper(x, n, m, k, lower_tail=0, log_p=1)
 	
 	def batch_augment_all_patterns(self, curs, output_table, prot_interaction_graph, \
 			running_type, total_vertex_set, prot_int_vertex_set):
 		"""
 		2006-12-28
 			add running_type==2
+		2026-10-18
+			prot_interaction_graph is a csr_graph
 		"""
 		sys.stderr.write("Augment patterns ...\n")
 		curs.execute("fetch 1000 from crs")
@@ -219,7 +388,8 @@ class AugmentPatternByProtInteraction:
 				vertex_set = vertex_set[1:-1].split(',')
 				vertex_set = map(int, vertex_set)
 				if running_type==1:
-					new_vertex_set, new_edge_set = self.augment_pattern_by_prot_interaction(vertex_set, prot_interaction_graph)
+					new_vertex_set, new_edge_set = self.augment_pattern_by_prot_interaction(vertex_set, \
+						prot_interaction_graph, self.steiner)
 					self.submit_aug_pi_graph(curs, output_table, mcl_id, new_vertex_set, new_edge_set)
 				elif running_type in [2,3,4]:
 					log_p_value = self.cal_pi_hg_p_value(vertex_set, prot_int_vertex_set, total_vertex_set)
@@ -248,7 +418,7 @@ class AugmentPatternByProtInteraction:
 			
 		--db_connect()
 		--create_aug_pi_table()
-		--get_prot_interaction_graph()
+		--get_prot_interaction_csr()
 		--batch_augment_all_patterns()
 			--augment_pattern_by_prot_interaction()
 			--submit_aug_pi_graph()
@@ -269,9 +439,7 @@ class AugmentPatternByProtInteraction:
 			curs.execute("DECLARE crs CURSOR FOR select id, vertex_set from %s"%self.input_table)
 		
 		if self.running_type in [1,2]:
-			DrawPredGOExptTFCompTF_Patterns_instance = DrawPredGOExptTFCompTF_Patterns()
-			prot_interaction_graph = DrawPredGOExptTFCompTF_Patterns_instance.get_prot_interaction_graph(\
-				curs, self.prot_interaction_table, self.tax_id)
+			prot_interaction_graph = self.get_prot_interaction_csr(curs, self.prot_interaction_table, self.tax_id)
 		else:
 			prot_interaction_graph = None
 		
@@ -302,7 +470,7 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:n:y:p:x:cbr", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:n:y:p:x:scbr", ["help", "hostname=", \
 			"dbname=", "schema="])
 	except:
 		print __doc__
@@ -320,6 +488,7 @@ if __name__ == '__main__':
 	commit = 0
 	debug = 0
 	report = 0
+	steiner = 0
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -342,6 +511,8 @@ if __name__ == '__main__':
 			running_type = int(arg)
 		elif opt in ("-x",):
 			tax_id = int(arg)
+		elif opt in ("-s",):
+			steiner = 1
 		elif opt in ("-c",):
 			commit = 1
 		elif opt in ("-b",):
@@ -351,7 +522,7 @@ if __name__ == '__main__':
 	if schema and input_table and output_table:
 			instance = AugmentPatternByProtInteraction(hostname, dbname, schema, \
 				input_table, output_table, prot_interaction_table, input_type, \
-				running_type, tax_id, commit, debug, report)
+				running_type, tax_id, commit, debug, report, steiner)
 			instance.run()
 	else:
 		print __doc__
@@ -14,6 +14,8 @@ Option:
 	-x ..., --max_sup=...	maximum support of an edge, 200(default)
 	-y ...,	parser type, 1(MpiFromDatasetSignatureToPattern.py's output, default),
 		2(haifeng's version, output of ccomp.py)
+	-e ...,	d_matrix type, 1(hex string of the unsigned char matrix, default), 0(python list)
+	-f ...,	output format, 0(tab-delimited text, default), 1(binary, codense/pattern_record.py)
 	-n,	output_table is new(IGNORE)
 	-c,	commit the database transaction(IGNORE)
 	-b,	debug version.
@@ -29,6 +31,14 @@ Description:
 	It's actually all to all shortest path. But BGL's python binding don't offer
 	all_pairs shortest path, so use BFS.
 	
+	2026-10-18
+		johnson_sp does one BFS per vertex now. d_matrix(4th column) is by default the hex
+		form of the row-major unsigned char matrix(255=unreachable), codense.common.string2d_matrix()
+		reads both this and the old python-list form.
+	
+	2026-10-18
+		-f 1 writes the binary pattern file of codense/pattern_record.py(d_matrix is stored
+		raw, -e is ignored). A binary inputfile is detected and read by pattern_parser().
 """
 import sys, os, math
 bit_number = math.log(sys.maxint)/math.log(2)
@@ -41,7 +51,8 @@ else:   #32bit
 import sys, os, getopt, csv, Numeric, cPickle
 from Scientific import MPI
 from codense.common import mpi_synchronize, db_connect, output_node, \
-	form_schema_tables, input_node, computing_node
+	form_schema_tables, input_node, computing_node, d_matrix_bytes2string
+from codense.pattern_record import pattern_writer, pattern_reader, is_pattern_file
 from sets import Set
 from graph.johnson_sp import johnson_sp
 from MpiFromDatasetSignatureToPattern import MpiFromDatasetSignatureToPattern
@@ -83,10 +94,14 @@ class MpiBFSCluster:
 	"""
 	def __init__(self,hostname='zhoudb', dbname='graphdb', schema=None, inputfile=None,\
 		outputfile=None, size=2000, sig_vector_fname=None, min_sup=0, max_sup=200, parser_type=1,\
-		new_table=0, commit=0, debug=0, report=0):
+		new_table=0, commit=0, debug=0, report=0, d_matrix_type=1, output_format=0):
 		"""
 		2006-08-22
 			add parser_type
+		2026-10-18
+			add d_matrix_type
+		2026-10-18
+			add output_format
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -98,13 +113,16 @@ class MpiBFSCluster:
 		self.min_sup = int(min_sup)
 		self.max_sup = int(max_sup)
 		self.parser_type = int(parser_type)
+		self.d_matrix_type = int(d_matrix_type)
+		self.output_format = int(output_format)
 		self.new_table = int(new_table)
 		self.commit = int(commit)
 		self.debug = int(debug)
 		self.report = int(report)
 		
 		self.parser_dict = {1: self.default_parser,
-			2: self.haifeng_parser}
+			2: self.haifeng_parser,
+			3: self.pattern_parser}
 	
 	def input_handler(self, parameter_list, message_size, report=0):
 		"""
@@ -124,6 +142,20 @@ class MpiBFSCluster:
 			sys.stderr.write("Fetching done.\n")
 		return block
 	
+	def get_d_matrix(self, j_instance, vertex_set, edge_set):
+		"""
+		2026-10-18
+			encode the shortest distance matrix according to self.d_matrix_type
+		2026-10-18
+			raw unsigned chars for the binary output
+		"""
+		if self.output_format==1:
+			return j_instance.py_shortest_distance_string(vertex_set, edge_set)
+		elif self.d_matrix_type==1:
+			return d_matrix_bytes2string(j_instance.py_shortest_distance_string(vertex_set, edge_set))
+		else:
+			return j_instance.py_shortest_distance(vertex_set, edge_set)
+	
 	def default_parser(self, row, j_instance, cfbo_instance):
 		"""
 		2006-08-22
@@ -134,13 +166,27 @@ class MpiBFSCluster:
 		for i in range(len(edge_set)):
 			edge_set[i] = edge_set[i].split(',')
 			edge_set[i] = map(int, edge_set[i])
+		return self.cc_parser(edge_set, j_instance, cfbo_instance)
+	
+	def pattern_parser(self, row, j_instance, cfbo_instance):
+		"""
+		2026-10-18
+			row is a decoded record of the binary pattern file, nothing to parse
+		"""
+		return self.cc_parser(row[1], j_instance, cfbo_instance)
+	
+	def cc_parser(self, edge_set, j_instance, cfbo_instance):
+		"""
+		2026-10-18
+			split out of default_parser()
+		"""
 		#04-27-06, work on each connected component
 		result = []
 		cfe_instance= cc_from_edge_list()
 		cfe_instance.run(edge_set)
 		for cc_edge_list in cfe_instance.cc_list:
 			vertex_set = cfbo_instance.vertex_set_from_cc_edge_list(cc_edge_list)
-			D = j_instance.py_shortest_distance(vertex_set,cc_edge_list)
+			D = self.get_d_matrix(j_instance, vertex_set, cc_edge_list)	#2026-10-18
 			recurrence_array = j_instance.py_recurrence_list()	#MUST be after py_shortest_distance()
 			cc_edge_list.sort()	#10-28-05 to ease codense2db.py	#01-01-06
 			output_row = [vertex_set, cc_edge_list, recurrence_array, D]	#10-28-05, #01-01-06
@@ -164,7 +210,7 @@ class MpiBFSCluster:
 			edge_set[i].sort()
 		edge_set.sort()
 		
-		D = j_instance.py_shortest_distance(vertex_set, edge_set)
+		D = self.get_d_matrix(j_instance, vertex_set, edge_set)	#2026-10-18
 		recurrence_array = j_instance.py_recurrence_list()	#MUST be after py_shortest_distance()
 		output_row = [vertex_set, edge_set, recurrence_array, D]	#10-28-05, #01-01-06
 		result = [output_row]
@@ -308,18 +354,31 @@ class MpiBFSCluster:
 		
 		mpi_synchronize(communicator)
 		
+		binary_input = is_pattern_file(self.inputfile)	#2026-10-18
+		if binary_input:
+			parser_type = 3
+		else:
+			parser_type = self.parser_type
 		if node_rank == 0:
-			inf = csv.reader(open(self.inputfile,'r'), delimiter='\t')
+			if binary_input:
+				inf = iter(pattern_reader(self.inputfile))	#input_handler() resumes it
+			else:
+				inf = csv.reader(open(self.inputfile,'r'), delimiter='\t')
 			parameter_list = [inf]
 			input_node(communicator, parameter_list, free_computing_nodes, self.size, self.report, input_handler=self.input_handler)
 			del inf
 		elif node_rank in free_computing_nodes:	#exclude the last node
-			parameter_list = [j_instance, self.parser_type]
+			parameter_list = [j_instance, parser_type]
 			computing_node(communicator, parameter_list, self.node_fire, self.cleanup_handler, self.report)
 		elif node_rank==communicator.size-1:
-			writer = csv.writer(open(self.outputfile, 'w'), delimiter='\t')
+			if self.output_format==1:
+				writer = pattern_writer(self.outputfile)
+			else:
+				writer = csv.writer(open(self.outputfile, 'w'), delimiter='\t')
 			parameter_list = [writer]
 			output_node(communicator, free_computing_nodes, parameter_list, self.output_handler, self.report)
+			if self.output_format==1:
+				writer.close()	#2026-10-18 writes the offset index
 			del writer
 
 if __name__ == '__main__':
@@ -328,7 +387,7 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:s:g:m:x:y:ncbr", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:s:g:m:x:y:e:f:ncbr", ["help", "hostname=", \
 			"dbname=", "schema="])
 	except:
 		print __doc__
@@ -344,6 +403,8 @@ if __name__ == '__main__':
 	min_sup = 0
 	max_sup = 200
 	parser_type = 1
+	d_matrix_type = 1
+	output_format = 0
 	new_table = 0
 	commit = 0
 	debug = 0
@@ -372,6 +433,10 @@ if __name__ == '__main__':
 			max_sup = int(arg)
 		elif opt in ("-y", ):
 			parser_type = int(arg)
+		elif opt in ("-e", ):
+			d_matrix_type = int(arg)
+		elif opt in ("-f", ):
+			output_format = int(arg)
 		elif opt in ("-n",):
 			new_table = 1
 		elif opt in ("-c",):
@@ -382,7 +447,8 @@ if __name__ == '__main__':
 			report = 1
 	if inputfile and outputfile and sig_vector_fname:
 		instance = MpiBFSCluster(hostname, dbname, schema, inputfile, outputfile,\
-			size, sig_vector_fname, min_sup, max_sup, parser_type, new_table, commit, debug, report)
+			size, sig_vector_fname, min_sup, max_sup, parser_type, new_table, commit, debug, report, d_matrix_type, \
+			output_format)
 		instance.run()
 	else:
 		print __doc__
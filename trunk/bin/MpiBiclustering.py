@@ -261,12 +261,15 @@ class MpiBiclustering:
 						cluster_group.bicluster_list[j] = bicluster	#update the list values, different from dictionary
 		sys.stderr.write("Node %s, Done.\n"%(node_rank))
 	
-	def generate_seeds(self, node_rank, go_no, edge_id_array, edge_matrix):
+	def generate_seeds(self, node_rank, go_no, edge_id_array, edge_matrix, received_data=None):
 		"""
 		04-20-05
 			stop when the hscore_cut_off is not met
 		04-29-05
 			try 4 times more after hscore_cut_off is not met.
+		2026-10-18
+			if received_data(the contiguous array edge_matrix is sliced from) is given,
+			biclustering reads it as a buffer, skipping the first row and column.
 		"""
 		sys.stderr.write("Node %s, generate seeds on function %s...\n"%(node_rank, go_no))
 		if edge_matrix.shape[0] < self.min_height:
@@ -278,7 +281,11 @@ class MpiBiclustering:
 		self.go_no2cluster_group[go_no].edge_id_set = Set(edge_id_array)
 		biclustering_instance = biclustering.biclustering(self.hscore_cut_off, self.min_height, \
 			self.min_width, self.batchThreshold)
-		biclustering_instance.data_read_in(edge_matrix)
+		if received_data is not None:
+			no_of_rows, no_of_columns = received_data.shape
+			biclustering_instance.data_read_in_buffer(received_data, no_of_rows, no_of_columns, 1, 1)
+		else:
+			biclustering_instance.data_read_in(edge_matrix)
 		result = biclustering_instance.getbicluster()
 		no_of_retries = 0	#try to get more clusters.
 		while result:
@@ -482,7 +489,7 @@ class MpiBiclustering:
 					received_data.shape = (no_of_rows, no_of_columns)
 					edge_id_array = map(int, received_data[1:,0])	#integer form
 					edge_matrix = received_data[1:,1:]
-					self.generate_seeds(node_rank, go_no, edge_id_array, edge_matrix)	#generate seeds
+					self.generate_seeds(node_rank, go_no, edge_id_array, edge_matrix, received_data)	#generate seeds
 					communicator.send("finished", 0, node_rank)
 					
 				received_data, source, tag, count = communicator.receive(Float, 0, None)	#get data from node 0
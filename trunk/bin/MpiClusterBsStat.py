@@ -46,7 +46,7 @@ from Scientific import MPI
 from codense.common import mpi_synchronize, db_connect, output_node, get_gene_id2gene_symbol, \
 	dict_map, get_dataset_no2desc, input_node, computing_node
 from sets import Set
-from TF_functions import cluster_bs_analysis
+from TF_functions import cluster_bs_analysis, bs_bitset_index
 from MpiCrackSplat import MpiCrackSplat	#12-18-05	for fill_edge2encodedOccurrence()
 from fuzzyDense import fuzzyDense	#12-18-05	for fuzzyDense()
 if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
@@ -269,12 +269,13 @@ class MpiClusterBsStat:
 		12-20-05
 			called common's computing_node()
 		2006-09-21 add fuzzyDense_flag
+		2026-10-18 add bs_bitset_index_instance
 		"""
 		node_rank = communicator.rank
 		sys.stderr.write("Node no.%s working...\n"%node_rank)
 		data = cPickle.loads(data)
 		gene_no2bs_no_set, bs_no2gene_no_set, ratio_cutoff, \
-		top_number, p_value_cut_off, fuzzyDense_instance, degree_cut_off, fuzzyDense_flag = parameter_list
+		top_number, p_value_cut_off, fuzzyDense_instance, degree_cut_off, fuzzyDense_flag, bs_bitset_index_instance = parameter_list
 		result = []
 		for row in data:
 			id, vertex_set, recurrence_array = row
@@ -286,12 +287,12 @@ class MpiClusterBsStat:
 				core_vertex_list, on_dataset_index_ls =  fuzzyDense_instance.get_core_vertex_set(vertex_set, recurrence_array, degree_cut_off)
 				if core_vertex_list:
 					ls_to_return = cluster_bs_analysis(core_vertex_list, gene_no2bs_no_set, bs_no2gene_no_set, ratio_cutoff, \
-						top_number, p_value_cut_off)
+						top_number, p_value_cut_off, bs_bitset_index_instance)
 					if ls_to_return:
 						result.append([id, core_vertex_list, on_dataset_index_ls, ls_to_return])
 			else:
 				ls_to_return = cluster_bs_analysis(vertex_set, gene_no2bs_no_set, bs_no2gene_no_set, ratio_cutoff, \
-					top_number, p_value_cut_off)
+					top_number, p_value_cut_off, bs_bitset_index_instance)
 				if ls_to_return:
 					result.append([id, vertex_set, [0], ls_to_return])	#05-31-06, on_dataset_index_ls is faked by [0]
 		sys.stderr.write("Node no.%s done.\n"%node_rank)
@@ -449,8 +450,10 @@ class MpiClusterBsStat:
 				fuzzyDense_instance = fuzzyDense(edge2encodedOccurrence)
 			else:
 				fuzzyDense_instance = None
+			bs_bitset_index_instance = bs_bitset_index(gene_no2bs_no_set, bs_no2gene_no_set)	#2026-10-18
 			parameter_list = [gene_no2bs_no_set, bs_no2gene_no_set, self.ratio_cutoff, \
-				self.top_number, self.p_value_cut_off, fuzzyDense_instance, self.degree_cut_off, self.fuzzyDense_flag]
+				self.top_number, self.p_value_cut_off, fuzzyDense_instance, self.degree_cut_off, self.fuzzyDense_flag, \
+				bs_bitset_index_instance]
 			computing_node(communicator, parameter_list, self.computing_node_handler, report=self.report)
 			
 		elif node_rank==communicator.size-1:
@@ -26,6 +26,14 @@ Description:
 	how many mismatches exist between the found binding site and the original
 	sequences(or consensus) for the PWM.
 	
+	2026-10-18
+		each nucleotide is a 4-bit mask(A=1, C=2, G=4, T=8, IUPAC codes are unions,
+		' ' in a site is N), a whole sequence/site/consensus is packed into one integer,
+		4 bits per position. Positions that match are the non-zero nibbles of
+		packed_sequence&packed_site, so a comparison is a few bitwise ops and one popcount.
+		Sites and consensuses are packed once per computing node(compile_mt_id2sites_ls()).
+		Reverse complement is a str.translate().
+	
 """
 import sys, os, math
 bit_number = math.log(sys.maxint)/math.log(2)
@@ -37,12 +45,54 @@ else:   #32bit
 	sys.path.insert(0, os.path.expanduser('~/lib/python'))
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/transfac/src')))
-import sys, os, getopt, csv, cPickle, fileinput, cStringIO
+import sys, os, getopt, csv, cPickle, fileinput, cStringIO, string
 from Scientific import MPI
 from codense.common import mpi_synchronize, db_connect, output_node, \
 	computing_node, input_node, get_mt_id_set_from_profile, get_mt_id2sites_ls
-from Bio.Seq import Seq
-from Bio.Data import IUPACData
+
+def nucleotide_hex_table(letter2mask):
+	"""
+	2026-10-18
+		str.translate() table from a letter to the hex digit of its mask, '0' for other letters
+	"""
+	table = ['0']*256
+	for letter, mask in letter2mask.iteritems():
+		table[ord(letter)] = '%x'%mask
+	return ''.join(table)
+
+sequence_hex_table = nucleotide_hex_table({'A':1, 'C':2, 'G':4, 'T':8})
+site_hex_table = nucleotide_hex_table({'A':1, 'C':2, 'G':4, 'T':8, ' ':15})	#' ' is not available, regarded as 'N'
+#same as Bio.Data.IUPACData.ambiguous_dna_values
+iupac_hex_table = nucleotide_hex_table({'A':1, 'C':2, 'G':4, 'T':8, 'M':3, 'R':5, 'W':9, 'S':6, 'Y':10, 'K':12, \
+	'V':7, 'H':11, 'D':13, 'B':14, 'X':15, 'N':15})
+complement_table = string.maketrans('ACGTMRWSYKVHDBNacgtmrwsykvhdbn', 'TGCAKYWSRMBDHVNtgcakywsrmbdhvn')
+
+def reverse_complement(sequence):
+	return sequence.translate(complement_table)[::-1]
+
+def pack_nucleotides(sequence, hex_table):
+	"""
+	2026-10-18
+		position i is the i-th nibble(from the lowest) of the returned integer
+	"""
+	if not sequence:
+		return 0
+	return long(sequence.translate(hex_table)[::-1], 16)
+
+_nibble_mask_dict = {}
+def count_matched_positions(packed_x, packed_y, length):
+	"""
+	2026-10-18
+		number of positions(within length) whose masks overlap
+	"""
+	nibble_mask = _nibble_mask_dict.get(length)
+	if nibble_mask is None:
+		nibble_mask = long('1'*length, 16)
+		_nibble_mask_dict[length] = nibble_mask
+	overlap = packed_x&packed_y
+	overlap |= overlap>>1
+	overlap |= overlap>>2
+	return bin(overlap&nibble_mask).count('1')
 
 class MpiConfirmMatchResult:
 	def __init__(self,hostname='zhoudb', dbname='graphdb', schema=None, inputdir=None,\
@@ -122,29 +172,78 @@ class MpiConfirmMatchResult:
 				no_of_unambiguous_letters += 1
 		return no_of_unambiguous_letters>=max_esc_length
 	
-	def get_no_of_mismatches_for_consensus(self, sequence, consensus, no_of_mismatches_allowed, max_esc_length):
+	def compile_sites_ls(self, sites_ls, max_esc_length):
+		"""
+		2026-10-18
+			consensus: [0, is_good_consensus, packed_consensus]
+			sites: [1, [site, packed_site], ...], packed_site is None if site has letters other
+				than ACGT and ' ', compared letter by letter then.
+		"""
+		if sites_ls[0] == 0:
+			consensus = sites_ls[1]
+			return [0, self.is_good_consensus(consensus, max_esc_length), pack_nucleotides(consensus, iupac_hex_table)]
+		compiled_sites_ls = [1]
+		for site in sites_ls[1:]:
+			if site.translate(None, 'ACGT '):
+				compiled_sites_ls.append([site, None])
+			else:
+				compiled_sites_ls.append([site, pack_nucleotides(site, site_hex_table)])
+		return compiled_sites_ls
+	
+	def compile_mt_id2sites_ls(self, mt_id2sites_ls, max_esc_length):
+		"""
+		2026-10-18
+		"""
+		mt_id2compiled_sites_ls = {}
+		for mt_id, sites_ls in mt_id2sites_ls.iteritems():
+			if sites_ls[0] in (0, 1):
+				mt_id2compiled_sites_ls[mt_id] = self.compile_sites_ls(sites_ls, max_esc_length)
+		return mt_id2compiled_sites_ls
+	
+	def get_no_of_mismatches_for_consensus(self, sequence, consensus, no_of_mismatches_allowed, max_esc_length, \
+		compiled_sites_ls=None):
 			"""
-			if self.debug:
-				sys.stderr.write("sequence %s vs consensus: %s \n"%(sequence, consensus))
+			2026-10-18
+				packed comparison, compiled_sites_ls from compile_sites_ls() if available.
+				A letter of sequence other than ACGT matches nothing.
 			"""
-			if not self.is_good_consensus(consensus, max_esc_length):
+			if compiled_sites_ls is None:
+				compiled_sites_ls = self.compile_sites_ls([0, consensus], max_esc_length)
+			if not compiled_sites_ls[1]:	#not is_good_consensus
 				return False
-			no_of_mismatches = 0
-			#more strict for consensus
-			no_of_mismatches_allowed = 0
-			for i in range(len(sequence)):
-				if sequence[i] not in IUPACData.ambiguous_dna_values[consensus[i]]:
-					no_of_mismatches += 1
-					if no_of_mismatches>no_of_mismatches_allowed:
-						break
+			#more strict for consensus, no_of_mismatches_allowed is 0
+			sequence_length = len(sequence)
+			return count_matched_positions(pack_nucleotides(sequence, sequence_hex_table), compiled_sites_ls[2], \
+				sequence_length)==sequence_length
+	
+	def get_no_of_mismatches_for_site(self, sequence, sites_ls, no_of_mismatches_allowed, max_esc_length, \
+		compiled_sites_ls=None):
 			"""
-			if self.debug:
-				sys.stderr.write("consensus %s with no_of_mismatches %s.\n"%(consensus, no_of_mismatches))
+			2026-10-18
+				packed comparison if both the sequence and the site are pure ACGT(' ' for the site)
 			"""
-			return no_of_mismatches<=no_of_mismatches_allowed
+			if compiled_sites_ls is None:
+				compiled_sites_ls = self.compile_sites_ls(sites_ls, max_esc_length)
+			if sequence.translate(None, 'ACGT'):	#letter by letter
+				return self.get_no_of_mismatches_for_site_by_letter(sequence, sites_ls[1:], no_of_mismatches_allowed, \
+					max_esc_length)
+			packed_sequence = pack_nucleotides(sequence, sequence_hex_table)
+			for site, packed_site in compiled_sites_ls[1:]:
+				if packed_site is None:
+					if self.get_no_of_mismatches_for_site_by_letter(sequence, [site], no_of_mismatches_allowed, \
+						max_esc_length):
+						return True
+				elif len(site)-count_matched_positions(packed_sequence, packed_site, len(site))<=no_of_mismatches_allowed:
+					return True
+			return False
 	
-	def get_no_of_mismatches_for_site(self, sequence, sites_ls, no_of_mismatches_allowed, max_esc_length):
-			for site in sites_ls[1:]:
+	def get_no_of_mismatches_for_site_by_letter(self, sequence, site_ls, no_of_mismatches_allowed, max_esc_length):
+			"""
+			2026-10-18
+				the old letter by letter comparison, site_ls is sites_ls[1:]
+			"""
+			no_of_mismatches = no_of_mismatches_allowed+1	#no site, not confirmed
+			for site in site_ls:
 				no_of_mismatches = 0	#zero before each comparison
 				"""
 				if self.debug:
@@ -167,7 +266,12 @@ class MpiConfirmMatchResult:
 					break
 			return no_of_mismatches<=no_of_mismatches_allowed
 	
-	def is_site_confirmed(self, mt_id2sites_ls, line, max_mis_match_perc, min_no_of_mismatches, max_esc_length):
+	def is_site_confirmed(self, mt_id2sites_ls, line, max_mis_match_perc, min_no_of_mismatches, max_esc_length, \
+		mt_id2compiled_sites_ls={}):
+		"""
+		2026-10-18
+			add mt_id2compiled_sites_ls, from compile_mt_id2sites_ls()
+		"""
 		### 1st parse (copied from transfacdb.py
 		ls = line[:-1].split('|')
 		mt_id = ls[0].strip()	#remove spaces
@@ -179,12 +283,7 @@ class MpiConfirmMatchResult:
 		sequence = ls[4].strip()
 		
 		if strand=='-':	#take the reverse_compliment()
-			seq = Seq(sequence)
-			sequence = seq.reverse_complement().tostring()
-			"""
-			if self.debug:
-				sys.stderr.write("Strand is -, need reverse_compliment() from %s to %s.\n"%(seq.data, sequence))
-			"""
+			sequence = reverse_complement(sequence)	#2026-10-18 not Bio.Seq
 		#transform it into upper case
 		sequence = sequence.upper()
 		
@@ -193,12 +292,13 @@ class MpiConfirmMatchResult:
 		
 		#check the no_of_mismatches
 		sites_ls = mt_id2sites_ls[mt_id]
+		compiled_sites_ls = mt_id2compiled_sites_ls.get(mt_id)
 		if sites_ls[0] == 0:	#it's consensus
 			return self.get_no_of_mismatches_for_consensus(sequence, sites_ls[1], no_of_mismatches_allowed,\
-				max_esc_length)
+				max_esc_length, compiled_sites_ls)
 		elif sites_ls[0] == 1:	#it's the sequence where the consensus is derived
 			return self.get_no_of_mismatches_for_site(sequence, sites_ls, no_of_mismatches_allowed,\
-				max_esc_length)
+				max_esc_length, compiled_sites_ls)
 		else:
 			sys.stderr.write("Wrong type of sites_ls of mt_id2sites_ls: %s.\n"%sites_ls[0])
 			return None
@@ -208,11 +308,12 @@ class MpiConfirmMatchResult:
 		node_rank = communicator.rank
 		sys.stderr.write("Node no.%s working...\n"%node_rank)
 		data = cPickle.loads(data)
-		mt_id2sites_ls, max_mis_match_perc, min_no_of_mismatches, max_esc_length = parameter_list
+		mt_id2sites_ls, max_mis_match_perc, min_no_of_mismatches, max_esc_length, mt_id2compiled_sites_ls = parameter_list
 		match_confirmed_results = ''
 		for prom_id,line in data:
 			seq_id_line = 'Inspecting %s\n'%prom_id
-			if self.is_site_confirmed(mt_id2sites_ls, line, max_mis_match_perc, min_no_of_mismatches, max_esc_length):
+			if self.is_site_confirmed(mt_id2sites_ls, line, max_mis_match_perc, min_no_of_mismatches, max_esc_length, \
+				mt_id2compiled_sites_ls):
 				match_confirmed_results += seq_id_line+line
 		sys.stderr.write("Node no.%s done.\n"%node_rank)
 		return match_confirmed_results
@@ -270,7 +371,9 @@ class MpiConfirmMatchResult:
 				input_handler=self.input_handler)
 			del aggregated_inf
 		elif node_rank in free_computing_nodes:
-			parameter_list = [mt_id2sites_ls, max_mis_match_perc, min_no_of_mismatches, max_esc_length]
+			mt_id2compiled_sites_ls = self.compile_mt_id2sites_ls(mt_id2sites_ls, self.max_esc_length)	#2026-10-18
+			parameter_list = [mt_id2sites_ls, self.max_mis_match_perc, self.min_no_of_mismatches, self.max_esc_length, \
+				mt_id2compiled_sites_ls]
 			computing_node(communicator, parameter_list, self.computing_handler, report=self.report)
 		elif node_rank==communicator.size-1:
 			parameter_list = [outf]
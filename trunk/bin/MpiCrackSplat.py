@@ -14,6 +14,10 @@ Option:
 	-c ..., --min_con=...	minimum connectivity(0.5, default)
 	-y ..., --cluster_block_size=...	min no of clusters in cluster_block_matrix(1500, default)IGNORE
 	-w ..., --cluster_block_edges=...	min no of edges in cluster_block_matrix(25,000, default)
+	-e ..., --edge_store=...	binary edge_store file(codense/edge_store.py), instead of the database
+	-n, --incremental	recompute edge betweenness only from sources affected by the removal
+	-t ..., --batch_size=...	edges removed per edge betweenness calculation, 1(default)
+	-p ..., --no_of_samples=...	sources sampled to approximate edge betweenness, 0(default, all)
 	-b, --debug	debug version.
 	-r, --report	enable report flag
 	-h, --help	Display the usage infomation.
@@ -26,6 +30,8 @@ Examples:
 Description:
 	Counterpart of CrackSplat.py, but uses ClusterByEBC and MPI.
 	Watch -w, control the transmission block size.
+	-n, -t and -p trade the exactness of ClusterByEBC for speed on dense patterns. With -r,
+	each node reports the splits, removed edges and source traversals it made.
 	
 """
 import sys, os, math
@@ -42,6 +48,7 @@ from graph.cc_from_edge_list import ClusterByEBC
 from codense.common import system_call, mpi_schedule_jobs, mpi_synchronize, db_connect, output_node
 from netmine_wrapper import netmine_wrapper
 from codense.codense2db import codense2db
+from codense.edge_store import edge_store
 from sets import Set
 from MpiFromDatasetSignatureToPattern import decodeOccurrenceToBv, encodeOccurrenceBv, MpiFromDatasetSignatureToPattern
 if sys.version_info[:2] < (2, 3):	#python2.2 or lower needs some extra
@@ -50,11 +57,15 @@ if sys.version_info[:2] < (2, 3):	#python2.2 or lower needs some extra
 class MpiCrackSplat:
 	def __init__(self,hostname='zhoudb', dbname='graphdb', schema=None, inputfile=None,\
 		outputfile=None, min_sup=0, max_sup=200,  min_size=5, min_con=0.5, \
-		cluster_block_size=1500, cluster_block_edges=25000, debug=0, report=0):
+		cluster_block_size=1500, cluster_block_edges=25000, debug=0, report=0, edge_store_fname=None, \
+		incremental=0, batch_size=1, no_of_samples=0):
 		"""
 		08-07-05
 			Program to handle the fim_closed output over the edge-transaction mining
 			Restore the patterns(vertex_set, edge_set) based on the dataset signature.
+		2026-10-18
+			add edge_store_fname
+			add incremental, batch_size, no_of_samples(ClusterByEBC.set_ebc_option())
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -69,13 +80,27 @@ class MpiCrackSplat:
 		self.cluster_block_edges = int(cluster_block_edges)
 		self.debug = int(debug)
 		self.report = int(report)
+		self.edge_store_fname = edge_store_fname
+		self.incremental = int(incremental)
+		self.batch_size = int(batch_size)
+		self.no_of_samples = int(no_of_samples)
 	
-	def fill_edge2encodedOccurrence(self, hostname, dbname, schema, edge2encodedOccurrence, min_sup, max_sup, edge_table='edge_cor_vector'):
+	def fill_edge2encodedOccurrence(self, hostname, dbname, schema, edge2encodedOccurrence, min_sup, max_sup, \
+		edge_table='edge_cor_vector', edge_store_fname=None):
 		"""
 		09-05-05
 			get the edge2encodedOccurrence from the database
+		2026-10-18
+			get it from the binary edge_store if edge_store_fname is given
 		"""
 		sys.stderr.write("Getting edges...\n")
+		if edge_store_fname:
+			edge_store_instance = edge_store(edge_store_fname)
+			edge_store_instance.fill_edge2encodedOccurrence(edge2encodedOccurrence, min_sup, max_sup)
+			no_of_datasets = edge_store_instance.no_of_datasets
+			edge_store_instance.close()
+			sys.stderr.write("Done.\n")
+			return no_of_datasets
 		(conn, curs) = db_connect(hostname, dbname, schema)
 		curs.execute("DECLARE crs CURSOR FOR select edge_name,sig_vector \
 			from %s"%(edge_table))
@@ -234,41 +259,64 @@ class MpiCrackSplat:
 				[v1_of_e1, v2_of_e1]
 				...
 				]
+		2026-10-18
+			ClusterByEBC options, count the splits etc.
+		2026-10-18
+			each cluster goes into ClusterByEBC as a slice of cluster_block_matrix(set_edge_buffer())
+			and the results come back as buffers(cc_buffer()), no per-edge python lists.
 		"""
 		node_rank = communicator.rank
 		sys.stderr.write("Node no.%s working...\n"%node_rank)
-		edge_list = []
-		for edge in cluster_block_matrix:
-			if edge==[-2,-2]:	#cluster separator
+		no_of_splits = 0
+		no_of_removed_edges = 0
+		no_of_source_traversals = 0
+		cluster_block_matrix = Numeric.array(cluster_block_matrix, Numeric.Int)	#contiguous C longs for set_edge_buffer()
+		if len(cluster_block_matrix)==0:	#nothing was sent, no [:,0]
+			separator_index_list = []
+		else:
+			separator_index_list = Numeric.nonzero(Numeric.equal(cluster_block_matrix[:,0], -2))
+		start_index = 0
+		for separator_index in separator_index_list:
+			edge_matrix = cluster_block_matrix[start_index:separator_index]
+			start_index = separator_index+1
+			if self.debug:
+				sys.stderr.write("The raw edge_list is %s.\n"%repr(edge_matrix.tolist()))
+			ClusterByEBC_instance = ClusterByEBC(min_size, min_con)
+			ClusterByEBC_instance.set_ebc_option(self.incremental, self.batch_size, self.no_of_samples)
+			ClusterByEBC_instance.set_edge_buffer(edge_matrix)
+			ClusterByEBC_instance.run()
+			no_of_splits += ClusterByEBC_instance.no_of_splits
+			no_of_removed_edges += ClusterByEBC_instance.no_of_removed_edges
+			no_of_source_traversals += ClusterByEBC_instance.no_of_source_traversals
+			vertex_string, vertex_offset_string, edge_string, edge_offset_string = ClusterByEBC_instance.cc_buffer()
+			del ClusterByEBC_instance
+			vertex_array = Numeric.fromstring(vertex_string, Numeric.Int)
+			vertex_offset_array = Numeric.fromstring(vertex_offset_string, Numeric.Int)
+			if edge_string:
+				edge_array = Numeric.reshape(Numeric.fromstring(edge_string, Numeric.Int), (-1,2))
+			else:	#no edges left, reshape() can't take (-1,2) on an empty array
+				edge_array = Numeric.zeros((0,2), Numeric.Int)
+			edge_offset_array = Numeric.fromstring(edge_offset_string, Numeric.Int)
+			for k in range(len(vertex_offset_array)-1):
+				vertex_list = Numeric.sort(vertex_array[vertex_offset_array[k]:vertex_offset_array[k+1]])
+				edge_list = edge_array[edge_offset_array[k]:edge_offset_array[k+1]]
 				if self.debug:
-					sys.stderr.write("The raw edge_list is %s.\n"%repr(edge_list))
-				ClusterByEBC_instance = ClusterByEBC(edge_list, min_size, min_con)
-				ClusterByEBC_instance.run()
-				for k in range(len(ClusterByEBC_instance.cc_list)):
-					edge_list = ClusterByEBC_instance.cc_list[k]
-					vertex_list = ClusterByEBC_instance.cc_vertex_list[k]
-					if self.debug:
-						sys.stderr.write("The edge_list is %s.(from node %s)\n"%(repr(edge_list), node_rank))
-						sys.stderr.write("The vertex_list is %s.(from node %s)\n"%(repr(vertex_list), node_rank))
-					no_of_vertices = len(vertex_list)
-					no_of_edges = len(edge_list)
-					edge_block = Numeric.zeros((no_of_vertices+no_of_edges+1, 2), Numeric.Int)	#Watch: +2
-					edge_block[0,0], edge_block[0,1] = no_of_vertices, no_of_edges
-					vertex_list.sort()
-					for i in range(no_of_vertices):
-						edge_block[i+1][0] = vertex_list[i]
-					for l in range(no_of_edges):
-						edge = edge_list[l]
-						if edge[0]>edge[1]:
-							edge.reverse()
-						edge_block[no_of_vertices+l+1,0], edge_block[no_of_vertices+l+1,1] = edge
-					if self.debug:
-						sys.stderr.write("The edge_block is %s.(from node %s)\n"%(repr(edge_block), node_rank))
-					communicator.send(edge_block, communicator.size-1, 1)
-				del ClusterByEBC_instance
-				edge_list= []	#clean up
-			else:
-				edge_list.append(list(edge))	#Watch: convert to list
+					sys.stderr.write("The edge_list is %s.(from node %s)\n"%(repr(edge_list.tolist()), node_rank))
+					sys.stderr.write("The vertex_list is %s.(from node %s)\n"%(repr(vertex_list.tolist()), node_rank))
+				no_of_vertices = len(vertex_list)
+				no_of_edges = len(edge_list)
+				edge_block = Numeric.zeros((no_of_vertices+no_of_edges+1, 2), Numeric.Int)	#Watch: +2
+				edge_block[0,0], edge_block[0,1] = no_of_vertices, no_of_edges
+				edge_block[1:no_of_vertices+1,0] = vertex_list
+				#smaller vertex first
+				edge_block[no_of_vertices+1:,0] = Numeric.minimum(edge_list[:,0], edge_list[:,1])
+				edge_block[no_of_vertices+1:,1] = Numeric.maximum(edge_list[:,0], edge_list[:,1])
+				if self.debug:
+					sys.stderr.write("The edge_block is %s.(from node %s)\n"%(repr(edge_block), node_rank))
+				communicator.send(edge_block, communicator.size-1, 1)
+		if self.report:
+			sys.stderr.write("Node no.%s: %s splits, %s edges removed, %s source traversals.\n"%\
+				(node_rank, no_of_splits, no_of_removed_edges, no_of_source_traversals))
 		sys.stderr.write("Node no.%s done.\n"%node_rank)
 	
 	def output_cluster(self, communicator, parameter_list, edge_block):
@@ -324,7 +372,8 @@ class MpiCrackSplat:
 		intermediateFile = '%s.unsorted'%self.outputfile	#intermediateFile to store concatenated results
 		if communicator.rank==(communicator.size-1):
 			edge2encodedOccurrence = {}
-			no_of_datasets = self.fill_edge2encodedOccurrence(self.hostname, self.dbname, self.schema, edge2encodedOccurrence, self.min_sup, self.max_sup)
+			no_of_datasets = self.fill_edge2encodedOccurrence(self.hostname, self.dbname, self.schema, edge2encodedOccurrence, self.min_sup, self.max_sup, \
+				edge_store_fname=self.edge_store_fname)
 		
 		mpi_synchronize(communicator)
 		
@@ -354,9 +403,10 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:m:x:s:c:y:w:br", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:m:x:s:c:y:w:e:nt:p:br", ["help", "hostname=", \
 			"dbname=", "schema=", "inputfile=", "outputfile=", "min_sup", "max_sup=", "min_size=", \
-			"min_con=", "cluster_block_size=", "cluster_block_edges=", "debug", "report"])
+			"min_con=", "cluster_block_size=", "cluster_block_edges=", "edge_store=", "incremental", "batch_size=", \
+			"no_of_samples=", "debug", "report"])
 	except:
 		print __doc__
 		sys.exit(2)
@@ -372,6 +422,10 @@ if __name__ == '__main__':
 	min_con = 0.5
 	cluster_block_size = 1500
 	cluster_block_edges = 25000
+	edge_store_fname = None
+	incremental = 0
+	batch_size = 1
+	no_of_samples = 0
 	debug = 0
 	report = 0
 	for opt, arg in opts:
@@ -400,13 +454,22 @@ if __name__ == '__main__':
 			cluster_block_size = int(arg)
 		elif opt in ("-w", "--cluster_block_edges"):
 			cluster_block_edges = int(arg)
+		elif opt in ("-e", "--edge_store"):
+			edge_store_fname = arg
+		elif opt in ("-n", "--incremental"):
+			incremental = 1
+		elif opt in ("-t", "--batch_size"):
+			batch_size = int(arg)
+		elif opt in ("-p", "--no_of_samples"):
+			no_of_samples = int(arg)
 		elif opt in ("-b", "--debug"):
 			debug = 1
 		elif opt in ("-r", "--report"):
 			report = 1
 	if schema and inputfile and outputfile:
 		instance = MpiCrackSplat(hostname, dbname, schema, inputfile, outputfile, \
-			min_sup, max_sup, min_size, min_con, cluster_block_size, cluster_block_edges, debug, report)
+			min_sup, max_sup, min_size, min_con, cluster_block_size, cluster_block_edges, debug, report, edge_store_fname, \
+			incremental, batch_size, no_of_samples)
 		instance.run()
 	else:
 		print __doc__
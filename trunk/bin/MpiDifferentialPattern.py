@@ -25,6 +25,11 @@ Examples:
 Description:
 	Find patterns whose recurrence shows difference between the given
 	  dataset_signature and the rest.
+	
+	2026-10-18
+		the effective possible edges of all datasets are counted in one pass over the
+		edge_set(bit-sliced counters over gene2enc_array[u]&gene2enc_array[v]), and the
+		t-test is codense.distribution_tail.welch_t_test(), no rpy.
 """
 import sys, os, math
 bit_number = math.log(sys.maxint)/math.log(2)
@@ -39,7 +44,7 @@ from Scientific import MPI
 from codense.common import mpi_synchronize, db_connect, output_node, draw_pattern,form_schema_tables,\
 	computing_node, input_node, get_gene_id2gene_no, get_gene_no2gene_id, get_gene_no2go_no
 from sets import Set
-from rpy import r
+from codense.distribution_tail import welch_t_test
 from MpiFromDatasetSignatureToPattern import encodeOccurrenceBv, encodeOccurrence
 from cluster_info import cluster_info
 
@@ -86,24 +91,52 @@ class MpiDifferentialPattern:
 				effective_vertex_set.add(vertex)
 		return effective_vertex_set
 	
+	def cal_no_of_effective_possible_edges(self, edge_set, gene2enc_array, no_of_datasets):
+		"""
+		2026-10-18
+			for each dataset, the number of edges whose both ends are present.
+			Bit j of counter_ls[k] is bit k of dataset j's count, adding the AND of an edge's
+			two occurrence bit vectors is a ripple carry across counter_ls, all datasets at once.
+		"""
+		counter_ls = []
+		for edge in edge_set:
+			carry = gene2enc_array[edge[0]]&gene2enc_array[edge[1]]
+			k = 0
+			while carry:
+				if k==len(counter_ls):
+					counter_ls.append(0L)
+				counter = counter_ls[k]
+				counter_ls[k] = counter^carry
+				carry = counter&carry
+				k += 1
+		no_of_effective_possible_edges_ls = [0]*no_of_datasets
+		for k in range(len(counter_ls)):
+			counter = counter_ls[k]
+			weight = 1<<k
+			for i in range(no_of_datasets):
+				if (counter>>i)&1:
+					no_of_effective_possible_edges_ls[i] += weight
+		return no_of_effective_possible_edges_ls
+	
 	def cal_effective_rec_array(self, edge_set, original_rec_array, vertex_list, gene2enc_array, debug=0):
 		"""
 		11-03-05
 			based on the present vertices in each dataset, calculate no_of_effective_possible_edges,
 			adjusted occurrence = no_of_real_edges_int/no_of_effective_possible_edges
+		2026-10-18
+			no_of_effective_possible_edges from cal_no_of_effective_possible_edges(), not by
+			get_effective_vertex_set() and a scan of edge_set for each dataset
 		"""
 		effective_rec_array = []
 		no_of_edges = len(edge_set)
+		no_of_effective_possible_edges_ls = self.cal_no_of_effective_possible_edges(edge_set, gene2enc_array, \
+			len(original_rec_array))
 		for i in range(len(original_rec_array)):
 			no_of_real_edges_float = original_rec_array[i]*no_of_edges
 			no_of_real_edges_int = int(no_of_real_edges_float)	#need to compensate the loss because of integer cast
 			if (no_of_real_edges_float-no_of_real_edges_int)>0.5:
 				no_of_real_edges_int += 1
-			effective_vertex_set = self.get_effective_vertex_set(vertex_list, gene2enc_array, i+1)	#WATCH i+1
-			no_of_effective_possible_edges = 0
-			for edge in edge_set:
-				if edge[0] in effective_vertex_set and edge[1] in effective_vertex_set:
-					no_of_effective_possible_edges += 1
+			no_of_effective_possible_edges = no_of_effective_possible_edges_ls[i]	#dataset i+1
 			"""
 			if debug:
 				print "which_dataset",i+1
@@ -121,6 +154,7 @@ class MpiDifferentialPattern:
 		"""
 		11-03-05 partition the effective_rec_array into non-interesting and interesting based on the interesting_dataset_set
 			do the t-test, get the p-value
+		2026-10-18 welch_t_test() instead of r.t_test()
 		"""
 		non_interesting_rec_array = []
 		interesting_rec_array = []
@@ -134,8 +168,7 @@ class MpiDifferentialPattern:
 			print "interesting_rec_array",interesting_rec_array
 			print "non_interesting_rec_arrray",non_interesting_rec_array
 		"""
-		result = r.t_test(non_interesting_rec_array, interesting_rec_array)
-		return result['p.value']
+		return welch_t_test(non_interesting_rec_array, interesting_rec_array)
 	
 	def computing_node_handler(self, communicator, data, parameter_list):
 		node_rank = communicator.rank
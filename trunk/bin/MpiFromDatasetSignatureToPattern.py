@@ -166,6 +166,52 @@ def decodeOccurrenceToBv(signature, no_of_datasets):
 	occurrence_vector[len(binary_list)-1] = 1
 	return occurrence_vector
 
+def index_signature2pattern(signature2pattern):
+	"""
+	2026-10-18
+		inverted index over the signatures, keyed by the lowest dataset no(1-based) in each signature.
+		An edge can only satisfy a signature if the edge occurs in that dataset, so each edge
+		just visits the buckets of its own datasets instead of all signatures.
+		key 0 holds the empty signature, which every edge satisfies.
+	"""
+	dataset_no2signature_set = {}
+	for signature in signature2pattern:
+		if signature>0:
+			dataset_no = decodeOccurrence(signature)[0]
+		else:
+			dataset_no = 0
+		if dataset_no not in dataset_no2signature_set:
+			dataset_no2signature_set[dataset_no] = Set()
+		dataset_no2signature_set[dataset_no].add(signature)
+	return dataset_no2signature_set
+
+def get_satisfied_signature_ls(occurrenceBinaryForm, dataset_no2signature_set):
+	"""
+	2026-10-18
+		signatures(in the index from index_signature2pattern()) which are subsets of occurrenceBinaryForm
+	"""
+	satisfied_signature_ls = []
+	dataset_no_ls = decodeOccurrence(occurrenceBinaryForm)
+	if occurrenceBinaryForm>0:
+		dataset_no_ls.append(0)
+	for dataset_no in dataset_no_ls:
+		if dataset_no in dataset_no2signature_set:
+			for signature in dataset_no2signature_set[dataset_no]:
+				if (occurrenceBinaryForm&signature)==signature:
+					satisfied_signature_ls.append(signature)
+	return satisfied_signature_ls
+
+def remove_signature_from_index(signature, dataset_no2signature_set):
+	"""
+	2026-10-18
+		the pattern of this signature is complete, no edge needs to visit it anymore
+	"""
+	if signature>0:
+		dataset_no = decodeOccurrence(signature)[0]
+	else:
+		dataset_no = 0
+	dataset_no2signature_set[dataset_no].discard(signature)
+
 
 class PatternFormThread(Thread):
 	"""
@@ -220,6 +266,8 @@ class PatternFormThread(Thread):
 			edge_sig_matrix replaces the intermediateFile
 		01-04-06
 			1st part split out to be readin_signature2pattern()
+		2026-10-18
+			each edge only visits signatures indexed under its own datasets, see index_signature2pattern()
 			
 			(loop)
 				--decodeOccurrenceBv()
@@ -230,6 +278,7 @@ class PatternFormThread(Thread):
 		sys.stderr.write("Thread of node %s starts patternFormation ...\n"%(self.rank))
 		of = open(node_outputfile, 'w')
 		codense2db_instance = codense2db()
+		dataset_no2signature_set = index_signature2pattern(signature2pattern)	#2026-10-18
 		counter = 0
 		edge_occurrenceBinaryForm_row = edge_sig_vector_queue.get()
 		while edge_occurrenceBinaryForm_row!= -1:
@@ -238,30 +287,30 @@ class PatternFormThread(Thread):
 			occurrenceBinaryForm = edge_occurrenceBinaryForm_row[2]	#08-24-05	already encoded when edge_sig_matrix is filled in
 			#occurrence_vector = decodeOccurrenceToBv(occurrenceBinaryForm, no_of_datasets)
 			signatureToBeDeleted = []
-			for signature in signature2pattern:
+			for signature in get_satisfied_signature_ls(occurrenceBinaryForm, dataset_no2signature_set):
 				frequency = signature2pattern[signature][0]
-				if (occurrenceBinaryForm&signature)==signature:
-					signature2pattern[signature].append(edge)
+				signature2pattern[signature].append(edge)
+				if debug:
+					sys.stderr.write("the occurrence_vector of edge %s is %s\n"%(repr(edge), \
+						repr(decodeOccurrenceToBv(occurrenceBinaryForm, no_of_datasets))))
+					sys.stderr.write("occurrence_vector's binary form is %s, signature is %s\n"%(occurrenceBinaryForm, signature))
+				if len(signature2pattern[signature]) == frequency+1:	#the 1st entry is frequency
+					signatureToBeDeleted.append(signature)
 					if debug:
-						sys.stderr.write("the occurrence_vector of edge %s is %s\n"%(repr(edge), \
-							repr(decodeOccurrenceToBv(occurrenceBinaryForm, no_of_datasets))))
-						sys.stderr.write("occurrence_vector's binary form is %s, signature is %s\n"%(occurrenceBinaryForm, signature))
-					if len(signature2pattern[signature]) == frequency+1:	#the 1st entry is frequency
-						signatureToBeDeleted.append(signature)
-						if debug:
-							sys.stderr.write("signature %s to be deleted, its pattern is %s\n"%(signature, repr(signature2pattern[signature])))
-					"""
-					edge_tuple = tuple(edge)
-					if edge_tuple not in edge2occurrence_vector:
-						edge2occurrence_vector[edge_tuple] = [1]
-						edge2occurrence_vector[edge_tuple].append(occurrence_vector)
-					else:
-						edge2occurrence_vector[edge_tuple][0] += 1
-					"""
+						sys.stderr.write("signature %s to be deleted, its pattern is %s\n"%(signature, repr(signature2pattern[signature])))
+				"""
+				edge_tuple = tuple(edge)
+				if edge_tuple not in edge2occurrence_vector:
+					edge2occurrence_vector[edge_tuple] = [1]
+					edge2occurrence_vector[edge_tuple].append(occurrence_vector)
+				else:
+					edge2occurrence_vector[edge_tuple][0] += 1
+				"""
 			for signature in signatureToBeDeleted:
 				edge_list = signature2pattern[signature][1:]
 				outputCcFromEdgeList(of, signature, edge_list, codense2db_instance, no_cc)
 				del signature2pattern[signature]
+				remove_signature_from_index(signature, dataset_no2signature_set)
 			edge_occurrenceBinaryForm_row = edge_sig_vector_queue.get()
 		if len(signature2pattern)>1:
 			sys.stderr.write('Weird %s signatures are still available\n'%len(signature2pattern))
@@ -379,6 +428,11 @@ class MpiFromDatasetSignatureToPattern:
 		sys.stderr.write("Node %s ends sending.\n"%communicator.rank)
 		
 	def receiveEdgeSigMatrix(self, communicator, PostFim_instance, no_of_datasets, block_size=10000):
+		"""
+		2026-10-18
+			PostFim_instance(PostFim or johnson_sp) takes the whole Numeric block through
+			add_edge_sig_block(), not row by row.
+		"""
 		sys.stderr.write("Node %s receiving edge recurrence_array.\n"%communicator.rank)
 		edge_sig_block = Numeric.zeros((block_size, 2+no_of_datasets), Numeric.Int)
 		edge_sig_block, source, tag, count = communicator.receive(edge_sig_block, 0, 0)	#get data from node 0
@@ -390,10 +444,7 @@ class MpiFromDatasetSignatureToPattern:
 				"""
 				break
 			else:
-				for edge_sig_vector in edge_sig_block:
-					if edge_sig_vector[0]==-1:	#reach the end of this edge_sig_block
-						break
-					PostFim_instance.add_edge_sig_vector(list(edge_sig_vector))
+				PostFim_instance.add_edge_sig_block(edge_sig_block)	#stops at the row starting with -1
 			edge_sig_block, source, tag, count = communicator.receive(edge_sig_block, 0, 0)	#get data from node 0
 		sys.stderr.write("Node %s ends receiving.\n"%communicator.rank)
 
@@ -474,6 +525,8 @@ class MpiFromDatasetSignatureToPattern:
 		01-07-06
 			back to edge_sig_matrix
 			add min_cluster_size
+		2026-10-18
+			each edge only visits signatures indexed under its own datasets, see index_signature2pattern()
 			
 			(loop)
 				--decodeOccurrenceBv()
@@ -483,6 +536,7 @@ class MpiFromDatasetSignatureToPattern:
 		"""		
 		sys.stderr.write("node %s starts patternFormation ...\n"%(communicator.rank))
 		codense2db_instance = codense2db()
+		dataset_no2signature_set = index_signature2pattern(signature2pattern)	#2026-10-18
 		counter = 0
 		for edge_occurrenceBinaryForm_row in edge_sig_matrix:
 			counter += 1
@@ -490,34 +544,34 @@ class MpiFromDatasetSignatureToPattern:
 			occurrenceBinaryForm = edge_occurrenceBinaryForm_row[2]	#08-24-05	already encoded when edge_sig_matrix is filled in
 			#occurrence_vector = decodeOccurrenceToBv(occurrenceBinaryForm, no_of_datasets)
 			signatureToBeDeleted = []
-			for signature in signature2pattern:
+			for signature in get_satisfied_signature_ls(occurrenceBinaryForm, dataset_no2signature_set):
 				frequency = signature2pattern[signature][0]
-				if (occurrenceBinaryForm&signature)==signature:
-					signature2pattern[signature].append(edge)
+				signature2pattern[signature].append(edge)
+				"""
+				if debug:
+					sys.stderr.write("the occurrence_vector of edge %s is %s\n"%(repr(edge), \
+						repr(decodeOccurrenceToBv(occurrenceBinaryForm, no_of_datasets))))
+					sys.stderr.write("occurrence_vector's binary form is %s, signature is %s\n"%(occurrenceBinaryForm, signature))
+				"""
+				if len(signature2pattern[signature]) == frequency+1:	#the 1st entry is frequency
+					signatureToBeDeleted.append(signature)
 					"""
 					if debug:
-						sys.stderr.write("the occurrence_vector of edge %s is %s\n"%(repr(edge), \
-							repr(decodeOccurrenceToBv(occurrenceBinaryForm, no_of_datasets))))
-						sys.stderr.write("occurrence_vector's binary form is %s, signature is %s\n"%(occurrenceBinaryForm, signature))
-					"""
-					if len(signature2pattern[signature]) == frequency+1:	#the 1st entry is frequency
-						signatureToBeDeleted.append(signature)
-						"""
-						if debug:
-							sys.stderr.write("signature %s to be deleted, its pattern is %s\n"%(signature, repr(signature2pattern[signature])))
-						"""
-					"""
-					edge_tuple = tuple(edge)
-					if edge_tuple not in edge2occurrence_vector:
-						edge2occurrence_vector[edge_tuple] = [1]
-						edge2occurrence_vector[edge_tuple].append(occurrence_vector)
-					else:
-						edge2occurrence_vector[edge_tuple][0] += 1
+						sys.stderr.write("signature %s to be deleted, its pattern is %s\n"%(signature, repr(signature2pattern[signature])))
 					"""
+				"""
+				edge_tuple = tuple(edge)
+				if edge_tuple not in edge2occurrence_vector:
+					edge2occurrence_vector[edge_tuple] = [1]
+					edge2occurrence_vector[edge_tuple].append(occurrence_vector)
+				else:
+					edge2occurrence_vector[edge_tuple][0] += 1
+				"""
 			for signature in signatureToBeDeleted:
 				edge_list = signature2pattern[signature][1:]
 				outputCcFromEdgeList(of, signature, edge_list, codense2db_instance, min_cluster_size, no_cc)
 				del signature2pattern[signature]
+				remove_signature_from_index(signature, dataset_no2signature_set)
 		sys.stderr.write("node %s patternFormation done.\n"%(communicator.rank))
 	
 	def input_handler(self, parameter_list, message_size, report=0):
@@ -11,6 +11,8 @@ Option:
 	-d ..., --max_degree=...	maximum degree of freedom(#columns-2), 10000,(default).
 	-t ..., --top_percentage=...	0.01(default).
 		if p_value_cut_off=0 and cor_cut_off=0, top_percentage is used to select edges.
+	-s ..., --block_size=...	tile width of graph_modeling's blocked correlation engine, 0(default, no tiling)
+		0 means gene pair by gene pair(the old way, edges in the old order).
 	-b, --debug	debug version.
 	-l, --leave_one_out	leave_one_out.
 	-h, --help	Display the usage infomation.
@@ -45,10 +47,12 @@ class MpiGraphModeling:
 		the mpi version of graph_modeling.cc
 	"""
 	def __init__(self, input_dir=None, output_dir=None, p_value_cut_off='0.01', cor_cut_off='0.6', \
-		max_degree='10000', top_percentage="0.01", leave_one_out=0, debug=0):
+		max_degree='10000', top_percentage="0.01", leave_one_out=0, debug=0, block_size=None):
 		"""
 		05-13-05
 			parameters to be passed to graph_modeling must be in string form.
+		2026-10-18
+			add block_size, None means graph_modeling's default(no tiling)
 		"""
 		self.input_dir = input_dir
 		self.output_dir = output_dir
@@ -58,6 +62,7 @@ class MpiGraphModeling:
 		self.top_percentage = top_percentage
 		self.leave_one_out = int(leave_one_out)
 		self.debug = int(debug)
+		self.block_size = block_size
 		
 	
 	def schedule_jobs(self, communicator, bin_path, input_dir, output_dir, parameters):
@@ -142,7 +147,10 @@ class MpiGraphModeling:
 		
 		homedir = os.path.expanduser('~')
 		bin_path = os.path.join(homedir,'script/annot/bin/graph/graph_modeling')
-		parameters = '-p %s -c %s -d %s -t %s'%(self.p_value_cut_off, self.cor_cut_off, self.max_degree, self.top_percentage)
+		parameters = '-p %s -c %s -d %s -t %s'%(self.p_value_cut_off, self.cor_cut_off, self.max_degree, \
+			self.top_percentage)
+		if self.block_size is not None:
+			parameters += ' -s %s'%self.block_size
 		if self.leave_one_out:
 			parameters += ' -l'
 		
@@ -154,9 +162,9 @@ if __name__ == '__main__':
 		sys.exit(2)
 	
 	long_options_list = ["help", "input_dir=", "output_dir=", "p_value_cut_off=", "cor_cut_off=", "max_degree=",\
-		"top_percentage=", "leave_one_out", "debug"]
+		"top_percentage=", "leave_one_out", "debug", "block_size="]
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hi:o:p:c:d:t:lb", long_options_list)
+		opts, args = getopt.getopt(sys.argv[1:], "hi:o:p:c:d:t:lbs:", long_options_list)
 	except:
 		print __doc__
 		sys.exit(2)
@@ -169,6 +177,7 @@ if __name__ == '__main__':
 	top_percentage = "0.01"
 	leave_one_out = 0
 	debug = 0
+	block_size = None
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -189,10 +198,12 @@ if __name__ == '__main__':
 			leave_one_out = 1
 		elif opt in ("-b", "--debug"):
 			debug = 1
+		elif opt in ("-s", "--block_size"):
+			block_size = arg
 
 	if input_dir and output_dir:
 		instance = MpiGraphModeling(input_dir, output_dir, p_value_cut_off, cor_cut_off, max_degree, \
-			top_percentage, leave_one_out, debug)
+			top_percentage, leave_one_out, debug, block_size)
 		instance.run()
 	else:
 		print __doc__
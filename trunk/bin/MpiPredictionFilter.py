@@ -48,7 +48,7 @@ else:   #32bit
 	sys.path.insert(0, os.path.expanduser('~/lib/python'))
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
 import sys, os, getopt, cPickle	#10-15-05 cPickle is used to serialize objects to pass between nodes
-from codense.common import db_connect, form_schema_tables, get_gene_no2go_no_set, output_node
+from codense.common import db_connect, form_schema_tables, get_gene_no2go_no_set, output_node, table_bulk_writer
 from Scientific import MPI
 from codense.common import mpi_synchronize
 from gene_stat import gene_stat
@@ -637,7 +637,22 @@ class MpiPredictionFilter:
 				)"%gene_table)
 		sys.stderr.write("Done.\n")	
 
-	def submit_to_p_gene_table(self, curs, p_gene_table, p_attr_instance):
+	p_gene_column_ls = ['gene_no', 'go_no', 'is_correct', 'is_correct_l1', 'is_correct_lca', 'avg_p_value', \
+		'no_of_clusters', 'cluster_array', 'p_value_cut_off', 'recurrence_cut_off', 'connectivity_cut_off', \
+		'cluster_size_cut_off', 'unknown_cut_off', 'depth_cut_off', 'mcl_id', 'lca_list', 'vertex_gradient', 'edge_gradient']
+	
+	def get_p_gene_table_writer(self, curs, p_gene_table, with_p_gene_id=1, block_size=5000):
+		"""
+		2026-10-18
+			a table_bulk_writer for submit_to_p_gene_table()
+		"""
+		if with_p_gene_id:
+			column_ls = ['p_gene_id'] + self.p_gene_column_ls
+		else:
+			column_ls = self.p_gene_column_ls
+		return table_bulk_writer(curs, p_gene_table, column_ls, block_size)
+	
+	def submit_to_p_gene_table(self, curs, p_gene_table, p_attr_instance, p_gene_table_writer=None):
 		"""
 		10-05-05
 		10-09-05
@@ -646,11 +661,23 @@ class MpiPredictionFilter:
 			judge if p_attr_instance.vertex_gradient and edge_gradient is None or not
 		10-21-05
 			if p_gene_id==-2, means don't submit p_gene_id
+		2026-10-18
+			if p_gene_table_writer(from get_p_gene_table_writer()) is given, the row is buffered in it.
 		"""
 		if not p_attr_instance.vertex_gradient:
 			p_attr_instance.vertex_gradient =0.0
 		if not p_attr_instance.edge_gradient:
 			p_attr_instance.edge_gradient = 0.0
+		if p_gene_table_writer and (p_attr_instance.p_gene_id!=-2)==(p_gene_table_writer.column_ls[0]=='p_gene_id'):
+			row = [p_attr_instance.gene_no, p_attr_instance.go_no, p_attr_instance.is_correct, p_attr_instance.is_correct_l1,\
+				p_attr_instance.is_correct_lca, p_attr_instance.avg_p_value, p_attr_instance.no_of_clusters, p_attr_instance.cluster_array, \
+				p_attr_instance.p_value_cut_off, p_attr_instance.recurrence_cut_off, p_attr_instance.connectivity_cut_off, \
+				p_attr_instance.cluster_size_cut_off, p_attr_instance.unknown_cut_off, p_attr_instance.depth_cut_off, \
+				p_attr_instance.mcl_id, p_attr_instance.lca_list or None, p_attr_instance.vertex_gradient, p_attr_instance.edge_gradient]
+			if p_attr_instance.p_gene_id!=-2:
+				row.insert(0, p_attr_instance.p_gene_id)
+			p_gene_table_writer.add_row(row)
+			return
 		if p_attr_instance.p_gene_id==-2:
 			if p_attr_instance.lca_list:
 				curs.execute("insert into %s(gene_no, go_no, is_correct, is_correct_l1, \
@@ -714,12 +741,14 @@ class MpiPredictionFilter:
 		"""
 		10-21-05
 			called by common.output_node()
+		2026-10-18
+			add p_gene_table_writer
 		"""
-		curs, output_table = parameter_list
+		curs, output_table, p_gene_table_writer = parameter_list
 		prediction_ls = cPickle.loads(data)
 		for row in prediction_ls:
 			p_attr_instance = prediction_attributes(row, type=2)
-			self.submit_to_p_gene_table(curs, output_table, p_attr_instance)
+			self.submit_to_p_gene_table(curs, output_table, p_attr_instance, p_gene_table_writer)
 	
 	def run(self):
 		"""
@@ -820,9 +849,11 @@ class MpiPredictionFilter:
 			self.computing_node(communicator, gene_no2go, self.exponent, self.score_list, \
 				self.max_layer, self.norm_exp, self.eg_d_type, mcl_id2accuracy, self.acc_cut_off, functor)
 		elif node_rank==communicator.size-1:
-			parameter_list = [curs, new_schema_instance.p_gene_table]
+			p_gene_table_writer = self.get_p_gene_table_writer(curs, new_schema_instance.p_gene_table)
+			parameter_list = [curs, new_schema_instance.p_gene_table, p_gene_table_writer]
 			free_computing_nodes = range(1,communicator.size-1)
 			output_node(communicator, free_computing_nodes, parameter_list, self.output_node_handler)
+			p_gene_table_writer.close()
 			if self.commit:
 				curs.execute("end")
 
@@ -6,13 +6,18 @@ Option:
 	-z ..., --hostname=...	the hostname, zhoudb(default)
 	-d ..., --dbname=...	the database name, graphdb(default)
 	-k ..., --schema=...	which schema in the database
-	-i ...,	--inputfile=...	the input file, dataset signature output by fim
+	-i ...,	--inputfile=...	the input file, dataset signature output by fim,
+		text or binary(codense/pattern_record.py, detected). Output is in the same format.
 	-o ..., --outputfile=...	the output file
 	-m ..., --min_sup=...	minimum support of an edge in the database, 0(default)
 	-x ..., --max_sup=...	maximum support of an edge, 200(default)
 	-s ..., --min_size=...	minimum size of a cluster(5 default)
 	-a ...,	alpha value(0.05, default)
 	-v ...,	message size(10,000,000, default)
+	-n ...,	no of local worker processes, 0(default, run under MPI)
+		if >0, run on this box without MPI, i.e. python MpiRecurrenceFilter.py -n 8 ...
+	-e ...,	edge_store file(codense/edge_store.py), edge occurrences from it, no database
+		(-k is not needed)
 	-b,	debug version.
 	-r,	enable report flag
 	-h, --help	Display the usage infomation.
@@ -25,6 +30,8 @@ Examples:
 Description:
 	Program to filter clusters based on recurrence and no_of_edges.
 	10-28-05 p-value log(ln)ged.
+	2026-10-18 log probabilities of edges are computed once, a pattern's probability is their
+		sum(no underflow), and its tail is codense.distribution_tail.pbinom_log_prob().
 """
 import sys, os, math
 bit_number = math.log(sys.maxint)/math.log(2)
@@ -34,19 +41,29 @@ if bit_number>40:       #64bit
 else:   #32bit
 	sys.path.insert(0, os.path.expanduser('~/lib/python'))
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
-import sys, os, getopt, csv, math, cPickle
-from Scientific import MPI
+import sys, os, getopt, csv, math, cPickle, re
+try:
+	from Scientific import MPI
+except ImportError:	#2026-10-18 local_node_run() doesn't need MPI
+	MPI = None
 from codense.common import mpi_synchronize, db_connect, output_node, get_edge2occurrence,\
-	computing_node, input_node
+	computing_node, input_node, local_node_run
 from sets import Set
-from rpy import r
+from codense.distribution_tail import pbinom_log_prob, negative_infinity
+from codense.pattern_record import pattern_reader, pattern_writer, is_pattern_file
+
+integer_pattern = re.compile(r'\d+')
 
 class MpiRecurrenceFilter:
 	def __init__(self,hostname='zhoudb', dbname='graphdb', schema=None, inputfile=None,\
 		outputfile=None, min_sup=0, max_sup=200,  min_size=5, alpha=0.05, \
-		message_size=10000000, debug=0, report=0):
+		message_size=10000000, debug=0, report=0, no_of_workers=0, edge_store_fname=None):
 		"""
 		10-22-05
+		2026-10-18
+			add no_of_workers
+		2026-10-18
+			add edge_store_fname
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -58,6 +75,8 @@ class MpiRecurrenceFilter:
 		self.min_size = int(min_size)
 		self.alpha = float(alpha)
 		self.message_size = int(message_size)
+		self.no_of_workers = int(no_of_workers)
+		self.edge_store_fname = edge_store_fname
 		self.debug = int(debug)
 		self.report = int(report)
 	
@@ -79,30 +98,63 @@ class MpiRecurrenceFilter:
 			sys.stderr.write("Fetching done.\n")
 		return block
 	
+	def get_edge2log_prob(self, edge2occurrrence, no_of_datasets):
+		"""
+		2026-10-18
+			log(occurrence/no_of_datasets) of each edge, once, not for each pattern
+		"""
+		edge2log_prob = {}
+		log_no_of_datasets = math.log(no_of_datasets)
+		for edge, occurrence in edge2occurrrence.iteritems():
+			if occurrence>0:
+				edge2log_prob[edge] = math.log(occurrence) - log_no_of_datasets
+			else:
+				edge2log_prob[edge] = negative_infinity
+		return edge2log_prob
+	
+	def get_pattern_log_prob(self, edge_no_ls, edge2log_prob):
+		"""
+		2026-10-18
+			edge_no_ls is the flattened edge_set, gene_no1, gene_no2, gene_no1, gene_no2, ...
+		"""
+		log_prob_ls = []
+		for i in range(0, len(edge_no_ls), 2):
+			gene_no1 = edge_no_ls[i]
+			gene_no2 = edge_no_ls[i+1]
+			if gene_no1<gene_no2:
+				log_prob_ls.append(edge2log_prob[(gene_no1, gene_no2)])
+			else:
+				log_prob_ls.append(edge2log_prob[(gene_no2, gene_no1)])
+		return math.fsum(log_prob_ls)
+	
 	def node_fire(self, communicator, data, parameter_list):
 		"""
 		10-22-05
+		2026-10-18
+			edge2log_prob instead of edge2occurrrence, the pattern probability stays in log space.
+			row could be a decoded binary record.
 		"""
 		node_rank = communicator.rank
 		sys.stderr.write("Node no.%s working...\n"%node_rank)
 		data = cPickle.loads(data)
-		min_size, alpha, edge2occurrrence, no_of_datasets = parameter_list
+		min_size, alpha, edge2log_prob, no_of_datasets = parameter_list
 		result = []
 		for row in data:
-			vertex_set = row[0][1:-1].split(',')
+			if type(row[0])==list:	#2026-10-18 binary record
+				vertex_set, edge_set, recurrence_array = row[:3]
+				edge_no_ls = []
+				for edge in edge_set:
+					edge_no_ls += edge
+			else:
+				vertex_set = row[0][1:-1].split(',')
+				recurrence_array = row[2][1:-1].split(',')
+				recurrence_array = map(float, recurrence_array)
+				edge_no_ls = map(int, integer_pattern.findall(row[1]))
 			if len(vertex_set)<min_size:	#too small
 				continue
-			recurrence_array = row[2][1:-1].split(',')
-			recurrence_array = map(float, recurrence_array)
 			recurrence = sum([int(occurrence==1) for occurrence in recurrence_array])
-			prob = 1.0
-			edge_set = row[1][2:-2].split('], [')
-			for edge in edge_set:
-				edge = edge.split(',')
-				edge = map(int, edge)
-				edge.sort()
-				prob *= edge2occurrrence[tuple(edge)]/float(no_of_datasets)
-			p_value = r.pbinom(recurrence-1, no_of_datasets, prob, lower_tail=r.FALSE,log_p=r.TRUE)
+			log_prob = self.get_pattern_log_prob(edge_no_ls, edge2log_prob)
+			p_value = pbinom_log_prob(recurrence-1, no_of_datasets, log_prob, lower_tail=0, log_p=1)
 			if p_value<=alpha:
 				result.append(row)
 		sys.stderr.write("Node no.%s done with %s/%s clusters left.\n"%(node_rank, len(result), len(data)))
@@ -118,39 +170,94 @@ class MpiRecurrenceFilter:
 			writer.writerow(row)
 		
 	
+	def get_edge2log_prob_from_source(self):
+		"""
+		2026-10-18
+			edge2occurrrence from the edge_store file if given, otherwise the database
+		"""
+		if self.edge_store_fname:
+			edge2occurrrence, no_of_datasets = get_edge2occurrence(None, self.min_sup, self.max_sup, \
+				edge_store_fname=self.edge_store_fname)
+		else:
+			(conn, curs) =  db_connect(self.hostname, self.dbname, self.schema)
+			edge2occurrrence, no_of_datasets = get_edge2occurrence(curs, self.min_sup, self.max_sup)
+			del conn, curs
+		return self.get_edge2log_prob(edge2occurrrence, no_of_datasets), no_of_datasets
+	
+	def open_input(self):
+		"""
+		2026-10-18
+			binary pattern file or the text one
+		"""
+		if is_pattern_file(self.inputfile):
+			return iter(pattern_reader(self.inputfile))	#input_handler() resumes it
+		else:
+			return csv.reader(open(self.inputfile,'r'), delimiter='\t')
+	
+	def open_output(self):
+		"""
+		2026-10-18
+			same format as the input
+		"""
+		if is_pattern_file(self.inputfile):
+			return pattern_writer(self.outputfile)
+		else:
+			return csv.writer(open(self.outputfile, 'w'), delimiter='\t')
+	
+	def close_output(self, writer):
+		if isinstance(writer, pattern_writer):
+			writer.close()
+	
+	def local_run(self):
+		"""
+		2026-10-18
+			same handlers as run(), but via local_node_run() on one box
+		"""
+		edge2log_prob, no_of_datasets = self.get_edge2log_prob_from_source()
+		inf = self.open_input()
+		writer = self.open_output()
+		local_node_run([inf], [self.min_size, self.alpha, edge2log_prob, no_of_datasets], [writer], \
+			self.message_size, self.node_fire, self.output_handler, input_handler=self.input_handler, \
+			no_of_workers=self.no_of_workers, report=self.report)
+		self.close_output(writer)
+		del inf, writer
+	
 	def run(self):
 		"""
 		10-22-05
-			
+		2026-10-18
+			no_of_workers>0, local_run() instead
 		"""
+		if self.no_of_workers>0:
+			self.local_run()
+			return
 		communicator = MPI.world.duplicate()
 		node_rank = communicator.rank
 		free_computing_nodes = range(1,communicator.size-1)
 		print "this is node",node_rank
 		if node_rank == 0:
-			(conn, curs) =  db_connect(self.hostname, self.dbname, self.schema)
-			edge2occurrrence, no_of_datasets = get_edge2occurrence(curs, self.min_sup, self.max_sup)
-			edge2occurrrence_pickle = cPickle.dumps((edge2occurrrence, no_of_datasets), -1)
+			edge2log_prob, no_of_datasets = self.get_edge2log_prob_from_source()	#2026-10-18
+			edge2log_prob_pickle = cPickle.dumps((edge2log_prob, no_of_datasets), -1)
 			for node in free_computing_nodes:	#send it to the computing_node
-				communicator.send(edge2occurrrence_pickle, node, 0)
-			del conn, curs
+				communicator.send(edge2log_prob_pickle, node, 0)
 		elif node_rank in free_computing_nodes:	#exclude the last node
 			data, source, tag = communicator.receiveString(0, 0)
-			edge2occurrrence, no_of_datasets = cPickle.loads(data)
+			edge2log_prob, no_of_datasets = cPickle.loads(data)
 		
 		mpi_synchronize(communicator)
 		if node_rank == 0:
-			inf = csv.reader(open(self.inputfile,'r'), delimiter='\t')
+			inf = self.open_input()
 			parameter_list = [inf]
 			input_node(communicator, parameter_list, free_computing_nodes, self.message_size, self.report, input_handler=self.input_handler)
 			del inf
 		elif node_rank in free_computing_nodes:
-			parameter_list = [self.min_size, self.alpha, edge2occurrrence, no_of_datasets]
+			parameter_list = [self.min_size, self.alpha, edge2log_prob, no_of_datasets]
 			computing_node(communicator, parameter_list, self.node_fire, report=self.report)
 		elif node_rank == communicator.size-1:
-			writer = csv.writer(open(self.outputfile, 'w'), delimiter='\t')
+			writer = self.open_output()
 			parameter_list = [writer]
 			output_node(communicator, free_computing_nodes, parameter_list, self.output_handler, self.report)
+			self.close_output(writer)
 			del writer
 
 
@@ -160,7 +267,7 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:m:x:s:a:v:br", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:i:o:m:x:s:a:v:n:e:br", ["help", "hostname=", \
 			"dbname=", "schema=", "inputfile=", "outputfile=", "min_sup", "max_sup=", "min_size=", \
 			"debug", "report"])
 	except:
@@ -177,6 +284,8 @@ if __name__ == '__main__':
 	min_size = 5
 	alpha = 0.05
 	message_size = 10000000
+	no_of_workers = 0
+	edge_store_fname = None
 	debug = 0
 	report = 0
 	for opt, arg in opts:
@@ -203,13 +312,17 @@ if __name__ == '__main__':
 			alpha = float(arg)
 		elif opt in ("-v"):
 			message_size = int(arg)
+		elif opt in ("-n",):
+			no_of_workers = int(arg)
+		elif opt in ("-e",):
+			edge_store_fname = arg
 		elif opt in ("-b"):
 			debug = 1
 		elif opt in ("-r"):
 			report = 1
-	if schema and inputfile and outputfile:
+	if (schema or edge_store_fname) and inputfile and outputfile:
 		instance = MpiRecurrenceFilter(hostname, dbname, schema, inputfile, outputfile, \
-			min_sup, max_sup, min_size, alpha, message_size, debug, report)
+			min_sup, max_sup, min_size, alpha, message_size, debug, report, no_of_workers, edge_store_fname)
 		instance.run()
 	else:
 		print __doc__
@@ -6,7 +6,7 @@ Option:
 	-z ..., --hostname=...	the hostname, zhoudb(default)
 	-d ..., --dbname=...	the database name, graphdb(default)
 	-k ..., --schema=...	which schema in the database
-	-i ...,	input_fname, from MpiBFSCluster.py
+	-i ...,	input_fname, from MpiBFSCluster.py, text or binary(detected)
 	-j ..., jnput_fname(output file)
 	--de=...,	the minimum GO tree depth(root is 0) to consider, 5(default)
 	-u ...,	min #genes associated with the candidate go in layer 1, 2(default)
@@ -38,6 +38,8 @@ Description:
 	output format:
 	id, gene_no, go_no, GradientScorePrediction_instance.depth, gradient_score, edge_gradient, \
 	is_correct, is_correct_L1, is_correct_lca, one_dim_list2string(lca_list)
+	2026-10-18 a binary input_fname(codense/pattern_record.py) is shipped to the computing
+		nodes as raw records, which are decoded there instead of parsing repr() strings.
 """
 import sys, os, math
 bit_number = math.log(sys.maxint)/math.log(2)
@@ -52,10 +54,10 @@ from Scientific import MPI
 from codense.common import mpi_synchronize, db_connect, get_gene_no2go_no_set, get_go_no2depth,\
 	get_go_no2edge_counter_list, combine_numerator_a_denominator_dict, one_dim_list2string, \
 	get_no_of_unknown_genes, get_go_no2gene_no_set, form_schema_tables, output_node, input_node,\
-	computing_node
+	computing_node, string2d_matrix, get_known_genes_dict, get_go_no2term_id, get_go_term_id2depth, get_go_no_pair2lca_ls
+from codense.pattern_record import pattern_reader, is_pattern_file, decode_pattern, d_matrix_bytes2rows
 from sets import Set
 from MpiPredictionFilter import prediction_attributes, gradient_class, MpiPredictionFilter
-from gene_stat import gene_stat
 from heapq import heappush, heappop
 if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
 	from python2_3 import *
@@ -244,12 +246,14 @@ class GradientScorePrediction(gradient_class):
 		"""
 		01-02-06
 			d_matrix_string is from the output file of MpiBFSCluster.py
+		2026-10-18
+			use string2d_matrix(), which also takes MpiBFSCluster.py's hex form
+		2026-10-18
+			an already decoded d_matrix(list of rows) is taken as it is
 		"""
-		d_matrix = d_matrix_string[2:-2].split('], [')
-		for index in range(len(d_matrix)):
-			d_matrix[index] = d_matrix[index].split(',')
-			d_matrix[index] = map(int, d_matrix[index])
-		return d_matrix
+		if type(d_matrix_string)==list:
+			return d_matrix_string
+		return string2d_matrix(d_matrix_string)
 	
 	def get_candidate_go_nos(self, gene_no2go, go_no2depth, vertex2no, layer2no_of_vertices, d_row, depth,\
 		min_layer1_associated_genes, min_layer1_ratio, min_layer2_associated_genes, min_layer2_ratio):
@@ -568,6 +572,82 @@ class GradientScorePrediction(gradient_class):
 	
 
 
+class PredictionJudge:
+	"""
+	2026-10-18
+		in-memory replacement of the judge_node, replicated on every computing node.
+		Same verdicts as gene_stat.direct_match() and gene_stat.common_ancestor_deep_enough(),
+		but common ancestors come from the preloaded go_no_pair2lca_ls(see codense.common.get_go_no_pair2lca_ls)
+		instead of one database query per go_no pair.
+	"""
+	def __init__(self, known_genes_dict, go_no2depth, go_no_pair2lca_ls, depth_cut_off):
+		self.known_genes_dict = known_genes_dict
+		self.go_no2depth = go_no2depth
+		self.go_no_pair2lca_ls = go_no_pair2lca_ls
+		self.depth_cut_off = int(depth_cut_off)
+	
+	def common_ancestor_deep_enough(self, p_go_no, k_functions_set):
+		"""
+		2026-10-18
+			return is_correct_lca, lca_list
+		"""
+		if self.go_no2depth[p_go_no] < self.depth_cut_off:
+			return 0, []
+		if p_go_no in k_functions_set:
+			return 1, [p_go_no]
+		max_depth = -1
+		lca_set = Set()
+		for k_go_no in k_functions_set:
+			if k_go_no < p_go_no:
+				key = (k_go_no, p_go_no)
+			else:
+				key = (p_go_no, k_go_no)
+			if key not in self.go_no_pair2lca_ls:
+				continue
+			depth, lca_ls = self.go_no_pair2lca_ls[key]
+			if depth > max_depth:
+				max_depth = depth
+				lca_set = Set(lca_ls)
+			elif depth == max_depth:
+				lca_set |= Set(lca_ls)
+		if lca_set:
+			lca_list = list(lca_set)
+			lca_list.sort()
+			return 1, lca_list
+		else:
+			return 0, []
+	
+	def judge(self, gene_no, go_no):
+		"""
+		2026-10-18
+			return [is_correct, is_correct_L1, is_correct_lca, lca_list], same as what judge_node sent back
+		"""
+		if gene_no in self.known_genes_dict:
+			k_functions_set = self.known_genes_dict[gene_no]
+			if self.go_no2depth[go_no] >= self.depth_cut_off and go_no in k_functions_set:
+				is_correct = 1
+			else:
+				is_correct = 0
+			is_correct_lca, lca_list = self.common_ancestor_deep_enough(go_no, k_functions_set)
+			return [is_correct, -2, is_correct_lca, lca_list]	#L1 is a waste of time. 10-20-05
+		else:
+			#unknown gene
+			return [-1, -1, -1, []]
+	
+	def judge_batch(self, gene_no_go_no_ls):
+		"""
+		2026-10-18
+			judge all predictions of one cluster, predictions sharing (gene_no, go_no) are judged once.
+		"""
+		pair2is_correct_ls = {}
+		is_correct_ls_ls = []
+		for gene_no, go_no in gene_no_go_no_ls:
+			key = (gene_no, go_no)
+			if key not in pair2is_correct_ls:
+				pair2is_correct_ls[key] = self.judge(gene_no, go_no)
+			is_correct_ls_ls.append(pair2is_correct_ls[key])
+		return is_correct_ls_ls
+
 class MpiStatCluster:
 	"""
 	10-20-05
@@ -612,6 +692,8 @@ class MpiStatCluster:
 		"""
 		01-02-06
 			input is from MpiBFSCluster.py's output
+		2026-10-18
+			a binary record comes as a string, it becomes [id, record]
 		"""
 		if report:
 			sys.stderr.write("Fetching stuff...\n")
@@ -620,7 +702,10 @@ class MpiStatCluster:
 		string_length = 0
 		for row in reader:
 			self.counter += 1
-			row.insert(0, self.counter)	#counter is used as id = line no
+			if type(row)==str:
+				row = [self.counter, row]
+			else:
+				row.insert(0, self.counter)	#counter is used as id = line no
 			block.append(row)
 			string_length += len(repr(row))	#the length to control MPI message size
 			if string_length>=message_size:
@@ -640,95 +725,62 @@ class MpiStatCluster:
 			starts to come from plain file
 		01-24-06
 			add recurrence_array to get recurrence
+		2026-10-18
+			predictions are judged in batch by the local PredictionJudge, not the judge_node
+		2026-10-18
+			decode binary records(2-element pattern)
 		"""
 		node_rank = communicator.rank
 		sys.stderr.write("Node no.%s working...\n"%node_rank)
-		GradientScorePrediction_instance, functor = parameter_list
+		GradientScorePrediction_instance, functor, judge_instance = parameter_list
 		data = cPickle.loads(data)
 		no_of_clusters = 0
 		no_of_predictions = 0
 		prediction_ls = []
 		for pattern in data:
-			#01-02-06
-			id, vertex_set_string, edge_set_string, recurrence_array_string, d_matrix_string = pattern
-			edge_set = edge_set_string[2:-2].split('], [')
-			for i in range(len(edge_set)):
-				edge_set[i] = edge_set[i].split(',')
-				edge_set[i] = map(int, edge_set[i])
+			if len(pattern)==2:	#2026-10-18 binary record
+				id, record = pattern
+				vertex_set, edge_set, recurrence_array, d_matrix_bytes = decode_pattern(record)
+				d_matrix_string = d_matrix_bytes2rows(d_matrix_bytes, len(vertex_set))
+			else:
+				#01-02-06
+				id, vertex_set_string, edge_set_string, recurrence_array_string, d_matrix_string = pattern
+				edge_set = edge_set_string[2:-2].split('], [')
+				for i in range(len(edge_set)):
+					edge_set[i] = edge_set[i].split(',')
+					edge_set[i] = map(int, edge_set[i])
+				vertex_set = vertex_set_string[1:-1].split(',')
+				vertex_set = map(int, vertex_set)
+				
+				#01-24-06
+				recurrence_array = recurrence_array_string[1:-1].split(',')
+				recurrence_array = map(float, recurrence_array)
 			no_of_edges = len(edge_set)
-			vertex_set = vertex_set_string[1:-1].split(',')
-			vertex_set = map(int, vertex_set)
-			
-			#01-24-06
-			recurrence_array = recurrence_array_string[1:-1].split(',')
-			recurrence_array = map(float, recurrence_array)
 			if functor:     #if functor is None, just the simple sum
 				recurrence_array = map(functor, recurrence_array)
 			recurrence = sum(recurrence_array)
 			
 			#Before call its get_prediction(), setup the vertex_set, edge_set, d_matrix
 			GradientScorePrediction_instance.setup_cluster_info(vertex_set, edge_set, d_matrix_string)
+			cluster_prediction_ls = []
 			for gene_no in vertex_set:
 				prediction_list = GradientScorePrediction_instance.get_prediction(gene_no)	#10-22-05
 				for gradient_score, edge_gradient, go_no in prediction_list:	#not None, None means no prediction.
-					#ask the judge_node if its' correct
-					communicator.send(cPickle.dumps([gene_no, go_no], -1), communicator.size-2, 3)	#tag is 3
-					data, source, tag = communicator.receiveString(communicator.size-2, 3)
-					is_correct, is_correct_L1, is_correct_lca, lca_list = cPickle.loads(data)
-					#01-02-06 reshuffle the row, 01-24-06 add recurrence
-					row = [id, gene_no, go_no, GradientScorePrediction_instance.depth, recurrence, gradient_score, edge_gradient, \
-						is_correct, is_correct_L1, is_correct_lca, one_dim_list2string(lca_list)]
-					prediction_ls.append(row)
-					no_of_predictions += 1
+					cluster_prediction_ls.append([gene_no, go_no, gradient_score, edge_gradient])
+			#2026-10-18 judge the whole cluster locally, no judge_node round trips
+			is_correct_ls_ls = judge_instance.judge_batch([(row[0], row[1]) for row in cluster_prediction_ls])
+			for i in range(len(cluster_prediction_ls)):
+				gene_no, go_no, gradient_score, edge_gradient = cluster_prediction_ls[i]
+				is_correct, is_correct_L1, is_correct_lca, lca_list = is_correct_ls_ls[i]
+				#01-02-06 reshuffle the row, 01-24-06 add recurrence
+				row = [id, gene_no, go_no, GradientScorePrediction_instance.depth, recurrence, gradient_score, edge_gradient, \
+					is_correct, is_correct_L1, is_correct_lca, one_dim_list2string(lca_list)]
+				prediction_ls.append(row)
+				no_of_predictions += 1
 			no_of_clusters += 1
 		sys.stderr.write("Node no.%s done with %s clusters, %s predictions.\n"%(node_rank, no_of_clusters, no_of_predictions))
 		return prediction_ls
 	
-	def cleanup_handler(self, communicator):
-		#tell the size-2 node to stop
-		communicator.send("-1", communicator.size-2, 3)	#tag is 3
-		#tell the last node to stop
-		communicator.send("-1", communicator.size-1, 1)	#tag is 1
-	
-	def judge_node(self, communicator, curs, gene_stat_instance, node_distance_class):
-		"""
-		10-20-05
-		"""
-		node_rank = communicator.rank
-		sys.stderr.write("Node no.%s ready to judge prediction...\n"%node_rank)
-		data, source, tag = communicator.receiveString(None, 3)	#tag is 3 for judge_node
-		no_of_resting_nodes = 0	#to keep track how many computing_nodes have rested
-		while 1:
-			if data=="-1":
-				no_of_resting_nodes += 1
-				if self.debug:
-					sys.stderr.write("From No.%s: node %s(%s-th) rested.\n"%(node_rank, source, no_of_resting_nodes))
-				if no_of_resting_nodes==communicator.size-3:	#WATCH: its' size-3
-					break
-					if self.report:
-						sys.stderr.write("node %s done, exit.\n"%node_rank)
-			else:
-				gene_no, go_no = cPickle.loads(data)
-				if gene_no in gene_stat_instance.known_genes_dict:
-					k_functions_set = gene_stat_instance.known_genes_dict[gene_no]
-					is_correct = gene_stat_instance.direct_match(go_no, k_functions_set)
-					is_correct_L1 = -2
-					#gene_stat_instance.L1_match(go_no, k_functions_set, node_distance_class, curs)
-					#L1 is a waste of time. 10-20-05
-					is_correct_lca = gene_stat_instance.common_ancestor_deep_enough(go_no, k_functions_set, node_distance_class, curs)
-				else:
-					#unknown gene
-					is_correct = -1
-					is_correct_L1 = -1
-					is_correct_lca = -1
-					#clear lca_list
-					gene_stat_instance.lca_list = []
-				is_correct_ls = [is_correct, is_correct_L1, is_correct_lca, gene_stat_instance.lca_list]
-				is_correct_ls_pickle = cPickle.dumps(is_correct_ls, -1)
-				communicator.send(is_correct_ls_pickle, source, 3)
-			data, source, tag = communicator.receiveString(None, 3)
-		sys.stderr.write("Node no.%s done.\n"%node_rank)
-	
 	def output_node_handler(self, communicator, parameter_list, data):
 		"""
 		10-21-05
@@ -755,13 +807,13 @@ class MpiStatCluster:
 				--form_schema_tables()
 				--get_gene_no2go_no_set()
 				--get_go_no2depth()
+				--get_known_genes_dict()
+				--get_go_no2term_id()
+				--get_go_term_id2depth()
+				--get_go_no_pair2lca_ls()
 				(pass data to computing_node)
 			(computing_node)
 				(take data from other nodes, 0 and size-1)
-			(judge_node)
-				--gene_stat()
-				--db_connect()
-				--gene_p_map_redundancy()
 			(output_node)
 				--db_connect()
 				--form_schema_tables()
@@ -775,13 +827,16 @@ class MpiStatCluster:
 				--fetch_cluster_block()
 			(computing_node)
 				--get_no_of_unknown_genes()
+				--PredictionJudge()
 				--node_fire_handler()
-				--cleanup_handler()
-			--judge_node()
-				--gene_stat_instance.(match functions)
+					--judge_instance.judge_batch()
 			--output_node()
 				--output_node_handler()
 					--MpiPredictionFilter_instance.submit_to_p_gene_table()
+		2026-10-18
+			the judge_node(size-2) is gone. Its data(known_genes_dict and the deep-enough lca's
+			of all go_no pairs) is broadcast to every computing node, which judges locally.
+			The size-2 node becomes a computing node.
 		"""
 		communicator = MPI.world.duplicate()
 		node_rank = communicator.rank
@@ -798,17 +853,29 @@ class MpiStatCluster:
 			go_no2depth_pickle = cPickle.dumps(go_no2depth, -1)
 			go_no2gene_no_set = get_go_no2gene_no_set(curs)
 			go_no2gene_no_set_pickle = cPickle.dumps(go_no2gene_no_set, -1)
-			for node in range(1, communicator.size-2):	#send it to the computing_node
+			#2026-10-18 data for the local PredictionJudge
+			known_genes_dict = get_known_genes_dict(curs)
+			known_genes_dict_pickle = cPickle.dumps(known_genes_dict, -1)
+			go_no_pair2lca_ls = get_go_no_pair2lca_ls(curs, get_go_no2term_id(curs), get_go_term_id2depth(curs), \
+				self.depth, report=self.report)
+			go_no_pair2lca_ls_pickle = cPickle.dumps(go_no_pair2lca_ls, -1)
+			for node in range(1, communicator.size-1):	#send it to the computing_node
 				communicator.send(gene_no2go_no_pickle, node, 0)
 				communicator.send(go_no2depth_pickle, node, 0)
 				communicator.send(go_no2gene_no_set_pickle, node, 0)
-		elif node_rank<=communicator.size-3:	#WATCH: last 2 nodes are not here.
+				communicator.send(known_genes_dict_pickle, node, 0)
+				communicator.send(go_no_pair2lca_ls_pickle, node, 0)
+		elif node_rank<=communicator.size-2:	#WATCH: last node is not here.
 			data, source, tag = communicator.receiveString(0, 0)
 			gene_no2go_no = cPickle.loads(data)	#take the data
 			data, source, tag = communicator.receiveString(0, 0)
 			go_no2depth = cPickle.loads(data)
 			data, source, tag = communicator.receiveString(0, 0)
 			go_no2gene_no_set = cPickle.loads(data)
+			data, source, tag = communicator.receiveString(0, 0)
+			known_genes_dict = cPickle.loads(data)
+			data, source, tag = communicator.receiveString(0, 0)
+			go_no_pair2lca_ls = cPickle.loads(data)
 			data, source, tag = communicator.receiveString(communicator.size-1, 0)	#from the last node
 			go_no2edge_counter_list = cPickle.loads(data)
 			#choose a functor for recurrence_array
@@ -816,12 +883,6 @@ class MpiStatCluster:
 				1: lambda x: int(x>=self.recurrence_x),
 				2: lambda x: math.pow(x, self.recurrence_x)}
 			functor = functor_dict[self.recurrence_x_type]
-		elif node_rank == communicator.size-2:	#judge node
-			gene_stat_instance = gene_stat(depth_cut_off=self.depth)
-			(conn, curs) =  db_connect(self.hostname, self.dbname, self.schema)
-			gene_stat_instance.dstruc_loadin(curs)
-			from gene_p_map_redundancy import gene_p_map_redundancy
-			node_distance_class = gene_p_map_redundancy()			
 		elif node_rank==communicator.size-1:	#establish connection before pursuing
 			(conn, curs) =  db_connect(self.hostname, self.dbname, self.schema)
 			"""
@@ -844,19 +905,22 @@ class MpiStatCluster:
 					gene_no2go_no = get_gene_no2go_no_set(curs)
 					go_no2edge_counter_list = get_go_no2edge_counter_list(curs, gene_no2go_no, self.edge_type2index)
 			go_no2edge_counter_list_pickle = cPickle.dumps(go_no2edge_counter_list, -1)
-			for node in range(1, communicator.size-2):	#send it to the computing_node
+			for node in range(1, communicator.size-1):	#send it to the computing_node
 				communicator.send(go_no2edge_counter_list_pickle, node, 0)
 		
 		mpi_synchronize(communicator)
 		
-		free_computing_nodes = range(1,communicator.size-2)	#exclude the last node
+		free_computing_nodes = range(1,communicator.size-1)	#exclude the last node
 		if node_rank == 0:
 			"""
 			curs.execute("DECLARE crs CURSOR FOR SELECT id, vertex_set, edge_set, no_of_edges,\
 			connectivity, unknown_gene_ratio, recurrence_array, d_matrix from %s"%(old_schema_instance.pattern_table))
 			"""
 			self.counter = 0	#01-02-06 counter is used as id
-			reader = csv.reader(open(self.input_fname, 'r'), delimiter='\t')
+			if is_pattern_file(self.input_fname):	#2026-10-18
+				reader = pattern_reader(self.input_fname).iter_payloads()
+			else:
+				reader = csv.reader(open(self.input_fname, 'r'), delimiter='\t')
 			parameter_list = [reader]
 			input_node(communicator, parameter_list, free_computing_nodes, self.message_size, \
 				self.report, input_handler=self.input_handler)
@@ -867,10 +931,9 @@ class MpiStatCluster:
 				go_no2edge_counter_list, no_of_unknown_genes, self.depth, self.min_layer1_associated_genes, \
 				self.min_layer1_ratio, self.min_layer2_associated_genes, self.min_layer2_ratio, self.exponent, \
 				self.score_list, self.max_layer, self.norm_exp, self.eg_d_type, self.debug)
-			parameter_list = [GradientScorePrediction_instance, functor]
-			computing_node(communicator, parameter_list, self.node_fire_handler, self.cleanup_handler, self.report)
-		elif node_rank == communicator.size-2:
-			self.judge_node(communicator, curs, gene_stat_instance, node_distance_class)
+			judge_instance = PredictionJudge(known_genes_dict, go_no2depth, go_no_pair2lca_ls, self.depth)
+			parameter_list = [GradientScorePrediction_instance, functor, judge_instance]
+			computing_node(communicator, parameter_list, self.node_fire_handler, report=self.report)
 		elif node_rank==communicator.size-1:
 			#01-02-06 output goes to plain file, not database
 			writer = csv.writer(open(self.jnput_fname, 'w'), delimiter='\t')
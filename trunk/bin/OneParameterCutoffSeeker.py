@@ -36,8 +36,8 @@ else:   #32bit
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
 import sys, os, getopt
 from codense.common import db_connect
-from p_gene_lm import p_gene_lm
-from heapq import heappush, heappop
+from p_gene_lm import p_gene_lm, accuracy_curve
+from heapq import heappush
 
 class OneParameterCutoffSeeker:
 	def __init__(self, hostname=None, dbname=None, schema=None, p_gene_table=None, \
@@ -105,66 +105,48 @@ class OneParameterCutoffSeeker:
 		sys.stderr.write("Got prediction_heap.\n")
 		return prediction_heap
 	
-	def get_sorted_param_acc_list(self, prediction_heap):
+	def get_accuracy_curve(self, prediction_heap):
 		"""
-		10-27-05 Calculate the accuracy for each param from highest to lowest
+		2026-10-18
+			accuracy for each param, one pass over the predictions via p_gene_lm's accuracy_curve
+			a prediction_pair counts only once, at its highest param.
 		"""
-		sys.stderr.write("Getting sorted_param_acc_list...\n")
-		sorted_param_acc_list = []
-		prediction_pair2highest_param = {}
-		if len(prediction_heap)>0:
-			prev_param, is_correct, gene_no, go_no = heappop(prediction_heap)
-			prev_param = -prev_param	#reverse the sign
-			prediction_pair2highest_param[(gene_no,go_no)] = prev_param
-			if is_correct==1:
-				no_of_correct = 1
-				no_of_wrong = 0
-			elif is_correct==0:
-				no_of_correct = 0
-				no_of_wrong = 1
-		else:
+		sys.stderr.write("Getting accuracy_curve...\n")
+		if len(prediction_heap)==0:
 			sys.stderr.write("No prediction.\n")
 			sys.exit(2)
-		while len(prediction_heap)>0:
-			param, is_correct, gene_no, go_no = heappop(prediction_heap)
-			param = -param	#reverse the sign
-			if param != prev_param:	#new param, calculate the acc for the prev_param
-				acc = float(no_of_correct)/(no_of_correct+no_of_wrong)
-				sorted_param_acc_list.append([prev_param, no_of_correct, no_of_wrong, acc])
-				if self.debug:
-					print "prev_param",prev_param,"no_of_correct",no_of_correct,"no_of_wrong",no_of_wrong,"acc",acc
-					raw_input("Continue?(Y/n)")
-				prev_param = param
-			#following prediction_pair judgement must be after param!=prev_param judgement
-			prediction_pair = (gene_no, go_no)
-			if prediction_pair not in prediction_pair2highest_param:	#judge whether the prediction_pair redundant or not
-				prediction_pair2highest_param[prediction_pair] = param
-				if is_correct==1:
-					no_of_correct += 1
-				elif is_correct==0:
-					no_of_wrong += 1
-		#handle the last param
-		acc = float(no_of_correct)/(no_of_correct+no_of_wrong)
-		sorted_param_acc_list.append([prev_param, no_of_correct, no_of_wrong, acc])
-		
-		sys.stderr.write("Got sorted_param_acc_list.\n")
+		score_list = [[-row[0], row[1], row[2], row[3]] for row in prediction_heap]	#reverse the sign
+		accuracy_curve_instance = accuracy_curve(score_list, no_redundancy=1)
+		if self.debug:
+			for row in self.get_sorted_param_acc_list(accuracy_curve_instance):
+				print "param",row[0],"no_of_correct",row[1],"no_of_wrong",row[2],"acc",row[3]
+		sys.stderr.write("Got accuracy_curve.\n")
+		return accuracy_curve_instance
+	
+	def get_sorted_param_acc_list(self, accuracy_curve_instance):
+		"""
+		10-27-05 Calculate the accuracy for each param from highest to lowest
+		2026-10-18
+			read off accuracy_curve_instance(from get_accuracy_curve())
+		"""
+		sorted_param_acc_list = []
+		for i in range(len(accuracy_curve_instance.threshold_ls)-1, -1, -1):
+			sorted_param_acc_list.append([accuracy_curve_instance.threshold_ls[i], accuracy_curve_instance.no_of_correct_ls[i], \
+				accuracy_curve_instance.no_of_wrong_ls[i], accuracy_curve_instance.accuracy_ls[i]])
 		return sorted_param_acc_list
 	
-	def get_cutoff(self, sorted_param_acc_list, accuracy_cut_off):
+	def get_cutoff(self, accuracy_curve_instance, accuracy_cut_off):
 		"""
 		10-27-05 From lowest to highest, seek the param giving the accuracy>=accuracy_cut_off
+		2026-10-18
+			a bisect on accuracy_curve_instance, [param, no_of_correct, no_of_wrong, acc] or None
 		"""
-		sys.stderr.write("Getting cutoff...\n")
-		no_of_diff_params = len(sorted_param_acc_list)
-		for i in range(len(sorted_param_acc_list)):
-			if sorted_param_acc_list[no_of_diff_params-1-i][-1] >= accuracy_cut_off:
-				break
-		if sorted_param_acc_list[no_of_diff_params-1-i][-1] >= accuracy_cut_off:
+		cutoff_row = accuracy_curve_instance.get_row_by_accuracy(accuracy_cut_off)
+		if cutoff_row:
 			sys.stderr.write("Got cutoff.\n")
-			return sorted_param_acc_list[no_of_diff_params-1-i]
 		else:
 			sys.stderr.write("No param's value meeting the accuracy.\n")
-			return None
+		return cutoff_row
 	
 	def run(self):
 		"""
@@ -173,7 +155,7 @@ class OneParameterCutoffSeeker:
 			--db_connect()
 			--get_prediction_step()
 			--get_prediction_heap()
-			--get_sorted_param_acc_list()
+			--get_accuracy_curve()
 			--get_cutoff()
 			--lm_table_create()
 			--submit()
@@ -184,10 +166,10 @@ class OneParameterCutoffSeeker:
 			self.judger_type)
 		prediction_heap = self.get_prediction_heap(curs, self.p_gene_table, p_gene_lm_instance.is_correct_dict, \
 			self.judger_type, self.which_dict, self.which, step)
-		sorted_param_acc_list = self.get_sorted_param_acc_list(prediction_heap)
+		accuracy_curve_instance = self.get_accuracy_curve(prediction_heap)
 		del prediction_heap	#10-27-05 release memory
-		cutoff_row = self.get_cutoff(sorted_param_acc_list, self.accuracy_cut_off)
-		del sorted_param_acc_list	#10-27-05 release memory
+		cutoff_row = self.get_cutoff(accuracy_curve_instance, self.accuracy_cut_off)
+		del accuracy_curve_instance	#10-27-05 release memory
 		print "cutoff_row",cutoff_row
 		if self.commit and cutoff_row and self.lm_table:	#cutoff_row is not None
 			p_gene_lm_instance.lm_table_create(curs, self.lm_table)
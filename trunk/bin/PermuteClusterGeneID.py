@@ -17,6 +17,7 @@ Examples:
 
 Description:
 	Program to permute the Gene Id of output of MpiBFSCluster.py
+	2026-10-18 a binary input(codense/pattern_record.py) gives a binary output.
 	 
 """
 
@@ -28,6 +29,7 @@ else:   #32bit
 	sys.path.insert(0, os.path.expanduser('~/lib/python'))
 import sys, os, getopt, csv, random
 from codense.common import db_connect
+from codense.pattern_record import pattern_reader, pattern_writer, is_pattern_file
 
 class PermuteClusterGeneID:
 	def __init__(self, hostname='zhoudb', dbname='graphdb', schema=None,input_fname=None, output_fname=None, \
@@ -57,6 +59,13 @@ class PermuteClusterGeneID:
 		return old_gene_id2new
 	
 	def permute_cluster_file(self, input_fname, output_fname, old_gene_id2new):
+		"""
+		2026-10-18
+			binary input_fname goes to permute_pattern_file()
+		"""
+		if is_pattern_file(input_fname):
+			self.permute_pattern_file(input_fname, output_fname, old_gene_id2new)
+			return
 		sys.stderr.write("Permuting cluster file %s..."%os.path.basename(input_fname))
 		reader = csv.reader(open(input_fname, 'r'), delimiter = '\t')
 		writer = csv.writer(open(output_fname, 'w'), delimiter='\t')
@@ -78,6 +87,27 @@ class PermuteClusterGeneID:
 		del reader, writer
 		sys.stderr.write("Done.\n")
 	
+	def permute_pattern_file(self, input_fname, output_fname, old_gene_id2new):
+		"""
+		2026-10-18
+			binary version of permute_cluster_file(), the records need no parsing
+		"""
+		sys.stderr.write("Permuting pattern file %s..."%os.path.basename(input_fname))
+		reader = pattern_reader(input_fname)
+		writer = pattern_writer(output_fname)
+		for vertex_list, edge_list, recurrence_array, d_matrix in reader:
+			vertex_list = [old_gene_id2new[gene_no] for gene_no in vertex_list]
+			vertex_list.sort()
+			for i in range(len(edge_list)):
+				edge_tuple = [old_gene_id2new[gene_no] for gene_no in edge_list[i]]
+				edge_tuple.sort()
+				edge_list[i] = edge_tuple
+			edge_list.sort()
+			writer.write(vertex_list, edge_list, recurrence_array, d_matrix)
+		reader.close()
+		writer.close()
+		sys.stderr.write("Done.\n")
+	
 	def run(self):
 		(conn, curs) =  db_connect(self.hostname, self.dbname, self.schema)
 		old_gene_id2new  = self.get_gene_id_permutation_dict(curs)
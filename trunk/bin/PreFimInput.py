@@ -7,6 +7,7 @@ Option:
 	-d ..., --dbname=...	the database name, graphdb(default, IGNORE)
 	-k ..., --schema=...	which schema in the database, IGNORE
 	-s ...,	sig_vector file
+	-e ...,	edge_store file(codense/edge_store.py), alternative to -s
 	-m ..., --min_sup=...	minimum support of an edge in the database, 0(default)
 	-x ..., --max_sup=...	maximum support of an edge, 200(default)
 	-t ...,	delimiter for the outputfile, 'tab'(default) (IGNORE)
@@ -31,22 +32,37 @@ else:   #32bit
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
 import sys, os, psycopg, getopt, csv
 from codense.common import db_connect
+from codense.edge_store import edge_store
 if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
         from python2_3 import *
 
 def output_edge_data_fim_edge_oriented(outputfile, min_support=3, \
 	max_support=200, hostname='zhoudb', dbname='graphdb', \
-	schema='sc_new_38', debug=0, edge_table='edge_cor_vector'):
+	schema='sc_new_38', debug=0, edge_table='edge_cor_vector', edge_store_fname=None):
 	"""
 	08-07-05
 		copied from misc.py
+	2026-10-18
+		read from the binary edge_store if edge_store_fname is given
 	"""
-	conn, curs = db_connect(hostname, dbname, schema)
-	
 	fname = outputfile
 	writer = csv.writer(open(fname,'w'),delimiter='\t')
 	
 	sys.stderr.write("Getting edge matrix for all functions...\n")
+	if edge_store_fname:
+		edge_store_instance = edge_store(edge_store_fname)
+		for row_no in edge_store_instance.get_row_no_ls(min_support, max_support):
+			sig_vector = edge_store_instance.get_sig_vector(row_no)
+			new_row = []
+			for i in range(len(sig_vector)):
+				if sig_vector[i]==1:
+					new_row.append(i+1)
+			writer.writerow(new_row)
+		edge_store_instance.close()
+		sys.stderr.write("Done\n")
+		return
+	
+	conn, curs = db_connect(hostname, dbname, schema)
 	curs.execute("DECLARE crs CURSOR FOR select edge_id,sig_vector \
 		from %s"%(edge_table))
 	curs.execute("fetch 5000 from crs")
@@ -137,7 +153,7 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:s:m:x:t:y:br", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:s:e:m:x:t:y:br", ["help", "hostname=", \
 			"dbname=", "schema=", "min_sup", "max_sup=", "debug"])
 	except:
 		print __doc__
@@ -147,6 +163,7 @@ if __name__ == '__main__':
 	dbname = 'graphdb'
 	schema = ''
 	sig_vector_fname = ''
+	edge_store_fname = ''
 	min_sup = 0
 	max_sup = 200
 	delimiter_char = '\t'
@@ -165,6 +182,8 @@ if __name__ == '__main__':
 			schema = arg
 		elif opt in ("-s",):
 			sig_vector_fname = arg
+		elif opt in ("-e",):
+			edge_store_fname = arg
 		elif opt in ("-m", "--min_sup"):
 			min_sup = int(arg)
 		elif opt in ("-x", "--max_sup"):
@@ -182,6 +201,8 @@ if __name__ == '__main__':
 	if sig_vector_fname and outputfile:
 		output_edge_data_fim_edge_oriented_from_sig_vector_file(outputfile, min_sup, max_sup, \
 			sig_vector_fname, delimiter_char, type, debug, report)
+	elif edge_store_fname and outputfile:
+		output_edge_data_fim_edge_oriented(outputfile, min_sup, max_sup, debug=debug, edge_store_fname=edge_store_fname)
 	else:
 		print __doc__
 		sys.exit(2)
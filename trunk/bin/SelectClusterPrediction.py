@@ -6,7 +6,7 @@ Option:
 	-z ..., --hostname=...	the hostname, zhoudb(default)
 	-d ..., --dbname=...	the database name, graphdb(default)
 	-k ..., --schema=...	which schema in the database
-	-i ...,	cluster filename, output of MpiBFSCluster.py
+	-i ...,	cluster filename, output of MpiBFSCluster.py, text or binary(detected)
 	-s ...,	stat filename, output of MpiStatCluster.py
 	-j ...,	fname setting to create splat, mcl, pattern tables
 	-f ...,	filter type (same as rpart_prediction.py) 1(default)
@@ -25,6 +25,9 @@ Description:
 		1. longest recurrence
 		2. largest edge_gradient
 		3. largest (recurrence + edge_gradient)
+	2026-10-18
+		a binary cluster file(codense/pattern_record.py) is read through its offset index,
+		only the selected clusters are read.
 	
 """
 
@@ -43,6 +46,7 @@ from codense.common import db_connect, get_known_genes_dict, form_schema_tables,
 from sets import Set
 from MpiPredictionFilter import prediction_attributes, MpiPredictionFilter
 from codense.codense2db import codense2db
+from codense.pattern_record import pattern_reader, is_pattern_file
 from rpy import r
 if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
 	from python2_3 import *
@@ -135,6 +139,8 @@ class SelectClusterPrediction:
 		"""
 		01-24-06
 			a lot of analogy to codense2db.py's run()
+		2026-10-18
+			binary cluster_fname goes to parse_cluster_record()
 		"""
 		sys.stderr.write("Parsing cluster_fname: %s ...\n"%os.path.basename(cluster_fname))
 		codense2db_instance  = codense2db()
@@ -146,20 +152,29 @@ class SelectClusterPrediction:
 		counter = 0
 		real_counter = 0
 		cluster_id2properties = {}	#additional properties for prediction_pair2instance
+		if is_pattern_file(cluster_fname):
+			reader = pattern_reader(cluster_fname)
+			cluster_id_ls = list(cluster_id_set)
+			cluster_id_ls.sort()	#sequential seeks
+			no_of_records = len(reader)
+			for cluster_id in cluster_id_ls:	#cluster_id starts from 1
+				if cluster_id<1 or cluster_id>no_of_records:	#not in the file, like the text path
+					continue
+				counter += 1
+				self.parse_cluster_record(curs, codense2db_instance, reader[cluster_id-1], cluster_id, \
+					gene_no2incidence_array, known_gene_no2go_no_set, schema_instance, cluster_id2properties)
+				if self.report and counter%2000==0:
+					sys.stderr.write("%s%s"%('\x08'*20, counter))
+			reader.close()
+			sys.stderr.write("Done.\n")
+			return cluster_id2properties
 		reader = csv.reader(open(cluster_fname, 'r'), delimiter='\t')
 		for row in reader:
 			counter += 1
 			#only those who are in cluster_id_set
 			if counter in cluster_id_set:	#cluster_id starts from 1
-				cluster_list = codense2db_instance.fimbfs_parser(row, gene_no2incidence_array, curs)
-				for cluster in cluster_list:
-					real_counter += 1
-					cluster.unknown_gene_ratio = codense2db_instance.calculate_unknown_gene_ratio(cluster.vertex_set, \
-						known_gene_no2go_no_set)
-					cluster.cluster_id = counter	#line number is the cluster_id
-					codense2db_instance.db_submit(curs, cluster, schema_instance.pattern_table)
-					
-					cluster_id2properties[cluster.cluster_id] = [cluster.connectivity, cluster.unknown_gene_ratio, cluster.vertex_set]
+				real_counter += self.parse_cluster_record(curs, codense2db_instance, row, counter, \
+					gene_no2incidence_array, known_gene_no2go_no_set, schema_instance, cluster_id2properties)
 			if real_counter==len(cluster_id_set):
 				#all relevant clusters have been got, ignore remaining clusters
 				break
@@ -170,6 +185,23 @@ class SelectClusterPrediction:
 		del reader
 		sys.stderr.write("Done.\n")
 		return cluster_id2properties
+	
+	def parse_cluster_record(self, curs, codense2db_instance, row, cluster_id, gene_no2incidence_array, \
+		known_gene_no2go_no_set, schema_instance, cluster_id2properties):
+		"""
+		2026-10-18
+			split out of parse_cluster_fname(), row is a text row or a decoded binary record.
+			return the number of clusters submitted.
+		"""
+		cluster_list = codense2db_instance.fimbfs_parser(row, gene_no2incidence_array, curs)
+		for cluster in cluster_list:
+			cluster.unknown_gene_ratio = codense2db_instance.calculate_unknown_gene_ratio(cluster.vertex_set, \
+				known_gene_no2go_no_set)
+			cluster.cluster_id = cluster_id	#line number is the cluster_id
+			codense2db_instance.db_submit(curs, cluster, schema_instance.pattern_table)
+			
+			cluster_id2properties[cluster.cluster_id] = [cluster.connectivity, cluster.unknown_gene_ratio, cluster.vertex_set]
+		return len(cluster_list)
 		
 	def submit_predictions(self, curs, schema_instance, prediction_pair2instance, cluster_id2properties):
 		sys.stderr.write("Submitting predictions...\n")
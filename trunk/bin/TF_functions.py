@@ -18,7 +18,7 @@ else:   #32bit
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
 import psycopg, re, sys, getopt, os, csv
 from codense.common import db_connect, org2tax_id, org_short2long, get_gene_id2gene_no
-from rpy import r
+from codense.distribution_tail import phyper, dbinom
 from sets import Set
 from heapq import heappush, heappop, heapreplace
 
@@ -85,7 +85,7 @@ def tf_stat(gene_no2tf_set, gene_no_list, tf2no_of_genes, no_of_total_genes):
 		m = tf2no_of_genes[tf]
 		n = no_of_total_genes -m
 		k = len(gene_no_list)
-		p_value = r.phyper(x-1,m,n,k,lower_tail = r.FALSE)
+		p_value = phyper(x-1,m,n,k,lower_tail=0)
 		row = [p_value, x, tf2stat[tf], tf]
 		tf_stat_list.append(row)
 	tf_stat_list.sort()
@@ -131,8 +131,8 @@ def tf_combo_stat(tf2gene_no_set_global, tf_stat_list, no_of_total_genes, cluste
 			prob_tf2 = len(tf2_gene_no_set_global)/float(no_of_total_genes)
 			prob_combo = prob_tf1*prob_tf2
 			combo_size_global = len(tf1_gene_no_set_global&tf2_gene_no_set_global)
-			likeli1 = r.dbinom(combo_size_local, cluster_size, prob_combo,log=r.TRUE)
-			likeli2 = r.dbinom(combo_size_global, no_of_total_genes, prob_combo, log=r.TRUE)
+			likeli1 = dbinom(combo_size_local, cluster_size, prob_combo, log=1)
+			likeli2 = dbinom(combo_size_global, no_of_total_genes, prob_combo, log=1)
 			if likeli2==0:
 				l_ratio = 1
 			else:
@@ -154,8 +154,45 @@ def hq_add(hq_list, row, top_number):
 		sys.stderr.write("The hq is %s.\n"%repr(hq_list))
 		sys.exit(2)
 
+def popcount(number):
+	"""
+	2026-10-18
+		no of 1 bits in a non-negative long
+	"""
+	return bin(number).count('1')
+
+class bs_bitset_index:
+	"""
+	2026-10-18
+		bs_no -> bitset of its genes in a long(bit i is the i-th gene_no of gene_no2bs_no_set, sorted),
+		global co-occurrence count of a bs_no pair is computed once and cached.
+		Build it once per run and pass it to every cluster_bs_analysis() call.
+	"""
+	def __init__(self, gene_no2bs_no_set, bs_no2gene_no_set):
+		gene_no_list = gene_no2bs_no_set.keys()
+		gene_no_list.sort()
+		gene_no2index = {}
+		for i in range(len(gene_no_list)):
+			gene_no2index[gene_no_list[i]] = i
+		self.bs_no2bitset = {}
+		for bs_no, gene_no_set in bs_no2gene_no_set.iteritems():
+			bitset = 0L
+			for gene_no in gene_no_set:
+				bitset |= 1L<<gene_no2index[gene_no]
+			self.bs_no2bitset[bs_no] = bitset
+		self.bs_no_pair2co_occurrence = {}
+	
+	def get_co_occurrence(self, bs_no1, bs_no2):
+		if bs_no1>bs_no2:
+			bs_no1, bs_no2 = bs_no2, bs_no1
+		co_occurrence = self.bs_no_pair2co_occurrence.get((bs_no1, bs_no2))
+		if co_occurrence is None:
+			co_occurrence = popcount(self.bs_no2bitset[bs_no1]&self.bs_no2bitset[bs_no2])
+			self.bs_no_pair2co_occurrence[(bs_no1, bs_no2)] = co_occurrence
+		return co_occurrence
+
 def cluster_bs_analysis(gene_no_list, gene_no2bs_no_set, bs_no2gene_no_set, ratio_cutoff=1.0/3, \
-	top_number=5, p_value_cut_off=0.001):
+	top_number=5, p_value_cut_off=0.001, bs_bitset_index_instance=None):
 	"""
 	09-19-05
 		three kinds of analysis
@@ -166,6 +203,10 @@ def cluster_bs_analysis(gene_no_list, gene_no2bs_no_set, bs_no2gene_no_set, rati
 		all just retain the top 5
 	12-15-05
 		add p_value_cut_off
+	2026-10-18
+		local combo sizes are counted on bitsets over the cluster's genes,
+		the global ones come from bs_bitset_index_instance(if given).
+		combo_set_local is only formed for the combos passing p_value_cut_off.
 	"""
 	#construct local dictionary and records the genes with no bs_no
 	local_bs_no2gene_no_set = {}
@@ -190,6 +231,17 @@ def cluster_bs_analysis(gene_no_list, gene_no2bs_no_set, bs_no2gene_no_set, rati
 			local_bs_no_and_gene_no_set.append([bs_no, gene_no_set])
 	
 	local_bs_no_and_gene_no_set.sort()	#sort by bs_no
+	#bitset of each bs_no over the cluster's genes
+	gene_no2local_index = {}
+	for gene_no in gene_no_list:
+		if gene_no not in gene_no2local_index:
+			gene_no2local_index[gene_no] = len(gene_no2local_index)
+	local_bitset_ls = []
+	for bs_no, gene_no_set in local_bs_no_and_gene_no_set:
+		bitset = 0L
+		for gene_no in gene_no_set:
+			bitset |= 1L<<gene_no2local_index[gene_no]
+		local_bitset_ls.append(bitset)
 	hq_list1 = []	#single hypergeometric
 	hq_list2 = []	#combo hypergeometric
 	hq_list3 = []	#combo binomial log ratio
@@ -201,7 +253,7 @@ def cluster_bs_analysis(gene_no_list, gene_no2bs_no_set, bs_no2gene_no_set, rati
 		m = len(bs_no2gene_no_set[bs_no1])
 		n = no_of_total_genes - m
 		k = cluster_size
-		p_value = r.phyper(x-1,m,n,k,lower_tail = r.FALSE)
+		p_value = phyper(x-1,m,n,k,lower_tail=0)
 		if p_value<=p_value_cut_off:	#12-15-05
 			score = -p_value	#Watch minus, heapq is a min-heap
 			bs_no_list = [bs_no1]
@@ -210,21 +262,25 @@ def cluster_bs_analysis(gene_no_list, gene_no2bs_no_set, bs_no2gene_no_set, rati
 			expected_ratio = global_ratio
 			row = [score, 1, bs_no_list, list(gene_no_set1), global_ratio, local_ratio, expected_ratio, unknown_ratio]
 			hq_add(hq_list1, row, top_number)
+		local_bitset1 = local_bitset_ls[i]
 		for j in range(i+1, len(local_bs_no_and_gene_no_set)):
 			bs_no2, gene_no_set2 = local_bs_no_and_gene_no_set[j]
-			combo_set_local = gene_no_set1&gene_no_set2
-			combo_size_local = len(combo_set_local)
+			combo_size_local = popcount(local_bitset1&local_bitset_ls[j])
 			gene_no_set_global1 = bs_no2gene_no_set[bs_no1]
 			gene_no_set_global2 = bs_no2gene_no_set[bs_no2]
 			prob_bs1 = len(gene_no_set_global1)/float(no_of_total_genes)
 			prob_bs2 = len(gene_no_set_global2)/float(no_of_total_genes)
 			prob_combo = prob_bs1*prob_bs2
-			combo_size_global = len(gene_no_set_global1&gene_no_set_global2)
+			if bs_bitset_index_instance:
+				combo_size_global = bs_bitset_index_instance.get_co_occurrence(bs_no1, bs_no2)
+			else:
+				combo_size_global = len(gene_no_set_global1&gene_no_set_global2)
 			
 			#first hypergeometric
 			n = no_of_total_genes - combo_size_global
-			p_value = r.phyper(combo_size_local-1,combo_size_global,n,cluster_size,lower_tail = r.FALSE)
+			p_value = phyper(combo_size_local-1,combo_size_global,n,cluster_size,lower_tail=0)
 			if p_value<=p_value_cut_off:	#12-15-05
+				combo_set_local = gene_no_set1&gene_no_set2
 				score = -p_value	#Watch minus, heapq is a min-heap
 				bs_no_list = [bs_no1, bs_no2]
 				global_ratio = float(combo_size_global)/no_of_total_genes
@@ -235,8 +291,8 @@ def cluster_bs_analysis(gene_no_list, gene_no2bs_no_set, bs_no2gene_no_set, rati
 			"""
 			#12-15-05 comment this block out
 			#second binomial log ratio
-			likeli1 = r.dbinom(combo_size_local, cluster_size, prob_combo,log=r.TRUE)
-			likeli2 = r.dbinom(combo_size_global, no_of_total_genes, prob_combo, log=r.TRUE)
+			likeli1 = dbinom(combo_size_local, cluster_size, prob_combo, log=1)
+			likeli2 = dbinom(combo_size_global, no_of_total_genes, prob_combo, log=1)
 			l_ratio = likeli1-likeli2
 			
 			score = -l_ratio	#Watch minus, heapq is a min-heap
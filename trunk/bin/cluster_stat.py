@@ -49,7 +49,8 @@ Description:
 """
 
 import sys,os,psycopg,pickle,getopt
-from rpy import r
+from codense.distribution_tail import phyper
+from codense.common import table_bulk_writer
 from sets import Set
 
 class cluster_stat:
@@ -192,9 +193,9 @@ class cluster_stat:
 					#ignore the function category if its percentage is < uniformity
 					continue
 				if self.bonferroni:
-					p_value = r.phyper(x-1,m,n,k,lower_tail = r.FALSE)*len(self._local_go_no_dict)
+					p_value = phyper(x-1,m,n,k,lower_tail=0)*len(self._local_go_no_dict)
 				else:
-					p_value = r.phyper(x-1,m,n,k,lower_tail = r.FALSE)
+					p_value = phyper(x-1,m,n,k,lower_tail=0)
 				if self.log:
 					self.logfile.write('%d %d %d %d %d %d %d %f\n'%\
 						(mcl_id,gene_no,go_no,x,m,n,k,p_value))
@@ -208,8 +209,7 @@ class cluster_stat:
 			if self.output:
 				self.outf.write('%d\t%d\t%s\t%f\t%f\n'%(mcl_id, gene_no, repr(p_value_vector), connectivity, unknown_gene_ratio))	#08-13-05
 			elif self.needcommit:
-				self.curs.execute("insert into %s(cluster_stat_id, mcl_id, leave_one_out, p_value_vector, connectivity)\
-				values(%d, %d, %d, ARRAY%s, %8.6f)"%(self.target_table, self.no_of_records, mcl_id, gene_no, repr(p_value_vector), connectivity))
+				self.target_table_writer.add_row([self.no_of_records, mcl_id, gene_no, p_value_vector, connectivity])	#2026-10-18
 
 	def retain_min_p_value_pairs(self, p_value_vector):
 		"""
@@ -315,6 +315,9 @@ class cluster_stat:
 			except:
 				sys.stderr.write("Error occurred when creating table %s\n"%self.target_table)
 		self.curs.execute("begin")
+		if self.needcommit:	#2026-10-18 rows are buffered and copied in blocks
+			self.target_table_writer = table_bulk_writer(self.curs, self.target_table, \
+				['cluster_stat_id', 'mcl_id', 'leave_one_out', 'p_value_vector', 'connectivity'])
 		self.curs.execute("DECLARE crs CURSOR FOR select mcl_id,vertex_set,connectivity from %s order by mcl_id offset %s limit %s"%\
 			(self.source_table, self.offset, self.limit))
 		self.curs.execute("fetch 5000 from crs")
@@ -331,6 +334,7 @@ class cluster_stat:
 			self.curs.execute("fetch 5000 from crs")
 			rows = self.curs.fetchall()
 		if self.needcommit:
+			self.target_table_writer.close()
 			self.curs.execute("create index %s_connectivity_idx on %s(connectivity)"%(self.target_table, self.target_table))
 			self.curs.execute("create index %s_mcl_id_idx on %s(mcl_id)"%(self.target_table, self.target_table))
 			self.curs.execute("end")
@@ -19,6 +19,7 @@ Option:
 		5(haifeng's output)
 	-s ..., --min_cluster_size=...	the minimum number of vertices, 5(default)
 	-l ..., --delimiter=...	the delimiter for the DATAFILE, \t (default)
+	-e ..., --edge_store=...	binary edge_store file(edge_store.py), replaces the edge_cor_vector table lookup
 	-b, --debug	debug version.
 	-c, --commit	commit this database transaction
 	-r, --report	report the progress(a number)
@@ -48,7 +49,9 @@ else:   #32bit
 import psycopg, getopt, csv, numarray, re
 from common import db_connect, get_haiyan_no2gene_no, get_gene_id2gene_no, \
 	get_gene_no2incidence_array, get_vertex_set_gim_array, \
-	get_known_genes_dict	#10-14-05	used to get unknown_gene_ratio
+	get_known_genes_dict, string2d_matrix, lru_cache, table_bulk_writer	#10-14-05	used to get unknown_gene_ratio
+from edge_store import edge_store
+from pattern_record import d_matrix_bytes2rows
 from graph import graph_modeling
 from graph.cc_from_edge_list import cc_from_edge_list
 from sets import Set
@@ -89,11 +92,15 @@ class codense2db:
 	'''
 	def __init__(self, infname=None, hostname='zhoudb', dbname='graphdb', schema=None, \
 			table=None, mcl_table=None, pattern_table=None, mapping_file=None, gim_inputfname=None, cor_cut_off=0,\
-			parser_type=1, min_cluster_size=5, delimiter='\t', debug=0, needcommit=0, report=0):
+			parser_type=1, min_cluster_size=5, delimiter='\t', debug=0, needcommit=0, report=0, edge_store_fname=None, \
+			edge_cache_size=100000, edge_block_size=500):
 		"""
 		02-25-05
 			modify the interface of the class and 2 member functions(get_combined_cor_vector, parse_recurrence)
 			to make it module-independent
+		2026-10-18
+			add edge_store_fname, get_combined_cor_vector() reads the binary edge_store instead of edge_table
+			add edge_cache_size and edge_block_size for get_combined_cor_vector()
 		"""
 		self.infname = infname
 		self.hostname = hostname
@@ -111,6 +118,13 @@ class codense2db:
 		self.debug = int(debug)
 		self.needcommit = int(needcommit)
 		self.report = int(report)
+		self.edge_store = None
+		if edge_store_fname:
+			self.edge_store = edge_store(edge_store_fname)
+		self.edge_cache_size = int(edge_cache_size)
+		self.edge_block_size = int(edge_block_size)
+		self.edge_table2cache = {}
+		self.pattern_table_writer_dict = {}	#2026-10-18 (pattern_table, has_d_matrix) -> table_bulk_writer
 	
 		self.parser_dict = {1:self.copath_parser,
 			2: self.codense_parser,
@@ -180,24 +194,70 @@ class codense2db:
 			make edge_table to be an explicit parameter
 		07-03-05
 			better edition of get_combined_cor_vector(), 2d list rather than 1d list.
+		2026-10-18
+			use self.edge_store if it's there
+		2026-10-18
+			edges are fetched through an lru_cache(one per edge_table) shared by all patterns,
+			the missing ones in one query per self.edge_block_size edges.
+			
+			--fetch_edge_block()
 		"""
+		if edge_table not in self.edge_table2cache:
+			self.edge_table2cache[edge_table] = lru_cache(self.edge_cache_size)
+		edge_cache = self.edge_table2cache[edge_table]
+		edge2vectors = {}
+		missing_edge_list = []
+		for edge in edge_set:
+			edge = tuple(edge)
+			vectors = edge_cache.get(edge)
+			if vectors is None:
+				if edge not in edge2vectors:
+					edge2vectors[edge] = None
+					missing_edge_list.append(edge)
+			else:
+				edge2vectors[edge] = vectors
+		for i in range(0, len(missing_edge_list), self.edge_block_size):
+			self.fetch_edge_block(curs, missing_edge_list[i:i+self.edge_block_size], edge_table, edge2vectors)
+		
 		combined_cor_vector = []
 		combined_sig_vector = []
 		for edge in edge_set:
-			edge_string = '{' + repr(edge)[1:-1] + '}'
-			curs.execute("select cor_vector, sig_vector from %s where edge_name='%s'"%(edge_table,edge_string))
-			rows = curs.fetchall()
-			if len(rows) == 0:
-				sys.stderr.write('%s not found in %s\n'%(edge_string, edge_table))
-				sys.exit(1)
-			cor_vector = rows[0][0][1:-1].split(',')
+			cor_vector, sig_vector = edge2vectors[tuple(edge)]
+			combined_cor_vector.append(list(cor_vector))
+			combined_sig_vector.append(list(sig_vector))
+		for edge in missing_edge_list:
+			edge_cache.put(edge, edge2vectors[edge])
+		return (combined_cor_vector, combined_sig_vector)
+	
+	def fetch_edge_block(self, curs, edge_list, edge_table, edge2vectors):
+		"""
+		2026-10-18
+			fill edge2vectors[edge] = (cor_vector, sig_vector) for a block of edges,
+			from self.edge_store or one 'edge_name in (...)' query.
+		"""
+		if self.edge_store:
+			for edge in edge_list:
+				row_no = self.edge_store.find_row_no(edge[0], edge[1])
+				if row_no == -1:
+					sys.stderr.write('%s not found in %s\n'%(repr(list(edge)), self.edge_store.edge_store_fname))
+					sys.exit(1)
+				edge2vectors[edge] = (self.edge_store.get_cor_vector(row_no), self.edge_store.get_sig_vector(row_no))
+			return
+		edge_string_list = ["'{%s,%s}'"%(edge[0], edge[1]) for edge in edge_list]
+		curs.execute("select edge_name, cor_vector, sig_vector from %s where edge_name in (%s)"%\
+			(edge_table, ','.join(edge_string_list)))
+		rows = curs.fetchall()
+		for row in rows:
+			edge = tuple(map(int, row[0][1:-1].split(',')))
+			cor_vector = row[1][1:-1].split(',')
 			cor_vector = map(float, cor_vector)
-			combined_cor_vector.append(cor_vector)
-			
-			sig_vector = rows[0][1][1:-1].split(',')
+			sig_vector = row[2][1:-1].split(',')
 			sig_vector = map(int, sig_vector)
-			combined_sig_vector.append(sig_vector)
-		return (combined_cor_vector, combined_sig_vector)
+			edge2vectors[edge] = (cor_vector, sig_vector)
+		for edge in edge_list:
+			if edge2vectors[edge] is None:
+				sys.stderr.write('%s not found in %s\n'%('{%s,%s}'%(edge[0], edge[1]), edge_table))
+				sys.exit(1)
 	
 	def parse_recurrence(self, combined_vector, no_of_edges=0, cor_cut_off=0):
 		"""
@@ -372,35 +432,50 @@ class codense2db:
 		12-06-05
 			add gene_no2incidence_array
 			calculate cluster.gim_array
+		2026-10-18
+			row could also be a decoded record of pattern_record.py's binary file
 		"""
 		
 		cluster_list = []
 		gene_no2incidence_array = argument	#12-06-05
 		curs = argument2
 		cluster = cluster_dstructure()
+		decoded = type(row[0])==list	#2026-10-18
 		#initialize two sets
-		cluster.vertex_set = row[0][1:-1].split(',')
-		cluster.vertex_set = map(int, cluster.vertex_set)
+		if decoded:
+			cluster.vertex_set = row[0]
+		else:
+			cluster.vertex_set = row[0][1:-1].split(',')
+			cluster.vertex_set = map(int, cluster.vertex_set)
 		if len(cluster.vertex_set)<self.min_cluster_size:	#pre-stop
 			return cluster_list
 		
 		cluster.cooccurrent_cluster_id = self.cooccurrent_cluster_id
 		cluster.cluster_id = self.cluster_no
 		
-		cluster.edge_set = row[1][2:-2].split('], [')
-		for i in range(len(cluster.edge_set)):
-			cluster.edge_set[i] = cluster.edge_set[i].split(',')
-			cluster.edge_set[i] = map(int, cluster.edge_set[i])
+		if decoded:
+			cluster.edge_set = row[1]
+		else:
+			cluster.edge_set = row[1][2:-2].split('], [')
+			for i in range(len(cluster.edge_set)):
+				cluster.edge_set[i] = cluster.edge_set[i].split(',')
+				cluster.edge_set[i] = map(int, cluster.edge_set[i])
 		
 		cluster.no_of_edges = len(cluster.edge_set)
 		no_of_nodes = len(cluster.vertex_set)
 		cluster.splat_connectivity = 2*float(cluster.no_of_edges)/(no_of_nodes*(no_of_nodes-1))
 		
 		cluster.connectivity = cluster.splat_connectivity
-		cluster.recurrence_array = row[2][1:-1].split(',')
-		cluster.recurrence_array = map(float, cluster.recurrence_array)
-		
-		cluster.d_matrix = row[3]	#10-28-05 string form
+		if decoded:
+			cluster.recurrence_array = row[2]
+			cluster.d_matrix = repr(d_matrix_bytes2rows(row[3], no_of_nodes))
+		else:
+			cluster.recurrence_array = row[2][1:-1].split(',')
+			cluster.recurrence_array = map(float, cluster.recurrence_array)
+			
+			cluster.d_matrix = row[3]	#10-28-05 string form
+			if cluster.d_matrix[:2]!='[[':	#2026-10-18 MpiBFSCluster.py's hex form, make it a list for ARRAY
+				cluster.d_matrix = repr(string2d_matrix(cluster.d_matrix))
 		
 		cluster.gim_array = get_vertex_set_gim_array(gene_no2incidence_array, cluster.vertex_set)	#12-06-05
 		
@@ -545,7 +620,28 @@ class codense2db:
 				cast(id as varchar) as cooccurrent_cluster_id from %s"%(mcl_table, pattern_table))
 				
 
-	def db_submit(self, curs, cluster, pattern_table):
+	def get_pattern_table_writer(self, curs, pattern_table, has_d_matrix=0):
+		"""
+		2026-10-18
+		"""
+		key = (pattern_table, has_d_matrix)
+		if key not in self.pattern_table_writer_dict:
+			column_ls = ['id', 'vertex_set', 'edge_set', 'no_of_vertices', 'no_of_edges', 'connectivity', \
+				'unknown_gene_ratio', 'recurrence_array', 'recurrence']
+			if has_d_matrix:
+				column_ls += ['d_matrix', 'gim_array']
+			self.pattern_table_writer_dict[key] = table_bulk_writer(curs, pattern_table, column_ls)
+		return self.pattern_table_writer_dict[key]
+	
+	def close_pattern_table_writers(self):
+		"""
+		2026-10-18
+		"""
+		for writer in self.pattern_table_writer_dict.values():
+			writer.close()
+		self.pattern_table_writer_dict = {}
+	
+	def db_submit(self, curs, cluster, pattern_table, use_writer=0):
 		"""
 		03-03-05
 			splat table's connectivity is the splat_connectivity, see doc above
@@ -558,7 +654,21 @@ class codense2db:
 			add gim_array
 		01-24-06
 			cluster_id is submitted to pattern_table
-		"""
+		2026-10-18
+			if use_writer, the row is buffered in a table_bulk_writer(see get_pattern_table_writer()),
+			call close_pattern_table_writers() at the end.
+		"""
+		if use_writer:
+			writer = self.get_pattern_table_writer(curs, pattern_table, cluster.d_matrix and 1 or 0)
+			row = [cluster.cluster_id, cluster.vertex_set, cluster.edge_set, len(cluster.vertex_set), cluster.no_of_edges, \
+				cluster.splat_connectivity, cluster.unknown_gene_ratio, cluster.recurrence_array, sum(cluster.recurrence_array)]
+			if cluster.d_matrix:
+				d_matrix = cluster.d_matrix
+				if type(d_matrix)==str:
+					d_matrix = string2d_matrix(d_matrix)
+				row += [d_matrix, cluster.gim_array]
+			writer.add_row(row)
+			return
 		#try:
 		#inserting into the pattern_table
 		if cluster.d_matrix:
@@ -673,12 +783,13 @@ class codense2db:
 					continue
 				#10-14-05 unknown_gene_ratio to submit to pattern_table
 				cluster.unknown_gene_ratio = self.calculate_unknown_gene_ratio(cluster.vertex_set, known_gene_no2go_no_set)
-				self.db_submit(curs, cluster, self.pattern_table)
+				self.db_submit(curs, cluster, self.pattern_table, use_writer=1)
 				no+=1
 				if self.report and no%1000==0:
 					sys.stderr.write('%s%d'%('\x08'*20, no))
 		if self.report:
 			sys.stderr.write('%s%d'%('\x08'*20, no))
+		self.close_pattern_table_writers()
 		if self.needcommit:
 			conn.commit()
 		sys.stderr.write('\n\tTotal patterns: %d\n'%no)
@@ -689,9 +800,9 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:o:p:g:f:y:s:l:bcr", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:o:p:g:f:y:s:l:e:bcr", ["help", "hostname=", \
 			"dbname=", "schema=", "table=", "mcl_table=", "mapping_file=", "cor_cut_off=",\
-			"parser_type=", "min_cluster_size=", "delimiter=", "debug", "commit", "report"])
+			"parser_type=", "min_cluster_size=", "delimiter=", "edge_store=", "debug", "commit", "report"])
 	except:
 		print __doc__
 		sys.exit(2)
@@ -711,6 +822,7 @@ if __name__ == '__main__':
 	debug = 0
 	commit = 0
 	report = 0
+	edge_store_fname = None
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -739,6 +851,8 @@ if __name__ == '__main__':
 			min_cluster_size = int(arg)
 		elif opt in ("-l", "--delimiter"):
 			delimiter = arg
+		elif opt in ("-e", "--edge_store"):
+			edge_store_fname = arg
 		elif opt in ("-b", "--debug"):
 			debug = 1
 		elif opt in ("-c", "--commit"):
@@ -748,7 +862,7 @@ if __name__ == '__main__':
 	if schema and pattern_table and len(args)==1:
 		instance = codense2db(args[0], hostname, dbname, schema, table, mcl_table, pattern_table, \
 			mapping_file, gim_inputfname, cor_cut_off, parser_type, min_cluster_size, \
-			delimiter, debug, commit, report)
+			delimiter, debug, commit, report, edge_store_fname)
 		instance.run()
 	else:
 		print __doc__
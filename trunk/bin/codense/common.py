@@ -24,6 +24,7 @@ if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
 
 # 2011-1-25 get_entrezgene_annotated_anchor() has been moved to pymodule.GenomeDB
 from pymodule.GenomeDB import get_entrezgene_annotated_anchor
+from lru_cache import lru_cache	#2026-10-18 moved to its own module, distribution_tail needs it without the rest
 
 
 def index_plus_one(i):
@@ -334,6 +335,57 @@ def get_go_term_id2depth(curs, schema=None, term_table='go.term'):
 	sys.stderr.write("Done\n")
 	return go_term_id2depth
 
+def get_go_no_pair2lca_ls(curs, go_no2term_id, go_term_id2depth, depth_cut_off, \
+	distance_table='go.node_dist', report=0):
+	"""
+	2026-10-18
+		bulk-load the common ancestors of all go_no pairs of this schema from distance_table in one cursor pass.
+		Only ancestors with depth>=depth_cut_off are kept and, for each pair, only the deepest ones.
+		Pairs without any deep-enough common ancestor are dropped, which keeps the structure
+		small enough to be pickled to every computing node.
+
+		key is (go_no1, go_no2) in ascending order.
+		value is [max_depth, lca_ls], lca_ls is a list of term_id's(not go_no), like gene_stat.lca_list.
+	"""
+	sys.stderr.write("Getting go_no_pair2lca_ls...\n")
+	term_id2go_no = {}
+	for go_no, term_id in go_no2term_id.iteritems():
+		term_id2go_no[term_id] = go_no
+	go_no_pair2lca_ls = {}
+	curs.execute("DECLARE lca_crs CURSOR FOR select go_id1, go_id2, common_ancestor_list from %s"%distance_table)
+	curs.execute("fetch 10000 from lca_crs")
+	rows = curs.fetchall()
+	counter = 0
+	while rows:
+		for row in rows:
+			go_id1, go_id2, common_ancestor_list = row
+			counter += 1
+			if go_id1 not in term_id2go_no or go_id2 not in term_id2go_no:
+				continue
+			max_depth = -1
+			lca_ls = []
+			for ancestor in map(int, common_ancestor_list[1:-1].split(',')):
+				depth = go_term_id2depth.get(ancestor, -1)
+				if depth<depth_cut_off or depth<max_depth:
+					continue
+				if depth>max_depth:
+					max_depth = depth
+					lca_ls = []
+				lca_ls.append(ancestor)
+			if lca_ls:
+				go_no1 = term_id2go_no[go_id1]
+				go_no2 = term_id2go_no[go_id2]
+				if go_no1>go_no2:
+					go_no1, go_no2 = go_no2, go_no1
+				go_no_pair2lca_ls[(go_no1, go_no2)] = [max_depth, lca_ls]
+		if report:
+			sys.stderr.write("%s%s/%s"%('\x08'*20, counter, len(go_no_pair2lca_ls)))
+		curs.execute("fetch 10000 from lca_crs")
+		rows = curs.fetchall()
+	curs.execute("close lca_crs")
+	sys.stderr.write("Done\n")
+	return go_no_pair2lca_ls
+
 
 def get_go_id2go_no(curs, schema=None, table='go'):
 	"""
@@ -1081,6 +1133,37 @@ def one_dim_list2string(ls):
 	ls_string = '{' + repr(ls)[1:-1] + '}'
 	return ls_string
 
+def d_matrix_bytes2string(d_matrix_bytes):
+	"""
+	2026-10-18
+		d_matrix_bytes is from johnson_sp.py_shortest_distance_string(), row-major unsigned chars.
+		hex it, so it's safe in a tab-delimited file. string2d_matrix() reverses it.
+	"""
+	import binascii
+	return binascii.hexlify(d_matrix_bytes)
+
+def string2d_matrix(d_matrix_string):
+	"""
+	2026-10-18
+		d_matrix_string comes in three forms,
+			hex string of unsigned chars(d_matrix_bytes2string(), MpiBFSCluster.py's default)
+			python list repr, '[[0, 1], [1, 0]]'(old MpiBFSCluster.py output)
+			postgres array, '{{0,1},{1,0}}'
+		return a list of rows(lists)
+	"""
+	if d_matrix_string[:2]=='[[':
+		d_matrix = d_matrix_string[2:-2].split('], [')
+	elif d_matrix_string[:2]=='{{':
+		d_matrix = d_matrix_string[2:-2].split('},{')
+	else:
+		import binascii, array
+		d_array = array.array('B', binascii.unhexlify(d_matrix_string))
+		no_of_vertices = int(math.sqrt(len(d_array))+0.5)
+		return [d_array[i*no_of_vertices:(i+1)*no_of_vertices].tolist() for i in range(no_of_vertices)]
+	for index in range(len(d_matrix)):
+		d_matrix[index] = map(int, d_matrix[index].split(','))
+	return d_matrix
+
 	
 def get_no_of_unknown_genes(gene_no2go):
 	"""
@@ -1260,12 +1343,120 @@ def computing_node(communicator, parameter_list, node_fire_handler, cleanup_hand
 		data, source, tag = communicator.receiveString(0, 0)	#get data from node 0
 	cleanup_handler(communicator)
 
+class local_communicator:
+	"""
+	2026-10-18
+		stands in for the Scientific.MPI communicator passed to the handlers when they are
+		run by local_node_run(). rank and size follow the MPI layout, 0 is the input node,
+		1..no_of_workers are computing nodes, size-1 is the output node.
+		There's no send()/receive(), handlers talking to other nodes can't run locally.
+	"""
+	def __init__(self, rank, size):
+		self.rank = rank
+		self.size = size
+
+"""
+2026-10-18
+	the node_fire_handler and its parameter_list for local_node_run()'s worker processes,
+	set before the pool forks so bound methods and unpicklable parameters are inherited, not pickled.
+"""
+_local_node_fire_handler = None
+_local_computing_parameter_list = None
+_local_communicator_size = 0
+_local_worker_rank = 1	#the main process runs blocks as computing node 1 if there's no pool
+
+def _local_worker_init(worker_counter):
+	"""
+	2026-10-18
+		Pool initializer, each worker takes the next number(1..no_of_workers) from the shared worker_counter.
+	"""
+	global _local_worker_rank
+	lock = worker_counter.get_lock()
+	lock.acquire()
+	worker_counter.value += 1
+	_local_worker_rank = worker_counter.value
+	lock.release()
+
+def _local_computing_node_fire(data_pickle):
+	"""
+	2026-10-18
+		what computing_node() does for one block, inside a worker process of local_node_run()
+		or in the main process(rank 1) if there's no pool.
+	"""
+	communicator = local_communicator(_local_worker_rank, _local_communicator_size)
+	result = _local_node_fire_handler(communicator, data_pickle, _local_computing_parameter_list)
+	return cPickle.dumps(result, -1)
+
+def local_node_run(input_parameter_list, computing_parameter_list, output_parameter_list, message_size, \
+	node_fire_handler, output_handler, input_handler=fetch_cluster_block, no_of_workers=1, report=0):
+	"""
+	2026-10-18
+		run the input_node()/computing_node()/output_node() trio on one box without MPI.
+		The handlers are the same ones given to those three functions:
+			input_handler(input_parameter_list, message_size, report)
+			node_fire_handler(communicator, data, computing_parameter_list)
+			output_handler(communicator, output_parameter_list, data)
+		data is pickled in both directions just like the MPI version.
+		
+		no_of_workers>1 forks a multiprocessing pool, at most 2*no_of_workers blocks are in flight
+		to bound memory. Results reach output_handler in the order the blocks were read.
+		no_of_workers<=1 or no multiprocessing module, everything runs in this process.
+	"""
+	global _local_node_fire_handler, _local_computing_parameter_list, _local_communicator_size, _local_worker_rank
+	_local_worker_rank = 1
+	_local_node_fire_handler = node_fire_handler
+	_local_computing_parameter_list = computing_parameter_list
+	_local_communicator_size = max(no_of_workers, 1)+2
+	output_communicator = local_communicator(_local_communicator_size-1, _local_communicator_size)
+	pool = None
+	if no_of_workers>1:
+		try:
+			import multiprocessing
+			pool = multiprocessing.Pool(no_of_workers, _local_worker_init, (multiprocessing.Value('i', 0),))
+		except ImportError:
+			sys.stderr.write("no multiprocessing module, run in one process.\n")
+	sys.stderr.write("Local run with %s workers...\n"%no_of_workers)
+	counter = 0
+	data = input_handler(input_parameter_list, message_size, report)
+	if pool is None:
+		while data:
+			result_pickle = _local_computing_node_fire(cPickle.dumps(data, -1))
+			output_handler(output_communicator, output_parameter_list, result_pickle)
+			counter += 1
+			data = input_handler(input_parameter_list, message_size, report)
+	else:
+		pending_result_ls = []
+		while data or pending_result_ls:
+			while data and len(pending_result_ls)<2*no_of_workers:
+				pending_result_ls.append(pool.apply_async(_local_computing_node_fire, (cPickle.dumps(data, -1),)))
+				data = input_handler(input_parameter_list, message_size, report)
+			result_pickle = pending_result_ls.pop(0).get()
+			output_handler(output_communicator, output_parameter_list, result_pickle)
+			counter += 1
+			if report:
+				sys.stderr.write("block %s done.\n"%counter)
+		pool.close()
+		pool.join()
+	sys.stderr.write("Local run done with %s blocks.\n"%counter)
+
 """
 10-22-05
 	a function to get edge2occurrence
 """
-def get_edge2occurrence(curs, min_sup=0, max_sup=200, edge_table='edge_cor_vector'):
+def get_edge2occurrence(curs, min_sup=0, max_sup=200, edge_table='edge_cor_vector', edge_store_fname=None):
+	"""
+	2026-10-18
+		read from the binary edge_store(codense/edge_store.py) if edge_store_fname is given, curs is ignored.
+	"""
 	sys.stderr.write("Getting edge2occurrence...\n")
+	if edge_store_fname:
+		from edge_store import edge_store
+		edge_store_instance = edge_store(edge_store_fname)
+		edge2occurrence = edge_store_instance.get_edge2occurrence(min_sup, max_sup)
+		no_of_datasets = edge_store_instance.no_of_datasets
+		edge_store_instance.close()
+		sys.stderr.write("Got edge2occurrence.\n")
+		return edge2occurrence, no_of_datasets
 	curs.execute("DECLARE crs CURSOR FOR select edge_name,sig_vector \
 		from %s"%(edge_table))
 	edge2occurrence = {}
@@ -1453,11 +1644,13 @@ def draw_pattern(vertex_set, edge_set, go_no, gene_no2gene_id, gene_no2go_no, cl
 	os.remove(graphSrcFname)
 
 
-def cal_hg_p_value(gene_no, go_no, vertex_list, no_of_total_genes, go_no2gene_no_set, r, debug=0):
+def cal_hg_p_value(gene_no, go_no, vertex_list, no_of_total_genes, go_no2gene_no_set, r=None, debug=0):
 	"""
 	11-10-05 'from rpy import r' should be executed in upper context
 	11-18-05 fix a bug in " n=no_of_total_genes - cluster_size"
+	2026-10-18 use phyper() from distribution_tail, r is not used anymore(kept for the interface)
 	"""
+	from distribution_tail import phyper
 	cluster_size = len(vertex_list)
 	no_of_local_associated_genes = 0
 	for vertex in vertex_list:
@@ -1477,48 +1670,95 @@ def cal_hg_p_value(gene_no, go_no, vertex_list, no_of_total_genes, go_no2gene_no
 		print "no_of_total_genes",no_of_total_genes
 		print "cluster_size", cluster_size
 	"""
-	p_value = r.phyper(x-1,m,n,k,lower_tail = r.FALSE)
+	p_value = phyper(x-1,m,n,k,lower_tail=0)
 	return p_value
 
+def get_raw_sequence_chunks(curs, acc_ver, first_id, last_id, raw_sequence_table='sequence.raw_sequence', chunk_cache=None):
+	"""
+	2026-10-18
+		id2chunk for ids from first_id to last_id of acc_ver. chunks not in chunk_cache(keyed by (acc_ver, id))
+		are fetched by one query and put into it. missing ids are reported and left out.
+	"""
+	id2chunk = {}
+	missing_id_ls = []
+	for id in range(first_id, last_id+1):
+		chunk = None
+		if chunk_cache is not None:
+			chunk = chunk_cache.get((acc_ver, id))
+		if chunk is None:
+			missing_id_ls.append(id)
+		else:
+			id2chunk[id] = chunk
+	if missing_id_ls:
+		curs.execute("select id, sequence from %s where acc_ver='%s' and id between %s and %s"%\
+			(raw_sequence_table, acc_ver, missing_id_ls[0], missing_id_ls[-1]))
+		rows = curs.fetchall()
+		for id, chunk in rows:
+			if id not in id2chunk:
+				id2chunk[id] = chunk
+				if chunk_cache is not None:
+					chunk_cache.put((acc_ver, id), chunk)
+		for id in missing_id_ls:
+			if id not in id2chunk:
+				sys.stderr.write("id %s missing in raw_sequence table.\n"%id)
+	return id2chunk
+
 """
 11-12-05 get a specified segment from chromosome sequence table
 	reverse is handled but complement(strand) is not. Upper level function should take care of this.
 11-15-05 improve it to be more robust, add acc_ver and report if not found in raw_sequence_table
 2006-08-28 fix a bug when the start%chunk_size =0 (sits on the edge of the previous chunk, two more chunks
 	are required)
+2026-10-18 fetch exactly the chunks covering [start, stop] by one query(get_raw_sequence_chunks()),
+	through chunk_cache(sequence_chunk_cache by default, byte_lru_cache(0) to turn it off).
+	annot_assembly rows are cached in assembly_cache(annot_assembly_cache by default).
+	if packed_genome(codense.packed_genome.packed_genome) has the acc_ver, it's read from there, no raw_sequence_table.
+	callers open it once(made by packed_genome.py) and pass it to every call:
+		from codense.packed_genome import packed_genome
+		genome = packed_genome(fname)
+		get_sequence_segment(curs, gi, start, stop, packed_genome=genome)
+		genome.close()
+	chunk k(from 0) of an acc_ver is raw_sequence_start_id+k, covering positions k*chunk_size+1 to (k+1)*chunk_size.
 """
 def get_sequence_segment(curs, gi, start, stop, annot_assembly_table='sequence.annot_assembly', \
-	raw_sequence_table='sequence.raw_sequence', chunk_size=10000):
+	raw_sequence_table='sequence.raw_sequence', chunk_size=10000, chunk_cache=None, packed_genome=None, \
+	assembly_cache=None):
 	need_reverse = int(start>stop)
 	if need_reverse:
 		start, stop = stop, start
-	curs.execute("select acc_ver, start, stop, raw_sequence_start_id from %s where gi=%s"%(annot_assembly_table, gi))
-	rows = curs.fetchall()
-	acc_ver, orig_start, orig_stop, raw_sequence_start_id = rows[0]
+	if chunk_cache is None:
+		chunk_cache = sequence_chunk_cache
+	if assembly_cache is None:
+		assembly_cache = annot_assembly_cache
+	assembly_key = (annot_assembly_table, gi)
+	row = assembly_cache.get(assembly_key)
+	if row is None:
+		curs.execute("select acc_ver, start, stop, raw_sequence_start_id from %s where gi=%s"%(annot_assembly_table, gi))
+		rows = curs.fetchall()
+		row = rows[0]
+		assembly_cache.put(assembly_key, row)
+	acc_ver, orig_start, orig_stop, raw_sequence_start_id = row
 	if stop>orig_stop:	#11-14-05 to avoid exceeding the boundary
 		stop = orig_stop
-	no_of_chunks_before = start/chunk_size-1	#how many chunks are before this segment (2006-08-28) -1 ensures the edge
-	segment_size = stop - start +1
-	no_of_chunks_segment = segment_size/chunk_size + 1	#how many chunks could be included in this segment
-	raw_sequence_start_id += no_of_chunks_before	#the first chunk which contains teh segment
-	offset = no_of_chunks_segment + 2	#add two more chunks to ensure the segment is enclosed(2006-08-28)
-	#get the sequence from raw_sequence_table
-	seq = ''
-	for i in range(offset):
-		curs.execute("select sequence from %s where acc_ver='%s' and id=%s"%\
-			(raw_sequence_table, acc_ver, raw_sequence_start_id+i))
-		rows = curs.fetchall()
-		if rows:	#11/14/05 it's possible to exceed the whole raw_sequence table because the offset adds one more chunk
-			seq += rows[0][0]
-		else:
-			sys.stderr.write("id %s missing in raw_sequence table.\n"%(raw_sequence_start_id+i))
-			sys.stderr.write("gi: %s, start: %s, stop: %s, raw_sequence_start_id: %s\n"%(gi, start, stop, raw_sequence_start_id))
-	relative_start = start - no_of_chunks_before*chunk_size
-	segment = seq[relative_start-1:relative_start-1+segment_size]	#WATCH index needs -1
+	if start<1:
+		start = 1
+	segment = None
+	if packed_genome is not None:
+		segment = packed_genome.get_segment(acc_ver, start, stop)
+	if segment is None:
+		segment = ''
+		if start<=stop:
+			first_chunk_index = (start-1)/chunk_size
+			last_chunk_index = (stop-1)/chunk_size
+			id2chunk = get_raw_sequence_chunks(curs, acc_ver, raw_sequence_start_id+first_chunk_index, \
+				raw_sequence_start_id+last_chunk_index, raw_sequence_table, chunk_cache)
+			if len(id2chunk)<last_chunk_index-first_chunk_index+1:
+				sys.stderr.write("gi: %s, start: %s, stop: %s, raw_sequence_start_id: %s\n"%(gi, start, stop, raw_sequence_start_id))
+			seq = ''.join([id2chunk.get(raw_sequence_start_id+i, '') for i in range(first_chunk_index, last_chunk_index+1)])
+			relative_start = start - first_chunk_index*chunk_size
+			segment = seq[relative_start-1:relative_start-1+stop-start+1]	#WATCH index needs -1
 	if need_reverse:
-		segment = list(segment)
-		segment.reverse()	#only 
-		segment = ''.join(segment)
+		segment = segment[::-1]	#only reverse
 	return segment
 
 def pg_1d_array2python_ls(pg_array, type_code=int):
@@ -1756,8 +1996,20 @@ def get_vertex_set_gim_array(gene_no2incidence_array, vertex_set):
 12-07-05
 	get the edge2encodedOccurrence from the database
 """
-def fill_edge2encodedOccurrence(curs, min_sup, max_sup, edge_table='edge_cor_vector'):
+def fill_edge2encodedOccurrence(curs, min_sup, max_sup, edge_table='edge_cor_vector', edge_store_fname=None):
+	"""
+	2026-10-18
+		read from the binary edge_store(codense/edge_store.py) if edge_store_fname is given, curs is ignored.
+	"""
 	sys.stderr.write("Getting edge2encodedOccurrence...\n")
+	if edge_store_fname:
+		from edge_store import edge_store
+		edge_store_instance = edge_store(edge_store_fname)
+		edge2encodedOccurrence = edge_store_instance.fill_edge2encodedOccurrence({}, min_sup, max_sup)
+		no_of_datasets = edge_store_instance.no_of_datasets
+		edge_store_instance.close()
+		sys.stderr.write("Done.\n")
+		return edge2encodedOccurrence, no_of_datasets
 	sys.path += [os.path.expanduser('~/script/annot/bin')]
 	from MpiFromDatasetSignatureToPattern import encodeOccurrenceBv
 	edge2encodedOccurrence = {}
@@ -2134,4 +2386,148 @@ def return_edge_set_string(edge_set):
 	for edge in edge_set:
 		edge_set_string_ls.append( '{%s,%s}'%(edge[0],edge[1]))
 	edge_set_string = '{' + ','.join(edge_set_string_ls) + '}'
-	return edge_set_string
\ No newline at end of file
+	return edge_set_string
+
+"""
+2026-10-18
+	lru_cache bounded by the total len() of the values(strings) instead of the no of entries.
+	A value longer than max_bytes is not kept.
+"""
+class byte_lru_cache(lru_cache):
+	def __init__(self, max_bytes=64*1024*1024):
+		lru_cache.__init__(self)
+		self.max_bytes = int(max_bytes)
+		self.no_of_bytes = 0
+	
+	def put(self, key, value):
+		entry = self.key2entry.get(key)
+		if entry is not None:
+			self.no_of_bytes += len(value) - len(entry[3])
+			entry[3] = value
+			self.move_to_front(entry)
+		elif len(value)<=self.max_bytes:
+			entry = [self.root, self.root[1], key, value]
+			self.root[1][0] = entry
+			self.root[1] = entry
+			self.key2entry[key] = entry
+			self.no_of_bytes += len(value)
+		while self.no_of_bytes>self.max_bytes:
+			self.pop_oldest()
+	
+	def pop_oldest(self):
+		key, value = lru_cache.pop_oldest(self)
+		self.no_of_bytes -= len(value)
+		return key, value
+
+#2026-10-18 shared by get_sequence_segment()
+sequence_chunk_cache = byte_lru_cache(64*1024*1024)
+annot_assembly_cache = lru_cache(100000)
+
+
+"""
+2026-10-18
+	buffered writer for a table, replacing one insert/update statement per row.
+	rows are lists in the order of column_ls. lists/tuples(nested ok) become postgres array
+	literals, None becomes NULL, floats are written by repr() to keep all digits.
+	every block_size rows are flushed by COPY ... FROM STDIN(curs.copy_from), or by
+	a multi-row 'insert ... values (...),(...)' if the cursor has no copy_from.
+	If update_key is given, it's an update: rows are copied into a temp table and
+		update table set column=tmp.column ... from tmp where table.update_key=tmp.update_key
+	Call close() at the end to flush the remaining rows.
+"""
+def pg_array_literal(value):
+	"""
+	2026-10-18
+		[[1,2],[3,4]] -> '{{1,2},{3,4}}'
+	"""
+	item_ls = []
+	for item in value:
+		if type(item) in (list, tuple):
+			item_ls.append(pg_array_literal(item))
+		elif item is None:
+			item_ls.append('NULL')
+		elif type(item)==float:
+			item_ls.append(repr(item))
+		else:
+			item_ls.append(str(item))
+	return '{' + ','.join(item_ls) + '}'
+
+class table_bulk_writer:
+	def __init__(self, curs, table, column_ls, block_size=5000, update_key=None):
+		self.curs = curs
+		self.table = table
+		self.column_ls = list(column_ls)
+		self.block_size = int(block_size)
+		self.update_key = update_key
+		self.row_ls = []
+		self.no_of_rows = 0
+		self.use_copy = hasattr(curs, 'copy_from')
+		self.tmp_table = None
+		if self.update_key:
+			self.tmp_table = 'tmp_%s_bulk_update'%(table.replace('.', '_'))
+			self.curs.execute("create temp table %s as select %s from %s limit 0"%\
+				(self.tmp_table, ', '.join(self.column_ls), table))
+	
+	def encode_copy_value(self, value):
+		if value is None:
+			return '\\N'
+		if type(value) in (list, tuple):
+			value = pg_array_literal(value)
+		elif type(value)==float:
+			value = repr(value)
+		else:
+			value = str(value)
+		return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+	
+	def encode_sql_value(self, value):
+		if value is None:
+			return 'NULL'
+		if type(value) in (list, tuple):
+			value = pg_array_literal(value)
+		elif type(value)==float:
+			return repr(value)
+		elif type(value) in (int, long):
+			return str(value)
+		return "'%s'"%(str(value).replace("'", "''"))
+	
+	def add_row(self, row):
+		self.row_ls.append(row)
+		if len(self.row_ls)>=self.block_size:
+			self.flush()
+	
+	def flush(self):
+		if not self.row_ls:
+			return
+		if self.update_key:
+			target_table = self.tmp_table
+		else:
+			target_table = self.table
+		if self.use_copy:
+			import cStringIO
+			buffer = cStringIO.StringIO()
+			for row in self.row_ls:
+				buffer.write('\t'.join(map(self.encode_copy_value, row)))
+				buffer.write('\n')
+			buffer.seek(0)
+			self.curs.copy_from(buffer, '%s(%s)'%(target_table, ', '.join(self.column_ls)))
+		else:
+			value_ls = []
+			for row in self.row_ls:
+				value_ls.append('(%s)'%(', '.join(map(self.encode_sql_value, row))))
+			self.curs.execute("insert into %s(%s) values %s"%(target_table, ', '.join(self.column_ls), ', '.join(value_ls)))
+		if self.update_key:
+			set_ls = []
+			for column in self.column_ls:
+				if column!=self.update_key:
+					set_ls.append('%s=t.%s'%(column, column))
+			self.curs.execute("update %s set %s from %s t where %s.%s=t.%s"%(self.table, ', '.join(set_ls), \
+				self.tmp_table, self.table, self.update_key, self.update_key))
+			self.curs.execute("delete from %s"%self.tmp_table)
+		self.no_of_rows += len(self.row_ls)
+		self.row_ls = []
+	
+	def close(self):
+		self.flush()
+		if self.tmp_table:
+			self.curs.execute("drop table %s"%self.tmp_table)
+			self.tmp_table = None
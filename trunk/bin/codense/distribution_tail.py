@@ -0,0 +1,350 @@
+#!/usr/bin/env python
+"""
+2026-10-18
+	in-process hypergeometric and binomial probabilities, replacing r.phyper(), r.pbinom()
+	and r.dbinom() from rpy. Arguments follow R's convention:
+		phyper(q, m, n, k, lower_tail=1, log_p=0)	m white balls, n black balls, k drawn, P(X<=q)
+		pbinom(q, size, prob, lower_tail=1, log_p=0)
+		dhyper(x, m, n, k, log=0), dbinom(x, size, prob, log=0)
+
+	Everything is computed in log-space from a table of log(i!) grown on demand.
+	A tail is summed directly only if it doesn't cover the mode, terms shrink monotonically
+	away from the mode (ratio recurrence, stops once they fall below 1e-17 of the sum).
+	The other tail is 1 minus that.
+
+	phyper() and pbinom() results are memoized in an lru_cache keyed by the argument tuple.
+	phyper_ls() and pbinom_ls() take sequences(scalars are broadcast) and return lists,
+	one phyper()/pbinom() per element, repeated arguments are served by the cache.
+
+2026-10-18
+	pt(q, df, lower_tail=1, log_p=0) from the regularized incomplete beta function(continued
+	fraction), and welch_t_test(x_ls, y_ls), the p-value of r.t_test(x_ls, y_ls).
+
+2026-10-18
+	pbinom_log_prob() takes log(prob), for a prob that underflows(product of many edge probabilities).
+"""
+
+import math
+from lru_cache import lru_cache
+
+log_factorial_table = [0.0]
+negative_infinity = float('-inf')
+tail_cache = lru_cache(200000)
+
+def log_factorial(n):
+	"""
+	2026-10-18
+	"""
+	if n>=len(log_factorial_table):
+		log = math.log
+		for i in range(len(log_factorial_table), n+1):
+			log_factorial_table.append(log_factorial_table[-1] + log(i))
+	return log_factorial_table[n]
+
+def log_choose(n, k):
+	if k<0 or k>n:
+		return negative_infinity
+	return log_factorial(n) - log_factorial(k) - log_factorial(n-k)
+
+def log_one_minus_exp(log_x):
+	"""
+	2026-10-18
+		log(1-exp(log_x)), accurate for tiny exp(log_x)
+	"""
+	if log_x==negative_infinity:
+		return 0.0
+	x = math.exp(log_x)
+	if x<1e-5:
+		return -x - x*x/2 - x*x*x/3
+	if x>=1.0:
+		return negative_infinity
+	return math.log(1.0-x)
+
+def log_tail_sum(log_first_term, first, last, ratio_func):
+	"""
+	2026-10-18
+		log of sum of terms from first to last(inclusive, step is +1 or -1),
+		term(i+step) = term(i)*ratio_func(i), terms are non-increasing.
+	"""
+	step = 1
+	if last<first:
+		step = -1
+	total = 1.0
+	term = 1.0
+	i = first
+	while i!=last:
+		term *= ratio_func(i)
+		total += term
+		if term<total*1e-17:
+			break
+		i += step
+	return log_first_term + math.log(total)
+
+def log_dhyper(x, m, n, k):
+	if x<max(0, k-n) or x>min(k, m):
+		return negative_infinity
+	return log_choose(m, x) + log_choose(n, k-x) - log_choose(m+n, k)
+
+def dhyper(x, m, n, k, log=0):
+	log_d = log_dhyper(x, m, n, k)
+	if log:
+		return log_d
+	return math.exp(log_d)
+
+def _log_phyper(q, m, n, k, lower_tail):
+	"""
+	2026-10-18
+		log P(X<=q) or log P(X>q)
+	"""
+	low = max(0, k-n)
+	high = min(k, m)
+	if q<low:
+		log_lower = negative_infinity
+	elif q>=high:
+		log_lower = 0.0
+	else:
+		log_lower = None
+	if log_lower is not None:
+		if lower_tail:
+			return log_lower
+		return log_one_minus_exp(log_lower)
+	mode = (k+1)*(m+1)/(m+n+2)
+	if q<mode:	#lower tail is away from the mode, sum downwards from q
+		def ratio_func(i):
+			return float(i*(n-k+i))/((m-i+1)*(k-i+1))
+		log_lower = log_tail_sum(log_dhyper(q, m, n, k), q, low, ratio_func)
+		if lower_tail:
+			return log_lower
+		return log_one_minus_exp(log_lower)
+	else:	#upper tail, sum upwards from q+1
+		def ratio_func(i):
+			return float((m-i)*(k-i))/((i+1)*(n-k+i+1))
+		log_upper = log_tail_sum(log_dhyper(q+1, m, n, k), q+1, high, ratio_func)
+		if lower_tail:
+			return log_one_minus_exp(log_upper)
+		return log_upper
+
+def phyper(q, m, n, k, lower_tail=1, log_p=0):
+	"""
+	2026-10-18
+		r.phyper(q, m, n, k, lower_tail, log_p)
+	"""
+	key = ('phyper', q, m, n, k, lower_tail, log_p)
+	p_value = tail_cache.get(key)
+	if p_value is None:
+		p_value = _log_phyper(int(q), int(m), int(n), int(k), lower_tail)
+		if not log_p:
+			p_value = math.exp(p_value)
+		tail_cache.put(key, p_value)
+	return p_value
+
+def log_dbinom(x, size, prob):
+	if prob<=0.0:
+		return log_dbinom_log_prob(x, size, negative_infinity)
+	return log_dbinom_log_prob(x, size, math.log(prob))
+
+def log_dbinom_log_prob(x, size, log_prob):
+	"""
+	2026-10-18
+		log_dbinom() given log(prob)
+	"""
+	if x<0 or x>size:
+		return negative_infinity
+	if log_prob==negative_infinity:
+		if x==0:
+			return 0.0
+		return negative_infinity
+	if log_prob>=0.0:
+		if x==size:
+			return 0.0
+		return negative_infinity
+	return log_choose(size, x) + x*log_prob + (size-x)*log_one_minus_exp(log_prob)
+
+def dbinom(x, size, prob, log=0):
+	log_d = log_dbinom(int(x), int(size), prob)
+	if log:
+		return log_d
+	return math.exp(log_d)
+
+def _log_pbinom(q, size, prob, lower_tail):
+	"""
+	2026-10-18
+		log P(X<=q) or log P(X>q)
+	"""
+	if prob<=0.0:
+		return _log_pbinom_log_prob(q, size, negative_infinity, lower_tail)
+	return _log_pbinom_log_prob(q, size, math.log(prob), lower_tail)
+
+def _log_pbinom_log_prob(q, size, log_prob, lower_tail):
+	"""
+	2026-10-18
+		_log_pbinom() given log(prob)
+	"""
+	if q<0:
+		log_lower = negative_infinity
+	elif q>=size:
+		log_lower = 0.0
+	elif log_prob==negative_infinity:
+		log_lower = 0.0
+	elif log_prob>=0.0:
+		log_lower = negative_infinity
+	else:
+		log_lower = None
+	if log_lower is not None:
+		if lower_tail:
+			return log_lower
+		return log_one_minus_exp(log_lower)
+	odds = math.exp(log_prob - log_one_minus_exp(log_prob))	#0 if prob underflows, the upper tail is summed then
+	mode = int((size+1)*math.exp(log_prob))
+	if q<mode:
+		def ratio_func(i):
+			return i/((size-i+1)*odds)
+		log_lower = log_tail_sum(log_dbinom_log_prob(q, size, log_prob), q, 0, ratio_func)
+		if lower_tail:
+			return log_lower
+		return log_one_minus_exp(log_lower)
+	else:
+		def ratio_func(i):
+			return (size-i)*odds/(i+1)
+		log_upper = log_tail_sum(log_dbinom_log_prob(q+1, size, log_prob), q+1, size, ratio_func)
+		if lower_tail:
+			return log_one_minus_exp(log_upper)
+		return log_upper
+
+def pbinom(q, size, prob, lower_tail=1, log_p=0):
+	"""
+	2026-10-18
+		r.pbinom(q, size, prob, lower_tail, log_p)
+	"""
+	key = ('pbinom', q, size, prob, lower_tail, log_p)
+	p_value = tail_cache.get(key)
+	if p_value is None:
+		p_value = _log_pbinom(int(q), int(size), float(prob), lower_tail)
+		if not log_p:
+			p_value = math.exp(p_value)
+		tail_cache.put(key, p_value)
+	return p_value
+
+def pbinom_log_prob(q, size, log_prob, lower_tail=1, log_p=0):
+	"""
+	2026-10-18
+		pbinom() with log(prob) instead of prob, not memoized(log_prob is rarely repeated)
+	"""
+	p_value = _log_pbinom_log_prob(int(q), int(size), float(log_prob), lower_tail)
+	if not log_p:
+		p_value = math.exp(p_value)
+	return p_value
+
+def broadcast(argument_ls):
+	"""
+	2026-10-18
+		turn scalars into lists as long as the longest sequence
+	"""
+	length = 1
+	for argument in argument_ls:
+		if hasattr(argument, '__len__'):
+			length = max(length, len(argument))
+	new_argument_ls = []
+	for argument in argument_ls:
+		if hasattr(argument, '__len__'):
+			new_argument_ls.append(argument)
+		else:
+			new_argument_ls.append([argument]*length)
+	return new_argument_ls
+
+def phyper_ls(q_ls, m_ls, n_ls, k_ls, lower_tail=1, log_p=0):
+	q_ls, m_ls, n_ls, k_ls = broadcast([q_ls, m_ls, n_ls, k_ls])
+	return [phyper(q_ls[i], m_ls[i], n_ls[i], k_ls[i], lower_tail, log_p) for i in range(len(q_ls))]
+
+def pbinom_ls(q_ls, size_ls, prob_ls, lower_tail=1, log_p=0):
+	q_ls, size_ls, prob_ls = broadcast([q_ls, size_ls, prob_ls])
+	return [pbinom(q_ls[i], size_ls[i], prob_ls[i], lower_tail, log_p) for i in range(len(q_ls))]
+
+def beta_continued_fraction(x, a, b, max_iteration=300, epsilon=3e-16):
+	"""
+	2026-10-18
+		continued fraction of the incomplete beta function(modified Lentz)
+	"""
+	tiny = 1e-300
+	c = 1.0
+	d = 1.0-(a+b)*x/(a+1.0)
+	if abs(d)<tiny:
+		d = tiny
+	d = 1.0/d
+	h = d
+	for m in xrange(1, max_iteration+1):
+		m2 = 2*m
+		aa = m*(b-m)*x/((a-1.0+m2)*(a+m2))
+		d = 1.0+aa*d
+		if abs(d)<tiny:
+			d = tiny
+		c = 1.0+aa/c
+		if abs(c)<tiny:
+			c = tiny
+		d = 1.0/d
+		h *= d*c
+		aa = -(a+m)*(a+b+m)*x/((a+m2)*(a+1.0+m2))
+		d = 1.0+aa*d
+		if abs(d)<tiny:
+			d = tiny
+		c = 1.0+aa/c
+		if abs(c)<tiny:
+			c = tiny
+		d = 1.0/d
+		delta = d*c
+		h *= delta
+		if abs(delta-1.0)<epsilon:
+			break
+	return h
+
+def log_incomplete_beta(x, a, b):
+	"""
+	2026-10-18
+		log of the regularized incomplete beta function I_x(a, b)
+	"""
+	if x<=0.0:
+		return negative_infinity
+	if x>=1.0:
+		return 0.0
+	log_front = math.lgamma(a+b) - math.lgamma(a) - math.lgamma(b) + a*math.log(x) + b*math.log(1.0-x)
+	if x<(a+1.0)/(a+b+2.0):
+		return log_front + math.log(beta_continued_fraction(x, a, b)) - math.log(a)
+	else:
+		return log_one_minus_exp(log_front + math.log(beta_continued_fraction(1.0-x, b, a)) - math.log(b))
+
+def pt(q, df, lower_tail=1, log_p=0):
+	"""
+	2026-10-18
+		r.pt(q, df, lower_tail, log_p), Student t distribution, df could be fractional
+	"""
+	df = float(df)
+	log_tail = log_incomplete_beta(df/(df+q*q), df/2.0, 0.5) - math.log(2.0)	#log P(T>|q|)
+	if (q>0) == bool(lower_tail):
+		log_p_value = log_one_minus_exp(log_tail)
+	else:
+		log_p_value = log_tail
+	if log_p:
+		return log_p_value
+	return math.exp(log_p_value)
+
+def welch_t_test(x_ls, y_ls):
+	"""
+	2026-10-18
+		two-sided p-value of Welch's t-test, what r.t_test(x_ls, y_ls)['p.value'] is.
+		R stops with an error if either group has <2 observations or both are constant,
+		1.0 is returned instead.
+	"""
+	no_of_x = len(x_ls)
+	no_of_y = len(y_ls)
+	if no_of_x<2 or no_of_y<2:
+		return 1.0
+	mean_x = sum(x_ls)/float(no_of_x)
+	mean_y = sum(y_ls)/float(no_of_y)
+	stderr_x2 = sum([(x-mean_x)*(x-mean_x) for x in x_ls])/(no_of_x-1)/no_of_x
+	stderr_y2 = sum([(y-mean_y)*(y-mean_y) for y in y_ls])/(no_of_y-1)/no_of_y
+	stderr = math.sqrt(stderr_x2+stderr_y2)
+	if stderr<=1e-15*max(abs(mean_x), abs(mean_y)) or stderr==0.0:
+		return 1.0
+	df = (stderr_x2+stderr_y2)**2/(stderr_x2*stderr_x2/(no_of_x-1) + stderr_y2*stderr_y2/(no_of_y-1))
+	t = (mean_x-mean_y)/stderr
+	return 2*pt(-abs(t), df)
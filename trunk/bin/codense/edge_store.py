@@ -0,0 +1,480 @@
+#!/usr/bin/env python
+"""
+Usage: edge_store.py -k SCHEMA [OPTION] OUTPUTFILE
+	edge_store.py -s SIG_VECTOR_FILE [OPTION] OUTPUTFILE
+
+Option:
+	-z ..., --hostname=...	the hostname, zhoudb(default)
+	-d ..., --dbname=...	the database name, graphdb(default)
+	-k ..., --schema=...	which schema in the database
+	-t ..., --table=...	the edge_cor_vector table, edge_cor_vector(default)
+	-s ..., --sig_vector_file=...	build from a sig_vector file instead of the database(no cor_vector)
+	-r, --report	report the progress
+	-h, --help	show this help
+
+Examples:
+	edge_store.py -k mm_fim_97 -t edge_cor_vector mm_fim_97.edge_store
+	edge_store.py -s mm_fim_97.gene_no.sig_vector mm_fim_97.edge_store
+
+Description:
+	Dump the edge_cor_vector table(or a sig_vector file) into a binary columnar
+	file, which is mmap-ed by class edge_store. No text parsing at reading time.
+
+	File layout(all little-endian, every column starts at an 8-byte boundary):
+		header: magic, no_of_edges, no_of_datasets, no_of_sig_bytes, has_cor
+		edge_id	int32 x no_of_edges
+		gene_no1	int32 x no_of_edges
+		gene_no2	int32 x no_of_edges
+		support	uint16 x no_of_edges
+		sig_bits	no_of_sig_bytes bytes per edge, bit i <=> dataset i (encodeOccurrenceBv order)
+		cor	float32 x no_of_datasets per edge(only if has_cor)
+		order	int32 x no_of_edges, row numbers sorted by (min(gene_no1,gene_no2), max(...))
+"""
+
+import sys, os, getopt, csv, mmap, struct, tempfile, binascii
+from array import array
+from heapq import heappush, heappop
+from itertools import izip, compress
+
+magic = 'EDGESTR1'
+header_format = '<8siiii'
+header_size = struct.calcsize(header_format)
+
+def array_to_file(ary, file_handle):
+	"""
+	2026-10-18
+		write an array in little-endian
+	"""
+	if sys.byteorder=='big':
+		ary = array(ary.typecode, ary)
+		ary.byteswap()
+	ary.tofile(file_handle)
+
+def array_from_string(typecode, string):
+	"""
+	2026-10-18
+		reverse of array_to_file()
+	"""
+	ary = array(typecode)
+	ary.fromstring(string)
+	if sys.byteorder=='big':
+		ary.byteswap()
+	return ary
+
+def pad_to_8(offset):
+	return (offset+7)/8*8
+
+def key_row_run_reader(run_fname, block_size=100000):
+	"""
+	2026-10-18
+		generator of ((smaller gene_no, bigger gene_no), row_no) from a run file written by
+		edge_store_writer.sort_one_run()
+	"""
+	inf = open(run_fname, 'rb')
+	while 1:
+		block = array('I')
+		try:
+			block.fromfile(inf, 3*block_size)
+		except EOFError:	#the last block, fromfile() keeps what's read
+			pass
+		for i in range(0, len(block)-2, 3):
+			yield ((block[i], block[i+1]), block[i+2])
+		if len(block)<3*block_size:
+			break
+	inf.close()
+
+def get_column_offsets(no_of_edges, no_of_datasets, no_of_sig_bytes, has_cor):
+	"""
+	2026-10-18
+		return column_name2offset, the last entry 'end' is the file size
+	"""
+	column_name2offset = {}
+	offset = pad_to_8(header_size)
+	column_size_ls = [('edge_id', 4*no_of_edges), ('gene_no1', 4*no_of_edges), ('gene_no2', 4*no_of_edges),\
+		('support', 2*no_of_edges), ('sig_bits', no_of_sig_bytes*no_of_edges), \
+		('cor', has_cor*4*no_of_datasets*no_of_edges), ('order', 4*no_of_edges)]
+	for column_name, column_size in column_size_ls:
+		column_name2offset[column_name] = offset
+		offset = pad_to_8(offset+column_size)
+	column_name2offset['end'] = offset
+	return column_name2offset
+
+class edge_store_writer:
+	"""
+	2026-10-18
+		append edges one by one(each column goes into its own temporary file),
+		close() assembles the final file.
+	"""
+	column_name_ls = ['edge_id', 'gene_no1', 'gene_no2', 'support', 'sig_bits', 'cor']
+	column_name2typecode = {'edge_id':'i', 'gene_no1':'i', 'gene_no2':'i', 'support':'H', 'sig_bits':'B', 'cor':'f'}
+
+	def __init__(self, output_fname, block_size=5000, sort_block_size=1000000):
+		"""
+		2026-10-18
+			sort_block_size edges are sorted in memory at a time for the order column,
+			the sorted runs are merged on disk.
+		"""
+		self.output_fname = output_fname
+		self.block_size = int(block_size)
+		self.sort_block_size = int(sort_block_size)
+		self.tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(output_fname)))
+		self.column_name2file = {}
+		self.column_name2buffer = {}
+		for column_name in self.column_name_ls:
+			self.column_name2file[column_name] = open(os.path.join(self.tmp_dir, column_name), 'wb')
+			self.column_name2buffer[column_name] = array(self.column_name2typecode[column_name])
+		self.no_of_edges = 0
+		self.no_of_datasets = None
+		self.no_of_sig_bytes = 0
+		self.has_cor = None
+
+	def flush(self):
+		for column_name in self.column_name_ls:
+			array_to_file(self.column_name2buffer[column_name], self.column_name2file[column_name])
+			self.column_name2buffer[column_name] = array(self.column_name2typecode[column_name])
+
+	def add_edge(self, edge_id, edge, sig_vector, cor_vector=None):
+		"""
+		2026-10-18
+			all edges must have the same no_of_datasets, cor_vector given for all or none
+		"""
+		if self.no_of_datasets is None:
+			self.no_of_datasets = len(sig_vector)
+			self.no_of_sig_bytes = (self.no_of_datasets+7)/8
+			self.has_cor = int(cor_vector is not None)
+		if len(sig_vector)!=self.no_of_datasets or (cor_vector is not None)!=self.has_cor:
+			raise ValueError("edge %s has an inconsistent sig_vector/cor_vector"%repr(edge))
+		column_name2buffer = self.column_name2buffer
+		column_name2buffer['edge_id'].append(edge_id)
+		column_name2buffer['gene_no1'].append(edge[0])
+		column_name2buffer['gene_no2'].append(edge[1])
+		support = 0
+		sig_bits = column_name2buffer['sig_bits']
+		for i in range(self.no_of_sig_bytes):
+			byte = 0
+			for j in range(8*i, min(8*i+8, self.no_of_datasets)):
+				if sig_vector[j]==1:
+					byte |= 1<<(j-8*i)
+					support += 1
+			sig_bits.append(byte)
+		column_name2buffer['support'].append(support)
+		if self.has_cor:
+			column_name2buffer['cor'].extend(cor_vector)
+		self.no_of_edges += 1
+		if self.no_of_edges%self.block_size==0:
+			self.flush()
+
+	def close(self):
+		self.flush()
+		for column_name in self.column_name_ls:
+			self.column_name2file[column_name].close()
+		if self.no_of_datasets is None:
+			self.no_of_datasets = 0
+			self.has_cor = 0
+		no_of_edges = self.no_of_edges
+		self.write_order_column(os.path.join(self.tmp_dir, 'order'))
+
+		column_name2offset = get_column_offsets(no_of_edges, self.no_of_datasets, self.no_of_sig_bytes, self.has_cor)
+		of = open(self.output_fname, 'wb')
+		of.write(struct.pack(header_format, magic, no_of_edges, self.no_of_datasets, self.no_of_sig_bytes, self.has_cor))
+		for column_name in self.column_name_ls+['order']:
+			of.write('\0'*(column_name2offset[column_name]-of.tell()))
+			column_fname = os.path.join(self.tmp_dir, column_name)
+			inf = open(column_fname, 'rb')
+			block = inf.read(1<<22)
+			while block:
+				of.write(block)
+				block = inf.read(1<<22)
+			inf.close()
+			os.remove(column_fname)
+		of.write('\0'*(column_name2offset['end']-of.tell()))
+		of.close()
+		os.rmdir(self.tmp_dir)
+
+	def sort_one_run(self, gene_no1_ls, gene_no2_ls, first_row_no, run_fname):
+		"""
+		2026-10-18
+			(smaller gene_no, bigger gene_no, row_no) triples sorted by the gene_no pair,
+			as unsigned ints(32-bit, so no 64-bit unsigned long needed) to run_fname.
+		"""
+		smaller_ls = array('I', map(min, gene_no1_ls, gene_no2_ls))
+		bigger_ls = array('I', map(max, gene_no1_ls, gene_no2_ls))
+		row_no_ls = range(len(smaller_ls))
+		row_no_ls.sort(key=lambda i: (smaller_ls[i], bigger_ls[i]))
+		run_array = array('I', [0])*(3*len(smaller_ls))
+		run_array[::3] = array('I', [smaller_ls[i] for i in row_no_ls])
+		run_array[1::3] = array('I', [bigger_ls[i] for i in row_no_ls])
+		run_array[2::3] = array('I', [first_row_no+i for i in row_no_ls])
+		of = open(run_fname, 'wb')
+		run_array.tofile(of)
+		of.close()
+
+	def write_order_column(self, order_fname):
+		"""
+		2026-10-18
+			the lookup order(row numbers sorted by (smaller gene_no, bigger gene_no)) to order_fname(little-endian int32).
+			sort_block_size edges are sorted at a time into a run, then a k-way merge of the runs.
+		"""
+		gene_no1_f = open(os.path.join(self.tmp_dir, 'gene_no1'), 'rb')
+		gene_no2_f = open(os.path.join(self.tmp_dir, 'gene_no2'), 'rb')
+		run_fname_ls = []
+		first_row_no = 0
+		while first_row_no<self.no_of_edges:
+			gene_no1_ls = array_from_string('i', gene_no1_f.read(4*self.sort_block_size))
+			gene_no2_ls = array_from_string('i', gene_no2_f.read(4*self.sort_block_size))
+			run_fname = os.path.join(self.tmp_dir, 'run%s'%len(run_fname_ls))
+			self.sort_one_run(gene_no1_ls, gene_no2_ls, first_row_no, run_fname)
+			run_fname_ls.append(run_fname)
+			first_row_no += len(gene_no1_ls)
+		gene_no1_f.close()
+		gene_no2_f.close()
+		
+		run_reader_ls = []
+		heap = []
+		for run_fname in run_fname_ls:
+			run_reader = key_row_run_reader(run_fname)
+			run_reader_ls.append(run_reader)
+			for key, row_no in run_reader:	#first record of this run
+				heappush(heap, (key, row_no, len(run_reader_ls)-1))
+				break
+		of = open(order_fname, 'wb')
+		order = array('i')
+		while heap:
+			key, row_no, run_index = heappop(heap)
+			order.append(row_no)
+			if len(order)>=self.sort_block_size:
+				array_to_file(order, of)
+				order = array('i')
+			for key, row_no in run_reader_ls[run_index]:	#next record of this run
+				heappush(heap, (key, row_no, run_index))
+				break
+		array_to_file(order, of)
+		of.close()
+		for run_fname in run_fname_ls:
+			os.remove(run_fname)
+
+class edge_store:
+	"""
+	2026-10-18
+		read-only, mmap-ed edge_cor_vector. row_no is the position of an edge in the file.
+	"""
+	def __init__(self, edge_store_fname):
+		self.edge_store_fname = edge_store_fname
+		self.file_handle = open(edge_store_fname, 'rb')
+		self.mm = mmap.mmap(self.file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		file_magic, self.no_of_edges, self.no_of_datasets, self.no_of_sig_bytes, self.has_cor = \
+			struct.unpack(header_format, self.mm[:header_size])
+		if file_magic!=magic:
+			raise ValueError("%s is not an edge_store file"%edge_store_fname)
+		self.column_name2offset = get_column_offsets(self.no_of_edges, self.no_of_datasets, \
+			self.no_of_sig_bytes, self.has_cor)
+		self.column_name2array = {}
+
+	def close(self):
+		self.mm.close()
+		self.file_handle.close()
+
+	def get_column(self, column_name):
+		"""
+		2026-10-18
+			edge_id, gene_no1, gene_no2, support or order as an array(cached)
+		"""
+		if column_name not in self.column_name2array:
+			typecode = edge_store_writer.column_name2typecode.get(column_name, 'i')
+			offset = self.column_name2offset[column_name]
+			column_size = array(typecode).itemsize*self.no_of_edges
+			self.column_name2array[column_name] = array_from_string(typecode, self.mm[offset:offset+column_size])
+		return self.column_name2array[column_name]
+
+	def get_edge_id(self, row_no):
+		return self.get_column('edge_id')[row_no]
+
+	def get_edge(self, row_no):
+		return [self.get_column('gene_no1')[row_no], self.get_column('gene_no2')[row_no]]
+
+	def get_support(self, row_no):
+		return self.get_column('support')[row_no]
+
+	def get_sig_bits(self, row_no):
+		offset = self.column_name2offset['sig_bits'] + row_no*self.no_of_sig_bytes
+		return self.mm[offset:offset+self.no_of_sig_bytes]
+
+	def get_encoded_occurrence(self, row_no):
+		"""
+		2026-10-18
+			same as encodeOccurrenceBv(sig_vector)
+		"""
+		if self.no_of_sig_bytes==0:
+			return 0L
+		sig_bits = self.get_sig_bits(row_no)
+		return long(binascii.hexlify(sig_bits[::-1]), 16)
+
+	def get_sig_vector(self, row_no):
+		sig_bits = self.get_sig_bits(row_no)
+		sig_vector = [0]*self.no_of_datasets
+		for i in range(self.no_of_sig_bytes):
+			byte = ord(sig_bits[i])
+			j = 0
+			while byte:
+				if byte&1:
+					sig_vector[8*i+j] = 1
+				byte >>= 1
+				j += 1
+		return sig_vector
+
+	def get_cor_vector(self, row_no):
+		if not self.has_cor:
+			return None
+		offset = self.column_name2offset['cor'] + row_no*4*self.no_of_datasets
+		return array_from_string('f', self.mm[offset:offset+4*self.no_of_datasets]).tolist()
+
+	def find_row_no(self, gene_no1, gene_no2):
+		"""
+		2026-10-18
+			binary search over the order column, orientation of the edge doesn't matter.
+			return -1 if not found.
+		"""
+		key = (min(gene_no1, gene_no2), max(gene_no1, gene_no2))
+		order = self.get_column('order')
+		gene_no1_ls = self.get_column('gene_no1')
+		gene_no2_ls = self.get_column('gene_no2')
+		lo = 0
+		hi = self.no_of_edges
+		while lo<hi:
+			mid = (lo+hi)/2
+			row_no = order[mid]
+			a = gene_no1_ls[row_no]
+			b = gene_no2_ls[row_no]
+			if a>b:
+				a, b = b, a
+			if (a,b)<key:
+				lo = mid+1
+			else:
+				hi = mid
+		if lo<self.no_of_edges:
+			row_no = order[lo]
+			if gene_no1_ls[row_no]==key[0] and gene_no2_ls[row_no]==key[1] or \
+				gene_no1_ls[row_no]==key[1] and gene_no2_ls[row_no]==key[0]:
+				return row_no
+		return -1
+
+	def get_row_no_ls(self, min_sup=0, max_sup=200):
+		"""
+		2026-10-18
+			rows whose support is within [min_sup, max_sup]
+		"""
+		support_ls = self.get_column('support')
+		return [row_no for row_no in xrange(self.no_of_edges) if min_sup<=support_ls[row_no]<=max_sup]
+
+	def get_edge2occurrence(self, min_sup=0, max_sup=200):
+		"""
+		2026-10-18
+			the counterpart of codense.common.get_edge2occurrence()
+		"""
+		gene_no1_ls = self.get_column('gene_no1')
+		gene_no2_ls = self.get_column('gene_no2')
+		support_ls = self.get_column('support')
+		edge_support_iter = izip(izip(gene_no1_ls, gene_no2_ls), support_ls)
+		if support_ls and (min(support_ls)<min_sup or max(support_ls)>max_sup):
+			edge_support_iter = compress(edge_support_iter, [min_sup<=support<=max_sup for support in support_ls])
+		return dict(edge_support_iter)
+
+	def fill_edge2encodedOccurrence(self, edge2encodedOccurrence, min_sup=0, max_sup=200):
+		"""
+		2026-10-18
+			the counterpart of codense.common.fill_edge2encodedOccurrence()
+		"""
+		gene_no1_ls = self.get_column('gene_no1')
+		gene_no2_ls = self.get_column('gene_no2')
+		for row_no in self.get_row_no_ls(min_sup, max_sup):
+			edge2encodedOccurrence[(gene_no1_ls[row_no], gene_no2_ls[row_no])] = self.get_encoded_occurrence(row_no)
+		return edge2encodedOccurrence
+
+def construct_edge_store_from_db(curs, output_fname, edge_table='edge_cor_vector', report=0):
+	"""
+	2026-10-18
+		one pass over the edge_cor_vector table
+	"""
+	sys.stderr.write("Constructing edge_store from %s...\n"%edge_table)
+	writer = edge_store_writer(output_fname)
+	curs.execute("DECLARE crs CURSOR FOR select edge_id, edge_name, sig_vector, cor_vector \
+		from %s"%(edge_table))
+	curs.execute("fetch 5000 from crs")
+	rows = curs.fetchall()
+	counter = 0
+	while rows:
+		for row in rows:
+			edge = map(int, row[1][1:-1].split(','))
+			sig_vector = map(int, row[2][1:-1].split(','))
+			cor_vector = map(float, row[3][1:-1].split(','))
+			writer.add_edge(row[0], edge, sig_vector, cor_vector)
+			counter += 1
+		if report:
+			sys.stderr.write('%s%s'%('\x08'*20, counter))
+		curs.execute("fetch 5000 from crs")
+		rows = curs.fetchall()
+	curs.execute("close crs")
+	writer.close()
+	sys.stderr.write("Done.\n")
+
+def construct_edge_store_from_sig_vector_file(sig_vector_fname, output_fname, report=0):
+	"""
+	2026-10-18
+		sig_vector file: gene_no1, gene_no2, sig_vector..., edge_id is the line number(starting from 1)
+	"""
+	sys.stderr.write("Constructing edge_store from %s...\n"%sig_vector_fname)
+	writer = edge_store_writer(output_fname)
+	reader = csv.reader(open(sig_vector_fname, 'r'), delimiter='\t')
+	counter = 0
+	for row in reader:
+		counter += 1
+		writer.add_edge(counter, map(int, row[:2]), map(int, row[2:]))
+		if report and counter%5000==0:
+			sys.stderr.write('%s%s'%('\x08'*20, counter))
+	del reader
+	writer.close()
+	sys.stderr.write("Done.\n")
+
+if __name__ == '__main__':
+	if len(sys.argv) == 1:
+		print __doc__
+		sys.exit(2)
+
+	try:
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:s:r", ["help", "hostname=", "dbname=", \
+			"schema=", "table=", "sig_vector_file=", "report"])
+	except:
+		print __doc__
+		sys.exit(2)
+
+	hostname = 'zhoudb'
+	dbname = 'graphdb'
+	schema = ''
+	table = 'edge_cor_vector'
+	sig_vector_fname = None
+	report = 0
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			print __doc__
+			sys.exit(2)
+		elif opt in ("-z", "--hostname"):
+			hostname = arg
+		elif opt in ("-d", "--dbname"):
+			dbname = arg
+		elif opt in ("-k", "--schema"):
+			schema = arg
+		elif opt in ("-t", "--table"):
+			table = arg
+		elif opt in ("-s", "--sig_vector_file"):
+			sig_vector_fname = arg
+		elif opt in ("-r", "--report"):
+			report = 1
+	if sig_vector_fname and len(args)==1:
+		construct_edge_store_from_sig_vector_file(sig_vector_fname, args[0], report)
+	elif schema and len(args)==1:
+		from common import db_connect
+		conn, curs = db_connect(hostname, dbname, schema)
+		construct_edge_store_from_db(curs, args[0], table, report)
+	else:
+		print __doc__
+		sys.exit(2)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+2026-10-18
+	moved out of codense.common(which pulls in psycopg, pymodule ...), so pure modules
+	like distribution_tail can use it. codense.common still exports it.
+
+	a least-recently-used cache with a fixed no of entries.
+	each entry is a [previous, next, key, value] list in a circular doubly-linked list,
+	self.root.next is the most recently used one.
+"""
+
+class lru_cache:
+	def __init__(self, max_size=100000):
+		self.max_size = int(max_size)
+		self.key2entry = {}
+		self.root = []
+		self.root[:] = [self.root, self.root, None, None]
+		self.no_of_hits = 0
+		self.no_of_misses = 0
+	
+	def __len__(self):
+		return len(self.key2entry)
+	
+	def __contains__(self, key):
+		return key in self.key2entry
+	
+	def get(self, key, default=None):
+		entry = self.key2entry.get(key)
+		if entry is None:
+			self.no_of_misses += 1
+			return default
+		self.no_of_hits += 1
+		self.move_to_front(entry)
+		return entry[3]
+	
+	def move_to_front(self, entry):
+		entry[0][1] = entry[1]
+		entry[1][0] = entry[0]
+		entry[0] = self.root
+		entry[1] = self.root[1]
+		self.root[1][0] = entry
+		self.root[1] = entry
+	
+	def put(self, key, value):
+		entry = self.key2entry.get(key)
+		if entry is not None:
+			entry[3] = value
+			self.move_to_front(entry)
+			return
+		if self.max_size<=0:
+			return
+		if len(self.key2entry)>=self.max_size:
+			self.pop_oldest()
+		entry = [self.root, self.root[1], key, value]
+		self.root[1][0] = entry
+		self.root[1] = entry
+		self.key2entry[key] = entry
+	
+	def pop_oldest(self):
+		"""
+		2026-10-18
+			remove the least recently used entry, return its (key, value)
+		"""
+		oldest = self.root[0]
+		oldest[0][1] = self.root
+		self.root[0] = oldest[0]
+		del self.key2entry[oldest[2]]
+		return oldest[2], oldest[3]
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+"""
+Usage: packed_genome.py [OPTION] OUTPUTFILE
+
+Option:
+	-z ..., --hostname=...	the hostname, zhoudb(default)
+	-d ..., --dbname=...	the database name, graphdb(default)
+	-t ..., --table=...	the raw_sequence table, sequence.raw_sequence(default)
+	-r, --report	report the progress
+	-h, --help	show this help
+
+Examples:
+	packed_genome.py -r ~/genome/raw_sequence.packed_genome
+
+Description:
+	2026-10-18
+	Dump the raw_sequence table(chunks of each acc_ver, in the order of id) into a
+	2-bit packed file, which is mmap-ed by class packed_genome.
+	codense.common.get_sequence_segment() takes it to avoid the database. Open it once and pass it on:
+		genome = packed_genome(fname)
+		get_sequence_segment(curs, gi, start, stop, packed_genome=genome)
+
+	File layout(all little-endian):
+		header: magic, index_offset(uint64)
+		for each sequence(8-byte aligned):
+			bases, 4 per byte, the first one in the highest 2 bits, A=0, C=1, G=2, T=3
+			exception runs(letters other than ACGT after upper()): start int32, length int32, letter
+			lowercase runs: start int32, length int32
+		index: no_of_sequences(uint32), then for each sequence
+			name_length(uint16), name, packed_offset(uint64), length(uint32),
+			runs_offset(uint64), no_of_exception_runs(uint32), no_of_lowercase_runs(uint32)
+"""
+
+import sys, getopt, mmap, struct, re, string, binascii, bisect
+from array import array
+from edge_store import array_to_file, array_from_string, pad_to_8
+
+magic = 'PKGENOM1'
+header_format = '<8sQ'
+header_size = struct.calcsize(header_format)
+index_entry_format = '<QIQII'
+index_entry_size = struct.calcsize(index_entry_format)
+base2digit_table = string.maketrans('ACGT', '0123')
+non_digit_letters = ''.join([chr(i) for i in range(256) if chr(i) not in '0123'])
+digit_fill_table = string.maketrans(non_digit_letters, '0'*len(non_digit_letters))	#other letters become A
+exception_pattern = re.compile(r'([^ACGT])\1*')
+lowercase_pattern = re.compile(r'[a-z]+')
+byte2bases = {}
+for i in range(256):
+	byte2bases[chr(i)] = ''.join(['ACGT'[(i>>shift)&3] for shift in (6, 4, 2, 0)])
+
+def pack_bases(digits):
+	"""
+	2026-10-18
+		digits('0'-'3', length is a multiple of 4) into bytes
+	"""
+	if not digits:
+		return ''
+	hex_string = '%x'%long(digits, 4)
+	return binascii.unhexlify(hex_string.rjust(len(digits)/2, '0'))
+
+class packed_genome_writer:
+	"""
+	2026-10-18
+		begin_sequence(name), add(chunk) as many times as needed, end_sequence(), ..., close()
+	"""
+	def __init__(self, output_fname):
+		self.outf = open(output_fname, 'wb')
+		self.outf.write(struct.pack(header_format, magic, 0))
+		self.offset = header_size
+		self.index_entry_ls = []
+		self.name = None
+
+	def write(self, data):
+		self.outf.write(data)
+		self.offset += len(data)
+
+	def write_padding(self):
+		self.write('\0'*(pad_to_8(self.offset)-self.offset))
+
+	def begin_sequence(self, name):
+		if self.name is not None:
+			self.end_sequence()
+		self.write_padding()
+		self.name = name
+		self.packed_offset = self.offset
+		self.length = 0
+		self.pending_digits = ''
+		self.exception_start_ls = array('i')
+		self.exception_length_ls = array('i')
+		self.exception_letter_ls = []
+		self.lowercase_start_ls = array('i')
+		self.lowercase_length_ls = array('i')
+
+	def add_run(self, start_ls, length_ls, start, length):
+		"""
+		2026-10-18
+			return 1 if merged into the last run
+		"""
+		if start_ls and start_ls[-1]+length_ls[-1]==start:
+			length_ls[-1] += length
+			return 1
+		start_ls.append(start)
+		length_ls.append(length)
+		return 0
+
+	def add(self, chunk):
+		upper_chunk = chunk.upper()
+		for match in exception_pattern.finditer(upper_chunk):
+			start = self.length+match.start()
+			letter = match.group(1)
+			if self.exception_letter_ls and self.exception_letter_ls[-1]==letter and \
+				self.exception_start_ls[-1]+self.exception_length_ls[-1]==start:
+				self.exception_length_ls[-1] += match.end()-match.start()
+			else:
+				self.exception_start_ls.append(start)
+				self.exception_length_ls.append(match.end()-match.start())
+				self.exception_letter_ls.append(letter)
+		if upper_chunk!=chunk:
+			for match in lowercase_pattern.finditer(chunk):
+				self.add_run(self.lowercase_start_ls, self.lowercase_length_ls, self.length+match.start(), \
+					match.end()-match.start())
+		digits = self.pending_digits + upper_chunk.translate(base2digit_table).translate(digit_fill_table)
+		no_of_full_digits = len(digits)/4*4
+		self.write(pack_bases(digits[:no_of_full_digits]))
+		self.pending_digits = digits[no_of_full_digits:]
+		self.length += len(chunk)
+
+	def end_sequence(self):
+		if self.pending_digits:
+			self.write(pack_bases(self.pending_digits.ljust(4, '0')))
+		self.write_padding()
+		runs_offset = self.offset
+		for ary in (self.exception_start_ls, self.exception_length_ls):
+			array_to_file(ary, self.outf)
+			self.offset += ary.itemsize*len(ary)
+		self.write(''.join(self.exception_letter_ls))
+		self.write_padding()
+		for ary in (self.lowercase_start_ls, self.lowercase_length_ls):
+			array_to_file(ary, self.outf)
+			self.offset += ary.itemsize*len(ary)
+		self.index_entry_ls.append((self.name, self.packed_offset, self.length, runs_offset, \
+			len(self.exception_start_ls), len(self.lowercase_start_ls)))
+		self.name = None
+
+	def close(self):
+		if self.name is not None:
+			self.end_sequence()
+		index_offset = self.offset
+		self.write(struct.pack('<I', len(self.index_entry_ls)))
+		for entry in self.index_entry_ls:
+			name = entry[0]
+			self.write(struct.pack('<H', len(name)) + name + struct.pack(index_entry_format, *entry[1:]))
+		self.outf.seek(0)
+		self.outf.write(struct.pack(header_format, magic, index_offset))
+		self.outf.close()
+
+class packed_genome:
+	"""
+	2026-10-18
+		read-only, mmap-ed packed genome
+	"""
+	def __init__(self, fname):
+		self.fname = fname
+		self.file_handle = open(fname, 'rb')
+		self.mm = mmap.mmap(self.file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		file_magic, index_offset = struct.unpack(header_format, self.mm[:header_size])
+		if file_magic!=magic:
+			raise ValueError("%s is not a packed_genome file"%fname)
+		self.name2entry = {}
+		no_of_sequences = struct.unpack('<I', self.mm[index_offset:index_offset+4])[0]
+		offset = index_offset+4
+		for i in range(no_of_sequences):
+			name_length = struct.unpack('<H', self.mm[offset:offset+2])[0]
+			name = self.mm[offset+2:offset+2+name_length]
+			offset += 2+name_length
+			self.name2entry[name] = struct.unpack(index_entry_format, self.mm[offset:offset+index_entry_size])
+			offset += index_entry_size
+		self.name2runs = {}
+
+	def close(self):
+		self.mm.close()
+		self.file_handle.close()
+
+	def __contains__(self, name):
+		return name in self.name2entry
+
+	def get_length(self, name):
+		return self.name2entry[name][1]
+
+	def get_runs(self, name):
+		"""
+		2026-10-18
+			(exception_start_ls, exception_length_ls, exception_letters, lowercase_start_ls, lowercase_length_ls)
+		"""
+		if name not in self.name2runs:
+			packed_offset, length, runs_offset, no_of_exception_runs, no_of_lowercase_runs = self.name2entry[name]
+			offset = runs_offset
+			exception_start_ls = array_from_string('i', self.mm[offset:offset+4*no_of_exception_runs])
+			offset += 4*no_of_exception_runs
+			exception_length_ls = array_from_string('i', self.mm[offset:offset+4*no_of_exception_runs])
+			offset += 4*no_of_exception_runs
+			exception_letters = self.mm[offset:offset+no_of_exception_runs]
+			offset = pad_to_8(offset+no_of_exception_runs)
+			lowercase_start_ls = array_from_string('i', self.mm[offset:offset+4*no_of_lowercase_runs])
+			offset += 4*no_of_lowercase_runs
+			lowercase_length_ls = array_from_string('i', self.mm[offset:offset+4*no_of_lowercase_runs])
+			self.name2runs[name] = (exception_start_ls, exception_length_ls, exception_letters, \
+				lowercase_start_ls, lowercase_length_ls)
+		return self.name2runs[name]
+
+	def get_segment(self, name, start, stop):
+		"""
+		2026-10-18
+			1-based, both ends included, clipped to the sequence. None if name is not here.
+		"""
+		if name not in self.name2entry:
+			return None
+		packed_offset, length = self.name2entry[name][:2]
+		start = max(start, 1)-1	#0-based from here
+		stop = min(stop, length)
+		if start>=stop:
+			return ''
+		data = self.mm[packed_offset+start/4:packed_offset+(stop+3)/4]
+		segment = ''.join(map(byte2bases.__getitem__, data))
+		segment = segment[start%4:start%4+stop-start]
+		exception_start_ls, exception_length_ls, exception_letters, lowercase_start_ls, lowercase_length_ls = \
+			self.get_runs(name)
+		i = max(bisect.bisect_right(exception_start_ls, start)-1, 0)
+		while i<len(exception_start_ls) and exception_start_ls[i]<stop:
+			run_start = max(exception_start_ls[i], start)
+			run_stop = min(exception_start_ls[i]+exception_length_ls[i], stop)
+			if run_start<run_stop:
+				segment = segment[:run_start-start] + exception_letters[i]*(run_stop-run_start) + segment[run_stop-start:]
+			i += 1
+		i = max(bisect.bisect_right(lowercase_start_ls, start)-1, 0)
+		while i<len(lowercase_start_ls) and lowercase_start_ls[i]<stop:
+			run_start = max(lowercase_start_ls[i], start)
+			run_stop = min(lowercase_start_ls[i]+lowercase_length_ls[i], stop)
+			if run_start<run_stop:
+				segment = segment[:run_start-start] + segment[run_start-start:run_stop-start].lower() + \
+					segment[run_stop-start:]
+			i += 1
+		return segment
+
+def construct_packed_genome_from_db(curs, output_fname, raw_sequence_table='sequence.raw_sequence', report=0):
+	"""
+	2026-10-18
+		one pass over raw_sequence_table, ordered by acc_ver and id
+	"""
+	sys.stderr.write("Constructing packed_genome from %s...\n"%raw_sequence_table)
+	writer = packed_genome_writer(output_fname)
+	curs.execute("DECLARE crs CURSOR FOR select acc_ver, sequence from %s order by acc_ver, id"%raw_sequence_table)
+	curs.execute("fetch 1000 from crs")
+	rows = curs.fetchall()
+	acc_ver = None
+	counter = 0
+	while rows:
+		for row in rows:
+			if row[0]!=acc_ver:
+				acc_ver = row[0]
+				writer.begin_sequence(acc_ver)
+				counter += 1
+			writer.add(row[1])
+		if report:
+			sys.stderr.write('%s%s'%('\x08'*20, counter))
+		curs.execute("fetch 1000 from crs")
+		rows = curs.fetchall()
+	curs.execute("close crs")
+	writer.close()
+	sys.stderr.write("Done with %s sequences.\n"%counter)
+
+if __name__ == '__main__':
+	if len(sys.argv) == 1:
+		print __doc__
+		sys.exit(2)
+
+	try:
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:t:r", ["help", "hostname=", "dbname=", \
+			"table=", "report"])
+	except:
+		print __doc__
+		sys.exit(2)
+
+	hostname = 'zhoudb'
+	dbname = 'graphdb'
+	table = 'sequence.raw_sequence'
+	report = 0
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			print __doc__
+			sys.exit(2)
+		elif opt in ("-z", "--hostname"):
+			hostname = arg
+		elif opt in ("-d", "--dbname"):
+			dbname = arg
+		elif opt in ("-t", "--table"):
+			table = arg
+		elif opt in ("-r", "--report"):
+			report = 1
+	if len(args)==1:
+		from common import db_connect
+		conn, curs = db_connect(hostname, dbname, 'sequence')
+		construct_packed_genome_from_db(curs, args[0], table, report)
+	else:
+		print __doc__
+		sys.exit(2)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+"""
+Usage: pattern_record.py [OPTION] INPUTFILE OUTPUTFILE
+
+Option:
+	INPUTFILE is a pattern file, tab-delimited text(MpiBFSCluster.py's output or
+		MpiFromDatasetSignatureToPattern.py's) or binary(detected).
+	OUTPUTFILE is the converted file.
+	-t, --text	convert to text, default is to binary
+	-r, --report	report the progress
+	-h, --help	show this help
+
+Examples:
+	pattern_record.py hs_fim_40m4x40.bfs hs_fim_40m4x40.bfs.pattern
+	pattern_record.py -t hs_fim_40m4x40.bfs.pattern /tmp/hs_fim_40m4x40.bfs
+
+Description:
+	2026-10-18
+	Binary pattern file passed among MpiBFSCluster.py, MpiStatCluster.py,
+	SelectClusterPrediction.py and PermuteClusterGeneID.py instead of rows of
+	repr() strings. A pattern is (vertex_set, edge_set, recurrence_array, d_matrix).
+
+	File layout(all little-endian):
+		header: magic
+		records: payload length(uint32), then the payload
+			no_of_vertices, no_of_edges, no_of_recurrences, no_of_d_matrix_bytes(uint32 each)
+			vertex_set	int32 x no_of_vertices
+			edge_set	int32 x 2*no_of_edges
+			recurrence_array	float64 x no_of_recurrences
+			d_matrix	uint8, row-major no_of_vertices X no_of_vertices(255=unreachable), or nothing
+	The offset index(OUTPUTFILE.index) holds the file offset of each record(uint64), so
+	pattern_reader[i] is one seek.
+"""
+
+import sys, os, getopt, csv, struct, re, binascii
+from array import array
+from edge_store import array_from_string
+
+magic = 'PATTERN1'
+record_header_format = '<IIII'
+record_header_size = struct.calcsize(record_header_format)
+index_suffix = '.index'
+integer_pattern = re.compile(r'-?\d+')
+
+def array_to_string(ary):
+	"""
+	2026-10-18
+		the little-endian bytes of an array, reverse of edge_store.array_from_string()
+	"""
+	if sys.byteorder=='big':
+		ary = array(ary.typecode, ary)
+		ary.byteswap()
+	return ary.tostring()
+
+def is_pattern_file(fname):
+	"""
+	2026-10-18
+		1 if fname starts with the binary pattern magic
+	"""
+	inf = open(fname, 'rb')
+	head = inf.read(len(magic))
+	inf.close()
+	return head == magic
+
+def d_matrix2bytes(d_matrix, no_of_vertices):
+	"""
+	2026-10-18
+		d_matrix in any of the forms going around:
+			None or '' (no d_matrix)
+			a list of rows
+			raw unsigned chars(johnson_sp.py_shortest_distance_string())
+			hex string(MpiBFSCluster.py's default), python list repr or postgres array(string2d_matrix())
+	"""
+	if not d_matrix:
+		return ''
+	if type(d_matrix) == str:
+		if d_matrix[:2]=='[[' or d_matrix[:2]=='{{':
+			from common import string2d_matrix
+			d_matrix = string2d_matrix(d_matrix)
+		elif len(d_matrix) == no_of_vertices*no_of_vertices:
+			return d_matrix
+		else:
+			return binascii.unhexlify(d_matrix)
+	d_array = array('B')
+	for d_row in d_matrix:
+		for distance in d_row:
+			if distance<0 or distance>255:	#unreachable
+				distance = 255
+			d_array.append(distance)
+	return d_array.tostring()
+
+def d_matrix_bytes2rows(d_matrix_bytes, no_of_vertices):
+	"""
+	2026-10-18
+		list of rows, what string2d_matrix() returns
+	"""
+	d_array = array('B', d_matrix_bytes)
+	return [d_array[i*no_of_vertices:(i+1)*no_of_vertices].tolist() for i in range(no_of_vertices)]
+
+def encode_pattern(vertex_set, edge_set, recurrence_array=[], d_matrix=None):
+	"""
+	2026-10-18
+		the payload of one record
+	"""
+	no_of_vertices = len(vertex_set)
+	edge_array = array('i')
+	for edge in edge_set:
+		edge_array.extend(edge[:2])
+	d_matrix_bytes = d_matrix2bytes(d_matrix, no_of_vertices)
+	return struct.pack(record_header_format, no_of_vertices, len(edge_set), len(recurrence_array), len(d_matrix_bytes)) + \
+		array_to_string(array('i', vertex_set)) + array_to_string(edge_array) + \
+		array_to_string(array('d', recurrence_array)) + d_matrix_bytes
+
+def decode_pattern(payload):
+	"""
+	2026-10-18
+		return [vertex_set, edge_set, recurrence_array, d_matrix_bytes]
+		edge_set is a list of [gene_no1, gene_no2], d_matrix_bytes is '' if there's no d_matrix.
+	"""
+	no_of_vertices, no_of_edges, no_of_recurrences, no_of_d_matrix_bytes = \
+		struct.unpack(record_header_format, payload[:record_header_size])
+	offset = record_header_size
+	vertex_set = array_from_string('i', payload[offset:offset+4*no_of_vertices]).tolist()
+	offset += 4*no_of_vertices
+	edge_array = array_from_string('i', payload[offset:offset+8*no_of_edges])
+	edge_set = [edge_array[2*i:2*i+2].tolist() for i in range(no_of_edges)]
+	offset += 8*no_of_edges
+	recurrence_array = array_from_string('d', payload[offset:offset+8*no_of_recurrences]).tolist()
+	offset += 8*no_of_recurrences
+	d_matrix_bytes = payload[offset:offset+no_of_d_matrix_bytes]
+	return [vertex_set, edge_set, recurrence_array, d_matrix_bytes]
+
+def parse_pattern_row(row):
+	"""
+	2026-10-18
+		a row of the text pattern file into [vertex_set, edge_set, recurrence_array, d_matrix_bytes].
+		edges can be '[[1, 2], [2, 3]]' or '[(1, 2), (2, 3)]'. Missing columns are empty.
+	"""
+	vertex_set = map(int, integer_pattern.findall(row[0]))
+	edge_no_ls = map(int, integer_pattern.findall(row[1]))
+	edge_set = [edge_no_ls[i:i+2] for i in range(0, len(edge_no_ls), 2)]
+	recurrence_array = []
+	if len(row)>2 and row[2][1:-1].strip():
+		recurrence_array = map(float, row[2][1:-1].split(','))
+	d_matrix_bytes = ''
+	if len(row)>3:
+		d_matrix_bytes = d_matrix2bytes(row[3], len(vertex_set))
+	return [vertex_set, edge_set, recurrence_array, d_matrix_bytes]
+
+class pattern_writer:
+	"""
+	2026-10-18
+		write patterns to a binary pattern file, the offset index is written by close()
+	"""
+	def __init__(self, output_fname):
+		self.output_fname = output_fname
+		self.outf = open(output_fname, 'wb')
+		self.outf.write(magic)
+		self.offset = len(magic)
+		self.offset_list = []
+
+	def write_payload(self, payload):
+		self.offset_list.append(self.offset)
+		self.outf.write(struct.pack('<I', len(payload)))
+		self.outf.write(payload)
+		self.offset += 4+len(payload)
+
+	def write(self, vertex_set, edge_set, recurrence_array=[], d_matrix=None):
+		self.write_payload(encode_pattern(vertex_set, edge_set, recurrence_array, d_matrix))
+
+	def writerow(self, row):
+		"""
+		2026-10-18
+			same call as csv.writer's, row is [vertex_set, edge_set, recurrence_array, d_matrix]
+		"""
+		self.write(*row)
+
+	def close(self):
+		self.outf.close()
+		write_offset_index(self.output_fname+index_suffix, self.offset_list)
+
+def write_offset_index(index_fname, offset_list, block_size=100000):
+	index_f = open(index_fname, 'wb')
+	for i in range(0, len(offset_list), block_size):
+		block = offset_list[i:i+block_size]
+		index_f.write(struct.pack('<%sQ'%len(block), *block))
+	index_f.close()
+
+class pattern_reader:
+	"""
+	2026-10-18
+		iterate over a binary pattern file, or pick a record by its number(starting from 0)
+		through the offset index. A missing index is rebuilt by hopping over the records.
+	"""
+	def __init__(self, input_fname):
+		self.input_fname = input_fname
+		self.inf = open(input_fname, 'rb')
+		if self.inf.read(len(magic)) != magic:
+			raise ValueError("%s is not a binary pattern file."%input_fname)
+		self.offset_list = None
+
+	def iter_payloads(self):
+		self.inf.seek(len(magic))
+		while 1:
+			length_string = self.inf.read(4)
+			if len(length_string)<4:
+				break
+			yield self.inf.read(struct.unpack('<I', length_string)[0])
+
+	def __iter__(self):
+		for payload in self.iter_payloads():
+			yield decode_pattern(payload)
+
+	def load_offset_index(self):
+		index_fname = self.input_fname+index_suffix
+		if os.path.isfile(index_fname) and os.path.getmtime(index_fname)>=os.path.getmtime(self.input_fname):
+			data = open(index_fname, 'rb').read()
+			self.offset_list = list(struct.unpack('<%sQ'%(len(data)/8), data))
+		else:
+			self.offset_list = []
+			offset = len(magic)
+			file_size = os.path.getsize(self.input_fname)
+			while offset+4<=file_size:
+				self.offset_list.append(offset)
+				self.inf.seek(offset)
+				offset += 4+struct.unpack('<I', self.inf.read(4))[0]
+
+	def __len__(self):
+		if self.offset_list is None:
+			self.load_offset_index()
+		return len(self.offset_list)
+
+	def get_payload(self, index):
+		if self.offset_list is None:
+			self.load_offset_index()
+		self.inf.seek(self.offset_list[index])
+		return self.inf.read(struct.unpack('<I', self.inf.read(4))[0])
+
+	def __getitem__(self, index):
+		return decode_pattern(self.get_payload(index))
+
+	def close(self):
+		self.inf.close()
+
+def text_pattern_reader(input_fname):
+	"""
+	2026-10-18
+		parse_pattern_row() over a tab-delimited pattern file
+	"""
+	reader = csv.reader(open(input_fname, 'r'), delimiter='\t')
+	for row in reader:
+		yield parse_pattern_row(row)
+
+def open_pattern_reader(input_fname):
+	"""
+	2026-10-18
+		pattern_reader for a binary file, text_pattern_reader() for a text one
+	"""
+	if is_pattern_file(input_fname):
+		return pattern_reader(input_fname)
+	else:
+		return text_pattern_reader(input_fname)
+
+def convert(input_fname, output_fname, to_text=0, report=0):
+	"""
+	2026-10-18
+		text -> binary, or binary -> text(MpiBFSCluster.py's d_matrix_type 1, hex d_matrix)
+	"""
+	if to_text:
+		writer = csv.writer(open(output_fname, 'w'), delimiter='\t')
+	else:
+		writer = pattern_writer(output_fname)
+	counter = 0
+	for vertex_set, edge_set, recurrence_array, d_matrix_bytes in open_pattern_reader(input_fname):
+		if to_text:
+			row = [vertex_set, edge_set]
+			if recurrence_array or d_matrix_bytes:
+				row.append(recurrence_array)
+			if d_matrix_bytes:
+				row.append(binascii.hexlify(d_matrix_bytes))
+			writer.writerow(row)
+		else:
+			writer.write(vertex_set, edge_set, recurrence_array, d_matrix_bytes)
+		counter += 1
+		if report and counter%10000==0:
+			sys.stderr.write("%s%s"%('\x08'*20, counter))
+	if not to_text:
+		writer.close()
+	if report:
+		sys.stderr.write("%s%s patterns converted.\n"%('\x08'*20, counter))
+
+if __name__ == '__main__':
+	if len(sys.argv) == 1:
+		print __doc__
+		sys.exit(2)
+
+	try:
+		opts, args = getopt.getopt(sys.argv[1:], "htr", ["help", "text", "report"])
+	except:
+		print __doc__
+		sys.exit(2)
+
+	to_text = 0
+	report = 0
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			print __doc__
+			sys.exit(2)
+		elif opt in ("-t", "--text"):
+			to_text = 1
+		elif opt in ("-r", "--report"):
+			report = 1
+	if len(args)==2:
+		convert(args[0], args[1], to_text, report)
+	else:
+		print __doc__
+		sys.exit(2)
@@ -30,6 +30,7 @@ Description:
 
 import sys,os,cStringIO,psycopg,getopt
 from sets import Set
+from codense.common import table_bulk_writer
 
 class compute_connectivity:
 	'''
@@ -61,6 +62,13 @@ class compute_connectivity:
 		self.vertex_pool = Set()
 		#store the vertices of all the splat patterns
 		self.log_file = open('/tmp/connectivity.log', 'w')
+		#2026-10-18 connectivity updates are buffered and done in bulk
+		if self.target_table:
+			self.connectivity_writer = table_bulk_writer(self.curs, self.target_table, ['mcl_id', 'connectivity'], \
+				update_key='mcl_id')
+		else:
+			self.connectivity_writer = table_bulk_writer(self.curs, self.source_table, ['splat_id', 'connectivity'], \
+				update_key='splat_id')
 					
 	def run(self):
 		self.curs.execute("begin")
@@ -81,6 +89,11 @@ class compute_connectivity:
 				sys.stderr.write("%s%s"%("\x08"*20,self.no_of_records))
 			self.curs.execute("fetch 5000 from crs")
 			rows = self.curs.fetchall()
+		try:
+			self.connectivity_writer.close()
+		except:
+			sys.stderr.write('Error occurred while setting connectivity\n')
+			sys.exit(1)
 
 		sys.stderr.write("\tNumber of distinct genes in all splat patterns: %d\n"%len(self.vertex_pool) )
 		self.log_file.write(repr(self.vertex_pool))
@@ -99,6 +112,8 @@ class compute_connectivity:
 		02-25-05
 			check the order of the vertices in the edge tuple
 			map the vertex_list to int
+		2026-10-18
+			connectivity goes to self.connectivity_writer
 		'''
 		self.dstruc_from_edge_set(edge_set)
 		self.curs.execute("select mcl_id, vertex_set from %s where splat_id=%d"%\
@@ -121,8 +136,7 @@ class compute_connectivity:
 						no_of_edges += 1
 			connectivity = 2.0*no_of_edges/((no_of_vertices-1)*no_of_vertices)
 			try:
-				self.curs.execute("update %s set connectivity=%f where mcl_id=%d"% \
-				(self.target_table, connectivity, mcl_id))
+				self.connectivity_writer.add_row([mcl_id, connectivity])
 			except:
 				sys.stderr.write('Error occurred while setting mcl connectivity\n')
 				sys.exit(1)
@@ -134,8 +148,7 @@ class compute_connectivity:
 		no_of_vertices = len(self.vertex_dict)
 		connectivity = 2.0*no_of_edges/((no_of_vertices-1)*no_of_vertices)
 		try:
-			self.curs.execute("update %s set connectivity=%f where splat_id=%d"% \
-			(self.source_table, connectivity, splat_id))
+			self.connectivity_writer.add_row([splat_id, connectivity])
 		except:
 			sys.stderr.write('Error occurred while setting splat connectivity\n')
 			sys.exit(1)
@@ -11,6 +11,8 @@ Option:
 	-m ..., --mcl_table=...	mcl_table corresponding to above table
 	-g ..., --gene_table=...	table storing the stat results
 	-n ..., --node_dist_table=...	the node_distance table, node_dist(default) (IGNORE)
+	-i ..., --go_dag_index=...	go_dag_index file from go_dag_index.py, if given, the max distances
+		between the predicted functions of each gene are computed(and logged if -l)
 	-s ..., --contrast=...	the contrast differential ratio for two contexts to be different, 0.3(default)
 	-y ..., --type=...	1(all genes, default), 2(known genes), 3(unknown genes).
 	-r, --report	report the progress(a number) IGNORE
@@ -102,7 +104,11 @@ class context_specific:
 	"""
 	def __init__(self, hostname='zhoub', dbname='graphdb', schema=None, table=None, \
 		mcl_table=None, node_dist_table=None, contrast=0.3, type=1, \
-		report=0, needcommit=0, log=0, gene_table='p_gene', stat_table_fname=None):
+		report=0, needcommit=0, log=0, gene_table='p_gene', stat_table_fname=None, go_dag_index_fname=None):
+		"""
+		2026-10-18
+			add go_dag_index_fname
+		"""
 		self.hostname = hostname
 		self.dbname = dbname
 		self.schema = schema	
@@ -148,6 +154,9 @@ class context_specific:
 		self.go_no2distance = {}
 		#mapping go term id and go_no
 		self.go_term_id2go_no = {}
+		self.go_dag_index_fname = go_dag_index_fname
+		self.go_dag_index = None
+		self.go_no2term_id = {}
 		
 	def dstruc_loadin(self, curs):
 		"""
@@ -155,14 +164,20 @@ class context_specific:
 		03-09-05
 			get the context from mcl_table via linking through mcl_id of p_gene_table
 			context_dict is set
+		2026-10-18
+			the distances come from the go_dag_index(if given), go.node_dist is not loaded any more.
 		"""
 		from codense.common import get_known_genes_dict, get_go_no2go_id, \
-			get_go_no2name, get_gene_no2gene_id
+			get_go_no2name, get_gene_no2gene_id, get_go_no2term_id
 		
 		self.known_genes_dict = get_known_genes_dict(curs)
 		self.go_no2go_id = get_go_no2go_id(curs)
 		self.go_no2go_name = get_go_no2name(curs)
 		self.gene_no2gene_id = get_gene_no2gene_id(curs)
+		if self.go_dag_index_fname:
+			from go_dag_index import go_dag_index
+			self.go_dag_index = go_dag_index(self.go_dag_index_fname)
+			self.go_no2term_id = get_go_no2term_id(curs)
 		
 		sys.stderr.write("Setting up gene_prediction_dict...")
 		#setup self.gene_prediction_dict
@@ -216,6 +231,32 @@ class context_specific:
 		"""
 		
 
+	def get_max_distances(self, go_no_list):
+		"""
+		2026-10-18
+			the maximum raw, lee and jasmine distances among the go_no's(predicted functions of one gene),
+			via self.go_dag_index
+		"""
+		max_raw_distance = 0
+		max_lee_distance = 0
+		max_jasmine_distance = 0
+		for i in range(len(go_no_list)):
+			for j in range(i+1, len(go_no_list)):
+				go_no1 = go_no_list[i]
+				go_no2 = go_no_list[j]
+				key = (min(go_no1, go_no2), max(go_no1, go_no2))
+				if key not in self.go_no2distance:
+					self.go_no2distance[key] = self.go_dag_index.get_distance(self.go_no2term_id[go_no1], \
+						self.go_no2term_id[go_no2])[:3]
+				raw_distance, lee_distance, jasmine_distance = self.go_no2distance[key]
+				if raw_distance > max_raw_distance:
+					max_raw_distance = raw_distance
+				if lee_distance > max_lee_distance:
+					max_lee_distance = lee_distance
+				if jasmine_distance > max_jasmine_distance:
+					max_jasmine_distance = jasmine_distance
+		return max_raw_distance, max_lee_distance, max_jasmine_distance
+
 	def cluster_context2dict(self, cluster_context):
 		"""
 		convert a cluster_context string fetched from database to a context_dict
@@ -293,6 +334,16 @@ class context_specific:
 				self.log_file.write('%d\t%s\t%d\t%d\t%d\n'%(gene_no, repr(go_no_list), max_raw_distance,\
 					max_lee_distance, max_jasmine_distance))
 			"""
+			if self.go_dag_index:
+				#2026-10-18 distances back, via go_dag_index
+				go_no_list = unit.p_functions_struc_dict.keys()
+				max_raw_distance, max_lee_distance, max_jasmine_distance = self.get_max_distances(go_no_list)
+				self.max_raw_distance_list.append(max_raw_distance)
+				self.max_lee_distance_list.append(max_lee_distance)
+				self.max_jasmine_distance_list.append(max_jasmine_distance)
+				if self.log:
+					self.log_file.write('%d\t%s\t%d\t%d\t%d\n'%(gene_no, repr(go_no_list), max_raw_distance,\
+						max_lee_distance, max_jasmine_distance))
 			#compute the distinct contexts
 			function_struc_dict = self.distinct_contexts(unit.p_functions_struc_dict)
 			self.gene_no2no_of_predictions[gene_no].append(len(function_struc_dict))
@@ -452,9 +503,9 @@ if __name__ == '__main__':
 		sys.exit(2)
 	
 	long_options_list = ["help", "hostname=", "dbname=", "schema=", "table=", "mcl_table=", \
-		"contrast=", "type=", "node_dist_table=", "report", "commit", "log", "gene_table="]
+		"contrast=", "type=", "node_dist_table=", "report", "commit", "log", "gene_table=", "go_dag_index="]
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:n:s:y:rclg:", long_options_list)
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:n:s:y:rclg:i:", long_options_list)
 	except:
 		print __doc__
 		sys.exit(2)
@@ -471,6 +522,7 @@ if __name__ == '__main__':
 	commit = 0
 	log = 0
 	gene_table = None
+	go_dag_index_fname = None
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -499,6 +551,8 @@ if __name__ == '__main__':
 			log = 1
 		elif opt in ("-g", "--gene_table"):
 			gene_table = arg
+		elif opt in ("-i", "--go_dag_index"):
+			go_dag_index_fname = arg
 	if len(args) == 1:
 		stat_table_fname = args[0]
 	else:
@@ -507,7 +561,7 @@ if __name__ == '__main__':
 	if schema and gene_table and table and mcl_table and stat_table_fname:
 		instance = context_specific(hostname, dbname, schema, table, mcl_table, \
 			node_dist_table, contrast, type, report, \
-			commit, log, gene_table, stat_table_fname)
+			commit, log, gene_table, stat_table_fname, go_dag_index_fname)
 		instance.run()
 	else:
 		print __doc__
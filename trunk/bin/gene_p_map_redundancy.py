@@ -12,6 +12,7 @@ Option:
 	-p ...,	pattern_table, (-y=2 only)
 	-s ...,	similarity_cut_off, 0.8(default) (-y=2 only)
 	-x ...,	maximum_distance, 2(default) (-y=2 only)
+	-i ..., --go_dag_index=...	go_dag_index file from go_dag_index.py, replaces go.node_dist (-y=1 only)
 	-c, --commit	commit this database transaction
 	-r, --report	report flag
 	-u, --debug debug flag
@@ -53,7 +54,7 @@ class gene_p_map_redundancy:
 	"""
 	def __init__(self, hostname=None, dbname=None, schema=None, p_gene_table=None, \
 		gene_p_table=None, type=1, pattern_table=None, similarity_cut_off=0.8, maximum_distance=2, \
-		needcommit=0, report=0, debug=0):
+		needcommit=0, report=0, debug=0, go_dag_index_fname=None):
 		"""
 		12-02-05
 			add similarity_cut_off and maximum_distance
@@ -61,6 +62,8 @@ class gene_p_map_redundancy:
 			add pattern_table
 		12-05-05
 			add type
+		2026-10-18
+			add go_dag_index_fname, get_distance() uses the go_dag_index instead of distance_table if given
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -81,6 +84,11 @@ class gene_p_map_redundancy:
 		self.go_no2distance = {}
 		
 		self.distance_table = 'go.node_dist'	#for get_distance()
+		if go_dag_index_fname:
+			from go_dag_index import go_dag_index
+			self.go_dag_index = go_dag_index(go_dag_index_fname)
+		else:
+			self.go_dag_index = None
 		self.term_table = 'go.term'	#for get_go_no2term_id()
 	
 	def data_fetch(self, curs, p_gene_table, gene_p_table):
@@ -250,6 +258,8 @@ class gene_p_map_redundancy:
 		
 		03-14-05
 			add common_ancestor_set to the value list of go_no2distance
+		2026-10-18
+			ask self.go_dag_index if it's there, no database query
 		"""
 		if go_no1==go_no2:
 			#this is possible because several p_gene_ids point to the same go_no.
@@ -267,6 +277,14 @@ class gene_p_map_redundancy:
 			sys.stderr.write("go_no: %s or %s don't have term_id\n"%(go_no1, go_no2))
 			sys.exit(13)
 		
+		if self.go_dag_index:
+			raw_distance, lee_distance, jasmine_distance, common_ancestor_set = self.go_dag_index.get_distance(go_id1, go_id2)
+			if go_no1<go_no2:
+				go_no2distance[(go_no1, go_no2)] = (raw_distance, lee_distance, jasmine_distance, common_ancestor_set)
+			else:
+				go_no2distance[(go_no2, go_no1)] = (raw_distance, lee_distance, jasmine_distance, common_ancestor_set)
+			return jasmine_distance
+		
 		curs.execute("select raw_distance, lee_distance, jasmine_distance, \
 			common_ancestor_list from %s where go_id1=%d and go_id2=%d"%\
 			(distance_table, go_id1, go_id2))
@@ -346,9 +364,9 @@ if __name__ == '__main__':
 		print __doc__
 		sys.exit(2)	
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:n:y:p:s:x:cru", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:n:y:p:s:x:i:cru", ["help", "hostname=", \
 			"dbname=", "schema=", "p_gene_table=", "gene_p_table=",\
-			"commit", "report", "debug"])
+			"go_dag_index=", "commit", "report", "debug"])
 	except:
 		print __doc__
 		sys.exit(2)
@@ -362,6 +380,7 @@ if __name__ == '__main__':
 	pattern_table = None
 	similarity_cut_off = 0.8
 	maximum_distance = 2
+	go_dag_index_fname = None
 	commit = 0
 	report = 0
 	debug = 0
@@ -387,6 +406,8 @@ if __name__ == '__main__':
 			similarity_cut_off = float(arg)
 		elif opt in ("-x",):
 			maximum_distance = int(arg)
+		elif opt in ("-i", "--go_dag_index"):
+			go_dag_index_fname = arg
 		elif opt in ("-c", "--commit"):
 			commit = 1
 		elif opt in ("-r", "--report"):
@@ -395,7 +416,7 @@ if __name__ == '__main__':
 			debug = 1
 	if schema and p_gene_table and gene_p_table:
 		instance = gene_p_map_redundancy(hostname, dbname, schema, p_gene_table, gene_p_table,\
-			type, pattern_table, similarity_cut_off, maximum_distance, commit, report, debug)
+			type, pattern_table, similarity_cut_off, maximum_distance, commit, report, debug, go_dag_index_fname)
 		instance.run()
 	else:
 		print __doc__
@@ -15,6 +15,7 @@ Option:
 	-y ..., --connectivity_gap_size=...	2(default, IGNORE)
 	-q ..., --subgraph_cut_off=...	the cut_off for the subgraph to be valid in one dataset, 0(default)
 		NOTICE: 0 means the binary conversion won't be used, just summing the floats
+	-i ..., --go_dag_index=...	go_dag_index file from go_dag_index.py, replaces go.node_dist
 	-n, --new_table	gene_table is new, need  to be created
 	-l, --leave_one_out	use the leave_one_out stat method, default is no leave_one_out
 	-w, --wu	Wu's strategy(Default is Jasmine's strategy)
@@ -48,7 +49,7 @@ else:   #32bit
 	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
 import sys, os, psycopg, getopt, csv, fileinput, math
 from sets import Set
-from codense.common import db_connect
+from codense.common import db_connect, table_bulk_writer
 from numarray import greater_equal
 if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
 	from python2_3 import *
@@ -66,8 +67,12 @@ class gene_stat:
 	def __init__(self, hostname='zhoudb', dbname='graphdb', schema=None, table=None, \
 		mcl_table=None, leave_one_out=0, wu=0, report=0,\
 		depth_cut_off =3, dir_files=None, needcommit=0, gene_table='p_gene',\
-		subgraph_cut_off=0, debug=0, new_table=0, recurrence_gap_size=2, connectivity_gap_size=2):
-		
+		subgraph_cut_off=0, debug=0, new_table=0, recurrence_gap_size=2, connectivity_gap_size=2, \
+		go_dag_index_fname=None):
+		"""
+		2026-10-18
+			add go_dag_index_fname, handed to gene_p_map_redundancy for the common ancestors
+		"""
 		self.hostname = hostname
 		self.dbname = dbname
 		self.schema = schema
@@ -94,6 +99,7 @@ class gene_stat:
 		#the gap between two recurrences
 		self.recurrence_gap_size = int(recurrence_gap_size)
 		self.connectivity_gap_size = int(connectivity_gap_size)
+		self.go_dag_index_fname = go_dag_index_fname
 		
 		#mapping between gene_no and go_no set
 		self.known_genes_dict = {}
@@ -139,7 +145,7 @@ class gene_stat:
 		"""	
 		sys.stderr.write("Starting gene-stat...\n")
 		from gene_p_map_redundancy import gene_p_map_redundancy
-		node_distance_class = gene_p_map_redundancy()
+		node_distance_class = gene_p_map_redundancy(go_dag_index_fname=self.go_dag_index_fname)
 		"""
 		05-19-05
 			#read from a single file
@@ -181,7 +187,7 @@ class gene_stat:
 		"""
 		sys.stderr.write("Starting gene-stat...\n")
 		from gene_p_map_redundancy import gene_p_map_redundancy
-		node_distance_class = gene_p_map_redundancy()
+		node_distance_class = gene_p_map_redundancy(go_dag_index_fname=self.go_dag_index_fname)
 		#the central function of the class
 		if self.leave_one_out:
 			#leave_one_out method gets data from both cluster_stat-like and mcl_result-like table
@@ -497,8 +503,13 @@ class gene_stat:
 			long float to scientific representation.
 		08-14-05
 			gene_table creation is split into another function, createGeneTable()
+		2026-10-18
+			rows go through a table_bulk_writer(COPY in blocks), lca_list is NULL if empty
 		"""		
 		sys.stderr.write("Database submitting...")
+		gene_table_writer = table_bulk_writer(curs, gene_table, ['gene_no', 'go_no', 'is_correct', 'is_correct_L1', \
+			'is_correct_lca', 'avg_p_value', 'no_of_clusters', 'cluster_array', 'p_value_cut_off', 'recurrence_cut_off', \
+			'connectivity_cut_off', 'cluster_size_cut_off', 'unknown_cut_off', 'depth_cut_off', 'mcl_id', 'lca_list'])
 		"""the value of self.prediction_tuple2list, [[p_value, cluster_id, gene_no, go_no, is_correct, \
 			is_correct_L1, is_correct_lca, cluster_size, unknown_gene_ratio], [...],  ... ] """
 		for (tuple, prediction_list)  in self.prediction_tuple2list.iteritems():
@@ -516,25 +527,11 @@ class gene_stat:
 				unknown_gene_ratio = unit[8]
 				lca_list = unit[9]
 				if len(lca_list)==0:
-					curs.execute("insert into %s(gene_no, go_no, is_correct, is_correct_L1, is_correct_lca, \
-						avg_p_value, no_of_clusters, cluster_array, p_value_cut_off, recurrence_cut_off,\
-						connectivity_cut_off, cluster_size_cut_off, unknown_cut_off, depth_cut_off, mcl_id)\
-						values(%d, %d, %d, %d, %d, %s, %s, ARRAY%s, %s, %s, %s, %s, %s, %s, %s)"%\
-						(gene_table, gene_no, go_no, is_correct, is_correct_L1, is_correct_lca, \
-						p_value, 1, repr([mcl_id]), p_value, recurrence, connectivity, \
-						cluster_size, unknown_gene_ratio, self.depth_cut_off, mcl_id))
-
-				else:
-					lca_list_string = '{'+repr(lca_list)[1:-1] + '}'
-					curs.execute("insert into %s(gene_no, go_no, is_correct, is_correct_L1, is_correct_lca, \
-						avg_p_value, no_of_clusters, cluster_array, p_value_cut_off, recurrence_cut_off,\
-						connectivity_cut_off, cluster_size_cut_off, unknown_cut_off, depth_cut_off, mcl_id, lca_list)\
-						values(%d, %d, %d, %d, %d, %s, %s, ARRAY%s, %s, %s, %s, %s, %s, %s, %s, '%s')"%\
-						(gene_table, gene_no, go_no, is_correct, is_correct_L1, is_correct_lca, \
-						p_value, 1, repr([mcl_id]), p_value, recurrence, connectivity, \
-						cluster_size, unknown_gene_ratio, self.depth_cut_off, mcl_id, lca_list_string))
-
-
+					lca_list = None
+				gene_table_writer.add_row([gene_no, go_no, is_correct, is_correct_L1, is_correct_lca, \
+					p_value, 1, [mcl_id], p_value, recurrence, connectivity, \
+					cluster_size, unknown_gene_ratio, self.depth_cut_off, mcl_id, lca_list])
+		gene_table_writer.close()
 		sys.stderr.write("done.\n")
 
 	def run(self):
@@ -586,9 +583,10 @@ if __name__ == '__main__':
 	
 	long_options_list = ["help", "hostname=", "dbname=", "schema=", "table=", "mcl_table=", \
 		"depth_cut_off=", "dir_files=", "leave_one_out", "wu", "report", "commit", "gene_table=", \
-		"subgraph_cut_off=", "debug", "new_table", "recurrence_gap_size=", "connectivity_gap_size="]
+		"subgraph_cut_off=", "debug", "new_table", "recurrence_gap_size=", "connectivity_gap_size=", \
+		"go_dag_index="]
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:e:f:x:y:lwrcg:q:bn", long_options_list)
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:e:f:x:y:lwrcg:q:bni:", long_options_list)
 	except:
 		print __doc__
 		sys.exit(2)
@@ -610,6 +608,7 @@ if __name__ == '__main__':
 	new_table = 0
 	recurrence_gap_size = 2
 	connectivity_gap_size = 2
+	go_dag_index_fname = None
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -648,11 +647,13 @@ if __name__ == '__main__':
 			recurrence_gap_size = int(arg)
 		elif opt in ("-y", "--connectivity_gap_size"):
 			connectivity_gap_size = int(arg)
+		elif opt in ("-i", "--go_dag_index"):
+			go_dag_index_fname = arg
 
 	if schema:
 		instance = gene_stat(hostname, dbname, schema, table, mcl_table, \
 			leave_one_out, wu, report, depth_cut_off, dir_files, commit, gene_table, \
-			subgraph_cut_off, debug, new_table, recurrence_gap_size, connectivity_gap_size)
+			subgraph_cut_off, debug, new_table, recurrence_gap_size, connectivity_gap_size, go_dag_index_fname)
 		instance.run()
 	else:
 		print __doc__
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+"""
+Usage: go_dag_index.py [OPTION] OUTPUT_FILE
+
+Option:
+	OUTPUT_FILE is where the serialized index goes.
+	-z ..., --hostname=...	the hostname, zhoudb(default)
+	-d ..., --dbname=...	the database name, graphdb(default)
+	-b ..., --branch=...	which GO branches, coma-separated, molecular_function,biological_process,cellular_component(default)
+	-r, --report	report the progress
+	-h, --help	show this help
+
+Examples:
+	go_dag_index.py -b biological_process go_dag_index.pickle
+
+Description:
+	2026-10-18
+	Builds an in-memory index of the GO DAG(go.term and go.term2term) and dumps it into
+	OUTPUT_FILE(cPickle). Load it back via go_dag_index(OUTPUT_FILE).
+	For any two term_ids, get_distance() returns the same raw/lee/jasmine distances and
+	common_ancestor_set as go_node_distance.py stores into go.node_dist, without going through
+	all the path-index(root-to-node path tuple) pairs.
+
+	How the path-index definitions translate(a, ancestor, always means ancestor-or-self):
+	The lca of two path-indices is the deepest node on both paths. A node c is such an lca
+	for some path pair iff c is a common ancestor and there're two paths from c to go_id1 and
+	go_id2 which share only c, i.e. no other node dominates both go_id1 and go_id2 in the
+	subgraph below c. That is checked by the lca of go_id1 and go_id2 in c's dominator tree.
+		raw_distance = min over common ancestors c of d(c,go_id1)+d(c,go_id2)
+		jasmine_distance = min over common ancestors c of min(d(c,go_id1), d(c,go_id2))
+		lee_distance = 14 - max over c in common_ancestor_set of the longest root-to-c path
+	d() is the shortest #edges. The c minimizing raw/jasmine always has disjoint
+	shortest paths(otherwise the shared node would be closer), so the minimum over all
+	common ancestors equals the one over path pairs.
+"""
+import sys, os, math
+bit_number = math.log(sys.maxint)/math.log(2)
+if bit_number>40:       #64bit
+	sys.path.insert(0, os.path.expanduser('~/lib64/python'))
+	sys.path.insert(0, os.path.join(os.path.expanduser('~/script64/annot/bin')))
+else:   #32bit
+	sys.path.insert(0, os.path.expanduser('~/lib/python'))
+	sys.path.insert(0, os.path.join(os.path.expanduser('~/script/annot/bin')))
+import getopt, cPickle
+from sets import Set
+
+class go_dag_index:
+	"""
+	2026-10-18
+		nodes are numbered 0..n-1 in topological order(parents before children).
+
+		term_id_ls[no] = term_id
+		parent_ls[no] = tuple of parent nos
+		ancestor_bits[no] = long, bit i is set if node i is an ancestor(or self)
+		ancestor2distance_ls[no] = {ancestor_no: shortest #edges from ancestor to no}
+		longest_depth_ls[no] = longest #edges from a root to no
+		dominator_ls[no] = {descendant_no: (idom_no, dominator_depth)}, the dominator tree
+			of the subgraph below no, rooted at no itself(-1, 0).
+	"""
+	def __init__(self, go_dag_index_fname=None):
+		self.term_id_ls = []
+		self.term_id2no = {}
+		self.parent_ls = []
+		self.ancestor_bits = []
+		self.ancestor2distance_ls = []
+		self.longest_depth_ls = []
+		self.dominator_ls = []
+		if go_dag_index_fname:
+			self.load(go_dag_index_fname)
+
+	def construct(self, edge_ls, report=0):
+		"""
+		2026-10-18
+			edge_ls is a list of (parent_term_id, child_term_id)
+		"""
+		sys.stderr.write("Constructing GO DAG index...\n")
+		term_id2parent_ls = {}
+		term_id2child_ls = {}
+		for parent, child in edge_ls:
+			for term_id in (parent, child):
+				if term_id not in term_id2parent_ls:
+					term_id2parent_ls[term_id] = []
+					term_id2child_ls[term_id] = []
+			if parent not in term_id2parent_ls[child]:
+				term_id2parent_ls[child].append(parent)
+				term_id2child_ls[parent].append(child)
+		#topological order, Kahn's algorithm, roots sorted to be reproducible
+		no_of_parents_left = {}
+		queue = []
+		for term_id, parent_ls in term_id2parent_ls.iteritems():
+			no_of_parents_left[term_id] = len(parent_ls)
+			if len(parent_ls)==0:
+				queue.append(term_id)
+		queue.sort()
+		self.term_id_ls = []
+		i = 0
+		while i<len(queue):
+			term_id = queue[i]
+			i += 1
+			self.term_id_ls.append(term_id)
+			for child in term_id2child_ls[term_id]:
+				no_of_parents_left[child] -= 1
+				if no_of_parents_left[child]==0:
+					queue.append(child)
+		if len(self.term_id_ls)!=len(term_id2parent_ls):
+			sys.stderr.write("GO graph has cycles, %s nodes out of topological order\n"%\
+				(len(term_id2parent_ls)-len(self.term_id_ls)))
+			sys.exit(3)
+		self.term_id2no = {}
+		for no in range(len(self.term_id_ls)):
+			self.term_id2no[self.term_id_ls[no]] = no
+		no_of_nodes = len(self.term_id_ls)
+		self.parent_ls = [None]*no_of_nodes
+		child_ls = [None]*no_of_nodes
+		for no in range(no_of_nodes):
+			term_id = self.term_id_ls[no]
+			self.parent_ls[no] = tuple([self.term_id2no[parent] for parent in term_id2parent_ls[term_id]])
+			child_ls[no] = [self.term_id2no[child] for child in term_id2child_ls[term_id]]
+
+		#ancestors, distances and depths, parents are always done before children
+		self.ancestor_bits = [0L]*no_of_nodes
+		self.ancestor2distance_ls = [None]*no_of_nodes
+		self.longest_depth_ls = [0]*no_of_nodes
+		for no in range(no_of_nodes):
+			bits = 1L<<no
+			ancestor2distance = {no:0}
+			longest_depth = 0
+			for parent in self.parent_ls[no]:
+				bits |= self.ancestor_bits[parent]
+				for ancestor, distance in self.ancestor2distance_ls[parent].iteritems():
+					if ancestor not in ancestor2distance or distance+1<ancestor2distance[ancestor]:
+						ancestor2distance[ancestor] = distance+1
+				if self.longest_depth_ls[parent]+1>longest_depth:
+					longest_depth = self.longest_depth_ls[parent]+1
+			self.ancestor_bits[no] = bits
+			self.ancestor2distance_ls[no] = ancestor2distance
+			self.longest_depth_ls[no] = longest_depth
+
+		#one dominator tree per node
+		self.dominator_ls = [None]*no_of_nodes
+		for no in range(no_of_nodes):
+			self.dominator_ls[no] = self.construct_dominator_tree(no, child_ls)
+			if report and no%1000==0:
+				sys.stderr.write("%s%s/%s"%('\x08'*20, no, no_of_nodes))
+		sys.stderr.write("Done.\n")
+
+	def construct_dominator_tree(self, source, child_ls):
+		"""
+		2026-10-18
+			in a DAG, the immediate dominator of a node is the dominator-tree lca of all its
+			parents reachable from source. Visit the descendants in topological order(=node no).
+		"""
+		descendant_ls = [source]
+		descendant_set = Set([source])
+		i = 0
+		while i<len(descendant_ls):
+			for child in child_ls[descendant_ls[i]]:
+				if child not in descendant_set:
+					descendant_set.add(child)
+					descendant_ls.append(child)
+			i += 1
+		descendant_ls.sort()
+		dominator_tree = {source: (-1, 0)}
+		for no in descendant_ls[1:]:
+			idom = None
+			for parent in self.parent_ls[no]:
+				if parent in dominator_tree:
+					if idom is None:
+						idom = parent
+					else:
+						idom = self.dominator_lca(dominator_tree, idom, parent)
+			dominator_tree[no] = (idom, dominator_tree[idom][1]+1)
+		return dominator_tree
+
+	def dominator_lca(self, dominator_tree, no1, no2):
+		"""
+		2026-10-18
+		"""
+		depth1 = dominator_tree[no1][1]
+		depth2 = dominator_tree[no2][1]
+		while depth1>depth2:
+			no1 = dominator_tree[no1][0]
+			depth1 -= 1
+		while depth2>depth1:
+			no2 = dominator_tree[no2][0]
+			depth2 -= 1
+		while no1!=no2:
+			no1 = dominator_tree[no1][0]
+			no2 = dominator_tree[no2][0]
+		return no1
+
+	def common_ancestor_no_ls(self, no1, no2):
+		"""
+		2026-10-18
+			walk the shorter ancestor list and test the other's bitset
+		"""
+		if len(self.ancestor2distance_ls[no1])>len(self.ancestor2distance_ls[no2]):
+			no1, no2 = no2, no1
+		bits = self.ancestor_bits[no2]
+		return [ancestor for ancestor in self.ancestor2distance_ls[no1] if (bits>>ancestor)&1]
+
+	def is_ancestor(self, ancestor_term_id, term_id):
+		"""
+		2026-10-18
+			ancestor-or-self
+		"""
+		return (self.ancestor_bits[self.term_id2no[term_id]]>>self.term_id2no[ancestor_term_id])&1
+
+	def get_common_ancestor_set(self, term_id1, term_id2):
+		"""
+		2026-10-18
+			the lca's of all path-index pairs, in term_id, same as common_ancestor_list of go.node_dist
+		"""
+		no1 = self.term_id2no[term_id1]
+		no2 = self.term_id2no[term_id2]
+		common_ancestor_set = Set()
+		for ancestor in self.common_ancestor_no_ls(no1, no2):
+			if self.dominator_lca(self.dominator_ls[ancestor], no1, no2)==ancestor:
+				common_ancestor_set.add(self.term_id_ls[ancestor])
+		return common_ancestor_set
+
+	def get_distance(self, term_id1, term_id2):
+		"""
+		2026-10-18
+			return (raw_distance, lee_distance, jasmine_distance, common_ancestor_set),
+			same value as gene_p_map_redundancy.go_no2distance.
+			term_ids without common ancestors(different branches) get distance_of_2nodes' defaults.
+		"""
+		no1 = self.term_id2no[term_id1]
+		no2 = self.term_id2no[term_id2]
+		ancestor2distance1 = self.ancestor2distance_ls[no1]
+		ancestor2distance2 = self.ancestor2distance_ls[no2]
+		raw_distance = 10000
+		lee_distance = 10000
+		jasmine_distance = 10000
+		common_ancestor_set = Set()
+		for ancestor in self.common_ancestor_no_ls(no1, no2):
+			distance1 = ancestor2distance1[ancestor]
+			distance2 = ancestor2distance2[ancestor]
+			if distance1+distance2<raw_distance:
+				raw_distance = distance1+distance2
+			if min(distance1, distance2)<jasmine_distance:
+				jasmine_distance = min(distance1, distance2)
+			if self.dominator_lca(self.dominator_ls[ancestor], no1, no2)==ancestor:
+				common_ancestor_set.add(self.term_id_ls[ancestor])
+				if 14-self.longest_depth_ls[ancestor]<lee_distance:
+					lee_distance = 14-self.longest_depth_ls[ancestor]
+		return (raw_distance, lee_distance, jasmine_distance, common_ancestor_set)
+
+	def construct_from_db(self, curs, branch_ls=['molecular_function', 'biological_process', 'cellular_component'], \
+		report=0):
+		"""
+		2026-10-18
+			same edges as go_node_distance.dstruc_loadin(), non-obsolete terms within one branch
+		"""
+		sys.stderr.write("Getting GO edges...")
+		edge_ls = []
+		for branch in branch_ls:
+			curs.execute("select t2t.term1_id, t2t.term2_id from \
+				go.term2term t2t, go.term t1, go.term t2 where t2t.term1_id=t1.id and \
+				t2t.term2_id=t2.id and t1.is_obsolete=0 and t2.is_obsolete=0 and \
+				t1.term_type='%s' and t2.term_type='%s' "%(branch, branch))
+			rows = curs.fetchall()
+			for row in rows:
+				edge_ls.append((row[0], row[1]))
+		sys.stderr.write("Done.\n")
+		self.construct(edge_ls, report)
+
+	def dump(self, output_fname):
+		"""
+		2026-10-18
+		"""
+		of = open(output_fname, 'wb')
+		cPickle.dump([self.term_id_ls, self.parent_ls, self.ancestor_bits, self.ancestor2distance_ls, \
+			self.longest_depth_ls, self.dominator_ls], of, -1)
+		of.close()
+
+	def load(self, go_dag_index_fname):
+		"""
+		2026-10-18
+		"""
+		sys.stderr.write("Loading GO DAG index from %s..."%go_dag_index_fname)
+		inf = open(go_dag_index_fname, 'rb')
+		self.term_id_ls, self.parent_ls, self.ancestor_bits, self.ancestor2distance_ls, \
+			self.longest_depth_ls, self.dominator_ls = cPickle.load(inf)
+		inf.close()
+		self.term_id2no = {}
+		for no in range(len(self.term_id_ls)):
+			self.term_id2no[self.term_id_ls[no]] = no
+		sys.stderr.write("Done.\n")
+
+
+if __name__ == '__main__':
+	if len(sys.argv) == 1:
+		print __doc__
+		sys.exit(2)
+
+	long_options_list = ["help", "hostname=", "dbname=", "branch=", "report"]
+	try:
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:b:r", long_options_list)
+	except:
+		print __doc__
+		sys.exit(2)
+
+	hostname = 'zhoudb'
+	dbname = 'graphdb'
+	branch_ls = ['molecular_function', 'biological_process', 'cellular_component']
+	report = 0
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			print __doc__
+			sys.exit(2)
+		elif opt in ("-z", "--hostname"):
+			hostname = arg
+		elif opt in ("-d", "--dbname"):
+			dbname = arg
+		elif opt in ("-b", "--branch"):
+			branch_ls = arg.split(',')
+		elif opt in ("-r", "--report"):
+			report = 1
+	if len(args)==1:
+		from codense.common import db_connect
+		(conn, curs) = db_connect(hostname, dbname)
+		instance = go_dag_index()
+		instance.construct_from_db(curs, branch_ls, report)
+		instance.dump(args[0])
+	else:
+		print __doc__
+		sys.exit(2)
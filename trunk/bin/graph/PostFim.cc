@@ -13,6 +13,8 @@ PostFim::PostFim(int no_cc, int no_of_datasets, int min_cluster_size, std::strin
 	#if defined(DEBUG)
 		std::cerr<<"PostFim Begins"<<std::endl;
 	#endif
+	_no_of_indexed_edges = 0;
+	dataset2edge_id_vector.resize(no_of_datasets);
 	_out.open(node_outputfname.c_str());
 }
 
@@ -26,6 +28,8 @@ PostFim::PostFim(char* input_filename, char* sig_vector_fname, char* output_file
 	#endif
 	_input_filename = input_filename;
 	_sig_vector_fname = sig_vector_fname;
+	_no_of_indexed_edges = 0;
+	dataset2edge_id_vector.resize(no_of_datasets);
 	_out.open(output_filename);
 }
 
@@ -52,6 +56,34 @@ void PostFim::add_edge_sig_vector(boost::python::list edge_sig_list)
 	edge_bitset_vector.push_back(sig_bitset);
 }
 
+int PostFim::add_edge_sig_block(boost::python::object edge_sig_block)
+/*
+2026-10-18
+	add_edge_sig_vector() for a whole block(rows of 2+_no_of_datasets C longs, e.g. the Numeric.Int
+	edge_sig_block received in MpiFromDatasetSignatureToPattern.py), read through the buffer interface.
+	Stops at a row starting with -1. Returns the number of rows added.
+*/
+{
+	Py_ssize_t no_of_items;
+	const long *data = read_buffer<long>(edge_sig_block, no_of_items);
+	int no_of_columns = _no_of_datasets+2;
+	int no_of_rows = no_of_items/no_of_columns;
+	int i;
+	for (i=0; i<no_of_rows; i++)
+	{
+		const long *row = data + i*no_of_columns;
+		if (row[0]==-1)
+			break;
+		edge_tuple_vector.push_back(row[0]);
+		edge_tuple_vector.push_back(row[1]);
+		boost::dynamic_bitset<> sig_bitset(_no_of_datasets);
+		for (int j=0; j<_no_of_datasets; j++)
+			sig_bitset[j] = row[j+2];
+		edge_bitset_vector.push_back(sig_bitset);
+	}
+	return i;
+}
+
 void PostFim::add_pattern_signature(boost::python::list pattern_sig_list)
 {
 	boost::dynamic_bitset<> sig_bitset(_no_of_datasets);
@@ -143,10 +175,32 @@ read edge name and sig_vector
 	std::cerr<<"Done."<<std::endl;
 }
 
+void PostFim::index_edge_bitset_vector()
+/*
+2026-10-18
+	append edges added since the last call to the dataset2edge_id_vector posting lists.
+	edges arrive in blocks(add_edge_sig_vector()) before any patternFormation(), so index lazily.
+*/
+{
+	for (int j = _no_of_indexed_edges; j<edge_bitset_vector.size(); j++)
+	{
+		boost::dynamic_bitset<>::size_type dataset_no = edge_bitset_vector[j].find_first();
+		while (dataset_no!=boost::dynamic_bitset<>::npos)
+		{
+			dataset2edge_id_vector[dataset_no].push_back(j);
+			dataset_no = edge_bitset_vector[j].find_next(dataset_no);
+		}
+	}
+	_no_of_indexed_edges = edge_bitset_vector.size();
+}
+
 void PostFim::patternFormation()
 /*
 01-13-06
 	pre-stop when edge_id_vector has reached the frequency
+2026-10-18
+	use the dataset2edge_id_vector inverted index. Each signature only checks edges occurring in its
+	rarest dataset, instead of all edges. Output is unchanged.
 */
 {
 	#if defined(DEBUG)
@@ -173,18 +227,40 @@ void PostFim::patternFormation()
 	edge_out.close();
 	*/
 
+	index_edge_bitset_vector();
 	std::vector<int> edge_id_vector;
+	boost::dynamic_bitset<>::size_type dataset_no, rarest_dataset_no;
 	for (int i = 0; i<pattern_bitset_vector.size(); i++)
 	{
-		for (int j = 0; j<edge_bitset_vector.size(); j++)
+		rarest_dataset_no = pattern_bitset_vector[i].find_first();
+		if (rarest_dataset_no==boost::dynamic_bitset<>::npos)	//empty signature, every edge qualifies
 		{
-			if ((pattern_bitset_vector[i] & edge_bitset_vector[j])==pattern_bitset_vector[i])
+			for (int j = 0; j<edge_bitset_vector.size(); j++)
 			{
 				edge_id_vector.push_back(j);
-				if (freq_of_signature_vector[i]==edge_id_vector.size())	//01-13-06
+				if (freq_of_signature_vector[i]==edge_id_vector.size())
 					break;
 			}
 		}
+		else
+		{
+			//2026-10-18 only visit edges of the rarest dataset in the signature, they are the only candidates
+			for (dataset_no = pattern_bitset_vector[i].find_next(rarest_dataset_no); \
+				dataset_no!=boost::dynamic_bitset<>::npos; dataset_no = pattern_bitset_vector[i].find_next(dataset_no))
+				if (dataset2edge_id_vector[dataset_no].size()<dataset2edge_id_vector[rarest_dataset_no].size())
+					rarest_dataset_no = dataset_no;
+			std::vector<int> &candidate_edge_id_vector = dataset2edge_id_vector[rarest_dataset_no];
+			for (int k = 0; k<candidate_edge_id_vector.size(); k++)
+			{
+				int j = candidate_edge_id_vector[k];	//ascending, same order as the full scan
+				if (pattern_bitset_vector[i].is_subset_of(edge_bitset_vector[j]))
+				{
+					edge_id_vector.push_back(j);
+					if (freq_of_signature_vector[i]==edge_id_vector.size())	//01-13-06
+						break;
+				}
+			}
+		}
 		if (freq_of_signature_vector[i]==edge_id_vector.size())
 		{
 			outputCcFromEdgeList(_out, edge_id_vector, edge_tuple_vector, _min_cluster_size, _no_cc);
@@ -467,6 +543,7 @@ BOOST_PYTHON_MODULE(PostFim)
 	using namespace boost::python;
 	class_<PostFim, boost::noncopyable>("PostFim", init<int, int, int, std::string>())
 		.def("add_edge_sig_vector", &PostFim::add_edge_sig_vector)
+		.def("add_edge_sig_block", &PostFim::add_edge_sig_block)
 		.def("add_pattern_signature", &PostFim::add_pattern_signature)
 		.def("patternFormation", &PostFim::patternFormation)
 	;
@@ -20,6 +20,7 @@
 #include <boost/utility.hpp>             // for boost::tie
 
 #include <getopt.h>	//to parse program options.
+#include "buffer_util.h"	//2026-10-18 for read_buffer
 
 using namespace boost;
 using namespace boost::python;
@@ -53,6 +54,10 @@ class PostFim
 		std::vector<unsigned int > edge_tuple_vector;
 		std::vector<boost::dynamic_bitset<> > edge_bitset_vector;
 		
+		//inverted index, dataset no -> ascending ids of edges occurring in that dataset
+		std::vector<std::vector<int> > dataset2edge_id_vector;
+		int _no_of_indexed_edges;
+		
 		char* _input_filename;
 		char* _sig_vector_fname;
 		
@@ -61,7 +66,9 @@ class PostFim
 		PostFim(int no_cc, int no_of_datasets, int min_cluster_size, std::string node_outputfname);
 		~PostFim();
 		void add_edge_sig_vector(boost::python::list edge_sig_list);
+		int add_edge_sig_block(boost::python::object edge_sig_block);	//2026-10-18
 		void add_pattern_signature(boost::python::list pattern_sig_list);
+		void index_edge_bitset_vector();
 		void patternFormation();
 		void outputCcFromEdgeList(ofstream &out, std::vector<int> &edge_id_vector, std::vector<unsigned int > &edge_tuple_vector,\
 			int min_cluster_size, int no_cc);
@@ -2,6 +2,12 @@
 *04-12-05
 *	biclustering algorithm modelled after Biclustering.java by Cheng & Church 2000
 *
+*2026-10-18
+*	matrix is one contiguous row-major float buffer. Numeric Float arrays and python buffers are
+*	read in one pass(data_read_in(), data_read_in_buffer() through buffer_util.h), not element by element.
+*	row/column sums are set by reset_sums() and maintained incrementally by remove_row()/remove_column(),
+*	so scoring() no longer recomputes the means, and it only visits the remaining
+*	submatrix(remainingRowList, remainingColumnList), not the full numberOfRows X numberOfColumns.
 */
 
 #include <iostream>			// for std::cout
@@ -9,6 +15,7 @@
 #include <string>			//for string
 #include <gsl/gsl_rng.h>		//for random number generator
 #include <boost/python.hpp>	//for python module and dict, tuple, make_tuple
+#include "buffer_util.h"	//2026-10-18 read_buffer()
 
 using namespace std;
 using namespace boost::python;
@@ -33,13 +40,19 @@ class biclustering
 		~biclustering();
 		
 		void data_read_in(boost::python::numeric::array& list_2d);
+		void data_read_in_buffer(boost::python::object buffer, int no_of_rows, int no_of_columns, int row_offset, int column_offset);
+		void init_remaining();
+		void reset_sums();
+		void remove_row(int i);
+		void remove_column(int j);
+		void update_remaining_list();
 		void scoring();
 		bicluster getbicluster();
 		boost::python::list return_matrix_data();
 	
 		int numberOfColumns;
 		int numberOfRows;
-		vector<vf> matrix;
+		vf matrix;	//2026-10-18 row-major, matrix[i*numberOfColumns+j]
 		double maxScore;
 		int minHeight;
 		int minWidth;
@@ -50,6 +63,11 @@ class biclustering
 		vd columnMean;
 		vd rowScore;
 		vd columnScore;
+		vd rowSum;	//2026-10-18 sum of row i over remaining columns
+		vd columnSum;	//2026-10-18 sum of column j over remaining rows
+		double totalSum;	//2026-10-18 sum of the remaining submatrix
+		vector<int> remainingRowList;	//2026-10-18 remaining rows in ascending order
+		vector<int> remainingColumnList;
 		double mean;
 		int smWidth;
 		int smHeight;
@@ -81,135 +99,223 @@ biclustering::~biclustering()
 
 void biclustering::data_read_in(boost::python::numeric::array& list_2d)
 {
+	/*
+	*2026-10-18
+	*	contiguous Float('d') arrays are read through the buffer interface,
+	*	others element by element as before.
+	*/
 	//convert the 2 dimensional list of python into matrix
 	boost::python::tuple shape = boost::python::extract<tuple>(list_2d.attr("shape"));
-	numberOfRows = boost::python::extract<int>(shape[0]);
-	if (numberOfRows == 0)
+	int no_of_rows = boost::python::extract<int>(shape[0]);
+	int no_of_columns = 0;
+	if (no_of_rows > 0)
+		no_of_columns = boost::python::extract<int>(shape[1]);
+	std::string typecode = boost::python::extract<std::string>(list_2d.attr("typecode")());
+	bool iscontiguous = boost::python::extract<bool>(list_2d.attr("iscontiguous")());
+	if (typecode=="d" && iscontiguous)
 	{
-		cout<<"No data"<<endl;
-		numberOfColumns = 0;
+		data_read_in_buffer(list_2d, no_of_rows, no_of_columns, 0, 0);
+		return;
 	}
-	else
-		numberOfColumns = boost::python::extract<int>(shape[1]);
+	numberOfRows = no_of_rows;
+	numberOfColumns = no_of_columns;
+	if (numberOfRows == 0)
+		cout<<"No data"<<endl;
 	cout<<"Number of rows: "<<numberOfRows<<endl;
 	cout<<"Number of columns: "<<numberOfColumns<<endl;
 	
 	//fill matrix
-	vf row_vector;	//temporarily hold the data before pushed into matrix
-	float value;
+	matrix.resize((long)numberOfRows*numberOfColumns);
 	for(int i=0; i<numberOfRows; i++)
-	{
 		for(int j=0; j<numberOfColumns; j++)
-		{
-			value = boost::python::extract<float>(list_2d[i][j]);
-			/*
-			if ((value-1.1)<0.0001)
-				value = float(gsl_rng_uniform_int(r, 1600)-800);
-			else
-			{
-				value = atof(value_string.c_str());
-				//see log on 04-14-05 in section of c++/c. tricks in the data type coersion.
-				#if defined(DEBUG)
-					std::cout << "Original: "<<value_string<<"Middle: "<<atof(value_string.c_str())<<" New: "<<value<<endl;
-				#endif
-			}
-			*/
-			row_vector.push_back(value);
-		}
-		matrix.push_back(row_vector);
-		row_vector.clear();	//clear it for the next time
+			matrix[(long)i*numberOfColumns+j] = boost::python::extract<float>(list_2d[i][j]);
+	init_remaining();
+}
+
+void biclustering::data_read_in_buffer(boost::python::object buffer, int no_of_rows, int no_of_columns, int row_offset, int column_offset)
+{
+	/*
+	*2026-10-18
+	*	buffer holds a no_of_rows X no_of_columns row-major matrix of doubles(Numeric Float array,
+	*	array.array('d'), ...). The submatrix from row_offset and column_offset on is read in.
+	*	i.e. MpiBiclustering.py's received_data with the go_no row and the edge_id column skipped.
+	*/
+	Py_ssize_t no_of_items;
+	const double *data = read_buffer<double>(buffer, no_of_items);
+	if (no_of_rows*(Py_ssize_t)no_of_columns > no_of_items || row_offset>no_of_rows || column_offset>no_of_columns)
+	{
+		PyErr_SetString(PyExc_ValueError, "buffer is smaller than no_of_rows X no_of_columns doubles.");
+		throw_error_already_set();
 	}
-	
-	//initialize other sequence structures
+	numberOfRows = no_of_rows - row_offset;
+	numberOfColumns = no_of_columns - column_offset;
+	if (numberOfRows == 0)
+		cout<<"No data"<<endl;
+	cout<<"Number of rows: "<<numberOfRows<<endl;
+	cout<<"Number of columns: "<<numberOfColumns<<endl;
+	matrix.resize((long)numberOfRows*numberOfColumns);
 	for(int i=0; i<numberOfRows; i++)
 	{
-		remainingR.push_back(true);
-		rowMean.push_back(0);
-		rowScore.push_back(0);
+		const double *row = data + (long)(i+row_offset)*no_of_columns + column_offset;
+		float *matrix_row = &matrix[0] + (long)i*numberOfColumns;
+		for(int j=0; j<numberOfColumns; j++)
+			matrix_row[j] = row[j];
+	}
+	init_remaining();
+}
+
+void biclustering::init_remaining()
+{
+	/*
+	*2026-10-18
+	*	initialize other sequence structures
+	*/
+	remainingR.assign(numberOfRows, true);
+	rowMean.assign(numberOfRows, 0);
+	rowScore.assign(numberOfRows, 0);
+	rowSum.assign(numberOfRows, 0);
+	remainingC.assign(numberOfColumns, true);
+	columnMean.assign(numberOfColumns, 0);
+	columnScore.assign(numberOfColumns, 0);
+	columnSum.assign(numberOfColumns, 0);
+}
+
+void biclustering::reset_sums()
+{
+	/*
+	*2026-10-18
+	*	all rows and columns remain, the full sums.
+	*	The only O(numberOfRows X numberOfColumns) pass besides scoring().
+	*/
+	totalSum = 0;
+	for (int j = 0; j < numberOfColumns; j++)
+	{
+		remainingC[j] = true;
+		columnSum[j] = 0;
 	}
-	for(int j=0; j<numberOfColumns; j++)
+	for (int i = 0; i < numberOfRows; i++)
 	{
-		remainingC.push_back(true);
-		columnMean.push_back(0);
-		columnScore.push_back(0);
+		const float *matrix_row = &matrix[0] + (long)i*numberOfColumns;
+		remainingR[i] = true;
+		rowSum[i] = 0;
+		for (int j = 0; j < numberOfColumns; j++)
+		{
+			rowSum[i] += matrix_row[j];
+			columnSum[j] += matrix_row[j];
+		}
+		totalSum += rowSum[i];
 	}
+	smWidth = numberOfColumns;
+	smHeight = numberOfRows;
 }
 
-void biclustering::scoring()
+void biclustering::remove_row(int i)
 {
 	/*
-	*copied from Biclustering.java, no change
-	*04-26-05 add some DEBUG macros to control compilation
+	*2026-10-18
+	*	O(numberOfColumns), the column sums and the total sum lose row i
 	*/
-	mean = 0;
+	const float *matrix_row = &matrix[0] + (long)i*numberOfColumns;
 	for (int j = 0; j < numberOfColumns; j++)
 		if (remainingC[j])
-			columnMean[j] = 0;	//initialization
+			columnSum[j] -= matrix_row[j];
+	totalSum -= rowSum[i];
+	remainingR[i] = false;
+	smHeight--;
+}
+
+void biclustering::remove_column(int j)
+{
+	/*
+	*2026-10-18
+	*	O(numberOfRows), the row sums and the total sum lose column j
+	*/
 	for (int i = 0; i < numberOfRows; i++)
 		if (remainingR[i])
-		{
-			rowMean[i] = 0;	//initialization
-			for (int j = 0; j < numberOfColumns; j++)
-				if (remainingC[j])
-				{
-					rowMean[i] += matrix[i][j];
-					columnMean[j] += matrix[i][j];
-				}
-			mean += rowMean[i];
-			rowMean[i] /= smWidth;	//smWidth determined in getBicluster()
-			#if defined(DEBUG)
-				cout<<"rowMean at "<<i<<" is "<<rowMean[i]<<"; incremental mean is "<<mean<<endl;
-			#endif
-		}
+			rowSum[i] -= matrix[(long)i*numberOfColumns+j];
+	totalSum -= columnSum[j];
+	remainingC[j] = false;
+	smWidth--;
+}
+
+void biclustering::update_remaining_list()
+{
+	//2026-10-18 rebuild remainingRowList and remainingColumnList from remainingR and remainingC
+	remainingRowList.clear();
+	for (int i = 0; i < numberOfRows; i++)
+		if (remainingR[i])
+			remainingRowList.push_back(i);
+	remainingColumnList.clear();
 	for (int j = 0; j < numberOfColumns; j++)
 		if (remainingC[j])
-		{
-			columnMean[j] /= smHeight;	//smHeight determined in getBicluster()
-			#if defined(DEBUG)
-				cout<<"colMean at "<<j<<" is "<<columnMean[j]<<endl;
-			#endif
-		}
+			remainingColumnList.push_back(j);
+}
+
+void biclustering::scoring()
+{
+	/*
+	*copied from Biclustering.java, no change
+	*04-26-05 add some DEBUG macros to control compilation
+	*2026-10-18
+	*	means come from rowSum, columnSum and totalSum(maintained by remove_row() etc.),
+	*	only the remaining submatrix is visited.
+	*/
+	update_remaining_list();
+	int no_of_remaining_rows = remainingRowList.size();
+	int no_of_remaining_columns = remainingColumnList.size();
+	for (int jj = 0; jj < no_of_remaining_columns; jj++)
+	{
+		int j = remainingColumnList[jj];
+		columnMean[j] = columnSum[j]/smHeight;	//smHeight determined in getBicluster()
+		columnScore[j] = 0;	//initialization
+		#if defined(DEBUG)
+			cout<<"colMean at "<<j<<" is "<<columnMean[j]<<endl;
+		#endif
+	}
+	for (int ii = 0; ii < no_of_remaining_rows; ii++)
+	{
+		int i = remainingRowList[ii];
+		rowMean[i] = rowSum[i]/smWidth;	//smWidth determined in getBicluster()
+		#if defined(DEBUG)
+			cout<<"rowMean at "<<i<<" is "<<rowMean[i]<<endl;
+		#endif
+	}
+	mean = totalSum/(smWidth * smHeight);
 	#if defined(DEBUG)
-		cout<<"mean before dividing is "<<mean<<endl;
 		cout<<"smWidth is "<<smWidth<<endl;
 		cout<<"smHeight is "<<smHeight<<endl;
-	#endif
-	mean /= smWidth * smHeight;
-	#if defined(DEBUG)
 		cout<<"mean is "<<mean<<endl;
 	#endif
 	HScore = 0;
-	for (int j = 0; j < numberOfColumns; j++)
-		if (remainingC[j])
-			columnScore[j] = 0;	//initialization
-	for (int i = 0; i < numberOfRows; i++)
-		if (remainingR[i])
+	for (int ii = 0; ii < no_of_remaining_rows; ii++)
+	{
+		int i = remainingRowList[ii];
+		const float *matrix_row = &matrix[0] + (long)i*numberOfColumns;
+		double row_offset = mean - rowMean[i];
+		rowScore[i] = 0;	//initialization
+		for (int jj = 0; jj < no_of_remaining_columns; jj++)
 		{
-			rowScore[i] = 0;	//initialization
-			for (int j = 0; j < numberOfColumns; j++)
-				if (remainingC[j])
-				{
-					double r = matrix[i][j] - rowMean[i] - columnMean[j] + mean;
-					#if defined(DEBUG)
-						cout<<"r score at "<<i<<" and "<<j<<" is "<<r<<endl;
-					#endif
-					r = r * r;
-					rowScore[i] += r;
-					columnScore[j] += r;
-				}
-			HScore += rowScore[i];
-			rowScore[i] /= smWidth;
+			int j = remainingColumnList[jj];
+			double r = matrix_row[j] - columnMean[j] + row_offset;
 			#if defined(DEBUG)
-				cout<<"rowScore at "<<i<<" is "<<rowScore[i]<<endl;
+				cout<<"r score at "<<i<<" and "<<j<<" is "<<r<<endl;
 			#endif
+			r = r * r;
+			rowScore[i] += r;
+			columnScore[j] += r;
 		}
+		HScore += rowScore[i];
+		rowScore[i] /= smWidth;
+		#if defined(DEBUG)
+			cout<<"rowScore at "<<i<<" is "<<rowScore[i]<<endl;
+		#endif
+	}
 	#if defined(DEBUG)
 		cout<<"HScore before dividing is "<<HScore<<endl;
 	#endif
 	HScore /= smWidth * smHeight;
-	for (int j = 0; j < numberOfColumns; j++)
-		if (remainingC[j])
-			columnScore[j] /= smHeight;
+	for (int jj = 0; jj < no_of_remaining_columns; jj++)
+		columnScore[remainingColumnList[jj]] /= smHeight;
 }
 
 bicluster biclustering::getbicluster()
@@ -219,12 +325,7 @@ bicluster biclustering::getbicluster()
 */
 {
 	bicluster bicluster_to_return;
-	for (int i = 0; i < numberOfRows; i++)
-		remainingR[i] = true;
-	for (int j = 0; j < numberOfColumns; j++)
-		remainingC[j] = true;
-	smWidth = numberOfColumns;
-	smHeight = numberOfRows;
+	reset_sums();
 	scoring();
 	int index = 0;
 	while ((HScore > maxScore) && (index > -1))
@@ -234,10 +335,7 @@ bicluster biclustering::getbicluster()
 					//no batchThreshold in the paper's algorithm
 			for (int i = 0; i < numberOfRows; i++)
 				if (remainingR[i] && (rowScore[i] > HScore))
-				{
-					remainingR[i] = false;
-					smHeight--;
-				}
+					remove_row(i);	//2026-10-18
 		}else
 		{	//find the maximum from rowScore and columnScore
 			double ms = 0;
@@ -264,14 +362,9 @@ bicluster biclustering::getbicluster()
 			}
 			if (index > -1)
 				if (row)
-				{
-					remainingR[index] = false;
-					smHeight--;
-				}else
-				{
-					remainingC[index] = false;
-					smWidth--;
-				}
+					remove_row(index);	//2026-10-18
+				else
+					remove_column(index);
 		}
 		scoring();
 	}
@@ -285,7 +378,7 @@ bicluster biclustering::getbicluster()
 			row_index_list.append(i);	//fill the row index of the cluster
 			for (int j = 0; j < numberOfColumns; j++)
 				if (remainingC[j])
-					matrix[i][j] = int(gsl_rng_uniform_int(r, 1600)-800);
+					matrix[(long)i*numberOfColumns+j] = int(gsl_rng_uniform_int(r, 1600)-800);
 			}
 	//fill the column index of the cluster
 	for (int j=0; j<numberOfColumns; j++)
@@ -309,7 +402,7 @@ boost::python::list biclustering::return_matrix_data()
 		list list_row;
 		for(int j=0; j<numberOfColumns; j++)
 		{
-			list_row.append(matrix[i][j]);
+			list_row.append(matrix[(long)i*numberOfColumns+j]);
 		}
 		list_2d.append(list_row);
 	}
@@ -320,7 +413,13 @@ BOOST_PYTHON_MODULE(biclustering)
 {
 	boost::python::class_<biclustering>("biclustering", init<double, int, int, int>())
 		.def("data_read_in", &biclustering::data_read_in)
+		.def("data_read_in_buffer", &biclustering::data_read_in_buffer)
 		.def("scoring", &biclustering::scoring)
+		.def("reset_sums", &biclustering::reset_sums)
+		.def("remove_row", &biclustering::remove_row)
+		.def("remove_column", &biclustering::remove_column)
+		.def_readonly("HScore", &biclustering::HScore)
+		.def_readonly("mean", &biclustering::mean)
 		.def("getbicluster", &biclustering::getbicluster)
 		.def("return_matrix_data", &biclustering::return_matrix_data)
 		.def_readonly("maxScore", &biclustering::maxScore)
@@ -0,0 +1,63 @@
+/*
+*2026-10-18
+*	exchange contiguous numeric data with python through the buffer interface, shared by
+*	cc_from_edge_list.cc, johnson_sp.cc and PostFim.cc.
+*	Input is anything exporting a buffer: array.array, Numeric arrays, strings.
+*	Integers are C long(array typecode 'l', Numeric.Int), floats are double('d').
+*	Output is a string(bytes in python 3) of the raw values, array.array(typecode, ...) takes it directly.
+*/
+#ifndef BUFFER_UTIL_H
+#define BUFFER_UTIL_H
+
+#include <boost/python.hpp>
+#include <vector>
+
+template <class T>
+const T *read_buffer(boost::python::object buffer_obj, Py_ssize_t &no_of_items)
+/*
+*2026-10-18
+*	pointer to the data of a (read-only) buffer of T. buffer_obj must stay alive while it's used.
+*/
+{
+	const void *buffer;
+	Py_ssize_t buffer_len;
+#if PY_MAJOR_VERSION >= 3
+	Py_buffer view;
+	if (PyObject_GetBuffer(buffer_obj.ptr(), &view, PyBUF_SIMPLE)!=0)
+		boost::python::throw_error_already_set();
+	buffer = view.buf;
+	buffer_len = view.len;
+	PyBuffer_Release(&view);	//buffer_obj holds the memory
+#else
+	if (PyObject_AsReadBuffer(buffer_obj.ptr(), &buffer, &buffer_len)!=0)
+		boost::python::throw_error_already_set();
+#endif
+	if (buffer_len%sizeof(T)!=0)
+	{
+		PyErr_SetString(PyExc_ValueError, "buffer length is not a multiple of the item size.");
+		boost::python::throw_error_already_set();
+	}
+	no_of_items = buffer_len/sizeof(T);
+	return (const T *)buffer;
+}
+
+template <class T>
+boost::python::object vector2string(const std::vector<T> &data_vector)
+/*
+*2026-10-18
+*	one copy of the raw values into a python string
+*/
+{
+	const char *data = data_vector.empty()?"":(const char *)&data_vector[0];
+	Py_ssize_t data_len = data_vector.size()*sizeof(T);
+#if PY_MAJOR_VERSION >= 3
+	PyObject *string_obj = PyBytes_FromStringAndSize(data, data_len);
+#else
+	PyObject *string_obj = PyString_FromStringAndSize(data, data_len);
+#endif
+	if (string_obj==NULL)
+		boost::python::throw_error_already_set();
+	return boost::python::object(boost::python::handle<>(string_obj));
+}
+
+#endif
@@ -11,42 +11,63 @@ void cc_from_edge_list::init_graph_from_edge_list(boost::python::list edge_list,
 /*
 *01-09-06
 *	re-structure to be faster
+*2026-10-18
+*	the vertex lookup goes to add_named_edge()
 */
 {
-	vertex_name_type vertex2name = get(vertex_name, graph);
 	int edge_length = boost::python::extract<int>(edge_list.attr("__len__")());
-	std::map<int, vertexDescriptor>::iterator pos;
-	bool inserted;
-	vertexDescriptor u, v;
 	for(int i=0; i<edge_length; i++)
 	{
 		int gene1 = boost::python::extract<int>(edge_list[i][0]);
 		int gene2 = boost::python::extract<int>(edge_list[i][1]);
 		//used in last to get the weight.
 		//boost::python::tuple tup = boost::python::make_tuple(gene1, gene2);	//01-09-06 no need for this tup
-		tie(pos, inserted) = geneNoMap.insert(std::make_pair(gene1, vertexDescriptor()));
-		if (inserted) {
-			u = add_vertex(graph);
-			vertex2name[u] = gene1;
-			pos->second = u;
-		} else
-			u = pos->second;
-		
-		tie(pos, inserted) = geneNoMap.insert(std::make_pair(gene2, vertexDescriptor()));
-		if (inserted) {
-			v = add_vertex(graph);
-			vertex2name[v] = gene2;
-			pos->second = v;
-		} else
-			v = pos->second;
-		
-		//01-09-06 make it simpler
-		//graph_traits < Graph >::edge_descriptor e;
-		//tie(e, inserted) = add_edge(u, v, graph);
-		add_edge(u, v, graph);
+		add_named_edge(gene1, gene2, graph);
 	}
 }
 
+void cc_from_edge_list::add_named_edge(int gene1, int gene2, Graph &graph)
+/*
+*2026-10-18
+*	add the edge gene1-gene2, vertices are created on first sight(geneNoMap)
+*/
+{
+	vertex_name_type vertex2name = get(vertex_name, graph);
+	std::map<int, vertexDescriptor>::iterator pos;
+	bool inserted;
+	vertexDescriptor u, v;
+	tie(pos, inserted) = geneNoMap.insert(std::make_pair(gene1, vertexDescriptor()));
+	if (inserted) {
+		u = add_vertex(graph);
+		vertex2name[u] = gene1;
+		pos->second = u;
+	} else
+		u = pos->second;
+	
+	tie(pos, inserted) = geneNoMap.insert(std::make_pair(gene2, vertexDescriptor()));
+	if (inserted) {
+		v = add_vertex(graph);
+		vertex2name[v] = gene2;
+		pos->second = v;
+	} else
+		v = pos->second;
+	
+	//01-09-06 make it simpler
+	//graph_traits < Graph >::edge_descriptor e;
+	//tie(e, inserted) = add_edge(u, v, graph);
+	add_edge(u, v, graph);
+}
+
+void cc_from_edge_list::init_graph_from_edge_array(const long *edge_data, int no_of_edges, Graph &graph)
+/*
+*2026-10-18
+*	init_graph_from_edge_list() from no_of_edges pairs of gene_no's
+*/
+{
+	for(int i=0; i<no_of_edges; i++)
+		add_named_edge(edge_data[2*i], edge_data[2*i+1], graph);
+}
+
 std::vector<Graph> cc_from_edge_list::cc2subgraph(Graph &graph)
 {
 	std::vector<int> component(num_vertices(graph));
@@ -206,6 +227,39 @@ void cc_from_edge_list::run(boost::python::list edge_list)
 }
 
 
+boost::python::tuple cc_from_edge_list::run_buffer(boost::python::object edge_buffer)
+/*
+*2026-10-18
+*	run() with the edges(pairs of C longs, e.g. array.array('l') or a Numeric.Int array of shape (m,2))
+*	in a buffer. Returns (edge_string, offset_string), both strings of C longs:
+*	edges of all components one after another, each in ascending order like subgraph2list(),
+*	and no_of_components+1 offsets(in edges) into it. cc_list is not touched.
+*/
+{
+	Py_ssize_t no_of_items;
+	const long *edge_data = read_buffer<long>(edge_buffer, no_of_items);
+	init_graph_from_edge_array(edge_data, no_of_items/2, g);
+	vector_subgraph = cc2subgraph(g);
+	vertex_name_type vertex2name = get(vertex_name, g);
+	std::vector<long> cc_edge_vector;
+	std::vector<long> cc_offset_vector(1, 0);
+	std::vector<Graph>::iterator g_iterator;
+	for(g_iterator=vector_subgraph.begin();g_iterator!=vector_subgraph.end();++g_iterator)
+	{
+		graph_traits<Graph>::edge_iterator ei, ei_end;
+		for (tie(ei,ei_end) = edges(*g_iterator); ei != ei_end; ++ei)
+		{
+			long vg_name = get(vertex2name, g_iterator->local_to_global(source(*ei, *g_iterator)));
+			long vg_name1 = get(vertex2name, g_iterator->local_to_global(target(*ei, *g_iterator)));
+			cc_edge_vector.push_back(std::min(vg_name, vg_name1));
+			cc_edge_vector.push_back(std::max(vg_name, vg_name1));
+		}
+		cc_offset_vector.push_back(cc_edge_vector.size()/2);
+	}
+	return boost::python::make_tuple(vector2string(cc_edge_vector), vector2string(cc_offset_vector));
+}
+
+
 Graph cc_from_edge_list::init_graph_from_edge_tuple_vector(std::vector<int> &edge_id_vector, std::vector<unsigned int > &edge_tuple_vector)
 /*
 *01-09-06
@@ -329,8 +383,12 @@ ClusterByEBC::ClusterByEBC()
 /*
 *09-06-05
 *	do nothing
+*2026-10-18
+*	default ebc options
 */
 {
+	_edge_buffer_given = false;
+	set_ebc_option(0, 1, 0);
 }
 
 ClusterByEBC::ClusterByEBC(boost::python::list edge_list, int size_cutoff, float conn_cutoff)\
@@ -342,6 +400,32 @@ ClusterByEBC::ClusterByEBC(boost::python::list edge_list, int size_cutoff, float
 */
 {
 	_edge_list = edge_list;
+	_edge_buffer_given = false;
+	set_ebc_option(0, 1, 0);
+}
+
+ClusterByEBC::ClusterByEBC(int size_cutoff, float conn_cutoff)\
+	:_input_filename(""),_min_edge_weight(0), _size_cutoff(size_cutoff),_conn_cutoff(conn_cutoff),_output_filename(""),_format_type(3),_offset(0)
+/*
+2026-10-18
+	Constructor for python to call, edges come from set_edge_buffer()
+*/
+{
+	_edge_buffer_given = false;
+	set_ebc_option(0, 1, 0);
+}
+
+void ClusterByEBC::set_edge_buffer(boost::python::object edge_buffer)
+/*
+2026-10-18
+	edges(pairs of C longs) from a buffer instead of the python edge_list. run() then leaves
+	cc_list/cc_vertex_list empty, the result comes from cc_buffer().
+*/
+{
+	Py_ssize_t no_of_items;
+	const long *edge_data = read_buffer<long>(edge_buffer, no_of_items);
+	_edge_buffer_vector.assign(edge_data, edge_data+no_of_items-no_of_items%2);
+	_edge_buffer_given = true;
 }
 
 ClusterByEBC::ClusterByEBC(std::string input_filename, int min_edge_weight, int size_cutoff, \
@@ -353,6 +437,8 @@ ClusterByEBC::ClusterByEBC(std::string input_filename, int min_edge_weight, int
 	Normal constructor
 */
 {
+	_edge_buffer_given = false;
+	set_ebc_option(0, 1, 0);
 }
 
 
@@ -544,6 +630,7 @@ void ClusterByEBC::cut_by_betweenness_centrality(Graph &graph, vector<double> &e
 				std::cerr<<"running brandes_betweenness_centrality... ";
 			#endif
 			brandes_betweenness_centrality(graph, edge_centrality_map(ec_map)); 
+			no_of_source_traversals += no_of_vertices;	//2026-10-18
 			#ifdef DEBUG
 				std::cerr<<"done."<<std::endl;
 			#endif
@@ -553,6 +640,7 @@ void ClusterByEBC::cut_by_betweenness_centrality(Graph &graph, vector<double> &e
 				std::cerr<<"max_centrality is "<<max_centrality<<std::endl;
 			#endif
 			remove_edge(e, graph);
+			no_of_removed_edges++;	//2026-10-18
 			//reindex_edge(graph);	//09-07-05	see doc of this function
 			#ifdef DEBUG
 				std::cerr<<"after removal the subgraph has "<<num_edges(graph)<<" edges."<<std::endl;
@@ -574,6 +662,7 @@ void ClusterByEBC::cut_by_betweenness_centrality(Graph &graph, vector<double> &e
 				#ifdef DEBUG
 					std::cerr<<"get the connected_components into a vector_graph and cut them separately "<<std::endl;
 				#endif
+				no_of_splits++;	//2026-10-18
 				std::vector<Graph> vector_graph = graph_components(graph, component, no_of_components);
 				std::vector<Graph>::iterator g_iterator;
 				for(g_iterator=vector_graph.begin();g_iterator!=vector_graph.end();++g_iterator)
@@ -590,6 +679,369 @@ void ClusterByEBC::cut_by_betweenness_centrality(Graph &graph, vector<double> &e
 	
 }
 
+void ClusterByEBC::set_ebc_option(int incremental, int batch_size, int no_of_samples, unsigned int seed)
+/*
+2026-10-18
+	options of the cutting, the default(0, 1, 0) is the exact method, cut_by_betweenness_centrality().
+	Any other combination goes through cut_component().
+	incremental: after a removal, only re-run the sources whose shortest path DAG contained a removed edge.
+		The betweenness stays exact, at the cost of a no_of_sources X no_of_vertices distance table.
+	batch_size: remove the batch_size edges of highest betweenness per round, not just one.
+	no_of_samples: if >0 and less than the component size, betweenness is approximated from
+		no_of_samples random sources(drawn per component with seed).
+*/
+{
+	_incremental = incremental;
+	_batch_size = batch_size<1 ? 1 : batch_size;
+	_no_of_samples = no_of_samples<0 ? 0 : no_of_samples;
+	_random_state = seed ? seed : 1;
+	no_of_splits = 0;
+	no_of_removed_edges = 0;
+	no_of_source_traversals = 0;
+}
+
+ebc_graph ClusterByEBC::graph2ebc_graph(Graph &graph)
+/*
+2026-10-18
+	graph is one of graph_components(), vertex descriptors are 0..num_vertices(graph)-1
+*/
+{
+	ebc_graph ebc_g;
+	vertex_name_type vertex2name = get(vertex_name, graph);
+	int no_of_vertices = num_vertices(graph);
+	for (int i=0; i<no_of_vertices; i++)
+		ebc_g.vertex_name_vector.push_back(get(vertex2name, vertex(i, graph)));
+	ebc_g.adjacency_vector.resize(no_of_vertices);
+	graph_traits<Graph>::edge_iterator ei, ei_end;
+	for (tie(ei,ei_end) = edges(graph); ei != ei_end; ++ei)
+	{
+		boost::array<int, 2> edge_array;
+		edge_array[0] = source(*ei, graph);
+		edge_array[1] = target(*ei, graph);
+		int edge_index = ebc_g.edge_vector.size();
+		ebc_g.edge_vector.push_back(edge_array);
+		ebc_g.adjacency_vector[edge_array[0]].push_back(std::make_pair(edge_array[1], edge_index));
+		ebc_g.adjacency_vector[edge_array[1]].push_back(std::make_pair(edge_array[0], edge_index));
+	}
+	ebc_g.edge_alive_vector.assign(ebc_g.edge_vector.size(), 1);
+	ebc_g.no_of_alive_edges = ebc_g.edge_vector.size();
+	return ebc_g;
+}
+
+void ClusterByEBC::remove_ebc_edge(ebc_graph &graph, int edge_index)
+//2026-10-18
+{
+	for (int k=0; k<2; k++)
+	{
+		std::vector<std::pair<int, int> > &neighbor_vector = graph.adjacency_vector[graph.edge_vector[edge_index][k]];
+		for (int i=0; i<neighbor_vector.size(); i++)
+			if (neighbor_vector[i].second==edge_index)
+			{
+				neighbor_vector[i] = neighbor_vector.back();
+				neighbor_vector.pop_back();
+				break;
+			}
+	}
+	graph.edge_alive_vector[edge_index] = 0;
+	graph.no_of_alive_edges--;
+}
+
+int ClusterByEBC::ebc_components(ebc_graph &graph, std::vector<int> &component)
+/*
+2026-10-18
+	connected components over the alive edges by BFS, returns the number of components
+*/
+{
+	int no_of_vertices = graph.vertex_name_vector.size();
+	component.assign(no_of_vertices, -1);
+	std::vector<int> queue;
+	int no_of_components = 0;
+	for (int i=0; i<no_of_vertices; i++)
+	{
+		if (component[i]!=-1)
+			continue;
+		component[i] = no_of_components;
+		queue.clear();
+		queue.push_back(i);
+		for (int head=0; head<queue.size(); head++)
+		{
+			std::vector<std::pair<int, int> > &neighbor_vector = graph.adjacency_vector[queue[head]];
+			for (int j=0; j<neighbor_vector.size(); j++)
+				if (component[neighbor_vector[j].first]==-1)
+				{
+					component[neighbor_vector[j].first] = no_of_components;
+					queue.push_back(neighbor_vector[j].first);
+				}
+		}
+		no_of_components++;
+	}
+	return no_of_components;
+}
+
+void ClusterByEBC::single_source_dependency(ebc_graph &graph, int source, std::vector<double> &edge_centrality_vector, \
+	std::vector<int> &distance_vector, std::vector<std::pair<int, double> > *dependency_vector)
+/*
+2026-10-18
+	one source of Brandes' algorithm(unweighted), the dependency is added to edge_centrality_vector.
+	distance_vector gets the BFS distances from source, -1 if unreachable.
+	If dependency_vector is not NULL, it gets (edge index, dependency) of this source, to be taken out later.
+*/
+{
+	int no_of_vertices = graph.vertex_name_vector.size();
+	distance_vector.assign(no_of_vertices, -1);
+	std::vector<double> sigma(no_of_vertices, 0.0);
+	std::vector<double> delta(no_of_vertices, 0.0);
+	std::vector<int> order;
+	order.reserve(no_of_vertices);
+	if (dependency_vector)
+		dependency_vector->clear();
+	distance_vector[source] = 0;
+	sigma[source] = 1.0;
+	order.push_back(source);
+	for (int head=0; head<order.size(); head++)
+	{
+		int v = order[head];
+		std::vector<std::pair<int, int> > &neighbor_vector = graph.adjacency_vector[v];
+		for (int j=0; j<neighbor_vector.size(); j++)
+		{
+			int w = neighbor_vector[j].first;
+			if (distance_vector[w]==-1)
+			{
+				distance_vector[w] = distance_vector[v]+1;
+				order.push_back(w);
+			}
+			if (distance_vector[w]==distance_vector[v]+1)
+				sigma[w] += sigma[v];
+		}
+	}
+	for (int i=order.size()-1; i>0; i--)
+	{
+		int w = order[i];
+		std::vector<std::pair<int, int> > &neighbor_vector = graph.adjacency_vector[w];
+		for (int j=0; j<neighbor_vector.size(); j++)
+		{
+			int v = neighbor_vector[j].first;
+			if (distance_vector[v]==distance_vector[w]-1)
+			{
+				double c = sigma[v]/sigma[w]*(1.0+delta[w]);
+				edge_centrality_vector[neighbor_vector[j].second] += c;
+				if (dependency_vector)
+					dependency_vector->push_back(std::make_pair(neighbor_vector[j].second, c));
+				delta[v] += c;
+			}
+		}
+	}
+	no_of_source_traversals++;
+}
+
+void ClusterByEBC::judge_ebc_graph(ebc_graph &graph, const int &size_cutoff, const float &conn_cutoff)
+/*
+2026-10-18
+	same judgement as cut_by_betweenness_centrality(): too small, good or to be cut
+*/
+{
+	int no_of_vertices = graph.vertex_name_vector.size();
+	if (no_of_vertices<size_cutoff)
+		return;
+	float connectivity = 2.0*graph.no_of_alive_edges/(no_of_vertices*(no_of_vertices-1));
+	if (graph.no_of_alive_edges<1 || connectivity>=conn_cutoff)
+		good_ebc_graph_vector.push_back(graph);
+	else
+		cut_component(graph, size_cutoff, conn_cutoff);
+}
+
+void ClusterByEBC::cut_component(ebc_graph &graph, const int &size_cutoff, const float &conn_cutoff)
+/*
+2026-10-18
+	counterpart of cut_by_betweenness_centrality() with the options of set_ebc_option().
+	graph is connected. Edges of highest betweenness are removed until it falls apart,
+	then each component goes to judge_ebc_graph().
+*/
+{
+	int no_of_vertices = graph.vertex_name_vector.size();
+	int no_of_edges = graph.edge_vector.size();
+	//the sources
+	std::vector<int> source_vector;
+	for (int i=0; i<no_of_vertices; i++)
+		source_vector.push_back(i);
+	if (_no_of_samples>0 && _no_of_samples<no_of_vertices)
+	{
+		//partial Fisher-Yates shuffle
+		for (int i=0; i<_no_of_samples; i++)
+		{
+			int j = i + rand_r(&_random_state)%(no_of_vertices-i);
+			std::swap(source_vector[i], source_vector[j]);
+		}
+		source_vector.resize(_no_of_samples);
+	}
+	int no_of_sources = source_vector.size();
+	std::vector<double> edge_centrality_vector(no_of_edges, 0.0);
+	//distances and dependencies of each source, only used if _incremental
+	std::vector<std::vector<int> > distance_matrix(no_of_sources);
+	std::vector<std::vector<std::pair<int, double> > > dependency_matrix(no_of_sources);
+	std::vector<int> distance_vector;
+	for (int i=0; i<no_of_sources; i++)
+		if (_incremental)
+			single_source_dependency(graph, source_vector[i], edge_centrality_vector, distance_matrix[i], &dependency_matrix[i]);
+		else
+			single_source_dependency(graph, source_vector[i], edge_centrality_vector, distance_vector, NULL);
+	
+	std::vector<int> edge_index_vector;
+	std::vector<int> component;
+	while (1)
+	{
+		//the batch of edges with the highest betweenness, ties broken by the edge index
+		edge_index_vector.clear();
+		for (int e=0; e<no_of_edges; e++)
+			if (graph.edge_alive_vector[e])
+				edge_index_vector.push_back(e);
+		int no_of_edges_to_remove = std::min(_batch_size, (int)edge_index_vector.size());
+		std::partial_sort(edge_index_vector.begin(), edge_index_vector.begin()+no_of_edges_to_remove, edge_index_vector.end(), \
+			edge_centrality_greater(edge_centrality_vector));
+		edge_index_vector.resize(no_of_edges_to_remove);
+		//sources whose shortest path DAG contains a removed edge, their old dependency is taken out
+		std::vector<int> affected_source_vector;
+		if (_incremental)
+		{
+			for (int i=0; i<no_of_sources; i++)
+				for (int k=0; k<no_of_edges_to_remove; k++)
+				{
+					boost::array<int, 2> &edge_array = graph.edge_vector[edge_index_vector[k]];
+					if (abs(distance_matrix[i][edge_array[0]]-distance_matrix[i][edge_array[1]])==1)
+					{
+						affected_source_vector.push_back(i);
+						std::vector<std::pair<int, double> > &dependency_vector = dependency_matrix[i];
+						for (int j=0; j<dependency_vector.size(); j++)
+							edge_centrality_vector[dependency_vector[j].first] -= dependency_vector[j].second;
+						break;
+					}
+				}
+		}
+		for (int k=0; k<no_of_edges_to_remove; k++)
+			remove_ebc_edge(graph, edge_index_vector[k]);
+		no_of_removed_edges += no_of_edges_to_remove;
+		int no_of_components = ebc_components(graph, component);
+		if (no_of_components>1)
+		{
+			no_of_splits++;
+			std::vector<ebc_graph> ebc_graph_vector(no_of_components);
+			std::vector<int> local_index(no_of_vertices);
+			for (int i=0; i<no_of_vertices; i++)
+			{
+				ebc_graph &component_graph = ebc_graph_vector[component[i]];
+				local_index[i] = component_graph.vertex_name_vector.size();
+				component_graph.vertex_name_vector.push_back(graph.vertex_name_vector[i]);
+			}
+			for (int c=0; c<no_of_components; c++)
+			{
+				ebc_graph_vector[c].adjacency_vector.resize(ebc_graph_vector[c].vertex_name_vector.size());
+				ebc_graph_vector[c].no_of_alive_edges = 0;
+			}
+			for (int e=0; e<no_of_edges; e++)
+				if (graph.edge_alive_vector[e])
+				{
+					ebc_graph &component_graph = ebc_graph_vector[component[graph.edge_vector[e][0]]];
+					boost::array<int, 2> edge_array;
+					edge_array[0] = local_index[graph.edge_vector[e][0]];
+					edge_array[1] = local_index[graph.edge_vector[e][1]];
+					int edge_index = component_graph.edge_vector.size();
+					component_graph.edge_vector.push_back(edge_array);
+					component_graph.adjacency_vector[edge_array[0]].push_back(std::make_pair(edge_array[1], edge_index));
+					component_graph.adjacency_vector[edge_array[1]].push_back(std::make_pair(edge_array[0], edge_index));
+					component_graph.edge_alive_vector.push_back(1);
+					component_graph.no_of_alive_edges++;
+				}
+			for (int c=0; c<no_of_components; c++)
+				judge_ebc_graph(ebc_graph_vector[c], size_cutoff, conn_cutoff);
+			return;
+		}
+		if (graph.no_of_alive_edges<1)	//a single vertex, no more edges
+		{
+			judge_ebc_graph(graph, size_cutoff, conn_cutoff);
+			return;
+		}
+		//still connected, update the betweenness
+		if (_incremental)
+		{
+			for (int k=0; k<affected_source_vector.size(); k++)
+			{
+				int i = affected_source_vector[k];
+				single_source_dependency(graph, source_vector[i], edge_centrality_vector, distance_matrix[i], &dependency_matrix[i]);
+			}
+		}
+		else
+		{
+			edge_centrality_vector.assign(no_of_edges, 0.0);
+			for (int i=0; i<no_of_sources; i++)
+				single_source_dependency(graph, source_vector[i], edge_centrality_vector, distance_vector, NULL);
+		}
+	}
+}
+
+void ClusterByEBC::graph2vector(Graph &graph, std::vector<long> &vertex_vector, std::vector<long> &edge_vector)
+/*
+2026-10-18
+	graph2list() appending to vectors of vertex names and edge name pairs
+*/
+{
+	vertex_name_type vertex2name = get(vertex_name, graph);
+	std::pair<vertexIterator, vertexIterator> vp;
+	for (vp = vertices(graph); vp.first != vp.second; ++vp.first)
+		vertex_vector.push_back(get(vertex2name, *vp.first));
+	graph_traits<Graph>::edge_iterator ei, ei_end;
+	for (tie(ei,ei_end) = edges(graph); ei != ei_end; ++ei)
+	{
+		edge_vector.push_back(get(vertex2name, source(*ei, graph)));
+		edge_vector.push_back(get(vertex2name, target(*ei, graph)));
+	}
+}
+
+void ClusterByEBC::ebc_graph2vector(ebc_graph &graph, std::vector<long> &vertex_vector, std::vector<long> &edge_vector)
+/*
+2026-10-18
+	ebc_graph2list() appending to vectors
+*/
+{
+	for (int i=0; i<graph.vertex_name_vector.size(); i++)
+		vertex_vector.push_back(graph.vertex_name_vector[i]);
+	for (int e=0; e<graph.edge_vector.size(); e++)
+		if (graph.edge_alive_vector[e])
+		{
+			long vertex_name1 = graph.vertex_name_vector[graph.edge_vector[e][0]];
+			long vertex_name2 = graph.vertex_name_vector[graph.edge_vector[e][1]];
+			edge_vector.push_back(std::min(vertex_name1, vertex_name2));
+			edge_vector.push_back(std::max(vertex_name1, vertex_name2));
+		}
+}
+
+boost::python::tuple ClusterByEBC::cc_buffer()
+/*
+2026-10-18
+	the good components after run() as 4 strings of C longs:
+	(vertex_string, vertex_offset_string, edge_string, edge_offset_string).
+	Offsets(no_of_components+1 of them) count vertices and edges(pairs), same order as cc_list.
+*/
+{
+	std::vector<long> vertex_vector, edge_vector;
+	std::vector<long> vertex_offset_vector(1, 0), edge_offset_vector(1, 0);
+	std::vector<Graph>::iterator g_iterator;
+	for(g_iterator=good_subgraph_vector.begin();g_iterator!=good_subgraph_vector.end();++g_iterator)
+	{
+		graph2vector(*g_iterator, vertex_vector, edge_vector);
+		vertex_offset_vector.push_back(vertex_vector.size());
+		edge_offset_vector.push_back(edge_vector.size()/2);
+	}
+	std::vector<ebc_graph>::iterator ebc_g_iterator;
+	for(ebc_g_iterator=good_ebc_graph_vector.begin();ebc_g_iterator!=good_ebc_graph_vector.end();++ebc_g_iterator)
+	{
+		ebc_graph2vector(*ebc_g_iterator, vertex_vector, edge_vector);
+		vertex_offset_vector.push_back(vertex_vector.size());
+		edge_offset_vector.push_back(edge_vector.size()/2);
+	}
+	return boost::python::make_tuple(vector2string(vertex_vector), vector2string(vertex_offset_vector), \
+		vector2string(edge_vector), vector2string(edge_offset_vector));
+}
+
 twoListTuple ClusterByEBC::graph2list(Graph &graph)
 /*
 *09-05-05
@@ -639,6 +1091,58 @@ twoListTuple ClusterByEBC::graph2list(Graph &graph)
 	return boost::make_tuple(graph_vertex_list,graph_edge_list);
 }
 
+twoListTuple ClusterByEBC::ebc_graph2list(ebc_graph &graph)
+/*
+2026-10-18
+	graph2list() for ebc_graph, each edge in ascending order of vertex names.
+*/
+{
+	boost::python::list graph_edge_list;
+	boost::python::list graph_vertex_list;
+	for (int i=0; i<graph.vertex_name_vector.size(); i++)
+		graph_vertex_list.append(graph.vertex_name_vector[i]);
+	for (int e=0; e<graph.edge_vector.size(); e++)
+		if (graph.edge_alive_vector[e])
+		{
+			int vertex_name1 = graph.vertex_name_vector[graph.edge_vector[e][0]];
+			int vertex_name2 = graph.vertex_name_vector[graph.edge_vector[e][1]];
+			if (vertex_name1<vertex_name2)
+				graph_edge_list.append(boost::python::make_tuple(vertex_name1, vertex_name2));
+			else
+				graph_edge_list.append(boost::python::make_tuple(vertex_name2, vertex_name1));
+		}
+	return boost::make_tuple(graph_vertex_list,graph_edge_list);
+}
+
+void ClusterByEBC::output_ebc_graph(std::ofstream &outf, ebc_graph &graph)
+/*
+2026-10-18
+	output_graph() for ebc_graph
+*/
+{
+	int no_of_vertices = graph.vertex_name_vector.size();
+	outf<<"[";
+	for (int i=0; i<no_of_vertices; i++)
+	{
+		outf<<graph.vertex_name_vector[i];
+		if (i!=no_of_vertices-1)
+			outf<<", ";
+	}
+	outf<<"]\t";
+	int no_of_edges = 0;
+	outf<<"[";
+	for (int e=0; e<graph.edge_vector.size(); e++)
+		if (graph.edge_alive_vector[e])
+		{
+			no_of_edges++;
+			outf << "[" << graph.vertex_name_vector[graph.edge_vector[e][0]]
+				<< ", " << graph.vertex_name_vector[graph.edge_vector[e][1]] << "]";
+			if (no_of_edges!=graph.no_of_alive_edges)
+				outf<<", ";
+		}
+	outf<<"]"<<std::endl;
+}
+
 void ClusterByEBC::output_graph(std::ofstream &outf, Graph &graph)
 /*
 09-06-05
@@ -697,6 +1201,9 @@ void ClusterByEBC::run()
 		--graph2list()
 		or
 		--output_graph()
+2026-10-18
+	non-default set_ebc_option() goes through judge_ebc_graph() and cut_component()
+	no_of_splits etc. are reported if DEBUG or the output goes to a file.
 */
 {
 	if (_format_type==1 && _input_filename!="")
@@ -707,7 +1214,9 @@ void ClusterByEBC::run()
 			init_graph_from_file(_input_filename, g, _size_cutoff, _offset);
 		else
 		{
-			if (_format_type==3 && _input_filename=="")
+			if (_format_type==3 && _input_filename=="" && _edge_buffer_given)	//2026-10-18
+				init_graph_from_edge_array(_edge_buffer_vector.empty()?NULL:&_edge_buffer_vector[0], _edge_buffer_vector.size()/2, g);
+			else if (_format_type==3 && _input_filename=="")
 				init_graph_from_edge_list(_edge_list, g);
 			else
 			{
@@ -727,13 +1236,22 @@ void ClusterByEBC::run()
 		std::cerr<<"No. of components in graph is: "<<vector_graph.size()<<std::endl;
 	#endif
 	vector<double> edge_centrality_vector(num_edges(g));
+	bool exact = (!_incremental && _batch_size==1 && _no_of_samples==0);	//2026-10-18
 	
 	for(g_iterator=vector_graph.begin();g_iterator!=vector_graph.end();++g_iterator)
 	{
-		cut_by_betweenness_centrality(*g_iterator, edge_centrality_vector, _size_cutoff, _conn_cutoff);
+		if (exact)
+			cut_by_betweenness_centrality(*g_iterator, edge_centrality_vector, _size_cutoff, _conn_cutoff);
+		else
+		{
+			ebc_graph ebc_g = graph2ebc_graph(*g_iterator);
+			judge_ebc_graph(ebc_g, _size_cutoff, _conn_cutoff);
+		}
 	}
 	
-	if (_output_filename=="")
+	std::vector<ebc_graph>::iterator ebc_g_iterator;
+	//2026-10-18 with set_edge_buffer() and no output_filename, the result is left to cc_buffer()
+	if (_output_filename=="" && !_edge_buffer_given)
 	{
 		for(g_iterator=good_subgraph_vector.begin();g_iterator!=good_subgraph_vector.end();++g_iterator)
 		{
@@ -741,12 +1259,22 @@ void ClusterByEBC::run()
 			cc_vertex_list.append(vertex_edge_tuple.get<0>());
 			cc_list.append(vertex_edge_tuple.get<1>());
 		}
+		for(ebc_g_iterator=good_ebc_graph_vector.begin();ebc_g_iterator!=good_ebc_graph_vector.end();++ebc_g_iterator)
+		{
+			twoListTuple vertex_edge_tuple = ebc_graph2list(*ebc_g_iterator);
+			cc_vertex_list.append(vertex_edge_tuple.get<0>());
+			cc_list.append(vertex_edge_tuple.get<1>());
+		}
 	}
-	else
+	else if (_output_filename!="")
 	{		
 		std::ofstream outf(_output_filename.c_str());
 		for(g_iterator=good_subgraph_vector.begin();g_iterator!=good_subgraph_vector.end();++g_iterator)
 			output_graph(outf, *g_iterator);
+		for(ebc_g_iterator=good_ebc_graph_vector.begin();ebc_g_iterator!=good_ebc_graph_vector.end();++ebc_g_iterator)
+			output_ebc_graph(outf, *ebc_g_iterator);
+		std::cerr<<"splits: "<<no_of_splits<<", removed edges: "<<no_of_removed_edges<<\
+			", source traversals: "<<no_of_source_traversals<<std::endl;
 	}
 }
 
@@ -756,15 +1284,24 @@ BOOST_PYTHON_MODULE(cc_from_edge_list)
 	class_<cc_from_edge_list>("cc_from_edge_list")
 		.def("init_graph_from_edge_list", &cc_from_edge_list::init_graph_from_edge_list)
 		.def("run", &cc_from_edge_list::run)
+		.def("run_buffer", &cc_from_edge_list::run_buffer)
 		.def_readonly("cc_list", &cc_from_edge_list::cc_list)
 	;
 	
 	class_<ClusterByEBC, bases<cc_from_edge_list> >("ClusterByEBC")
 		.def(init<std::string, int, int, float, boost::python::optional<int, int, std::string> >())
 		.def(init<boost::python::list, int, float>())
+		.def(init<int, float>())
 		.def("run", &ClusterByEBC::run)
+		.def("set_edge_buffer", &ClusterByEBC::set_edge_buffer)
+		.def("cc_buffer", &ClusterByEBC::cc_buffer)
+		.def("set_ebc_option", &ClusterByEBC::set_ebc_option, \
+			(boost::python::arg("incremental"), boost::python::arg("batch_size"), boost::python::arg("no_of_samples"), boost::python::arg("seed")=1))
 		.def_readonly("cc_list", &ClusterByEBC::cc_list)
 		.def_readonly("cc_vertex_list", &ClusterByEBC::cc_vertex_list)
+		.def_readonly("no_of_splits", &ClusterByEBC::no_of_splits)
+		.def_readonly("no_of_removed_edges", &ClusterByEBC::no_of_removed_edges)
+		.def_readonly("no_of_source_traversals", &ClusterByEBC::no_of_source_traversals)
 	;
 }
 
@@ -780,6 +1317,9 @@ void print_usage(FILE* stream, char* program_name)
 		"\t-e ..., --min_edge_weight=...	minimum edge weight, 0(default).\n"\
 		"\t-m ..., --format_type=...	the format type, 1(gspan format, default), 2, 3\n"\
 		"\t-f ..., --offset=...	the offset into the inputfile, 0(default)\n"\
+		"\t-a, --incremental	only recompute betweenness from sources affected by the removal\n"\
+		"\t-b ..., --batch_size=...	edges removed per betweenness calculation, 1(default)\n"\
+		"\t-n ..., --no_of_samples=...	sources sampled to approximate betweenness, 0(default, all)\n"\
 		"\tFor long option, = or ' '(blank) is same.\n"\
 		"\tFormat 2 is MpiFromDatasetSignatureToPattern.py output format.\n"\
 		"\tFormat 3 is to get edge_list from python.\n");
@@ -790,7 +1330,7 @@ void print_usage(FILE* stream, char* program_name)
 int main(int argc, char* argv[])
 {
 	int next_option;
-	const char* const short_options="hi:o:s:d:e:m:f:";
+	const char* const short_options="hi:o:s:d:e:m:f:ab:n:";
 	const struct option long_options[]={
 	  {"help",0,NULL,'h'},
 	  {"input", 1, NULL, 'i'},
@@ -800,6 +1340,9 @@ int main(int argc, char* argv[])
 	  {"min_edge_weight", 1, NULL, 'e'},
 	  {"format_type",1,NULL,'m'},
 	  {"offset",1,NULL,'f'},
+	  {"incremental",0,NULL,'a'},
+	  {"batch_size",1,NULL,'b'},
+	  {"no_of_samples",1,NULL,'n'},
 	  {NULL,0,NULL,0}
 	};
 	
@@ -811,6 +1354,9 @@ int main(int argc, char* argv[])
 	int min_edge_weight = 0;
 	int format_type = 1;
 	int offset = 0;
+	int incremental = 0;
+	int batch_size = 1;
+	int no_of_samples = 0;
 
 	do
 	{
@@ -841,6 +1387,15 @@ int main(int argc, char* argv[])
 		case 'f':
 			offset = atoi(optarg);
 			break;
+		case 'a':
+			incremental = 1;
+			break;
+		case 'b':
+			batch_size = atoi(optarg);
+			break;
+		case 'n':
+			no_of_samples = atoi(optarg);
+			break;
 		case '?':
 			print_usage(stderr, program_name);
 		case -1:
@@ -856,6 +1411,7 @@ int main(int argc, char* argv[])
 	if (input_filename!="")
 	{
 		ClusterByEBC instance(input_filename, min_edge_weight, min_size, density_cutoff, format_type, offset, output_filename);
+		instance.set_ebc_option(incremental, batch_size, no_of_samples);
 		instance.run();
 	}
 	else
@@ -1,6 +1,9 @@
 /*
 *04-29-05
 *	a module to extract connected components(cc) from an edge list.
+*2026-10-18
+*	run_buffer() and ClusterByEBC::set_edge_buffer()/cc_buffer() exchange edges and components
+*	as buffers of C longs instead of lists of tuples, see buffer_util.h
 *
 */
 
@@ -22,7 +25,10 @@
 #include <fstream>	//to read input_filename
 
 #include <algorithm>	//01-09-06	for sort
+#include <cmath>	//2026-10-18 for floor
+#include <cstdlib>	//2026-10-18 for rand_r, abs
 #include <boost/array.hpp>	//01-09-06 for array in output_subgraph()
+#include "buffer_util.h"	//2026-10-18 for read_buffer, vector2string
 
 using namespace boost;
 using namespace boost::python;
@@ -45,18 +51,47 @@ typedef boost::tuple<boost::python::list, boost::python::list> twoListTuple;
 //Tue Sep  6 21:50:15 2005
 typedef boost::tokenizer<boost::char_separator<char> > char_tokenizer;
 
+//2026-10-18 a component in the approximate/incremental edge betweenness cutting(ClusterByEBC::cut_component())
+struct ebc_graph
+{
+	std::vector<int> vertex_name_vector;	//local vertex index -> vertex name
+	std::vector<boost::array<int, 2> > edge_vector;	//local vertex indices of each edge
+	std::vector<std::vector<std::pair<int, int> > > adjacency_vector;	//(neighbor, edge index) of alive edges
+	std::vector<char> edge_alive_vector;
+	int no_of_alive_edges;
+};
+
 //Mon Jan  9 22:35:20 2006	for sorting in output_subgraph()
 inline bool cmp_edge_array(boost::array<unsigned int, 2> e1, boost::array<unsigned int, 2> e2) { return e1[0] < e2[0]; }
 
+//2026-10-18 edge indices by descending betweenness, then ascending index. Betweenness is rounded to 1e-6
+//	so that the round-off of incremental updates doesn't break ties differently.
+struct edge_centrality_greater
+{
+	const std::vector<double> &_edge_centrality_vector;
+	edge_centrality_greater(const std::vector<double> &edge_centrality_vector):_edge_centrality_vector(edge_centrality_vector) {}
+	bool operator()(int e1, int e2) const
+	{
+		double c1 = floor(_edge_centrality_vector[e1]*1e6+0.5);
+		double c2 = floor(_edge_centrality_vector[e2]*1e6+0.5);
+		if (c1!=c2)
+			return c1>c2;
+		return e1<e2;
+	}
+};
+
 class cc_from_edge_list
 {
 	public:
 	void init_graph_from_edge_list(boost::python::list edge_list, Graph &graph);
+	void add_named_edge(int gene1, int gene2, Graph &graph);	//2026-10-18
+	void init_graph_from_edge_array(const long *edge_data, int no_of_edges, Graph &graph);	//2026-10-18
 	std::vector<Graph> cc2subgraph(Graph &graph);
 	boost::python::list subgraph2list(Graph &subgraph, Graph &graph);
 	std::vector<Graph> subgraph_components(Graph &subgraph, Graph &graph, std::vector<int> component, int no_of_components);
 	std::vector<Graph> graph_components(Graph &graph, std::vector<int> component, int no_of_components);
 	void run(boost::python::list edge_list);
+	boost::python::tuple run_buffer(boost::python::object edge_buffer);	//2026-10-18
 	
 	//01-09-06 following is for PostFim.cc, but later, copied these to PostFim.cc because boost::python compilation problem
 	Graph init_graph_from_edge_tuple_vector(std::vector<int> &edge_id_vector, std::vector<unsigned int > &edge_tuple_vector);
@@ -74,6 +109,7 @@ class ClusterByEBC:public cc_from_edge_list
 	public:
 	ClusterByEBC();
 	ClusterByEBC(boost::python::list edge_list, int size_cutoff, float conn_cutoff);
+	ClusterByEBC(int size_cutoff, float conn_cutoff);	//2026-10-18, edges come from set_edge_buffer()
 	ClusterByEBC(std::string input_filename, int min_edge_weight, int size_cutoff, \
 		float conn_cutoff, int format_type=1, int offset=0, std::string output_filename="");
 	~ClusterByEBC();
@@ -81,14 +117,35 @@ class ClusterByEBC:public cc_from_edge_list
 	void init_graph_from_file(const std::string &input_filename, Graph &graph, const int &size_cutoff, const int &offset);
 	void reindex_edge(Graph &graph);
 	void cut_by_betweenness_centrality(Graph &graph, vector<double> &edge_centrality_vector, const int &size_cutoff, const float &conn_cutoff);
+	void set_ebc_option(int incremental, int batch_size, int no_of_samples, unsigned int seed=1);
+	ebc_graph graph2ebc_graph(Graph &graph);
+	void remove_ebc_edge(ebc_graph &graph, int edge_index);
+	int ebc_components(ebc_graph &graph, std::vector<int> &component);
+	void single_source_dependency(ebc_graph &graph, int source, std::vector<double> &edge_centrality_vector, \
+		std::vector<int> &distance_vector, std::vector<std::pair<int, double> > *dependency_vector);
+	void judge_ebc_graph(ebc_graph &graph, const int &size_cutoff, const float &conn_cutoff);
+	void cut_component(ebc_graph &graph, const int &size_cutoff, const float &conn_cutoff);
 	void run();
+	void set_edge_buffer(boost::python::object edge_buffer);	//2026-10-18
+	boost::python::tuple cc_buffer();	//2026-10-18
+	void graph2vector(Graph &graph, std::vector<long> &vertex_vector, std::vector<long> &edge_vector);	//2026-10-18
+	void ebc_graph2vector(ebc_graph &graph, std::vector<long> &vertex_vector, std::vector<long> &edge_vector);	//2026-10-18
 	twoListTuple graph2list(Graph &graph);
+	twoListTuple ebc_graph2list(ebc_graph &graph);
 	void output_graph(std::ofstream &outf, Graph &graph);
+	void output_ebc_graph(std::ofstream &outf, ebc_graph &graph);
 
 	std::vector<Graph> good_subgraph_vector;
+	std::vector<ebc_graph> good_ebc_graph_vector;	//2026-10-18 results of cut_component()
+	//2026-10-18 statistics to compare the modes
+	int no_of_splits;	//times a component falls apart
+	int no_of_removed_edges;
+	int no_of_source_traversals;	//single-source shortest path runs in betweenness calculation
 	boost::python::list cc_vertex_list;	//09-05-05	to return the vertex_list as well
 	//input edge_list
 	boost::python::list _edge_list;
+	std::vector<long> _edge_buffer_vector;	//2026-10-18 input from set_edge_buffer()
+	bool _edge_buffer_given;
 	//options
 	private:
 	const std::string _input_filename;
@@ -98,5 +155,10 @@ class ClusterByEBC:public cc_from_edge_list
 	const float _conn_cutoff;
 	const int _format_type;
 	const int _offset;
+	//2026-10-18 see set_ebc_option()
+	int _incremental;
+	int _batch_size;
+	int _no_of_samples;
+	unsigned int _random_state;
 
 };
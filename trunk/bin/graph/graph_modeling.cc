@@ -162,11 +162,242 @@ vector<float> cor_cut_off_vector_return(double p_value_cut_off, double cor_cut_o
 }
 	
 
+cor_matrix::cor_matrix()
+{
+	no_of_genes = 0;
+	no_of_cols = 0;
+}
+
+void cor_matrix::fill_from_gene_array(vector<vf> &gene_array)
+/*
+*2026-10-18
+*	copy gene_array(graph_construct::input()) into the contiguous buffer
+*/
+{
+	no_of_genes = gene_array.size();
+	if (no_of_genes==0)
+		no_of_cols = 0;
+	else
+		no_of_cols = gene_array[0].size();
+	vector<float> expr_vector;
+	expr_vector.reserve(no_of_genes*no_of_cols);
+	for (int i=0; i<no_of_genes; i++)
+		expr_vector.insert(expr_vector.end(), gene_array[i].begin(), gene_array[i].end());
+	fill_from_expr_vector(expr_vector, no_of_genes);
+}
+
+void cor_matrix::fill_from_expr_vector(vector<float> &expr_vector, int no_of_genes_given)
+/*
+*2026-10-18
+*	expr_vector is genes concatenated one after another, NAN or 100000000 is NA(same as ind_cor()).
+*	Each gene is centered by its own mean, correlation doesn't change, but the one-pass sums
+*	in pair_sums() don't suffer cancellation from large raw intensities.
+*/
+{
+	no_of_genes = no_of_genes_given;
+	if (no_of_genes==0)
+		no_of_cols = 0;
+	else
+		no_of_cols = expr_vector.size()/no_of_genes;
+	value_vector.assign(no_of_genes*no_of_cols, 0.0);
+	valid_vector.assign(no_of_genes*no_of_cols, 1);
+	sum_vector.assign(no_of_genes, 0.0);
+	sq_sum_vector.assign(no_of_genes, 0.0);
+	no_of_valids_vector.assign(no_of_genes, 0);
+	int index;
+	double mean, value;
+	for (int i=0; i<no_of_genes; i++)
+	{
+		mean = 0.0;
+		for (int k=0; k<no_of_cols; k++)
+		{
+			index = i*no_of_cols+k;
+			if ( (expr_vector[index]==100000000) || (gsl_isnan(expr_vector[index])) )
+				valid_vector[index] = 0;
+			else
+			{
+				mean += expr_vector[index];
+				no_of_valids_vector[i]++;
+			}
+		}
+		if (no_of_valids_vector[i]>0)
+			mean /= no_of_valids_vector[i];
+		for (int k=0; k<no_of_cols; k++)
+		{
+			index = i*no_of_cols+k;
+			if (valid_vector[index])
+			{
+				value = expr_vector[index] - mean;
+				value_vector[index] = value;
+				sum_vector[i] += value;
+				sq_sum_vector[i] += value*value;
+			}
+		}
+	}
+}
+
+void cor_matrix::pair_sums(int i, int j, int &n, double &sx, double &sy, double &sxx, double &syy, double &sxy)
+/*
+*2026-10-18
+*	sums over the columns valid in both genes
+*/
+{
+	const float* x = &value_vector[i*no_of_cols];
+	const float* y = &value_vector[j*no_of_cols];
+	sxy = 0.0;
+	if (no_of_valids_vector[i]==no_of_cols && no_of_valids_vector[j]==no_of_cols)
+	{
+		//no NA in either gene, per-gene sums are good
+		n = no_of_cols;
+		sx = sum_vector[i];
+		sy = sum_vector[j];
+		sxx = sq_sum_vector[i];
+		syy = sq_sum_vector[j];
+		for (int k=0; k<no_of_cols; k++)
+			sxy += (double)x[k]*y[k];
+	}
+	else
+	{
+		const char* x_valid = &valid_vector[i*no_of_cols];
+		const char* y_valid = &valid_vector[j*no_of_cols];
+		n = 0;
+		sx = sy = sxx = syy = 0.0;
+		for (int k=0; k<no_of_cols; k++)
+		{
+			if (x_valid[k] && y_valid[k])
+			{
+				n++;
+				sx += x[k];
+				sy += y[k];
+				sxx += (double)x[k]*x[k];
+				syy += (double)y[k]*y[k];
+				sxy += (double)x[k]*y[k];
+			}
+		}
+	}
+}
+
+edge cor_from_sums(int n, double sx, double sy, double sxx, double syy, double sxy)
+/*
+*2026-10-18
+*	same convention as ind_cor(), 1.1 if either side has no variance.
+*/
+{
+	edge edge_data;
+	double xx, yy, xy;
+	edge_data.degree = n-2;
+	edge_data.significance = 0;
+	if (n<=0)
+	{
+		edge_data.value = 1.1;
+		return edge_data;
+	}
+	xx = sxx - sx*sx/n;
+	yy = syy - sy*sy/n;
+	xy = sxy - sx*sy/n;
+	if (xx<=1e-12*sxx || yy<=1e-12*syy)	//zero up to rounding error
+		edge_data.value = 1.1;
+	else
+		edge_data.value = (float)(xy/sqrt(xx*yy));
+	return edge_data;
+}
+
+edge cor_matrix::cor(int i, int j)
+/*
+*2026-10-18
+*	same as ind_cor(v1, v2, -1)
+*/
+{
+	int n;
+	double sx, sy, sxx, syy, sxy;
+	pair_sums(i, j, n, sx, sy, sxx, syy, sxy);
+	return cor_from_sums(n, sx, sy, sxx, syy, sxy);
+}
+
+edge cor_matrix::min_cor(int i, int j)
+/*
+*2026-10-18
+*	same as ind_min_cor(), but each leave-one-out correlation is O(1) given the pair sums.
+*	A left-out NA column leaves everything as is, which is the full correlation.
+*/
+{
+	int n;
+	double sx, sy, sxx, syy, sxy, x_k, y_k;
+	pair_sums(i, j, n, sx, sy, sxx, syy, sxy);
+	const float* x = &value_vector[i*no_of_cols];
+	const float* y = &value_vector[j*no_of_cols];
+	const char* x_valid = &valid_vector[i*no_of_cols];
+	const char* y_valid = &valid_vector[j*no_of_cols];
+	
+	edge edge_data_to_return;
+	edge edge_data_tmp;
+	edge_data_to_return.value = 1.1;
+	edge_data_to_return.degree = 0;
+	edge_data_to_return.significance = 0;
+	for (int k=0; k<no_of_cols; k++)
+	{
+		if (x_valid[k] && y_valid[k])
+		{
+			x_k = x[k];
+			y_k = y[k];
+			edge_data_tmp = cor_from_sums(n-1, sx-x_k, sy-y_k, sxx-x_k*x_k, syy-y_k*y_k, sxy-x_k*y_k);
+		}
+		else
+			edge_data_tmp = cor_from_sums(n, sx, sy, sxx, syy, sxy);
+		if(abs(edge_data_tmp.value)<abs(edge_data_to_return.value) && (edge_data_tmp.degree+2)>=JK_CUT_OFF)
+			edge_data_to_return = edge_data_tmp;
+	}
+	if((edge_data_to_return.degree+2)>=JK_CUT_OFF && \
+		edge_data_to_return.value >= cor_cut_off_vector[edge_data_to_return.degree-1] && edge_data_to_return.value<=1.0)
+		edge_data_to_return.significance = 1;
+	return edge_data_to_return;
+}
+
+vector<float> cor_matrix_construct(vector<float> expr_vector, int no_of_genes, bool leave_one_out, int block_size)
+/*
+*2026-10-18
+*	python interface to cor_matrix. expr_vector is genes concatenated, NA is NAN or 100000000.
+*	Returns the correlation of (i,j), i<j, at i*no_of_genes-i*(i+1)/2+j-i-1. 1.1 if not enough valid data.
+*	leave_one_out requires cor_cut_off_vector_construct() ahead, same as ind_min_cor().
+*/
+{
+	cor_matrix gene_cor_matrix;
+	gene_cor_matrix.fill_from_expr_vector(expr_vector, no_of_genes);
+	vector<float> cor_vector(no_of_genes*(no_of_genes-1)/2, 1.1);
+	if (block_size<=0)
+		block_size = no_of_genes;
+	edge edge_data;
+	int i_end, j_end, j_start;
+	for (int i_block=0; i_block<no_of_genes; i_block+=block_size)
+	{
+		i_end = min(i_block+block_size, no_of_genes);
+		for (int j_block=i_block; j_block<no_of_genes; j_block+=block_size)
+		{
+			j_end = min(j_block+block_size, no_of_genes);
+			for (int i=i_block; i<i_end; i++)
+			{
+				j_start = max(j_block, i+1);
+				for (int j=j_start; j<j_end; j++)
+				{
+					if (leave_one_out)
+						edge_data = gene_cor_matrix.min_cor(i, j);
+					else
+						edge_data = gene_cor_matrix.cor(i, j);
+					if ((edge_data.degree+2)>=JK_CUT_OFF)
+						cor_vector[i*no_of_genes-i*(i+1)/2+j-i-1] = edge_data.value;
+				}
+			}
+		}
+	}
+	return cor_vector;
+}
+
 graph_construct::graph_construct(char* outf_name, vector<int> edge_vector)
 {
 	out.open(outf_name);
 	edge_tuple_vector = edge_vector;
 	no_of_01 = 0;
+	block_size = 0;
 }
 
 graph_construct::graph_construct(char* inf_name, char* outf_name, char* g_name, double p_value_cut_off_given, \
@@ -182,6 +413,7 @@ graph_construct::graph_construct(char* inf_name, char* outf_name, char* g_name,
 	leave_one_out = leave_one_out_given;
 	//ios::app | ios::out);
 	no_of_01 = 0;
+	block_size = 0;
 	//histogram = gsl_histogram_alloc (50);
 	//gsl_histogram_set_ranges_uniform (histogram, -5.0, 5.0);
 }
@@ -406,7 +638,6 @@ void graph_construct::edge_construct(bool leave_one_out, int top_number)
 		std::cerr<<"Constructing edges...";
 	#endif
 	edge edge_data;
-	edge_string_cor top_element;
 	out<<"t\t#\t"<<graph_name<<endl;
 	for (int i=0; i<no_of_genes; i++)
 	{
@@ -416,34 +647,83 @@ void graph_construct::edge_construct(bool leave_one_out, int top_number)
 				edge_data = ind_min_cor(gene_array[i], gene_array[j]);
 			else
 				edge_data = cor(gene_array[i], gene_array[j], -1);	//leave_one_out position=-1 means no leave_one_out
-			if ((edge_data.degree+2)>=JK_CUT_OFF && edge_data.value<=1.0)	//enough valid pairs and value is under 1.0
+			edge_handle(i, j, edge_data, top_number);
+		}
+	}
+	#if defined(DEBUG)
+		std::cerr<<"Done."<<endl;
+	#endif
+}
+
+void graph_construct::edge_handle(int i, int j, edge &edge_data, int top_number)
+/*
+*2026-10-18
+*	split from edge_construct(), the cutoff or top selection of one gene pair
+*/
+{
+	edge_string_cor top_element;
+	if ((edge_data.degree+2)>=JK_CUT_OFF && edge_data.value<=1.0)	//enough valid pairs and value is under 1.0
+	{
+		if (top_number<=0)	//06-22-05	top_number<=0 means no top selection
+		{
+			if(edge_data.value >= cor_cut_off_array[edge_data.degree-1])
 			{
-				if (top_number<=0)	//06-22-05	top_number<=0 means no top selection
+				no_of_01++;
+				out<<"e\t"<<gene_labels_vector[i]<<'\t'<<gene_labels_vector[j]<<'\t'<<edge_data.value<<endl;
+			}
+		}
+		else	//06-22-05	if top_number not zero, we do top selection
+		{
+			if (edge_pq.size()<top_number)
+			{
+				no_of_01++;	//this counter is nothing
+				edge_pq.push(boost::make_tuple(gene_labels_vector[i], gene_labels_vector[j], edge_data.value));
+			}
+			else
+			{
+				top_element = edge_pq.top();
+				if (edge_data.value>top_element.get<2>())
 				{
-					if(edge_data.value >= cor_cut_off_array[edge_data.degree-1])
-					{
-						no_of_01++;
-						out<<"e\t"<<gene_labels_vector[i]<<'\t'<<gene_labels_vector[j]<<'\t'<<edge_data.value<<endl;
-					}
+					edge_pq.pop();	//throw away the smallest
+					edge_pq.push(boost::make_tuple(gene_labels_vector[i], gene_labels_vector[j], edge_data.value));
 				}
-				else	//06-22-05	if top_number not zero, we do top selection
+			}
+		}
+	}
+}
+
+void graph_construct::edge_construct_by_block(bool leave_one_out, int top_number, int block_size)
+/*
+*2026-10-18
+*	edge_construct() via cor_matrix. Gene pairs are visited tile by tile(block_size x block_size),
+*	so both tiles of genes stay in cache. Edges come out in tile order, not row order.
+*/
+{
+	#if defined(DEBUG)
+		std::cerr<<"Constructing edges by block...";
+	#endif
+	gene_cor_matrix.fill_from_gene_array(gene_array);
+	edge edge_data;
+	int i_end, j_end, j_start;
+	out<<"t\t#\t"<<graph_name<<endl;
+	for (int i_block=0; i_block<no_of_genes; i_block+=block_size)
+	{
+		i_end = min(i_block+block_size, no_of_genes);
+		for (int j_block=i_block; j_block<no_of_genes; j_block+=block_size)
+		{
+			j_end = min(j_block+block_size, no_of_genes);
+			for (int i=i_block; i<i_end; i++)
+			{
+				j_start = max(j_block, i+1);
+				for (int j=j_start; j<j_end; j++)
 				{
-					if (edge_pq.size()<top_number)
-					{
-						no_of_01++;	//this counter is nothing
-						edge_pq.push(boost::make_tuple(gene_labels_vector[i], gene_labels_vector[j], edge_data.value));
-					}
+					if (leave_one_out)
+						edge_data = gene_cor_matrix.min_cor(i, j);
 					else
-					{
-						top_element = edge_pq.top();
-						if (edge_data.value>top_element.get<2>())
-						{
-							edge_pq.pop();	//throw away the smallest
-							edge_pq.push(boost::make_tuple(gene_labels_vector[i], gene_labels_vector[j], edge_data.value));
-						}
-					}
+						edge_data = gene_cor_matrix.cor(i, j);
+					edge_handle(i, j, edge_data, top_number);
 				}
-		}
+			}
 		}
 	}
 	#if defined(DEBUG)
@@ -598,6 +878,8 @@ void graph_construct::output()
 void graph_construct::run()
 /*08-29-05
 *	deal with the case with no_of_genes==0
+*2026-10-18
+*	block_size>0 uses edge_construct_by_block()
 */
 {
 	cor_cut_off_vector = cor_cut_off_array_construct(p_value_cut_off, cor_cut_off, max_degree);
@@ -612,7 +894,10 @@ void graph_construct::run()
 	}
 	if (no_of_genes>=2)
 	{
-		edge_construct(leave_one_out, top_number_to_be_passed);	//0 means no top_number selection, non 0 means top_number selection
+		if (block_size>0)	//2026-10-18
+			edge_construct_by_block(leave_one_out, top_number_to_be_passed, block_size);
+		else
+			edge_construct(leave_one_out, top_number_to_be_passed);	//0 means no top_number selection, non 0 means top_number selection
 		output();
 	}
 	else
@@ -635,6 +920,9 @@ void print_usage(FILE* stream,int exit_code)
 		"\t\t if p_value_cut_off=0 and cor_cut_off=0, top_percentage is used to select edges.\n"\
 		"\t-d ..., --max_degree=...	maximum degree of freedom(#columns-2), 10000,(default).\n"\
 		"\t-l, --leave_one_out	leave_one_out.\n"\
+		"\t-s ..., --block_size=...	tile width of the blocked correlation engine, 0(default).\n"\
+		"\t\t0 means the old gene-pair by gene-pair edge_construct(), edges in row order.\n"\
+		"\t\t>0(64 is a good start) is faster, but edges come out tile by tile.\n"\
 		"\tFor long option, = or ' '(blank) is same.\n"\
 		"\tLine tokenizer is one space, tab, or \\r\n");
 	exit(3);
@@ -644,7 +932,7 @@ void print_usage(FILE* stream,int exit_code)
 int main(int argc, char* argv[])
 {
 	int next_option;
-	const char* const short_options="ho:n:p:c:t:d:l";
+	const char* const short_options="ho:n:p:c:t:d:ls:";
 	const struct option long_options[]={
 	  {"help",0,NULL,'h'},
 	  {"output",1,NULL,'o'},
@@ -654,6 +942,7 @@ int main(int argc, char* argv[])
 	  {"top_percentage", 1, NULL, 't'},
 	  {"max_degree", 1, NULL, 'd'},
 	  {"leave_one_out", 0, NULL, 'l'},
+	  {"block_size", 1, NULL, 's'},
 	  {NULL,0,NULL,0}
 	};
 	
@@ -665,6 +954,7 @@ int main(int argc, char* argv[])
 	float top_percentage = 0.01;
 	int max_degree = 10000;
 	bool leave_one_out=false;
+	int block_size = 0;	//tiling is opt-in, it changes the order of edges
 
 	do
 	{
@@ -695,6 +985,9 @@ int main(int argc, char* argv[])
 		case 'l':
 			leave_one_out = true;
 			break;
+		case 's':
+			block_size = atoi(optarg);
+			break;
 		case '?':
 			print_usage(stderr,-1);
 		case -1:
@@ -715,6 +1008,7 @@ int main(int argc, char* argv[])
 		
 		graph_construct instance(argv[optind], output_filename, name, p_value_cut_off, cor_cut_off, top_percentage, \
 			max_degree, leave_one_out);
+		instance.block_size = block_size;
 		instance.run();
 		/*
 		//testing
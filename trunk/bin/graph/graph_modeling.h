@@ -60,6 +60,39 @@ edge euc_dist(vf v1, vf v2);
 //05-27-05 declare to let python have the cor_cut_off_vector.
 vector<float> cor_cut_off_vector_return(double p_value_cut_off, double cor_cut_off_given);
 
+class cor_matrix
+{
+	/*
+	*2026-10-18
+	*	all genes of one dataset in one contiguous row-major buffer, NA positions zeroed and flagged in
+	*	valid_vector. Per-gene sums are precomputed, so a gene pair without NA only needs the cross product.
+	*	One pass over a pair gets its sums, every leave-one-out correlation is then derived by subtracting
+	*	one column, instead of rescanning both vectors for each left-out column like ind_min_cor().
+	*
+	*	fill_from_gene_array() or fill_from_expr_vector()
+	*	min_cor() / cor()
+	*		--pair_sums()
+	* */
+	public:
+		cor_matrix();
+		void fill_from_gene_array(vector<vf> &gene_array);
+		void fill_from_expr_vector(vector<float> &expr_vector, int no_of_genes_given);
+		void pair_sums(int i, int j, int &n, double &sx, double &sy, double &sxx, double &syy, double &sxy);
+		edge min_cor(int i, int j);
+		edge cor(int i, int j);
+		
+		int no_of_genes;
+		int no_of_cols;
+		vector<float> value_vector;
+		vector<char> valid_vector;
+		vector<double> sum_vector;
+		vector<double> sq_sum_vector;
+		vector<int> no_of_valids_vector;
+};
+
+//2026-10-18 all-pairs (leave_one_out minimum) correlation of a dataset, in the condensed upper triangle order
+vector<float> cor_matrix_construct(vector<float> expr_vector, int no_of_genes, bool leave_one_out, int block_size);
+
 class graph_construct
 {
 	/*one sequence to call
@@ -72,6 +105,12 @@ class graph_construct
 	 *			--cor
 	 *	output
 	 *
+	 *2026-10-18 block_size>0, edge_construct_by_block() replaces edge_construct()
+	 *	edge_construct_by_block
+	 *		--gene_cor_matrix.fill_from_gene_array
+	 *		--gene_cor_matrix.min_cor
+	 *		--edge_handle
+	 *
 	 * another sequence to call
 	 * 	gene_array_fill
 	 * 		--general_split
@@ -99,6 +138,8 @@ class graph_construct
 		int input(float top_percentage);
 		void edge_construct(bool leave_one_out, int top_number);	//04-30-05	flag leave_one_out to control whether leave_one_out or not.
 			//06-22-05	top_number used to get the top edges
+		void edge_construct_by_block(bool leave_one_out, int top_number, int block_size);	//2026-10-18
+		void edge_handle(int i, int j, edge &edge_data, int top_number);	//2026-10-18
 		void output();
 		edge min_cor(vf v1, vf v2);
 		edge cor(vf v1, vf v2, int position);
@@ -118,6 +159,8 @@ class graph_construct
 		int max_degree;
 		bool leave_one_out;
 		float top_percentage;
+		int block_size;	//2026-10-18	tile width for edge_construct_by_block(), 0 means edge_construct()
+		cor_matrix gene_cor_matrix;	//2026-10-18
 		
 		std::map<std::string, int > gene_label2index;	//06-22-05	start to use map<>, not hash_map<>
 		std::priority_queue<edge_string_cor, vector<edge_string_cor>, cmp_edge > edge_pq;
@@ -25,11 +25,45 @@ void johnson_sp::add_edge_sig_vector(boost::python::list edge_sig_list)
 		else
 			sig_bitset[i-2] = extract<int>(edge_sig_list[i]);
 	}
+	add_edge_sig(edge_tuple[0], edge_tuple[1], sig_bitset);
+}
+
+void johnson_sp::add_edge_sig(unsigned long gene1, unsigned long gene2, const boost::dynamic_bitset<> &sig_bitset)
+/*
+2026-10-18
+	split from add_edge_sig_vector()
+*/
+{
 	//in ascending order, edge names in *.sig_vector are actually in reverse order, due to Haiyan's remnancy
-	if (edge_tuple[0]<edge_tuple[1])
-		edge2bitset[hash_edge_name(edge_tuple[0], edge_tuple[1])] = sig_bitset;
+	if (gene1<gene2)
+		edge2bitset[hash_edge_name(gene1, gene2)] = sig_bitset;
 	else
-		edge2bitset[hash_edge_name(edge_tuple[1], edge_tuple[0])] = sig_bitset;
+		edge2bitset[hash_edge_name(gene2, gene1)] = sig_bitset;
+}
+
+int johnson_sp::add_edge_sig_block(boost::python::object edge_sig_block)
+/*
+2026-10-18
+	add_edge_sig_vector() for a whole block(rows of 2+_no_of_datasets C longs), read through the
+	buffer interface. Stops at a row starting with -1. Returns the number of rows added.
+*/
+{
+	Py_ssize_t no_of_items;
+	const long *data = read_buffer<long>(edge_sig_block, no_of_items);
+	int no_of_columns = _no_of_datasets+2;
+	int no_of_rows = no_of_items/no_of_columns;
+	int i;
+	for (i=0; i<no_of_rows; i++)
+	{
+		const long *row = data + i*no_of_columns;
+		if (row[0]==-1)
+			break;
+		boost::dynamic_bitset<> sig_bitset(_no_of_datasets);
+		for (int j=0; j<_no_of_datasets; j++)
+			sig_bitset[j] = row[j+2];
+		add_edge_sig(row[0], row[1], sig_bitset);
+	}
+	return i;
 }
 
 std::pair<Graph, std::vector<boost::dynamic_bitset<> > > johnson_sp::init_graph_from_vertex_edge_list(boost::python::list vertex_list, boost::python::list edge_list)
@@ -38,6 +72,30 @@ std::pair<Graph, std::vector<boost::dynamic_bitset<> > > johnson_sp::init_graph_
 	move the graph from input argument to return argument
 	all gene_no-related int changed to unsigned long
 	add codes to fill recurrence_bitset_vector
+2026-10-18
+	the lists are copied into arrays for init_graph_from_vertex_edge_array()
+*/
+{
+	int no_of_vertices = boost::python::extract<int>(vertex_list.attr("__len__")());
+	std::vector<long> vertex_vector(no_of_vertices);
+	for(int i=0; i<no_of_vertices; i++)
+		vertex_vector[i] = boost::python::extract<unsigned long>(vertex_list[i]);
+	int no_of_edges = boost::python::extract<int>(edge_list.attr("__len__")());
+	std::vector<long> edge_vector(2*no_of_edges);
+	for(int i=0; i<no_of_edges; i++)
+	{
+		edge_vector[2*i] = boost::python::extract<unsigned long>(edge_list[i][0]);
+		edge_vector[2*i+1] = boost::python::extract<unsigned long>(edge_list[i][1]);
+	}
+	return init_graph_from_vertex_edge_array(vertex_vector.empty()?NULL:&vertex_vector[0], no_of_vertices, \
+		edge_vector.empty()?NULL:&edge_vector[0], no_of_edges);
+}
+
+std::pair<Graph, std::vector<boost::dynamic_bitset<> > > johnson_sp::init_graph_from_vertex_edge_array(const long *vertex_data, \
+	int no_of_vertices, const long *edge_data, int no_of_edges)
+/*
+2026-10-18
+	the body of init_graph_from_vertex_edge_list(), edge_data is no_of_edges pairs of gene_no's.
 */
 {
 	#ifdef DEBUG
@@ -46,22 +104,20 @@ std::pair<Graph, std::vector<boost::dynamic_bitset<> > > johnson_sp::init_graph_
 	Graph graph;
 	std::vector<boost::dynamic_bitset<> > recurrence_bitset_vector;	//01-23-06
 	std::map<unsigned long, vertexDescriptor> geneNoMap;
-	int no_of_vertices = boost::python::extract<int>(vertex_list.attr("__len__")());
 	vertexDescriptor u, v;
 	for(int i=0; i<no_of_vertices; i++)
 	{
-		unsigned long gene_no = boost::python::extract<unsigned long>(vertex_list[i]);
+		unsigned long gene_no = vertex_data[i];
 		u = add_vertex(graph);
 		geneNoMap[gene_no] = u;
 	}
-	int no_of_edges = boost::python::extract<int>(edge_list.attr("__len__")());
 	property_map<Graph, edge_weight_t>::type weightmap = get(edge_weight, graph);
 	bool inserted;
 	edgeDescriptor e;
 	for(int i=0; i<no_of_edges; i++)
 	{
-		unsigned long gene1 = boost::python::extract<unsigned long>(edge_list[i][0]);
-		unsigned long gene2 = boost::python::extract<unsigned long>(edge_list[i][1]);
+		unsigned long gene1 = edge_data[2*i];
+		unsigned long gene2 = edge_data[2*i+1];
 		u = geneNoMap[gene1];
 		v = geneNoMap[gene2];
 		tie(e, inserted) = add_edge(u, v, graph);
@@ -76,49 +132,56 @@ std::pair<Graph, std::vector<boost::dynamic_bitset<> > > johnson_sp::init_graph_
 }
 
 
-boost::python::list johnson_sp::calculate_sp(Graph &graph)
+std::vector<unsigned char> johnson_sp::calculate_sp(Graph &graph)
 /*
 01-23-06
 	move the D from input argument to return argument
+2026-10-18
+	BFS from each vertex over a CSR form of the graph instead of johnson_all_pairs_shortest_paths().
+	return the row-major no_of_vertices X no_of_vertices distance matrix.
 */
 {
 	#ifdef DEBUG
 		std::cerr<<"Calculating SP..."<<std::endl;
 	#endif
-	boost::python::list D_matrix;
 	int no_of_vertices = num_vertices(graph);
-	std::vector<std::vector<int> > d_matrix;
-	std::vector<int> one_row;
-	for (int i=0; i<no_of_vertices; i++)
-	{
-		one_row.push_back(-1);
-	}
+	//CSR adjacency
+	std::vector<int> offset_vector(no_of_vertices+1, 0);
+	std::vector<int> neighbor_vector;
+	graph_traits<Graph>::adjacency_iterator ai, ai_end;
 	for (int i=0; i<no_of_vertices; i++)
 	{
-		d_matrix.push_back(one_row);
+		for (tie(ai, ai_end)=adjacent_vertices(i, graph); ai!=ai_end; ++ai)
+			neighbor_vector.push_back(*ai);
+		offset_vector[i+1] = neighbor_vector.size();
 	}
-	johnson_all_pairs_shortest_paths(graph, d_matrix);
-
-	//put it into python list
-	for(int i=0; i<d_matrix.size(); i++)
+	std::vector<unsigned char> d_matrix(no_of_vertices*no_of_vertices, 255);
+	std::vector<int> queue(no_of_vertices);
+	for (int source=0; source<no_of_vertices; source++)
 	{
-		boost::python::list d_row;
-		for(int j=0; j<d_matrix[i].size(); j++)
+		unsigned char *d_row = &d_matrix[source*no_of_vertices];
+		int head = 0, tail = 0;
+		d_row[source] = 0;
+		queue[tail++] = source;
+		while (head<tail)
 		{
-			#ifdef DEBUG
-				std::cerr<<d_matrix[i][j];
-			#endif
-			d_row.append(d_matrix[i][j]);
+			int u = queue[head++];
+			unsigned char next_distance = (d_row[u]<254)?d_row[u]+1:254;
+			for (int k=offset_vector[u]; k<offset_vector[u+1]; k++)
+			{
+				int v = neighbor_vector[k];
+				if (d_row[v]==255)
+				{
+					d_row[v] = next_distance;
+					queue[tail++] = v;
+				}
+			}
 		}
-		#ifdef DEBUG
-			std::cerr<<std::endl;
-		#endif
-		D_matrix.append(d_row);
 	}
 	#ifdef DEBUG
 		std::cerr<<"SP done."<<std::endl;
 	#endif
-	return D_matrix;
+	return d_matrix;
 }
 
 
@@ -127,38 +190,103 @@ boost::python::list johnson_sp::py_shortest_distance(boost::python::list vertex_
 01-23-06
 	named from run()
 	lots of changes following others
+2026-10-18
+	the python list of lists is made from calculate_sp()'s matrix
 */
 {
 	std::pair<Graph, std::vector<boost::dynamic_bitset<> > > graph_recurrence_bitset_vector;
 	graph_recurrence_bitset_vector = init_graph_from_vertex_edge_list(vertex_list, edge_list);
 	_recurrence_bitset_vector = graph_recurrence_bitset_vector.second;
-	return calculate_sp(graph_recurrence_bitset_vector.first);
+	int no_of_vertices = num_vertices(graph_recurrence_bitset_vector.first);
+	std::vector<unsigned char> d_matrix = calculate_sp(graph_recurrence_bitset_vector.first);
+	boost::python::list D_matrix;
+	for(int i=0; i<no_of_vertices; i++)
+	{
+		boost::python::list d_row;
+		for(int j=0; j<no_of_vertices; j++)
+			d_row.append(int(d_matrix[i*no_of_vertices+j]));
+		D_matrix.append(d_row);
+	}
+	return D_matrix;
 }
 
-boost::python::list johnson_sp::py_recurrence_list()
+std::string johnson_sp::py_shortest_distance_string(boost::python::list vertex_list, boost::python::list edge_list)
+/*
+2026-10-18
+	same as py_shortest_distance(), but the distance matrix comes back as a string of
+	no_of_vertices*no_of_vertices unsigned chars(row-major), array.array('B', ...) takes it directly.
+*/
+{
+	std::pair<Graph, std::vector<boost::dynamic_bitset<> > > graph_recurrence_bitset_vector;
+	graph_recurrence_bitset_vector = init_graph_from_vertex_edge_list(vertex_list, edge_list);
+	_recurrence_bitset_vector = graph_recurrence_bitset_vector.second;
+	std::vector<unsigned char> d_matrix = calculate_sp(graph_recurrence_bitset_vector.first);
+	return std::string(d_matrix.begin(), d_matrix.end());
+}
+
+boost::python::object johnson_sp::py_shortest_distance_buffer(boost::python::object vertex_buffer, boost::python::object edge_buffer)
+/*
+2026-10-18
+	py_shortest_distance_string() with the vertices and edges(pairs) in buffers of C longs,
+	e.g. array.array('l') or Numeric.Int arrays of shape (n,) and (m,2).
+	Returns the n X n unsigned char matrix(row-major) as a string.
+*/
+{
+	Py_ssize_t no_of_vertices, no_of_edge_items;
+	const long *vertex_data = read_buffer<long>(vertex_buffer, no_of_vertices);
+	const long *edge_data = read_buffer<long>(edge_buffer, no_of_edge_items);
+	std::pair<Graph, std::vector<boost::dynamic_bitset<> > > graph_recurrence_bitset_vector;
+	graph_recurrence_bitset_vector = init_graph_from_vertex_edge_array(vertex_data, no_of_vertices, edge_data, no_of_edge_items/2);
+	_recurrence_bitset_vector = graph_recurrence_bitset_vector.second;
+	std::vector<unsigned char> d_matrix = calculate_sp(graph_recurrence_bitset_vector.first);
+	return vector2string(d_matrix);
+}
+
+std::vector<float> johnson_sp::recurrence_vector()
 /*
 01-23-06
 	calculate the recurrence_list from _recurrence_bitset_vector
 
 	must be run after init_graph_from_vertex_edge_list()
+2026-10-18
+	split from py_recurrence_list()
 */
 {
 	#ifdef DEBUG
 		std::cerr<<"calculating py_recurrence_list..."<<std::endl;
 	#endif
-	boost::python::list recurrence_list;
+	std::vector<float> recurrence_vector(_no_of_datasets);
 	for (int i=0; i<_no_of_datasets; i++)
 	{
 		float recurrence = 0.0;
 		for (int j=0; j< _recurrence_bitset_vector.size(); j++)
 			recurrence += _recurrence_bitset_vector[j][i];	//watch the order of i and j
 		recurrence /= _recurrence_bitset_vector.size();	//divided by no_of_edges
-		recurrence_list.append(recurrence);
+		recurrence_vector[i] = recurrence;
 	}
+	return recurrence_vector;
+}
+
+boost::python::list johnson_sp::py_recurrence_list()
+/*
+01-23-06
+	must be run after init_graph_from_vertex_edge_list()
+*/
+{
+	std::vector<float> recurrence_vector = this->recurrence_vector();
+	boost::python::list recurrence_list;
+	for (int i=0; i<recurrence_vector.size(); i++)
+		recurrence_list.append(recurrence_vector[i]);
 	return recurrence_list;
-	#ifdef DEBUG
-		std::cerr<<"done."<<std::endl;
-	#endif
+}
+
+boost::python::object johnson_sp::py_recurrence_buffer()
+/*
+2026-10-18
+	py_recurrence_list() as a string of floats(array typecode 'f')
+*/
+{
+	return vector2string(recurrence_vector());
 }
 
 BOOST_PYTHON_MODULE(johnson_sp)
@@ -168,7 +296,11 @@ BOOST_PYTHON_MODULE(johnson_sp)
 		.def(init<int>())
 		.def("add_edge_sig_vector", &johnson_sp::add_edge_sig_vector)
 		.def("py_shortest_distance", &johnson_sp::py_shortest_distance)
+		.def("py_shortest_distance_string", &johnson_sp::py_shortest_distance_string)
+		.def("py_shortest_distance_buffer", &johnson_sp::py_shortest_distance_buffer)
+		.def("add_edge_sig_block", &johnson_sp::add_edge_sig_block)
 		.def("py_recurrence_list", &johnson_sp::py_recurrence_list)
+		.def("py_recurrence_buffer", &johnson_sp::py_recurrence_buffer)
 	;
 
 }
@@ -1,23 +1,31 @@
 /*
 *10-09-05
 *	a module to calculate the shortest path for a graph.
+*2026-10-18
+*	all-pairs shortest path by one BFS per source over a CSR adjacency(the graph is unweighted),
+*	johnson_all_pairs_shortest_paths() is not used any more.
+*	distances are kept in an unsigned char matrix, 255 means unreachable, longer paths are capped at 254.
+*2026-10-18
+*	buffer versions of the input/output(add_edge_sig_block(), py_shortest_distance_buffer(),
+*	py_recurrence_buffer()), see buffer_util.h
 *
 */
 
 #include <boost/graph/adjacency_list.hpp>	//for graph definition
 #include <boost/graph/subgraph.hpp>	//for boost::subgraph
 #include <boost/graph/graph_traits.hpp>  // for boost::graph_traits
-#include <boost/graph/johnson_all_pairs_shortest.hpp>	//for boost::johnson_all_pairs_shortest_paths()
 
 #include <boost/python.hpp>	//for python module and dict, tuple, make_tuple
 
 #include <iostream>			// for std::cout
 #include <vector>			//for vector
+#include <string>			//for string, 2026-10-18
 //01-23-06
 #include <ext/hash_map>	//for hash_map
 #include <utility>	///for pair
 #define hash_edge_name(o1, o2) ((o1<<30) + o2)
 #include <boost/dynamic_bitset.hpp> //for dynamic_bitset
+#include "buffer_util.h"	//2026-10-18 for read_buffer, vector2string
 
 using namespace boost;
 using namespace boost::python;
@@ -34,11 +42,19 @@ class johnson_sp
 	johnson_sp();	//01-23-06
 	johnson_sp(int no_of_datasets);	//01-23-06
 	void add_edge_sig_vector(boost::python::list edge_sig_list);	//01-23-06
+	void add_edge_sig(unsigned long gene1, unsigned long gene2, const boost::dynamic_bitset<> &sig_bitset);	//2026-10-18
+	int add_edge_sig_block(boost::python::object edge_sig_block);	//2026-10-18
 	
 	std::pair<Graph, std::vector<boost::dynamic_bitset<> > > init_graph_from_vertex_edge_list(boost::python::list vertex_list, boost::python::list edge_list);
-	boost::python::list calculate_sp(Graph &graph);
+	std::pair<Graph, std::vector<boost::dynamic_bitset<> > > init_graph_from_vertex_edge_array(const long *vertex_data, int no_of_vertices, \
+		const long *edge_data, int no_of_edges);	//2026-10-18
+	std::vector<unsigned char> calculate_sp(Graph &graph);
 	boost::python::list py_shortest_distance(boost::python::list vertex_list, boost::python::list edge_list);
+	std::string py_shortest_distance_string(boost::python::list vertex_list, boost::python::list edge_list);	//2026-10-18
+	boost::python::object py_shortest_distance_buffer(boost::python::object vertex_buffer, boost::python::object edge_buffer);	//2026-10-18
+	std::vector<float> recurrence_vector();	//2026-10-18
 	boost::python::list py_recurrence_list();
+	boost::python::object py_recurrence_buffer();	//2026-10-18
 	
 	__gnu_cxx::hash_map<unsigned long, boost::dynamic_bitset<> > edge2bitset;
 	const int _no_of_datasets;
@@ -6,34 +6,85 @@ Option:
 	INPUTDIR is the directory containing all the graph files in gspan format.
 	OUTPUTFILE is the file to store the merged graphs also in gspan format.
 	-s ..., --support=...	minimum support for the edge to be kept. 5(default)
+	-t ..., --type=...	0(database counter table, default), 1(in-memory dictionary),
+		2(streaming, sorted runs per file and a k-way merge)
+	-d ..., --tmp_dir=...	where type 2 puts its sorted runs, /tmp(default)
+	-b ..., --block_size=...	edges read from each run at a time during the merge, 10000(default)
 	-h, --help              show this help
 	
 Examples:
 	graph_merge.py -s 6 gph_result/sc/ gph_result/sc_mcl/mcl_gph_dataset1
+	graph_merge.py -s 6 -t 2 -d /scratch gph_result/hs/ gph_result/hs_mcl/mcl_gph_dataset1
 
 Description:
 	This program merges all the graphs in gspan format, generated by
 	graph_reorganize.py. The ouput is also in gspan format.
 	After this, either run reverse+kMax or gspan2mcl_input.py+mcl to
 	get the dense clusters.
+	
+	Type 2 packs each edge into a 64-bit key(smaller vertex in the high 32 bits), counts
+	the edges of each file in a sorted run on disk, then merges all runs. Memory is bounded
+	by the largest file plus no_of_files*block_size edges. Edges come out sorted.
 
 """
 
 
-import sys, os, re, getopt
+import sys, os, re, getopt, tempfile
+from array import array
+from heapq import heappush, heappop
 from codense.common import db_connect
 
+def pack_edge(vertex1, vertex2):
+	"""
+	2026-10-18
+		one 64-bit key for an undirected edge, smaller vertex first
+	"""
+	if vertex1 <= vertex2:
+		return (long(vertex1)<<32) | vertex2
+	else:
+		return (long(vertex2)<<32) | vertex1
+
+def unpack_edge(key):
+	"""
+	2026-10-18
+	"""
+	return (int(key>>32), int(key&0xFFFFFFFFL))
+
+def edge_run_reader(run_fname, block_size=10000):
+	"""
+	2026-10-18
+		generator of (key, count) from a run file written by graph_merge.sort_edges_of_one_file(),
+		block_size records are read at a time.
+	"""
+	inf = open(run_fname, 'rb')
+	while 1:
+		block = array('L')
+		try:
+			block.fromfile(inf, 2*block_size)
+		except EOFError:	#the last block, fromfile() keeps what's read
+			pass
+		for i in range(0, len(block)-1, 2):
+			yield (block[i], block[i+1])
+		if len(block)<2*block_size:
+			break
+	inf.close()
+
 class graph_merge:
 	'''
 	02-26-05
 		use the kjDict to reduce the memory usage, but no effect.
 	03-08-05
 		use a database table to handle 
+	2026-10-18
+		add type, tmp_dir, block_size. type 2 is the streaming merge, stream_run().
 	'''
-	def __init__(self, support, dir, ofname):
+	def __init__(self, support, dir, ofname, type=0, tmp_dir='/tmp', block_size=10000):
 		self.support = int(support)
 		self.dir = dir
 		self.of = open(ofname, 'w')
+		self.type = int(type)
+		self.tmp_dir = tmp_dir
+		self.block_size = int(block_size)
 		
 		self.hostname = 'zhoudb'
 		self.dbname = 'template1'
@@ -164,6 +215,111 @@ class graph_merge:
 		sys.stderr.write("Done\n")
 		
 	
+	def sort_edges_of_one_file(self, pathname, run_fname, get_first_block=0):
+		"""
+		2026-10-18
+			count the edges of one gspan file, write (key, count) in ascending order of key to run_fname,
+			as unsigned longs(64-bit).
+			return the lines before edges if get_first_block, '' otherwise.
+		"""
+		first_block = ''
+		key_array = array('L')
+		inf = open(pathname, 'r')
+		for line in inf:
+			if line[0] == 'e':
+				#edge here, like 'e 3807 3859 0.804645'
+				line_list = line[:-1].split()
+				key_array.append(pack_edge(int(line_list[1]), int(line_list[2])))
+			elif get_first_block:
+				first_block += line
+		inf.close()
+		key_list = key_array.tolist()
+		del key_array
+		key_list.sort()
+		run_array = array('L')
+		previous_key = None
+		for key in key_list:
+			if key == previous_key:
+				run_array[-1] += 1
+			else:
+				run_array.append(key)
+				run_array.append(1)
+				previous_key = key
+		of = open(run_fname, 'wb')
+		run_array.tofile(of)
+		of.close()
+		return first_block
+	
+	def merge_edge_runs(self, run_fname_list, support, block_size=10000):
+		"""
+		2026-10-18
+			k-way merge of the sorted runs, output edges with summed count>=support.
+			return the number of edges output.
+		"""
+		sys.stderr.write("Merging %s runs..."%len(run_fname_list))
+		run_reader_list = []
+		heap = []
+		for run_fname in run_fname_list:
+			run_reader = edge_run_reader(run_fname, block_size)
+			run_reader_list.append(run_reader)
+			for key, count in run_reader:	#first record of this run
+				heappush(heap, (key, count, len(run_reader_list)-1))
+				break
+		no_of_edges = 0
+		previous_key = None
+		recurrence = 0
+		while heap:
+			key, count, run_index = heappop(heap)
+			if key != previous_key:
+				if previous_key is not None and recurrence >= support:
+					vertex1, vertex2 = unpack_edge(previous_key)
+					self.of.write("e %d %d %d\n"%(vertex1, vertex2, recurrence))
+					no_of_edges += 1
+				previous_key = key
+				recurrence = 0
+			recurrence += count
+			for key, count in run_reader_list[run_index]:	#next record of this run
+				heappush(heap, (key, count, run_index))
+				break
+		if previous_key is not None and recurrence >= support:
+			vertex1, vertex2 = unpack_edge(previous_key)
+			self.of.write("e %d %d %d\n"%(vertex1, vertex2, recurrence))
+			no_of_edges += 1
+		sys.stderr.write("%s edges output. Done.\n"%no_of_edges)
+		return no_of_edges
+	
+	def stream_run(self):
+		"""
+		2026-10-18
+			one sorted run per file, then a k-way merge, the runs are removed afterwards.
+			
+			--sort_edges_of_one_file()
+			--merge_edge_runs()
+		"""
+		if array('L').itemsize < 8:
+			sys.stderr.write("Streaming merge needs 64-bit unsigned long.\n")
+			sys.exit(3)
+		run_dir = tempfile.mkdtemp(prefix='graph_merge_', dir=self.tmp_dir)
+		files = os.listdir(self.dir)
+		sys.stderr.write("\tTotally, %d files to be processed.\n"%len(files))
+		first_block = ''
+		run_fname_list = []
+		for i in range(len(files)):
+			f = files[i]
+			sys.stderr.write("%d/%d:\t%s\n"%(i+1,len(files),f))
+			run_fname = os.path.join(run_dir, '%s.run'%i)
+			block = self.sort_edges_of_one_file(os.path.join(self.dir, f), run_fname, i==0)
+			if i==0:
+				first_block = block
+			run_fname_list.append(run_fname)
+		#output the preceding block first
+		self.of.write(first_block)
+		self.merge_edge_runs(run_fname_list, self.support, self.block_size)
+		self.of.close()
+		for run_fname in run_fname_list:
+			os.remove(run_fname)
+		os.rmdir(run_dir)
+	
 	def old_run(self):
 		(first_block, graph_dict) = self.dstruc_loadin(self.dir)
 		self.output(first_block, graph_dict, self.support)
@@ -178,7 +334,15 @@ class graph_merge:
 		--loadin_edges()
 			--add_one_edge()
 		--output_from_db()
+		2026-10-18
+			type 1 goes to old_run(), type 2 to stream_run()
 		"""
+		if self.type == 1:
+			self.old_run()
+			return
+		elif self.type == 2:
+			self.stream_run()
+			return
 		(conn, curs) = db_connect(self.hostname, self.dbname, self.schema)
 		self.create_counter_table(curs, self.counter_table)
 		first_block = self.loadin_edges(self.dir, curs, self.counter_table)
@@ -191,22 +355,31 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "s:h", ["support=", "help"])
+		opts, args = getopt.getopt(sys.argv[1:], "s:t:d:b:h", ["support=", "type=", "tmp_dir=", "block_size=", "help"])
 	except:
 		print __doc__
 		sys.exit(2)
 	
 	support = 5
+	type = 0
+	tmp_dir = '/tmp'
+	block_size = 10000
 	for opt, arg in opts:
 		if opt in ("-s", "--support"):
 			support = int(arg)
+		elif opt in ("-t", "--type"):
+			type = int(arg)
+		elif opt in ("-d", "--tmp_dir"):
+			tmp_dir = arg
+		elif opt in ("-b", "--block_size"):
+			block_size = int(arg)
 		elif opt in ("-h", "--help"):
 			print __doc__
 			sys.exit(2)
 
 			
 	if len(args) == 2:
-		instance = graph_merge(support, args[0], args[1])
+		instance = graph_merge(support, args[0], args[1], type, tmp_dir, block_size)
 		instance.run()
 	else:
 		print __doc__
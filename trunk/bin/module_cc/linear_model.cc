@@ -1,9 +1,16 @@
 /*
 * 02-28-05 linear model fitting module for python, boost.python + gsl
 *
+* 2026-10-18 fit_groups(): batched OLS/logistic(IRLS) fitting of many groups in one call,
+*	replacing rpy's glm+summary in p_gene_lm.py. Data comes in as flat double buffers(array.array('d'),
+*	Numeric arrays, ...), read without copying. Groups are fitted with the GIL released,
+*	in parallel via OpenMP if compiled with -fopenmp.
 */
 #include <boost/python.hpp>
+#include "../graph/buffer_util.h"	//2026-10-18 read_buffer()
 #include <gsl/gsl_multifit.h>		//for gsl linear model stuff
+#include <vector>
+#include <cmath>
 using namespace boost::python;
 
 class linear_model
@@ -96,8 +103,352 @@ tuple linear_model::chisq_return()
 	return boost::python::make_tuple(chisq);
 }
 
+/*
+*2026-10-18
+*	fit_groups() and its helpers. Small dense problems(no of coefficients<=10 or so), so
+*	the normal equations are solved by Cholesky decomposition directly.
+*/
+
+struct glm_result
+{
+	bool ok;
+	bool converged;	//false if the logistic fit hit max_iterations, like glm()'s warning
+	std::vector<double> coefficient_vector;
+	std::vector<double> se_vector;
+	std::vector<double> p_value_vector;
+};
+
+bool cholesky_inverse(std::vector<double> &a, int p)
+{
+	/*
+	*2026-10-18
+	*	a is a p X p symmetric positive definite matrix(row-major), replaced by its inverse.
+	*	return false if it's singular.
+	*/
+	std::vector<double> l(p*p, 0.0);
+	for (int j=0; j<p; j++)
+	{
+		double d = a[j*p+j];
+		for (int k=0; k<j; k++)
+			d -= l[j*p+k]*l[j*p+k];
+		if (d<=1e-12*(std::fabs(a[j*p+j])+1e-300))
+			return false;
+		l[j*p+j] = std::sqrt(d);
+		for (int i=j+1; i<p; i++)
+		{
+			double s = a[i*p+j];
+			for (int k=0; k<j; k++)
+				s -= l[i*p+k]*l[j*p+k];
+			l[i*p+j] = s/l[j*p+j];
+		}
+	}
+	//inverse of l, lower triangular
+	std::vector<double> l_inv(p*p, 0.0);
+	for (int j=0; j<p; j++)
+	{
+		l_inv[j*p+j] = 1.0/l[j*p+j];
+		for (int i=j+1; i<p; i++)
+		{
+			double s = 0.0;
+			for (int k=j; k<i; k++)
+				s -= l[i*p+k]*l_inv[k*p+j];
+			l_inv[i*p+j] = s/l[i*p+i];
+		}
+	}
+	//a^-1 = l_inv^T * l_inv
+	for (int i=0; i<p; i++)
+		for (int j=0; j<=i; j++)
+		{
+			double s = 0.0;
+			for (int k=i; k<p; k++)
+				s += l_inv[k*p+i]*l_inv[k*p+j];
+			a[i*p+j] = s;
+			a[j*p+i] = s;
+		}
+	return true;
+}
+
+double log_beta_continued_fraction(double a, double b, double x)
+{
+	/*
+	*2026-10-18
+	*	continued fraction of the regularized incomplete beta function(modified Lentz)
+	*/
+	const double tiny = 1e-300;
+	double c = 1.0;
+	double d = 1.0 - (a+b)*x/(a+1.0);
+	if (std::fabs(d)<tiny)
+		d = tiny;
+	d = 1.0/d;
+	double h = d;
+	for (int m=1; m<=300; m++)
+	{
+		int m2 = 2*m;
+		double aa = m*(b-m)*x/((a+m2-1.0)*(a+m2));
+		d = 1.0 + aa*d;
+		if (std::fabs(d)<tiny)
+			d = tiny;
+		c = 1.0 + aa/c;
+		if (std::fabs(c)<tiny)
+			c = tiny;
+		d = 1.0/d;
+		h *= d*c;
+		aa = -(a+m)*(a+b+m)*x/((a+m2)*(a+m2+1.0));
+		d = 1.0 + aa*d;
+		if (std::fabs(d)<tiny)
+			d = tiny;
+		c = 1.0 + aa/c;
+		if (std::fabs(c)<tiny)
+			c = tiny;
+		d = 1.0/d;
+		double delta = d*c;
+		h *= delta;
+		if (std::fabs(delta-1.0)<1e-15)
+			break;
+	}
+	return std::log(h);
+}
+
+double incomplete_beta(double a, double b, double x)
+{
+	/*
+	*2026-10-18
+	*	regularized incomplete beta function I_x(a,b)
+	*/
+	if (x<=0.0)
+		return 0.0;
+	if (x>=1.0)
+		return 1.0;
+	double log_front = std::lgamma(a+b) - std::lgamma(a) - std::lgamma(b) + a*std::log(x) + b*std::log(1.0-x);
+	if (x<(a+1.0)/(a+b+2.0))
+		return std::exp(log_front + log_beta_continued_fraction(a, b, x))/a;
+	else
+		return 1.0 - std::exp(log_front + log_beta_continued_fraction(b, a, 1.0-x))/b;
+}
+
+double two_sided_t_p_value(double t, double df)
+{
+	//2026-10-18 P(|T|>|t|), T~t(df)
+	return incomplete_beta(df/2.0, 0.5, df/(df+t*t));
+}
+
+double two_sided_z_p_value(double z)
+{
+	//2026-10-18 P(|Z|>|z|), Z~N(0,1)
+	return std::erfc(std::fabs(z)/std::sqrt(2.0));
+}
+
+void weighted_normal_equations(const double *x_data, const double *y_data, const std::vector<double> &w,
+	int start, int end, int no_of_columns, std::vector<double> &xtwx, std::vector<double> &xtwz)
+{
+	/*
+	*2026-10-18
+	*	X^T*W*X and X^T*W*y for rows [start, end), X gets an intercept column in front.
+	*	y_data is the working response.
+	*/
+	int p = no_of_columns+1;
+	std::vector<double> row(p);
+	xtwx.assign(p*p, 0.0);
+	xtwz.assign(p, 0.0);
+	for (int i=start; i<end; i++)
+	{
+		row[0] = 1.0;
+		for (int j=0; j<no_of_columns; j++)
+			row[j+1] = x_data[(long)i*no_of_columns+j];
+		double wi = w[i-start];
+		for (int j=0; j<p; j++)
+		{
+			double wr = wi*row[j];
+			xtwz[j] += wr*y_data[i-start];
+			for (int k=0; k<=j; k++)
+				xtwx[j*p+k] += wr*row[k];
+		}
+	}
+	for (int j=0; j<p; j++)
+		for (int k=0; k<j; k++)
+			xtwx[k*p+j] = xtwx[j*p+k];
+}
+
+glm_result fit_one_group(const double *x_data, const double *y_data, int start, int end, int no_of_columns,
+	int logistic, int max_iterations, double tolerance)
+{
+	/*
+	*2026-10-18
+	*	same estimates, standard errors and p-values as R's summary(glm(y~x, family=gaussian or binomial))
+	*	gaussian: t-test with the residual variance as dispersion.
+	*	binomial: IRLS starting from mu=(y+0.5)/2 as R does, z-test.
+	*/
+	glm_result result;
+	result.ok = false;
+	result.converged = true;
+	int n = end-start;
+	int p = no_of_columns+1;
+	if (n<=p)
+		return result;
+	std::vector<double> xtwx, xtwz, w(n, 1.0), z(n), eta(n), beta(p, 0.0);
+	if (!logistic)
+	{
+		for (int i=0; i<n; i++)
+			z[i] = y_data[start+i];
+		weighted_normal_equations(x_data, &z[0], w, start, end, no_of_columns, xtwx, xtwz);
+		if (!cholesky_inverse(xtwx, p))
+			return result;
+		for (int j=0; j<p; j++)
+			for (int k=0; k<p; k++)
+				beta[j] += xtwx[j*p+k]*xtwz[k];
+		double rss = 0.0;
+		for (int i=start; i<end; i++)
+		{
+			double fitted = beta[0];
+			for (int j=0; j<no_of_columns; j++)
+				fitted += beta[j+1]*x_data[(long)i*no_of_columns+j];
+			rss += (y_data[i]-fitted)*(y_data[i]-fitted);
+		}
+		double df = n-p;
+		double dispersion = rss/df;
+		for (int j=0; j<p; j++)
+		{
+			double se = std::sqrt(dispersion*xtwx[j*p+j]);
+			result.coefficient_vector.push_back(beta[j]);
+			result.se_vector.push_back(se);
+			result.p_value_vector.push_back(two_sided_t_p_value(beta[j]/se, df));
+		}
+		result.ok = true;
+		return result;
+	}
+	//logistic
+	for (int i=0; i<n; i++)
+	{
+		double mu = (y_data[start+i]+0.5)/2.0;
+		eta[i] = std::log(mu/(1.0-mu));
+	}
+	double deviance_old = 0.0;
+	result.converged = false;
+	for (int iteration=0; iteration<max_iterations; iteration++)
+	{
+		for (int i=0; i<n; i++)
+		{
+			double mu = 1.0/(1.0+std::exp(-eta[i]));
+			double variance = mu*(1.0-mu);
+			if (variance<1e-300)
+				variance = 1e-300;
+			w[i] = variance;
+			z[i] = eta[i] + (y_data[start+i]-mu)/variance;
+		}
+		weighted_normal_equations(x_data, &z[0], w, start, end, no_of_columns, xtwx, xtwz);
+		if (!cholesky_inverse(xtwx, p))
+			return result;
+		for (int j=0; j<p; j++)
+		{
+			beta[j] = 0.0;
+			for (int k=0; k<p; k++)
+				beta[j] += xtwx[j*p+k]*xtwz[k];
+		}
+		double deviance = 0.0;
+		for (int i=0; i<n; i++)
+		{
+			eta[i] = beta[0];
+			for (int j=0; j<no_of_columns; j++)
+				eta[i] += beta[j+1]*x_data[(long)(start+i)*no_of_columns+j];
+			double y = y_data[start+i];
+			//log(1+exp(eta)) - y*eta, numerically stable
+			double log_one_plus_exp = eta[i]>0 ? eta[i]+std::log1p(std::exp(-eta[i])) : std::log1p(std::exp(eta[i]));
+			deviance += 2.0*(log_one_plus_exp - y*eta[i]);
+		}
+		if (iteration>0 && std::fabs(deviance-deviance_old)/(std::fabs(deviance)+0.1)<tolerance)
+		{
+			result.converged = true;
+			break;
+		}
+		deviance_old = deviance;
+	}
+	//standard errors at the final estimates
+	for (int i=0; i<n; i++)
+	{
+		double mu = 1.0/(1.0+std::exp(-eta[i]));
+		w[i] = mu*(1.0-mu);
+		if (w[i]<1e-300)
+			w[i] = 1e-300;
+	}
+	weighted_normal_equations(x_data, &z[0], w, start, end, no_of_columns, xtwx, xtwz);
+	if (!cholesky_inverse(xtwx, p))
+		return result;
+	for (int j=0; j<p; j++)
+	{
+		double se = std::sqrt(xtwx[j*p+j]);
+		result.coefficient_vector.push_back(beta[j]);
+		result.se_vector.push_back(se);
+		result.p_value_vector.push_back(two_sided_z_p_value(beta[j]/se));
+	}
+	result.ok = true;
+	return result;
+}
+
+list fit_groups(object x_buffer, object y_buffer, list offset_list, int no_of_columns, int logistic,
+	int no_of_threads, int max_iterations, double tolerance)
+{
+	/*
+	*2026-10-18
+	*	x_buffer: row-major doubles, no_of_columns per row, no intercept column(it's added)
+	*	y_buffer: doubles, one per row
+	*	offset_list: group i is rows [offset_list[i], offset_list[i+1])
+	*	return: a list, for each group, (coefficient_list, se_list, p_value_list, converged), intercept first,
+	*		or None if the group can't be fitted(too few rows, singular design).
+	*		converged is 0 if the logistic fit stopped at max_iterations, always 1 for the gaussian one.
+	*/
+	Py_ssize_t no_of_x, no_of_y;
+	const double *x_data = read_buffer<double>(x_buffer, no_of_x);
+	const double *y_data = read_buffer<double>(y_buffer, no_of_y);
+	if (no_of_columns<0 || no_of_x!=no_of_y*no_of_columns)
+	{
+		PyErr_SetString(PyExc_ValueError, "x_buffer size doesn't match y_buffer size * no_of_columns.");
+		throw_error_already_set();
+	}
+	int no_of_offsets = extract<int>(offset_list.attr("__len__")());
+	std::vector<int> offset_vector;
+	for (int i=0; i<no_of_offsets; i++)
+	{
+		offset_vector.push_back(extract<int>(offset_list[i]));
+		if (offset_vector[i]<0 || offset_vector[i]>no_of_y || (i>0 && offset_vector[i]<offset_vector[i-1]))
+		{
+			PyErr_SetString(PyExc_ValueError, "offset_list is not an ascending list of row numbers.");
+			throw_error_already_set();
+		}
+	}
+	int no_of_groups = no_of_offsets>0 ? no_of_offsets-1 : 0;
+	std::vector<glm_result> result_vector(no_of_groups);
+	if (no_of_threads<1)
+		no_of_threads = 1;
+	Py_BEGIN_ALLOW_THREADS
+	#pragma omp parallel for num_threads(no_of_threads) schedule(dynamic)
+	for (int i=0; i<no_of_groups; i++)
+		result_vector[i] = fit_one_group(x_data, y_data, offset_vector[i], offset_vector[i+1], no_of_columns,
+			logistic, max_iterations, tolerance);
+	Py_END_ALLOW_THREADS
+	list result_list;
+	for (int i=0; i<no_of_groups; i++)
+	{
+		if (!result_vector[i].ok)
+		{
+			result_list.append(object());
+			continue;
+		}
+		list coefficient_list, se_list, p_value_list;
+		for (int j=0; j<no_of_columns+1; j++)
+		{
+			coefficient_list.append(result_vector[i].coefficient_vector[j]);
+			se_list.append(result_vector[i].se_vector[j]);
+			p_value_list.append(result_vector[i].p_value_vector[j]);
+		}
+		result_list.append(make_tuple(coefficient_list, se_list, p_value_list, int(result_vector[i].converged)));
+	}
+	return result_list;
+}
+
 BOOST_PYTHON_MODULE(linear_model)
 {
+	def("fit_groups", fit_groups, (arg("x_buffer"), arg("y_buffer"), arg("offset_list"), arg("no_of_columns"),
+		arg("logistic")=0, arg("no_of_threads")=1, arg("max_iterations")=25, arg("tolerance")=1e-8));
 	class_<linear_model>("linear_model")
 		.def("prepare_data", &linear_model::prepare_data)
 		.def("run", &linear_model::run)
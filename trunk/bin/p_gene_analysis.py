@@ -16,6 +16,8 @@ Option:
 	-j ..., --judger_type=...	how to judge predicted functions, 0(default), 1, 2
 	-x ..., --recurrence_gap_size=...	2(default)
 	-y ..., --connectivity_gap_size=...	2(default)
+	-i ..., --go_dag_index=...	go_dag_index file from go_dag_index.py. If given, the prediction_space
+		is also output go_no group by go_no group(parent-child merged), distances from the index.
 	-r, --report	report the progress(a number)
 	-c, --commit	commit the database transaction, records down the go_no2accuracy.
 	-a ..., --accuracy_cut_off=...	the accuracy_cut_off to be based for p_value adjusting, 0(default)
@@ -115,10 +117,12 @@ class p_gene_analysis:
 		table=None, mcl_table=None, p_value_cut_off=0.01, report=0, \
 		judger_type=0, needcommit=0, gene_table='p_gene', lm_table=None, \
 		stat_table_fname=None, debug=0, accuracy_cut_off=0, gene_p_table=None,\
-		recurrence_gap_size=2, connectivity_gap_size=2):
+		recurrence_gap_size=2, connectivity_gap_size=2, go_dag_index_fname=None):
 		"""
 		03-08-05
 			p_value_cut_off=0.01, otherwise float(None) doesn't work.
+		2026-10-18
+			add go_dag_index_fname
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -139,6 +143,7 @@ class p_gene_analysis:
 		#the gap between two recurrences
 		self.recurrence_gap_size = int(recurrence_gap_size)
 		self.connectivity_gap_size = int(connectivity_gap_size)
+		self.go_dag_index_fname = go_dag_index_fname
 		
 	def init(self):	
 		#open a file
@@ -557,16 +562,18 @@ class p_gene_analysis:
 	#See log of 2005, section 'linear model overfitting' for detail.
 	###begin 
 
-	def return_go_no_group2prediction_space(self, go_no2prediction_space, curs, distance_table):
+	def return_go_no_group2prediction_space(self, go_no2prediction_space, curs, distance_table, go_dag_index_fname=None):
 		"""
 		03-06-05
 			input: go_no2prediction_space, curs
 			output: go_no_group2prediction_space
 			group the go_no2prediction_space, data of several go_nos who are parent-child
 			will be merged.
+		2026-10-18
+			go_dag_index_fname is passed to return_go_no_map()
 		"""
 		go_no_list = go_no2prediction_space.keys()
-		go_no_map = self.return_go_no_map(go_no_list, curs, distance_table)
+		go_no_map = self.return_go_no_map(go_no_list, curs, distance_table, go_dag_index_fname)
 		go_no_groups = self.dict_map2group(go_no_map)
 		go_no_group2prediction_space = {}
 		sys.stderr.write("Grouping go_no2prediction_space data...")
@@ -577,18 +584,20 @@ class p_gene_analysis:
 		sys.stderr.write("done.\n")
 		return go_no_group2prediction_space
 	
-	def return_go_no_map(self, go_no_list, curs, distance_table):
+	def return_go_no_map(self, go_no_list, curs, distance_table, go_dag_index_fname=None):
 		"""
 		03-06-05
 			input: a list of go_nos, curs
 			output: a map showing which go_no corresponds to which
 			
 			curs is used to get the go_no2term_id and nodes pairwise distance
+		2026-10-18
+			if go_dag_index_fname is given, pairwise distances come from the go_dag_index, not distance_table
 		"""
 		sys.stderr.write("Mapping go_nos...")
 		from gene_p_map_redundancy import gene_p_map_redundancy
 		from codense.common import get_go_no2term_id
-		borrowed_instance = gene_p_map_redundancy()
+		borrowed_instance = gene_p_map_redundancy(go_dag_index_fname=go_dag_index_fname)
 		go_no_map = {}
 		go_no2term_id = get_go_no2term_id(curs)
 		go_no2distance = {}
@@ -743,13 +752,13 @@ class p_gene_analysis:
 			self.overview_stats(self.stat_table_f)
 			self.go_no_accuracy(self.prediction_pair2attr, self.stat_table_f, curs)
 			self.table_output(self.stat_table_f, self.prediction_space2attr)
-			"""
-			#first grouping the data of parent-child go functions
-			distance_table = 'go.node_dist'
-			go_no_group2prediction_space = self.return_go_no_group2prediction_space(self.go_no2prediction_space, curs, distance_table)
-			#output the prediction_space go_no by go_no
-			self.prediction_space_split_output(self.stat_table_f, go_no_group2prediction_space, self.recurrence_gap_size, self.connectivity_gap_size)
-			"""
+			if self.go_dag_index_fname:	#2026-10-18 too slow with distance_table, so only with the go_dag_index
+				#first grouping the data of parent-child go functions
+				distance_table = 'go.node_dist'
+				go_no_group2prediction_space = self.return_go_no_group2prediction_space(self.go_no2prediction_space, curs, \
+					distance_table, self.go_dag_index_fname)
+				#output the prediction_space go_no by go_no
+				self.prediction_space_split_output(self.stat_table_f, go_no_group2prediction_space, self.recurrence_gap_size, self.connectivity_gap_size)
 		if self.gene_p_table:
 			self.gene_p_table_submit(curs, self.gene_p_table, self.gene_p_list)
 		if self.needcommit:
@@ -762,9 +771,9 @@ if __name__ == '__main__':
 	
 	long_options_list = ["help", "hostname=", "dbname=", "schema=", "table=", "mcl_table=", "p_value_cut_off=",\
 		"judger_type=", "report", "commit", "gene_table=", "lm_table=", "debug", "accuracy_cut_off=",\
-		"gene_p_table=",  "recurrence_gap_size=", "connectivity_gap_size="]
+		"gene_p_table=",  "recurrence_gap_size=", "connectivity_gap_size=", "go_dag_index="]
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:p:j:rcg:l:ba:n:x:y:", long_options_list)
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:t:m:p:j:rcg:l:ba:n:x:y:i:", long_options_list)
 	except:
 		print __doc__
 		sys.exit(2)
@@ -786,6 +795,7 @@ if __name__ == '__main__':
 	gene_p_table = None
 	recurrence_gap_size = 2
 	connectivity_gap_size = 2
+	go_dag_index_fname = None
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -822,6 +832,8 @@ if __name__ == '__main__':
 			recurrence_gap_size = int(arg)
 		elif opt in ("-y", "--connectivity_gap_size"):
 			connectivity_gap_size = int(arg)
+		elif opt in ("-i", "--go_dag_index"):
+			go_dag_index_fname = arg
 	
 	if len(args) == 1:
 		stat_table_fname = args[0]
@@ -829,7 +841,7 @@ if __name__ == '__main__':
 	if schema and p_value_cut_off!=None and stat_table_fname:
 		instance = p_gene_analysis(hostname, dbname, schema, table, mcl_table, p_value_cut_off,\
 			report, judger_type, commit, gene_table, lm_table, stat_table_fname, debug, \
-			accuracy_cut_off, gene_p_table, recurrence_gap_size, connectivity_gap_size)
+			accuracy_cut_off, gene_p_table, recurrence_gap_size, connectivity_gap_size, go_dag_index_fname)
 		instance.run()
 	else:
 		print __doc__
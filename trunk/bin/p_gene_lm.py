@@ -14,11 +14,14 @@ Option:
 	-l ,,,, --lm_table=...	the lm_table to store the linear_model results, needed if needcommit
 	-a ..., --accuracy_cut_off=...	0.5(default)
 	-p ..., --percentage=...	0.3(default) if accuracy_cut_off=0, use percentage to select score_cut_off
+	-y ..., --accuracy_cut_off_ls=...	comma-separated accuracy_cut_offs, like 0.5,0.6,0.7. score_cut_offs
+		of all of them are output to stdout(one accuracy curve per go_no). lm_table still takes -a.
 	-j ..., --judger_type=...	how to judge predicted functions, 0(default), 1, 2
 	-b ..., --bit_string=...	the bit_string control which parameter to be counted into regression
 		p_value, recurrence, connectivity, cluster_size, connectivity_2nd;	11111(default)
 	-n, --no_redundancy	use the pair accuracy to find score cutoff
 	-o, --logistic	logistic regression
+	-x ..., --no_of_threads=...	threads used to fit the models of all go_nos, 1(default)
 	-c, --commit	commit this database transaction
 	-r, --report	report flag
 	-u, --debug debug flag
@@ -29,6 +32,7 @@ Examples:
 	p_gene_lm.py -k sc_54 -t p_gene_repos_2_e5 -s splat_repost
 		-l p_gene_repos_2_e5_lm -j 1 -r -c >/tmp/p_gene_lm.out
 	p_gene_lm.py -k mm_oxi_stress_7t1 -f fmos_7t1g1e3d40q20s200c50z0001c8 -j 2 >/tmp/p_gene_lm.out
+	p_gene_lm.py -k sc_54 -t p_gene_repos_2_e5 -s splat_repost -j 1 -y 0.5,0.6,0.7,0.8 >/tmp/p_gene_lm.out
 	
 Description:
 	linear model:
@@ -52,9 +56,108 @@ from p_gene_analysis import prediction_space_attr
 from codense.common import *
 from numarray import *
 from Numeric import average
-from rpy import r, set_default_mode,NO_CONVERSION,BASIC_CONVERSION
+from array import array as py_array
+from module_cc.linear_model import fit_groups
+from bisect import bisect_left
 if sys.version_info[:2] < (2, 3):       #python2.2 or lower needs some extra
 	from python2_3 import *
+
+class accuracy_curve:
+	"""
+	2026-10-18
+		accuracy of predictions with score>=threshold, for every distinct score as the threshold,
+		one sort + one pass from the highest score down(suffix sums).
+		score_list: [[score, is_correct, gene_no, go_no], ...], gene_no and go_no are only used
+		if no_redundancy, where a (gene_no, go_no) pair is counted once, at its highest score.
+		is_correct==1 is correct, is_correct==0 is wrong, others are not counted.
+		
+		threshold_ls is ascending. no_of_correct_ls[i], no_of_wrong_ls[i] and accuracy_ls[i] are
+		for threshold_ls[i]. All cutoff queries afterwards are O(log(no of thresholds)).
+	"""
+	def __init__(self, score_list, no_redundancy=0):
+		score_list.sort()
+		self.score_ls = [row[0] for row in score_list]	#ascending, for percentage queries
+		self.threshold_ls = []
+		self.no_of_correct_ls = []
+		self.no_of_wrong_ls = []
+		self.accuracy_ls = []
+		prediction_pair_set = {}
+		no_of_correct = 0
+		no_of_wrong = 0
+		for i in range(len(score_list)-1, -1, -1):
+			row = score_list[i]
+			if no_redundancy:
+				prediction_pair = (row[2], row[3])
+				if prediction_pair in prediction_pair_set:
+					is_correct = -1
+				else:
+					prediction_pair_set[prediction_pair] = 1
+					is_correct = row[1]
+			else:
+				is_correct = row[1]
+			if is_correct==1:
+				no_of_correct += 1
+			elif is_correct==0:
+				no_of_wrong += 1
+			if i==0 or score_list[i-1][0]!=row[0]:	#the lowest entry of this score
+				self.threshold_ls.append(row[0])
+				self.no_of_correct_ls.append(no_of_correct)
+				self.no_of_wrong_ls.append(no_of_wrong)
+				if no_of_correct+no_of_wrong>0:
+					self.accuracy_ls.append(float(no_of_correct)/(no_of_correct+no_of_wrong))
+				else:
+					self.accuracy_ls.append(0.0)
+		self.threshold_ls.reverse()
+		self.no_of_correct_ls.reverse()
+		self.no_of_wrong_ls.reverse()
+		self.accuracy_ls.reverse()
+		#running maximum of accuracy from the lowest threshold, non-decreasing, for bisect
+		self.running_max_accuracy_ls = []
+		running_max_accuracy = -1.0
+		for accuracy in self.accuracy_ls:
+			if accuracy>running_max_accuracy:
+				running_max_accuracy = accuracy
+			self.running_max_accuracy_ls.append(running_max_accuracy)
+	
+	def get_index_by_accuracy(self, accuracy_cut_off):
+		"""
+		2026-10-18
+			index of the lowest threshold whose accuracy>=accuracy_cut_off, -1 if none.
+		"""
+		index = bisect_left(self.running_max_accuracy_ls, accuracy_cut_off)
+		if index==len(self.running_max_accuracy_ls):
+			return -1
+		return index
+	
+	def get_cut_off_by_accuracy(self, accuracy_cut_off):
+		"""
+		2026-10-18
+			the lowest score_cut_off meeting accuracy_cut_off, None if none.
+		"""
+		index = self.get_index_by_accuracy(accuracy_cut_off)
+		if index==-1:
+			return None
+		return self.threshold_ls[index]
+	
+	def get_row_by_accuracy(self, accuracy_cut_off):
+		"""
+		2026-10-18
+			[score_cut_off, no_of_correct, no_of_wrong, accuracy], None if none.
+		"""
+		index = self.get_index_by_accuracy(accuracy_cut_off)
+		if index==-1:
+			return None
+		return [self.threshold_ls[index], self.no_of_correct_ls[index], self.no_of_wrong_ls[index], self.accuracy_ls[index]]
+	
+	def get_cut_off_by_percentage(self, percentage):
+		"""
+		2026-10-18
+			same as p_gene_lm.return_score_cut_off_by_percentage()
+		"""
+		cut_off_index = int(len(self.score_ls)*percentage)
+		if cut_off_index!=0:
+			cut_off_index -= 1
+		return self.score_ls[len(self.score_ls)-1-cut_off_index]
 	
 class p_gene_lm:
 	"""
@@ -81,7 +184,8 @@ class p_gene_lm:
 	"""
 	def __init__(self, hostname=None, dbname=None, schema=None, netmine_fname=None, table=None, splat_table=None,\
 		mcl_table=None, lm_table=None, accuracy_cut_off=0, percentage=0.3, judger_type=0, bit_string='11111', min_data_points=5, \
-		no_redundancy=0, logistic=0, needcommit=0, report=0, debug=0, valid_space=20, recurrence_gap_size=2, connectivity_gap_size=2):
+		no_redundancy=0, logistic=0, needcommit=0, report=0, debug=0, valid_space=20, recurrence_gap_size=2, connectivity_gap_size=2, \
+		no_of_threads=1, accuracy_cut_off_ls=[]):
 		"""
 		03-08-05
 			add two more parameters, recurrence_gap_size and connectivity_gap_size (make them explicit)
@@ -92,6 +196,10 @@ class p_gene_lm:
 			add logistic
 		08-08-05
 			add no_redundancy
+		2026-10-18
+			add no_of_threads
+		2026-10-18
+			add accuracy_cut_off_ls
 		"""
 		self.hostname = hostname
 		self.dbname = dbname
@@ -113,6 +221,8 @@ class p_gene_lm:
 		self.report = int(report)		
 		self.debug = int(debug)
 		self.valid_space = int(valid_space)
+		self.no_of_threads = int(no_of_threads)
+		self.accuracy_cut_off_ls = map(float, accuracy_cut_off_ls)
 		#the gap between two recurrences
 		self.recurrence_gap_size = int(recurrence_gap_size)
 		self.connectivity_gap_size = int(connectivity_gap_size)
@@ -279,70 +389,61 @@ class p_gene_lm:
 			
 			--data_prepare
 			--submit
+		2026-10-18
+			fit all go_nos in one fit_groups() call(module_cc.linear_model), no more rpy.
+			Same coefficients and p-values as summary(glm(...)) of R, gaussian or binomial family.
+			go_nos whose model can't be fitted(singular) are skipped like those with too few data.
+			a logistic fit stopped at max_iterations is kept, with a warning, as R does.
 		"""
 		sys.stderr.write("Linear Model Fitting...\n")
 		go_no2lm_results = {}
 		
-		#06-30-05	setup the formula_list based on bit_string
-		coeff_name_list = ['p_value', 'recurrence', 'connectivity', 'cluster_size', 'connectivity_2nd']
-		formula_list = []
+		#06-30-05	setup the column_index_list based on bit_string
+		column_index_list = []
 		for i in range(len(bit_string)):
 			if bit_string[i] == '1':
-				formula_list.append(coeff_name_list[i])
+				column_index_list.append(i)
 		
+		#2026-10-18	stack all go_nos' data into two flat buffers, rows of go_no_list[i] start at offset_list[i]
+		go_no_list = []
+		offset_list = [0]
+		x_buffer = py_array('d')
+		y_buffer = py_array('d')
 		for (go_no,data) in go_no2prediction_space.iteritems():
 			sys.stderr.write("%s prediction entries from %s.\n"%(len(data), go_no))
-			#11-09-05 extend coeff_list and coeff_p_value_list
-			coeff_list = [0]*7	#intercept, p_value, recurrence, connectivity, cluster_size
-			coeff_p_value_list = [1]*7
-			index = 0	#06-30-05	the pointer for summary_stat
-			
 			if len(data)<=50:
 				#two few data
 				continue
-			#convert it to a 2d array
-			data = array(data)
-			"""
-			data_frame = r("d=data.frame(p_value=c(%s),recurrence=c(%s),connectivity=c(%s), is_correct=c(%s))"%(repr(list(data[:,0]))[1:-1], \
-				repr(list(data[:,1]))[1:-1], repr(list(data[:,2]))[1:-1], repr(list(data[:,3]))[1:-1]))
-			lm_result = r("lm_result=glm(is_correct~p_value+recurrence+connectivity, data=d,family=binomial)")
-			significance_dict = r("summary(lm_result)")
-			print significance_dict['coefficients']
-			"""
-			set_default_mode(NO_CONVERSION) #04-07-05
-			data_frame = r.as_data_frame({"p_value":data[:,0], "recurrence":data[:,1], "connectivity":data[:,2], \
-				"cluster_size":data[:,3], "connectivity_2nd":data[:,4], "is_correct":data[:,-1]})	#06-30-05	-1 denotes is_correct
-			if self.logistic:
-				lm_result = r.glm(r("is_correct~%s"%'+'.join(formula_list)), data=data_frame, family=r("binomial"))
-			else:
-				lm_result = r.glm(r("is_correct~%s"%'+'.join(formula_list)), data=data_frame)	#06-30-05 use formula_list
-			set_default_mode(BASIC_CONVERSION) #04-07-05
-			#04-07-05 r.summary() requires lm_result in NO_CONVERSION state
-			summary_stat = r.summary(lm_result)
+			for entry in data:
+				for i in column_index_list:
+					x_buffer.append(entry[i])
+				y_buffer.append(entry[-1])	#06-30-05	-1 denotes is_correct
+			go_no_list.append(go_no)
+			offset_list.append(len(y_buffer))
+		
+		result_list = fit_groups(x_buffer, y_buffer, offset_list, len(column_index_list), self.logistic, self.no_of_threads)
+		for k in range(len(go_no_list)):
+			go_no = go_no_list[k]
+			if result_list[k] is None:
+				sys.stderr.write("model of %s can't be fitted, skipped.\n"%go_no)
+				continue
+			coefficient_list, se_list, p_value_list, converged = result_list[k]
+			if not converged:
+				sys.stderr.write("Warning: fitting %s did not converge.\n"%go_no)	#glm.fit's warning in R
 			if self.debug:
 				print "everything about coefficients from function", go_no, "is"
-				print summary_stat['coefficients']	#p-values of coefficients
-			"""
-			#04-07-05 convert to python dictionary form
-			lm_result = lm_result.as_py()
-			coeff_list = [lm_result["coefficients"]["(Intercept)"], lm_result["coefficients"]["p_value"], \
-				lm_result["coefficients"]["recurrence"], lm_result["coefficients"]["connectivity"], \
-				lm_result["coefficients"]["cluster_size"], \
-				summary_stat['coefficients'][0][-1], summary_stat['coefficients'][1][-1],\
-				summary_stat['coefficients'][2][-1], summary_stat['coefficients'][3][-1],\
-				summary_stat['coefficients'][4][-1], 1]
-				#the last entry is score_cut_off, replaced later in get_score_cut_off()
-				#06-30-05	add corresponding p-values
-			"""
-			#06-30-05	0 in summary_stat['coefficients'] is intercept
-			coeff_list[0] = summary_stat['coefficients'][0][0]	#0 is the coefficient
-			coeff_p_value_list[0] = summary_stat['coefficients'][0][-1]	#-1 is the corresponding p-value
+				print coefficient_list, se_list, p_value_list
+			#11-09-05 extend coeff_list and coeff_p_value_list
+			coeff_list = [0]*7	#intercept, p_value, recurrence, connectivity, cluster_size
+			coeff_p_value_list = [1]*7
+			#06-30-05	0 is intercept
+			coeff_list[0] = coefficient_list[0]
+			coeff_p_value_list[0] = p_value_list[0]
 			#06-30-05	fill in other efficients based on bit_string, NOTE i+1
-			for i in range(len(bit_string)):
-				if bit_string[i] == '1':
-					index+=1
-					coeff_list[i+1] = summary_stat['coefficients'][index][0]	#0 is the coefficient
-					coeff_p_value_list[i+1] = summary_stat['coefficients'][index][-1]	#-1 is the corresponding p-value
+			for index in range(len(column_index_list)):
+				i = column_index_list[index]
+				coeff_list[i+1] = coefficient_list[index+1]
+				coeff_p_value_list[i+1] = p_value_list[index+1]
 			#11-09-05 restructure the following list
 			go_no2lm_results[go_no] = [coeff_list, coeff_p_value_list, 1]	#the last entry is score_cut_off, replaced later in get_score_cut_off()
 		sys.stderr.write("done.\n")
@@ -384,25 +485,20 @@ class p_gene_lm:
 			this is for OneParameterCutoffSeeker.py. Itself needs testing.
 			
 			--return_score_cut_off()
+		2026-10-18
+			scores are computed by get_score_list(), the cutoff comes from accuracy_curve
 		"""
 		sys.stderr.write("Getting score cutoff for accuracy_cut_off %s...\n"%(accuracy_cut_off))
 		for go_no,data in go_no2prediction_space.iteritems():
 			if go_no not in go_no2lm_results:
 				#this go_no has too few data, ignored.
 				continue
-			score_list = []
-			#11-09-05 restructure the list, go_no2lm_results[go_no]
-			coeff_list, coeff_p_value_list, score_cut_off = go_no2lm_results[go_no]
-			for entry in data:
-				#intercept + coeff1*p_value + coeff2*recurrence + coeff3*connectivity + coeff4*cluster_size + coeff5*connectivity_2nd
-				score = coeff_list[0]+ coeff_list[1]*entry[0] + coeff_list[2]*entry[1] + coeff_list[3]*entry[2] + coeff_list[4]*entry[3] + coeff_list[5]*entry[4]
-				#score, is_correct
-				score_list.append([score, entry[-1], entry[-3], entry[-2]])	#06-30-05	-1 denotes is_correct, 08-08-05 -3,-2 are gene_no,go_no.
+			score_list = self.get_score_list(data, go_no2lm_results[go_no][0])
 			if accuracy_cut_off==0:
 				score_cut_off = self.return_score_cut_off_by_percentage(score_list, percentage, go_no)
 			else:
 				score_cut_off = self.return_score_cut_off(score_list, accuracy_cut_off, go_no)
-			if score_cut_off:
+			if score_cut_off is not None:	#2026-10-18 0.0 is a real cutoff
 				#found the cutting point, append the score cutoff to the coeff_list
 				go_no2lm_results[go_no][-1] = score_cut_off
 			else:
@@ -411,6 +507,58 @@ class p_gene_lm:
 		sys.stderr.write("Done.\n")
 		return go_no2lm_results
 	
+	def get_score_list(self, data, coeff_list):
+		"""
+		2026-10-18
+			split out of get_score_cut_off()
+			data is go_no2prediction_space[go_no]
+		"""
+		score_list = []
+		for entry in data:
+			#intercept + coeff1*p_value + coeff2*recurrence + coeff3*connectivity + coeff4*cluster_size + coeff5*connectivity_2nd
+			score = coeff_list[0]+ coeff_list[1]*entry[0] + coeff_list[2]*entry[1] + coeff_list[3]*entry[2] + coeff_list[4]*entry[3] + coeff_list[5]*entry[4]
+			#score, is_correct
+			score_list.append([score, entry[-1], entry[-3], entry[-2]])	#06-30-05	-1 denotes is_correct, 08-08-05 -3,-2 are gene_no,go_no.
+		return score_list
+	
+	def get_score_cut_off_ls(self, go_no2prediction_space, go_no2lm_results, accuracy_cut_off_ls):
+		"""
+		2026-10-18
+			one accuracy_curve per go_no, answering all accuracy_cut_offs in accuracy_cut_off_ls.
+			output: go_no2score_cut_off_ls, go_no:[score_cut_off for each accuracy_cut_off]
+				1e10 if the accuracy_cut_off can't be met, like get_score_cut_off()
+		"""
+		sys.stderr.write("Getting score cutoffs for %s accuracy_cut_offs...\n"%(len(accuracy_cut_off_ls)))
+		go_no2score_cut_off_ls = {}
+		for go_no,data in go_no2prediction_space.iteritems():
+			if go_no not in go_no2lm_results:
+				continue
+			score_list = self.get_score_list(data, go_no2lm_results[go_no][0])
+			accuracy_curve_instance = accuracy_curve(score_list, self.no_redundancy)
+			score_cut_off_ls = []
+			for accuracy_cut_off in accuracy_cut_off_ls:
+				score_cut_off = accuracy_curve_instance.get_cut_off_by_accuracy(accuracy_cut_off)
+				if score_cut_off is not None:
+					score_cut_off_ls.append(score_cut_off)
+				else:
+					score_cut_off_ls.append(1e10)
+			go_no2score_cut_off_ls[go_no] = score_cut_off_ls
+		sys.stderr.write("Done.\n")
+		return go_no2score_cut_off_ls
+	
+	def score_cut_off_ls_output(self, outf, go_no2score_cut_off_ls, accuracy_cut_off_ls):
+		"""
+		2026-10-18
+			one row per go_no, one column per accuracy_cut_off
+		"""
+		sys.stderr.write("Outputting score cutoffs...")
+		writer = csv.writer(outf, delimiter='\t')
+		writer.writerow(['go_no']+accuracy_cut_off_ls)
+		for go_no, score_cut_off_ls in go_no2score_cut_off_ls.iteritems():
+			writer.writerow([go_no]+score_cut_off_ls)
+		del writer
+		sys.stderr.write("done.\n")
+	
 	def return_score_cut_off(self, score_list, accuracy_cut_off, go_no):
 		"""
 		03-27-05
@@ -418,75 +566,18 @@ class p_gene_lm:
 			1. use the bicut method to speed up the score_cut_off searching
 			2. judge self.no_redundancy
 				get_pair_accuracy()
+		2026-10-18
+			replace the bicut with accuracy_curve, the lowest score whose accuracy>=accuracy_cut_off.
+			None if no score meets it.
 		"""
 		sys.stderr.write("\tReturning score_cut_off for go %d..."%(go_no))
-		#default no score_cut_off
-		score_cut_off = None
-		score_list.sort()
-		if self.debug:
-			print "score\tis_correct"
-			for score_tuple in score_list:
-				print "%s\t%s"%(score_tuple[0], score_tuple[1])
-		#convert to a 2d array, they have the same indices
-		score_array = array(score_list)
-		previous_score = None
-		no_of_known_predictions = len(score_array)
+		accuracy_curve_instance = accuracy_curve(score_list, self.no_redundancy)
 		if self.debug:
-			print "score\tis_correct_array\ttotal\taccuracy"
-		#08-08-05 	use the bicut method to speed up
-		gap = 1
-		lower = 0
-		upper = len(score_array)
-		list_index = upper/2
-		while gap>0.001:
-			score = score_array[list_index,0]
-			previous_list_index = list_index
-			if self.no_redundancy:	#08-08-05
-				accuracy = self.get_pair_accuracy(score_array[list_index:])
-			else:
-				correct_array = score_array[:,1][list_index:]
-				accuracy = sum(correct_array)/float(len(correct_array))
-				if self.debug:
-					sys.stderr.write("correct_array(%s, length): %s\n"%(len(correct_array), repr(correct_array)))
-			if self.debug:
-				print "list_index: %s; %s\t%s"%(list_index, score, accuracy)
-				raw_input("Continue:(Y/n)?")
-			gap = abs(accuracy-accuracy_cut_off)
-			if accuracy>=accuracy_cut_off:
-				upper = list_index
-				list_index = (list_index + lower)/2
-			else:
-				lower = list_index
-				list_index = (upper + list_index)/2
-			if list_index == previous_list_index:	#convergence failure
-				break
-		
-		score_cut_off = score
-		"""
-		#calculate the accuracy from the low score cutoff to high score cutoff, once >= accuracy_cut_off, break
-		for i in range(len(score_array)):
-			score = score_array[i,0]
-			if score == previous_score:
-				#same score, previous one doesn't meet the cutoff, this one won't either.
-				continue
-			else:
-				#this score becomes previous_score for the next score
-				previous_score = score
-				if self.no_redundancy:	#08-08-05
-					accuracy = self.get_pair_accuracy(score_array[i:])
-				else:
-					#count the is_correct==1 entries from i-th row, and divide it by (no_of_known_predictions-i+1)
-					correct_array = score_array[:,1][i:]
-					accuracy = sum(correct_array)/float(len(correct_array))
-					if self.debug:
-						sys.stderr.write("correct_array(%s, length): %s\n"%(len(correct_array), repr(correct_array)))
-				if self.debug:
-					print "%s\t%s"%(score, accuracy)
-					raw_input("Continue:(Y/n)?")
-				if accuracy >= accuracy_cut_off:
-					score_cut_off = score
-					break
-		"""
+			print "score\tno_of_correct\tno_of_wrong\taccuracy"
+			for i in range(len(accuracy_curve_instance.threshold_ls)):
+				print "%s\t%s\t%s\t%s"%(accuracy_curve_instance.threshold_ls[i], accuracy_curve_instance.no_of_correct_ls[i], \
+					accuracy_curve_instance.no_of_wrong_ls[i], accuracy_curve_instance.accuracy_ls[i])
+		score_cut_off = accuracy_curve_instance.get_cut_off_by_accuracy(accuracy_cut_off)
 		sys.stderr.write("Done.\n")
 		return score_cut_off
 	
@@ -508,21 +599,14 @@ class p_gene_lm:
 	def return_score_cut_off_by_percentage(self, score_list, percentage, go_no):
 		"""
 		06-30-05
+		2026-10-18
+			use accuracy_curve, the rough accuracy is now the one of the score_cut_off
 		"""
 		sys.stderr.write("\tReturning score_cut_off for go %s based on percentage %s...\n"%(go_no, percentage))
-		#default no score_cut_off
-		score_cut_off = None
-		score_list.sort()
-		score_list.reverse()	#####different from return_score_cut_off. descending order
-		cut_off_index = int(len(score_list)*percentage)
-		if cut_off_index!=0:
-			cut_off_index -= 1	#index starts from 0, not like counting
-		score_cut_off = score_list[cut_off_index][0]
-		#convert to a 2d array, they have the same indices
-		score_array = array(score_list)
-		correct_array = score_array[:,1][:cut_off_index]
-		accuracy = sum(correct_array)/float(len(correct_array))
-		sys.stderr.write("\tThe rough accuracy for percentage %s is %s.\n"%(percentage, accuracy))
+		accuracy_curve_instance = accuracy_curve(score_list, self.no_redundancy)
+		score_cut_off = accuracy_curve_instance.get_cut_off_by_percentage(percentage)
+		index = bisect_left(accuracy_curve_instance.threshold_ls, score_cut_off)
+		sys.stderr.write("\tThe rough accuracy for percentage %s is %s.\n"%(percentage, accuracy_curve_instance.accuracy_ls[index]))
 		sys.stderr.write("Done.\n")
 		return score_cut_off
 		
@@ -600,6 +684,8 @@ class p_gene_lm:
 				--return_score_cut_off()
 					--get_pair_accuracy()
 			--lm_results_output()
+			--get_score_cut_off_ls()	(if accuracy_cut_off_ls)
+			--score_cut_off_ls_output()
 			--submit()
 		
 		"""
@@ -621,6 +707,9 @@ class p_gene_lm:
 		self.lm_results_output(sys.stdout, go_no2lm_results)
 		go_no2lm_results = self.get_score_cut_off(self.go_no2prediction_space, go_no2lm_results, self.accuracy_cut_off, self.percentage)
 		self.lm_results_output(sys.stdout, go_no2lm_results)
+		if self.accuracy_cut_off_ls:	#2026-10-18
+			go_no2score_cut_off_ls = self.get_score_cut_off_ls(self.go_no2prediction_space, go_no2lm_results, self.accuracy_cut_off_ls)
+			self.score_cut_off_ls_output(sys.stdout, go_no2score_cut_off_ls, self.accuracy_cut_off_ls)
 		if self.needcommit:
 			self.submit(curs, self.lm_table, go_no2lm_results)
 			curs.execute("end")
@@ -630,10 +719,10 @@ if __name__ == '__main__':
 		print __doc__
 		sys.exit(2)
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:f:t:s:m:l:a:p:j:b:nocru", ["help", "hostname=", \
+		opts, args = getopt.getopt(sys.argv[1:], "hz:d:k:f:t:s:m:l:a:p:y:j:b:nox:cru", ["help", "hostname=", \
 			"dbname=", "schema=", "netmine_fname=", "table=", "splat_table=", "mcl_table=",  "lm_table=", \
-			"accuracy_cut_off=", "percentage=", "judger_type=", "bit_string=", "no_redundancy", \
-			"logistic", "commit", "report", "debug"])
+			"accuracy_cut_off=", "percentage=", "accuracy_cut_off_ls=", "judger_type=", "bit_string=", "no_redundancy", \
+			"logistic", "no_of_threads=", "commit", "report", "debug"])
 	except:
 		print __doc__
 		sys.exit(2)
@@ -648,10 +737,12 @@ if __name__ == '__main__':
 	lm_table = None
 	accuracy_cut_off = 0.5
 	percentage = 0.3
+	accuracy_cut_off_ls = []
 	judger_type = 0
 	bit_string = '11111'
 	no_redundancy = 0
 	logistic = 0
+	no_of_threads = 1
 	commit = 0
 	report = 0
 	debug = 0
@@ -685,6 +776,8 @@ if __name__ == '__main__':
 			accuracy_cut_off = float(arg)
 		elif opt in ("-p", "--percentage"):
 			percentage = float(arg)
+		elif opt in ("-y", "--accuracy_cut_off_ls"):
+			accuracy_cut_off_ls = map(float, arg.split(','))
 		elif opt in ("-j", "--judger_type"):
 			judger_type = int(arg)
 		elif opt in ("-b", "--bit_string"):
@@ -693,6 +786,8 @@ if __name__ == '__main__':
 			no_redundancy = 1
 		elif opt in ("-o", "--logistic"):
 			logistic = 1
+		elif opt in ("-x", "--no_of_threads"):
+			no_of_threads = int(arg)
 		elif opt in ("-c", "--commit"):
 			commit = 1
 		elif opt in ("-r", "--report"):
@@ -709,7 +804,8 @@ if __name__ == '__main__':
 	if schema and table and splat_table and mcl_table:
 		instance = p_gene_lm(hostname, dbname, schema, netmine_fname, table, splat_table, \
 			mcl_table, lm_table, accuracy_cut_off, percentage, judger_type, bit_string, min_data_points, \
-			no_redundancy, logistic, commit, report, debug, valid_space, recurrence_gap_size, connectivity_gap_size)
+			no_redundancy, logistic, commit, report, debug, valid_space, recurrence_gap_size, connectivity_gap_size, \
+			no_of_threads, accuracy_cut_off_ls)
 		instance.run()
 	else:
 		print __doc__
@@ -8,30 +8,57 @@ Option:
 	FILE is the file to store the resultant triplets or quadruplets.
 	-q, --quadruplets	search for the quadruplets, default is triplets
 	-z, --gzipped	FILE will be gzipped(to save space)
+	-B, --binary	FILE is in binary format(see triplet_record.py), default is text
+	-u, --dedup	drop duplicate triplets within one graph before writing
 	-h, --help              show this help
 	
 Examples:
 	triplet_construct.py gph_result/sc_yh60_type0 pickle/triplets.gz
 	triplet_construct.py -q gph_result/sc_yh60_type0 pickle/quadruplets.gz
+	triplet_construct.py -q -B -u gph_result/sc_yh60_type0 pickle/quadruplets.bin
 	
 Description:
-.
+.	Vertices within a triplet/quadruplet are in ascending order.
+	A graph with an edge listed twice(like 'e 1 2' and 'e 2 1') yields the same
+	triplet more than once, -u keeps only one of them.
 """
 
-import pickle,sys,os,gzip,getopt
+import pickle,sys,os,getopt
+from triplet_record import open_triplet_file, triplet_writer
 
 class triplet_construct:
-	def __init__(self, of, quadruplets=0):
+	"""
+	2026-10-18
+		records go through a triplet_writer. add binary, dedup.
+	"""
+	def __init__(self, of, quadruplets=0, binary=0, dedup=0):
 		self.local_vertex_dict = {}
 		self.local_duplet_dict = {}
 		self.outf = of
 		self.quadruplets = int(quadruplets)
+		self.writer = triplet_writer(of, binary)
+		self.dedup = int(dedup)
+		self.local_triplet_dict = {}
 
 	def init(self):
 		self.local_vertex_dict = {}
 		#sort of a linked list(see log)
 		self.local_duplet_dict = {}
 		#a graph dictionary
+		self.local_triplet_dict = {}
+		#triplets already written for this graph, used if dedup
+	
+	def output(self, triplet):
+		"""
+		2026-10-18
+			return 1 if written, 0 if it's a duplicate(only if dedup)
+		"""
+		if self.dedup:
+			if triplet in self.local_triplet_dict:
+				return 0
+			self.local_triplet_dict[triplet] = 1
+		self.writer.write(triplet)
+		return 1
 		
 	def parse(self, inf):
 		#loop below initilizes local_duplet_dict & local_vertex_dict.
@@ -72,8 +99,7 @@ class triplet_construct:
 					if self.local_duplet_dict.has_key((duplet[0], duplet[1])):
 						#sys.stderr.write('triplet: %s\n'%repr(triplet))
 						#sys.stderr.write('duplet: %s\n'%repr(duplet))
-						self.outf.write('%d,%d,%d\n'%(triplet[0],triplet[1],triplet[2],))
-						triplets_count += 1
+						triplets_count += self.output((triplet[0],triplet[1],triplet[2]))
 		sys.stderr.write('\tTotal triplets: %d\n'%triplets_count)
 
 	def local_quadruplet_construct_to_file(self):
@@ -90,8 +116,7 @@ class triplet_construct:
 						#sys.stderr.write('duplet: %s\n'%repr(duplet))
 						for k in range(j+1, no_of_neighbours):
 							if (neighbour_list[i], neighbour_list[k]) in self.local_duplet_dict and (neighbour_list[j], neighbour_list[k]) in self.local_duplet_dict:
-								self.outf.write('%d,%d,%d,%d\n'%(vertex, neighbour_list[i], neighbour_list[j], neighbour_list[k]))
-								quadruplets_count += 1
+								quadruplets_count += self.output((vertex, neighbour_list[i], neighbour_list[j], neighbour_list[k]))
 		sys.stderr.write('\tTotal quadruplets: %d\n'%quadruplets_count)
 
 	def run(self, inf):
@@ -102,14 +127,14 @@ class triplet_construct:
 		else:
 			self.local_triplet_construct_to_file()
 
-def triplet_batch(dir, ofname, quadruplets, gzipped):
+	def close(self):
+		self.writer.close()
+
+def triplet_batch(dir, ofname, quadruplets, gzipped, binary=0, dedup=0):
 	files = os.listdir(dir)
 	sys.stderr.write("\tTotally, %d files to be processed.\n"%len(files))
-	if gzipped == 1:
-		of = gzip.open(ofname, 'w')
-	else:
-		of = open(ofname, 'w')
-	instance = triplet_construct(of, quadruplets)
+	of = open_triplet_file(ofname, 'w', gzipped)
+	instance = triplet_construct(of, quadruplets, binary, dedup)
 
 	for f in files:
 		pathname = os.path.join(dir, f)
@@ -117,6 +142,8 @@ def triplet_batch(dir, ofname, quadruplets, gzipped):
 		inf = open(pathname, 'r')
 		instance.run(inf)
 		inf.close()
+	instance.close()
+	of.close()
 		
 
 
@@ -126,13 +153,15 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "hqz", ["help", "quadruplets", "gzipped"])
+		opts, args = getopt.getopt(sys.argv[1:], "hqzBu", ["help", "quadruplets", "gzipped", "binary", "dedup"])
 	except:
 		print __doc__
 		sys.exit(2)
 	
 	gzipped = 0
 	quadruplets = 0
+	binary = 0
+	dedup = 0
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -141,10 +170,13 @@ if __name__ == '__main__':
 			quadruplets = 1
 		elif opt in ("-z", "--gzipped"):
 			gzipped = 1
-
+		elif opt in ("-B", "--binary"):
+			binary = 1
+		elif opt in ("-u", "--dedup"):
+			dedup = 1
 
 	if len(args) == 2:
-		triplet_batch(args[0], args[1], quadruplets, gzipped)
+		triplet_batch(args[0], args[1], quadruplets, gzipped, binary, dedup)
 	else:
 		print __doc__
 		sys.exit(2)
@@ -3,28 +3,81 @@
 Usage: triplet_counting.py [OPTION] FILE TRIPLET_DIR
 
 Option:
-	FILE	the file outputted by triplet_construct.py. '-z' specifies gzipped or not.
+	FILE	the file outputted by triplet_construct.py, text or binary. '-z' specifies gzipped or not.
 	TRIPLET_DIR	the directory to hold the 39 files.
 	-t ..., --threshhold=...,	Memory threshhold. Specifies #triplets to be processed
 		in one run. Default is 1.6e7
 	-b ..., --bufferdir=...,	the directory to store the bucketing files
 		at least allow space 2 times as large as FILE, default is '/tmp'
 	-z, --gzipped	FILE is in gzipped(to save space) format
+	-y ..., --type=...	0(hash-partitioned buckets, default), 1(old multi-pass)
+	-p ..., --no_of_buckets=...	#bucket files for type 0, 64(default)
+	-n ..., --no_of_processes=...	#processes counting buckets in parallel, 1(default)
+	-B, --binary	type 0 writes the 39 files in binary format(see triplet_record.py)
 	-h, --help	show this help
 	
 Examples:
 	triplet_counting.py -t 2.0e7 pickle/triplets gph_result/dir_39
 	triplet_counting.py -z -b /usr/local/src pickle/quadruplets.gz gph_result/dir_39
+	triplet_counting.py -z -p 128 -n 4 pickle/quadruplets.gz gph_result/dir_39
 	
 Description:
 .	It doesn't matter FILE is triplets or quadruplets.
+	Type 0 reads FILE once, hashes each triplet into one of no_of_buckets files in
+	bufferdir, stored as packed unsigned ints. The same triplet always lands in the
+	same bucket, so each bucket is counted on its own. A bucket holding more than
+	threshhold triplets is split again with another hash seed.
+	Type 1 rewrites the remaining triplets between two buffer files, keeping
+	threshhold distinct ones in memory per pass. It only takes text FILE.
 """
 
 import pickle,sys,os,gzip,getopt
+from array import array
+from triplet_record import open_triplet_file, raw_record_reader, triplet_reader, triplet_writer
+
+def triplet_bucket_writer(fname, block_size=100000):
+	"""
+	2026-10-18
+		buffers packed triplets and appends them to fname as unsigned ints
+	"""
+	class writer:
+		def __init__(self):
+			self.buffer = array('I')
+			self.no_of_records = 0
+		
+		def write(self, triplet):
+			self.buffer.extend(triplet)
+			self.no_of_records += 1
+			if self.no_of_records%block_size == 0:
+				self.flush()
+		
+		def flush(self):
+			if self.buffer:
+				of = open(fname, 'ab')
+				self.buffer.tofile(of)
+				of.close()
+				self.buffer = array('I')
+	return writer()
+
+def triplet_bucket_reader(fname, record_width, block_size=100000):
+	"""
+	2026-10-18
+		generator of triplets(int tuples) from a bucket file(headerless binary records)
+	"""
+	inf = open(fname, 'rb')
+	for triplet in raw_record_reader(inf, record_width, block_size):
+		yield triplet
+	inf.close()
 
 
 class triplet_counting:
-	def __init__(self, triplet_file_path, dir, threshhold, gzipped, bufferdir):
+	"""
+	2026-10-18
+		add type, no_of_buckets, no_of_processes. type 0 is partition_run().
+		add binary, FILE is read through triplet_reader.
+	"""
+	def __init__(self, triplet_file_path, dir, threshhold, gzipped, bufferdir, type=0, \
+		no_of_buckets=64, no_of_processes=1, binary=0):
 		self.counting_dir = os.path.abspath(dir)
 		if not os.path.isdir(self.counting_dir):
 			os.makedirs(self.counting_dir)
@@ -40,12 +93,178 @@ class triplet_counting:
 		self.triplet_file_dict = {}
 		self.triplet_dict = {}
 		self.no_of_runs = 0
+		self.type = int(type)
+		self.no_of_buckets = int(no_of_buckets)
+		self.no_of_processes = int(no_of_processes)
+		self.record_width = 0
+		self.binary = int(binary)
+		self.triplet_writer_dict = {}
 	
 	def triplet_file_dict_initialize(self):
 		for i in range(1,40):
 			self.triplet_file_dict[i] = open(os.path.join(self.counting_dir,'triplet_%d'%i), 'w')	
 
+	def triplet_writer_dict_initialize(self, suffix=''):
+		"""
+		2026-10-18
+			the 39 files, each wrapped in a triplet_writer, for partition_run()
+		"""
+		triplet_file_dict = {}
+		triplet_writer_dict = {}
+		for i in range(1,40):
+			triplet_file_dict[i] = open(os.path.join(self.counting_dir,'triplet_%d%s'%(i, suffix)), 'wb')
+			triplet_writer_dict[i] = triplet_writer(triplet_file_dict[i], self.binary)
+		return triplet_file_dict, triplet_writer_dict
+	
+	def triplet_writer_dict_close(self, triplet_file_dict, triplet_writer_dict):
+		for i in range(1,40):
+			triplet_writer_dict[i].close()
+			triplet_file_dict[i].close()
+	
+	def partition(self, triplet_iter, bucket_prefix, no_of_buckets, seed):
+		"""
+		2026-10-18
+			hash each triplet into one of no_of_buckets files.
+			return the list of (bucket_fname, no_of_records).
+		"""
+		bucket_fname_list = []
+		writer_list = []
+		for i in range(no_of_buckets):
+			bucket_fname = '%s_%s'%(bucket_prefix, i)
+			if os.path.isfile(bucket_fname):
+				os.remove(bucket_fname)
+			bucket_fname_list.append(bucket_fname)
+			writer_list.append(triplet_bucket_writer(bucket_fname))
+		for triplet in triplet_iter:
+			writer_list[hash((seed,)+triplet)%no_of_buckets].write(triplet)
+		bucket_ls = []
+		for i in range(no_of_buckets):
+			writer_list[i].flush()
+			if writer_list[i].no_of_records:
+				bucket_ls.append((bucket_fname_list[i], writer_list[i].no_of_records))
+		return bucket_ls
+	
+	def split_oversized_buckets(self, bucket_ls, max_depth=3):
+		"""
+		2026-10-18
+			a bucket with more than threshhold triplets is re-partitioned with another seed.
+			The #records bounds #distinct triplets from above, so a bucket full of
+			duplicates stops splitting after max_depth rounds and is counted as it is.
+		"""
+		final_bucket_ls = []
+		stack = [(bucket_fname, no_of_records, 1) for bucket_fname, no_of_records in bucket_ls]
+		while stack:
+			bucket_fname, no_of_records, depth = stack.pop()
+			if no_of_records<=self.threshhold or depth>max_depth:
+				final_bucket_ls.append(bucket_fname)
+				continue
+			no_of_sub_buckets = int(no_of_records/self.threshhold)+2
+			sub_bucket_ls = self.partition(triplet_bucket_reader(bucket_fname, self.record_width), \
+				bucket_fname, no_of_sub_buckets, depth)
+			os.remove(bucket_fname)
+			for sub_bucket_fname, sub_no_of_records in sub_bucket_ls:
+				stack.append((sub_bucket_fname, sub_no_of_records, depth+1))
+		return final_bucket_ls
+	
+	def count_bucket(self, bucket_fname, triplet_writer_dict):
+		triplet_dict = {}
+		for triplet in triplet_bucket_reader(bucket_fname, self.record_width):
+			if triplet in triplet_dict:
+				triplet_dict[triplet] += 1
+			else:
+				triplet_dict[triplet] = 1
+		for triplet, freq in triplet_dict.iteritems():
+			triplet_writer_dict[freq].write(triplet)
+		os.remove(bucket_fname)
+	
+	def count_buckets_in_child(self, bucket_fname_list, process_index):
+		"""
+		2026-10-18
+			the child writes its own 39 partial files, triplet_%d.%d, and exits
+		"""
+		triplet_file_dict, triplet_writer_dict = self.triplet_writer_dict_initialize('.%d'%process_index)
+		for bucket_fname in bucket_fname_list:
+			self.count_bucket(bucket_fname, triplet_writer_dict)
+		self.triplet_writer_dict_close(triplet_file_dict, triplet_writer_dict)
+	
+	def parallel_count_buckets(self, bucket_fname_list):
+		"""
+		2026-10-18
+			fork no_of_processes children, each counts every no_of_processes-th bucket.
+			Their partial files are appended to the 39 files afterwards.
+		"""
+		pid_list = []
+		for process_index in range(self.no_of_processes):
+			pid = os.fork()
+			if pid == 0:
+				exit_code = 0
+				try:
+					try:
+						self.count_buckets_in_child(bucket_fname_list[process_index::self.no_of_processes], process_index)
+					except:
+						import traceback
+						traceback.print_exc()
+						exit_code = 1
+				finally:
+					os._exit(exit_code)
+			pid_list.append(pid)
+		no_of_failures = 0
+		for pid in pid_list:
+			pid, status = os.waitpid(pid, 0)
+			if status != 0:
+				no_of_failures += 1
+		for i in range(1,40):
+			for process_index in range(self.no_of_processes):
+				partial_fname = os.path.join(self.counting_dir,'triplet_%d.%d'%(i, process_index))
+				if os.path.isfile(partial_fname):
+					inf = open(partial_fname, 'rb')
+					self.triplet_writer_dict[i].append_file(inf)
+					inf.close()
+					os.remove(partial_fname)
+		if no_of_failures:
+			sys.stderr.write("%d counting processes failed\n"%no_of_failures)
+			sys.exit(3)
+	
+	def partition_run(self):
+		"""
+		2026-10-18
+			read FILE once into hash buckets, then count bucket by bucket
+		"""
+		self.triplet_file_dict, self.triplet_writer_dict = self.triplet_writer_dict_initialize()
+		inf = open_triplet_file(self.ancestor_fname, 'r', self.gzipped)
+		reader = triplet_reader(inf)
+		bucket_prefix = os.path.join(self.bufferdir, 'triplet_bucket_%s'%os.getpid())
+		bucket_ls = self.partition(reader, bucket_prefix, self.no_of_buckets, 0)
+		inf.close()
+		self.record_width = reader.record_width
+		sys.stderr.write('\tpartition done, %d non-empty buckets\n'%len(bucket_ls))
+		bucket_fname_list = self.split_oversized_buckets(bucket_ls)
+		if self.no_of_processes>1 and len(bucket_fname_list)>1:
+			self.parallel_count_buckets(bucket_fname_list)
+		else:
+			for bucket_fname in bucket_fname_list:
+				self.count_bucket(bucket_fname, self.triplet_writer_dict)
+				self.no_of_runs += 1
+		self.triplet_writer_dict_close(self.triplet_file_dict, self.triplet_writer_dict)
+		sys.stderr.write('\t%d buckets counted\n'%len(bucket_fname_list))
+	
 	def run(self):
+		"""
+		2026-10-18
+			type 0 goes to partition_run(), type 1 to old_run()
+		"""
+		if self.type == 1:
+			inf = open_triplet_file(self.ancestor_fname, 'r', self.gzipped)
+			binary = triplet_reader(inf).binary
+			inf.close()
+			if binary:
+				sys.stderr.write("type 1 only takes text FILE, %s is binary.\n"%self.ancestor_fname)
+				sys.exit(2)
+			self.old_run()
+		else:
+			self.partition_run()
+	
+	def old_run(self):
 		self.triplet_file_dict_initialize()
 		self.atom_run(self.ancestor_fname, self.source_fname)
 		if self.gzipped == 1:
@@ -100,7 +319,8 @@ if __name__ == '__main__':
 		sys.exit(2)
 		
 	try:
-		opts, args = getopt.getopt(sys.argv[1:], "ht:zb:", ["help", "threshhold=", "gzipped", "bufferdir="])
+		opts, args = getopt.getopt(sys.argv[1:], "ht:zb:y:p:n:B", ["help", "threshhold=", "gzipped", "bufferdir=", \
+			"type=", "no_of_buckets=", "no_of_processes=", "binary"])
 	except:
 		print __doc__
 		sys.exit(2)
@@ -108,6 +328,10 @@ if __name__ == '__main__':
 	threshhold = 1.6e7
 	gzipped = 0
 	bufferdir = '/tmp'
+	type = 0
+	no_of_buckets = 64
+	no_of_processes = 1
+	binary = 0
 	for opt, arg in opts:
 		if opt in ("-h", "--help"):
 			print __doc__
@@ -118,10 +342,18 @@ if __name__ == '__main__':
 			gzipped = 1
 		elif opt in ("-b", "--bufferdir"):
 			bufferdir = arg
-
+		elif opt in ("-y", "--type"):
+			type = int(arg)
+		elif opt in ("-p", "--no_of_buckets"):
+			no_of_buckets = int(arg)
+		elif opt in ("-n", "--no_of_processes"):
+			no_of_processes = int(arg)
+		elif opt in ("-B", "--binary"):
+			binary = 1
 
 	if len(args) == 2:
-		instance = triplet_counting(args[0], args[1], threshhold, gzipped, bufferdir)
+		instance = triplet_counting(args[0], args[1], threshhold, gzipped, bufferdir, type, \
+			no_of_buckets, no_of_processes, binary)
 		instance.run()
 	else:
 		print __doc__
@@ -3,7 +3,7 @@
 Usage: triplet_filter.py -k SCHEMA [OPTION] DATADIR NEWDIR
 
 Option:
-	DATADIR is the directory of the graph construction results.
+	DATADIR is the directory of the graph construction results(text or binary triplet files).
 	NEWDIR is the directory to store the filtered results.
 	-z ..., --hostname=...	the hostname, zhoudb(default)
 	-d ..., --dbname=...	the database name, graphdb(default)
@@ -28,10 +28,12 @@ Description:
 Note:
 	There're some known genes that are not in schema.
 	So 1 & 2 are different.
+	Each output file keeps the format(text or binary, see triplet_record.py) of its input.
 """
 
 
 import sys, pickle, os, psycopg, getopt
+from triplet_record import triplet_reader, triplet_writer
 
 			
 class triplet_filter:
@@ -79,13 +81,15 @@ class triplet_filter:
 		
 	def transform(self, inf, outf):
 		'''
+		2026-10-18
+			read/write through triplet_reader/triplet_writer
 		'''
-		line = inf.readline()
-		while line:
-			list = line[:-1].split(',')
-			if int(list[0]) in self.global_vertex_dict and int(list[1]) in self.global_vertex_dict and int(list[2]) in self.global_vertex_dict:
-				outf.write(line)
-			line = inf.readline()
+		reader = triplet_reader(inf)
+		writer = triplet_writer(outf, reader.binary)
+		for triplet in reader:
+			if triplet[0] in self.global_vertex_dict and triplet[1] in self.global_vertex_dict and triplet[2] in self.global_vertex_dict:
+				writer.write(triplet)
+		writer.close()
 
 def transform_batch(dbname, schema, type, orgn, dir, output_dir):
 	files = os.listdir(dir)
@@ -101,8 +105,8 @@ def transform_batch(dbname, schema, type, orgn, dir, output_dir):
 	for f in files:
 		pathname = os.path.join(dir, f)
 		sys.stderr.write("%d/%d:\t%s\n"%(files.index(f)+1,len(files),f))
-		inf = open(pathname, 'r')
-		outf = open(os.path.join(output_dir,f), 'w')
+		inf = open(pathname, 'rb')
+		outf = open(os.path.join(output_dir,f), 'wb')
 		instance.transform(inf, outf)
 		inf.close()
 		outf.close()
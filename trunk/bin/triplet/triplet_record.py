@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+"""
+Usage: triplet_record.py [OPTION] INPUT_FILE OUTPUT_FILE
+
+Option:
+	INPUT_FILE is a triplet/quadruplet file, text or binary(detected).
+	OUTPUT_FILE is the converted file.
+	-t, --text	convert to text, default is to binary
+	-z, --gzipped	INPUT_FILE and OUTPUT_FILE are gzipped
+	-h, --help	show this help
+
+Examples:
+	triplet_record.py pickle/quadruplets pickle/quadruplets.bin
+	triplet_record.py -t gph_result/dir_39/triplet_6 /tmp/triplet_6.txt
+
+Description:
+	2026-10-18
+	Streaming reader/writer for triplet/quadruplet files, shared by triplet_construct.py,
+	triplet_counting.py, triplet_filter.py and triplet_stat.py.
+
+	Text format is one record per line, gene_no's separated by ','.
+	Binary format is an 8-byte header(binary_magic, then the record width in one byte,
+	then 3 zero bytes), followed by fixed-width records of gene_no's(in the order given to
+	triplet_writer, triplet_construct.py writes them ascending), each an unsigned int in the
+	machine's byte order. An empty binary file has no header.
+
+	triplet_reader tells the two formats apart by the header.
+"""
+
+import sys, gzip, getopt
+from array import array
+
+binary_magic = 'TRPB'
+header_size = 8
+
+def open_triplet_file(fname, mode='r', gzipped=0):
+	"""
+	2026-10-18
+		binary safe open, gzip.open() if gzipped
+	"""
+	if mode[-1] != 'b':
+		mode = mode + 'b'
+	if gzipped:
+		return gzip.open(fname, mode)
+	else:
+		return open(fname, mode)
+
+def pack_header(record_width):
+	return binary_magic + chr(record_width) + '\0\0\0'
+
+def raw_record_reader(inf, record_width, block_size=100000):
+	"""
+	2026-10-18
+		generator of int tuples from headerless binary records
+	"""
+	block_bytes = block_size*record_width*array('I').itemsize
+	while 1:
+		data = inf.read(block_bytes)
+		if not data:
+			break
+		block = array('I')
+		block.fromstring(data)
+		for i in xrange(0, len(block), record_width):
+			yield tuple(block[i:i+record_width])
+		if len(data)<block_bytes:
+			break
+
+class triplet_reader:
+	"""
+	2026-10-18
+		iterate over int tuples of a text or binary triplet file.
+		record_width is known once the first record is read(0 for an empty file).
+	"""
+	def __init__(self, inf, block_size=100000):
+		self.inf = inf
+		self.block_size = block_size
+		self.record_width = 0
+		self.binary = 0
+		self.head = inf.read(header_size)
+		if self.head[:len(binary_magic)] == binary_magic and len(self.head) == header_size:
+			self.binary = 1
+			self.record_width = ord(self.head[len(binary_magic)])
+
+	def __iter__(self):
+		if self.binary:
+			return raw_record_reader(self.inf, self.record_width, self.block_size)
+		else:
+			return self.text_record_iter()
+
+	def text_record_iter(self):
+		#the header read may have taken several short lines, readline() completes the last one.
+		chunk = self.head + self.inf.readline()
+		for line in chunk.split('\n'):
+			if line:
+				yield self.parse_line(line)
+		line = self.inf.readline()
+		while line:
+			if line != '\n':
+				yield self.parse_line(line)
+			line = self.inf.readline()
+
+	def parse_line(self, line):
+		triplet = tuple(map(int, line.split(',')))
+		if self.record_width == 0:
+			self.record_width = len(triplet)
+		return triplet
+
+class triplet_writer:
+	"""
+	2026-10-18
+		write int tuples as text lines or binary records. The binary header goes out
+		with the first record(if write_header), so an empty output stays empty.
+		close() flushes the buffer but leaves outf open.
+	"""
+	def __init__(self, outf, binary=0, write_header=1, block_size=100000):
+		self.outf = outf
+		self.binary = int(binary)
+		self.write_header = int(write_header)
+		self.block_size = block_size
+		self.record_width = 0
+		self.no_of_records = 0
+		self.buffer = array('I')
+
+	def write(self, triplet):
+		if self.record_width == 0:
+			self.record_width = len(triplet)
+			if self.binary and self.write_header:
+				self.outf.write(pack_header(self.record_width))
+		if self.binary:
+			self.buffer.extend(triplet)
+			self.no_of_records += 1
+			if self.no_of_records%self.block_size == 0:
+				self.flush()
+		else:
+			self.outf.write('%s\n'%(','.join(map(str, triplet))))
+			self.no_of_records += 1
+
+	def flush(self):
+		if self.buffer:
+			self.outf.write(self.buffer.tostring())
+			self.buffer = array('I')
+
+	def append_file(self, inf):
+		"""
+		2026-10-18
+			copy the records of another file in the same format(binary or text) without parsing
+		"""
+		self.flush()
+		head = inf.read(header_size)
+		if head[:len(binary_magic)] == binary_magic and len(head) == header_size:
+			if self.record_width == 0:
+				self.record_width = ord(head[len(binary_magic)])
+				if self.write_header:
+					self.outf.write(head)
+		else:
+			self.outf.write(head)
+		data = inf.read(1048576)
+		while data:
+			self.outf.write(data)
+			data = inf.read(1048576)
+
+	def close(self):
+		self.flush()
+
+def convert(input_fname, output_fname, binary=1, gzipped=0):
+	inf = open_triplet_file(input_fname, 'r', gzipped)
+	outf = open_triplet_file(output_fname, 'w', gzipped)
+	writer = triplet_writer(outf, binary)
+	for triplet in triplet_reader(inf):
+		writer.write(triplet)
+	writer.close()
+	outf.close()
+	inf.close()
+
+if __name__ == '__main__':
+	if len(sys.argv) == 1:
+		print __doc__
+		sys.exit(2)
+
+	try:
+		opts, args = getopt.getopt(sys.argv[1:], "htz", ["help", "text", "gzipped"])
+	except:
+		print __doc__
+		sys.exit(2)
+
+	binary = 1
+	gzipped = 0
+	for opt, arg in opts:
+		if opt in ("-h", "--help"):
+			print __doc__
+			sys.exit(2)
+		elif opt in ("-t", "--text"):
+			binary = 0
+		elif opt in ("-z", "--gzipped"):
+			gzipped = 1
+
+	if len(args) == 2:
+		convert(args[0], args[1], binary, gzipped)
+	else:
+		print __doc__
+		sys.exit(2)
@@ -14,9 +14,11 @@ Examples:
 Description:
 	Triplet never means triplet. Triplet can be any large(>3).
 	The name is history relics.
+	TRIPLET_FILE can be text or binary(see triplet_record.py).
 """
 
-import pickle,sys,os,random,getopt,psycopg,csv
+import pickle,sys,os,random,getopt,psycopg
+from triplet_record import triplet_reader
 
 
 class triplet_stat:
@@ -73,11 +75,13 @@ class triplet_stat:
 		pickle.dump(self.transfac_dict, open(self.transfac_pickle_fname, 'w'))
 		
 	def recurrence_triplet_list_construct(self, triplet_fname):
-		inf = open(triplet_fname, 'r')
-		reader = csv.reader(inf)
-		for row in reader:
-			row = map(int, row)
-			self.recurrence_triplet_list.append(row)
+		"""
+		2026-10-18
+			read through triplet_reader
+		"""
+		inf = open(triplet_fname, 'rb')
+		for triplet in triplet_reader(inf):
+			self.recurrence_triplet_list.append(list(triplet))
 		inf.close()
 		
 	def recurrence_stat_list_construct(self):